@@ -0,0 +1,203 @@
+#   Benchmarks for laser_post.py without FreeCAD.
+#
+#   python bench/benchmark.py
+#   python bench/benchmark.py --sizes 10k,100k,1M,10M --save baseline.json
+#   python bench/benchmark.py --args="--numpy" --baseline baseline.json
+#   python bench/benchmark.py --post old/laser_post.py --save before.json
+#
+#   Every workload, size and stage runs in a fresh process, so the peak memory
+#   is that of the one case. The stages are parse() over every operation,
+#   laser_gcode() over the parsed text, a whole export() to a file and an
+#   export() of the job saved and loaded again as a toolpath file.
+#   Reported are the seconds, Path commands per second, the peak resident
+#   memory, how much of it the stage added on top of the job itself, and the
+#   size of the output. --post times another copy of the post, an older
+#   revision for instance, to save as the baseline of the current one; stages
+#   it does not have are skipped.
+
+import argparse
+import contextlib
+import gc
+import importlib.util
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+POST = os.path.join(os.path.dirname(HERE), "laser_post.py")
+sys.path.insert(0, HERE)
+sys.path.insert(1, os.path.dirname(HERE))
+
+STAGES = ("parse", "laser_gcode", "export", "toolpath")
+DEFAULT_SIZES = "10k,100k,1M"
+
+parser = argparse.ArgumentParser(prog="benchmark", description="time laser_post.py on synthetic jobs")
+parser.add_argument("--workloads", default="engrave,nested,arcs,depth", help="comma separated, default all")
+parser.add_argument("--sizes", default=DEFAULT_SIZES, help="commands per job, k and M allowed, default " + DEFAULT_SIZES)
+parser.add_argument("--stages", default=",".join(STAGES), help="comma separated, default all")
+parser.add_argument("--args", default="", help="post processor arguments as given to export(), written as --args=\"...\"")
+parser.add_argument("--post", default=POST, help="laser_post.py to time, default the one next to bench")
+parser.add_argument("--repeat", type=int, default=1, help="time each case this many times and keep the fastest")
+parser.add_argument("--save", help="write the results to this json file")
+parser.add_argument("--baseline", help="compare with results saved by --save")
+parser.add_argument("--threshold", type=float, default=0.1, help="slowdown against the baseline that fails the run, default 0.1")
+parser.add_argument("--case", help=argparse.SUPPRESS)
+
+
+def size_value(text):
+    scale = {"k": 1000, "M": 1000000}.get(text[-1:], 1)
+    return int(float(text.rstrip("kM")) * scale)
+
+
+def load_post(filename, name="laser_post"):
+
+    # the post as the module laser_post, wherever it is
+    spec = importlib.util.spec_from_file_location(name, os.path.abspath(filename))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_case(workload, size, stage, args, repeat, post=POST):
+
+    #   One case, or None when the post has no such stage.
+
+    import headless
+
+    headless.install()
+    laser_post = load_post(post)
+    # memory is read the way --profile reads it, a post from before that
+    # borrows the readers of the one next to bench
+    meter = laser_post if hasattr(laser_post, "_rss_mb") else load_post(POST, "laser_post_meter")
+    import workloads
+
+    if stage == "toolpath" and not hasattr(laser_post, "save_toolpath"):
+        return None
+
+    objects = workloads.WORKLOADS[workload](size)
+    commands = sum(obj.Path.Size for obj in objects)
+    post_args = args + " --no-show-editor"
+    # parse() and laser_gcode() with the arguments, older posts keep them in the module
+    processor = laser_post.PostProcessor() if hasattr(laser_post, "PostProcessor") else laser_post
+    with contextlib.redirect_stdout(io.StringIO()):
+        processor.processArguments(post_args)
+
+    text = None
+    if stage == "laser_gcode":
+        text = "".join(processor.parse(obj) for obj in objects)
+    target = os.path.join(tempfile.mkdtemp(prefix="laser_bench"), "out.nc")
+    if stage == "toolpath":
+        saved = os.path.splitext(target)[0] + ".toolpath"
+        laser_post.save_toolpath(objects, saved)
+        objects = laser_post.load_toolpath(saved)
+
+    best = None
+    output = 0
+    for _ in range(repeat):
+        gc.collect()
+        before = meter._rss_mb()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            if stage == "parse":
+                output = sum(len(processor.parse(obj)) for obj in objects)
+            elif stage == "laser_gcode":
+                output = len(processor.laser_gcode(text))
+            else:
+                laser_post.export(objects, target, post_args)
+                output = os.path.getsize(target)
+        seconds = time.perf_counter() - start
+        if best is None or seconds < best:
+            best = seconds
+    for name in (target, os.path.splitext(target)[0] + ".toolpath"):
+        if os.path.exists(name):
+            os.remove(name)
+    os.rmdir(os.path.dirname(target))
+
+    peak = meter._peak_mb()
+    return {
+        "workload": workload,
+        "size": size,
+        "stage": stage,
+        "args": args,
+        "commands": commands,
+        "seconds": round(best, 4),
+        "commands_per_s": round(commands / best) if best else None,
+        "peak_mb": round(peak, 1) if peak is not None else None,
+        "added_mb": round(peak - before, 1) if peak is not None and before is not None else None,
+        "output_bytes": output,
+    }
+
+
+def _key(row):
+    return (row["workload"], row["size"], row["stage"], row["args"])
+
+
+def main(argv=None):
+
+    options = parser.parse_args(argv)
+
+    if options.case:
+        workload, size, stage = options.case.split(":")
+        print(json.dumps(run_case(workload, int(size), stage, options.args, options.repeat, options.post)))
+        return 0
+
+    baseline = {}
+    if options.baseline:
+        with open(options.baseline) as f:
+            baseline = {_key(row): row for row in json.load(f)["rows"]}
+
+    print("%-8s %9s %-11s %9s %12s %9s %9s %12s%s" % (
+        "workload", "commands", "stage", "seconds", "commands/s", "peak MB", "added MB", "output",
+        "  vs baseline" if baseline else ""))
+
+    rows = []
+    slower = 0
+    for workload in options.workloads.split(","):
+        for size in [size_value(s) for s in options.sizes.split(",")]:
+            for stage in options.stages.split(","):
+                command = [
+                    sys.executable, os.path.abspath(__file__), "--case", "%s:%d:%s" % (workload, size, stage),
+                    "--args=" + options.args, "--repeat", str(options.repeat), "--post", options.post,
+                ]
+                done = subprocess.run(command, stdout=subprocess.PIPE, universal_newlines=True)
+                if done.returncode:
+                    print("%-8s %9d %-11s failed" % (workload, size, stage))
+                    slower += 1
+                    continue
+                row = json.loads(done.stdout.splitlines()[-1])
+                if row is None:
+                    print("%-8s %9d %-11s not in this post" % (workload, size, stage))
+                    continue
+                rows.append(row)
+
+                compare = ""
+                old = baseline.get(_key(row))
+                if old and old["commands_per_s"]:
+                    ratio = row["commands_per_s"] / old["commands_per_s"]
+                    compare = "  %5.2fx" % ratio
+                    if ratio < 1 - options.threshold:
+                        compare += " slower"
+                        slower += 1
+                print("%-8s %9d %-11s %9.3f %12d %9s %9s %12d%s" % (
+                    workload, row["commands"], stage, row["seconds"], row["commands_per_s"],
+                    row["peak_mb"], row["added_mb"], row["output_bytes"], compare))
+                sys.stdout.flush()
+
+    if options.save:
+        with open(options.save, "w") as f:
+            json.dump({
+                "python": platform.python_version(), "machine": platform.machine(),
+                "post": os.path.abspath(options.post), "rows": rows,
+            }, f, indent=1)
+
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
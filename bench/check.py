@@ -0,0 +1,266 @@
+#   Checks that the fast paths of laser_post.py write what the plain one does,
+#   without FreeCAD, on the jobs of the benchmark.
+#
+#   python bench/check.py
+#   python bench/check.py --sizes 20k,200k --args="--compact"
+#   python bench/check.py --post old/laser_post.py
+#
+#   Every workload is posted once as it is and again with each of --numpy,
+#   --jobs, --cache (filling the cache and then reading it) and --stream, and
+#   each program has to be the one of the plain post line for line. The jobs
+#   are cut into operations of --operation-size commands, so the seams where
+#   --jobs and --cache join operations get checked many times over. Then the
+#   --estimate of the plain program is checked against the plain Python
+#   planner below, which reads the program as written, one line at a time,
+#   with the blocks of --repeat-passes written out again. Without numpy the
+#   estimate is skipped and the programs are compared just the same.
+
+import argparse
+import contextlib
+import io
+import math
+import os
+import re
+import shutil
+import sys
+import tempfile
+
+from benchmark import POST, load_post, size_value
+
+VARIANTS = ("--numpy", "--jobs 2", "--cache", "--cache", "--stream")
+DEFAULT_SIZES = "20k"
+TOLERANCE = 1e-6  # relative difference of an estimate from the reference that fails
+
+parser = argparse.ArgumentParser(prog="check", description="check laser_post.py's fast paths against the plain post")
+parser.add_argument("--workloads", default="engrave,nested,arcs,depth", help="comma separated, default all")
+parser.add_argument("--sizes", default=DEFAULT_SIZES, help="commands per job, k and M allowed, default " + DEFAULT_SIZES)
+parser.add_argument("--args", default="", help="post processor arguments of every post, written as --args=\"...\"")
+parser.add_argument("--post", default=POST, help="laser_post.py to check, default the one next to bench")
+parser.add_argument("--operation-size", type=int, default=2000, help="commands per operation at most, default 2000")
+
+_WORD = re.compile(r"([A-Z])([-+.0-9]+)")
+_COMMENT = re.compile(r"\([^)]*\)")
+_OPERATION = "(begin operation: "
+_OUTPUT_TIME = re.compile(r"\(Output Time:.*\)")
+
+
+def unrolled(text, begin, end):
+
+    # the program with the blocks of --repeat-passes written out once per pass,
+    # as --estimate sees it
+    if not (begin and end):
+        return text
+
+    def pattern(template, count):
+        template = re.escape(template).replace(re.escape("{n}"), r"\d+")
+        return template.replace(re.escape("{count}"), r"(?P<count>\d+)" if count else r"\d+")
+
+    loop = re.compile(r"^%s\n(?P<body>.*?)^%s\n" % (pattern(begin, True), pattern(end, False)), re.S | re.M)
+    return loop.sub(lambda found: found.group("body") * int(found.group("count")), text)
+
+
+def post_text(laser_post, objects, target, args):
+
+    # the program one post writes, without the time it was written
+    post = laser_post.PostProcessor()
+    post.CACHE_DIR = os.path.join(os.path.dirname(target), "cache")
+    with contextlib.redirect_stdout(io.StringIO()):
+        post.export(objects, target, args + " --no-show-editor")
+    with open(target) as f:
+        return _OUTPUT_TIME.sub("", f.read()), post
+
+
+def first_difference(a, b):
+    for number, (line, other) in enumerate(zip(a.splitlines(), b.splitlines()), 1):
+        if line != other:
+            return "line %d: %r, plain %r" % (number, line, other)
+    return "%d lines, plain %d" % (len(a.splitlines()), len(b.splitlines()))
+
+
+def reference_estimate(text, settings):
+
+    #   The estimate of --estimate worked out move by move: the same machine,
+    #   but read with a regular expression per line and planned with a forward
+    #   and a backward pass over the joints instead of numpy's columns.
+
+    scale = settings["scale"]
+    accel = settings["acceleration"]
+    rapid = settings["rapid_rate"] / 60
+    pos = list(settings["start"])
+    g, feed, laser, op = 0.0, math.nan, 0.0, 0
+    labels = [""]
+    paused = {}
+    moves = []
+    stopped = True
+    for line in text.splitlines():
+        found = line.find(_OPERATION)
+        while found >= 0:
+            close = line.find(")", found)
+            labels.append(line[found + len(_OPERATION):close])
+            op = len(labels) - 1
+            found = line.find(_OPERATION, close)
+        words = {}
+        for letter, digits in _WORD.findall(_COMMENT.sub("", line)):
+            try:
+                value = float(digits[:12])
+            except ValueError:
+                value = math.nan
+            if letter == "G" and value in (0.0, 1.0, 2.0, 3.0):
+                words["motion"] = value
+            elif letter == "G" and value == 4.0:
+                words["dwell"] = value
+            elif letter == "M" and value in settings["off"] + settings["on"]:
+                words["laser"] = max(words.get("laser", 0.0), float(value in settings["on"]))
+            if letter not in "GXYZIJKFNABC" or letter == "G" and value not in (0.0, 1.0, 2.0, 3.0):
+                # the machine comes to a stop for anything that is not a move
+                stopped = True
+            if value == value:
+                words[letter] = value
+        g = words.get("motion", g)
+        feed = words["F"] * scale / 60 if "F" in words else feed
+        laser = words.get("laser", laser)
+        if "dwell" in words:
+            paused[op] = paused.get(op, 0.0) + words.get("P", 0.0)
+        circle = g in (2.0, 3.0) and ("I" in words or "J" in words)
+        if not any(axis in words for axis in "XYZ") and not circle:
+            continue
+        end = [words[axis] * scale if axis in words else pos[n] for n, axis in enumerate("XYZ")]
+        moves.append((pos, end, words.get("I", 0.0) * scale, words.get("J", 0.0) * scale, g, feed, laser, op, stopped))
+        pos = end
+        stopped = False
+
+    # length, speed and the directions a move starts and ends in
+    kept = []
+    synced = False
+    for start, end, i, j, kind, speed, on, op, sync in moves:
+        delta = [b - a for a, b in zip(start, end)]
+        length = math.sqrt(sum(d * d for d in delta))
+        speed = rapid if kind == 0 or speed != speed else speed
+        entry = leave = [d / length for d in delta] if length else None
+        if kind >= 2 and math.hypot(i, j) > 1e-9:
+            radius = math.hypot(i, j)
+            ex, ey = delta[0] - i, delta[1] - j
+            turn = 1.0 if kind == 3 else -1.0
+            sweep = (turn * (math.atan2(ey, ex) - math.atan2(-j, -i))) % (2 * math.pi)
+            sweep = 2 * math.pi if sweep < 1e-9 else sweep
+            arc = radius * sweep
+            length = math.hypot(arc, delta[2])
+            flat, rise = arc / length / radius, delta[2] / length
+            entry = [turn * j * flat, -turn * i * flat, rise]
+            leave = [-turn * ey * flat, turn * ex * flat, rise]
+            if accel > 0:
+                speed = min(speed, math.sqrt(accel * radius))
+        synced = synced or sync
+        if length > 1e-9:
+            kept.append((length, max(speed, 1e-6), entry, leave, kind, on, op, synced))
+            synced = False
+
+    # squared speed at every joint, the corner limit first
+    joints = [0.0]
+    for before, after in zip(kept, kept[1:]):
+        cos = -sum(a * b for a, b in zip(before[3], after[2]))
+        half = math.sqrt(min(max(0.5 * (1 - cos), 0.0), 1.0))
+        corner = accel * settings["junction_deviation"] * half / (1 - half) if half < 1 - 1e-9 else math.inf
+        joints.append(0.0 if after[7] else min(corner, min(before[1], after[1]) ** 2))
+    joints.append(0.0)
+    if accel > 0:
+        for n, move in enumerate(kept):
+            joints[n + 1] = min(joints[n + 1], joints[n] + 2 * accel * move[0])
+        for n in range(len(kept) - 1, -1, -1):
+            joints[n] = min(joints[n], joints[n + 1] + 2 * accel * kept[n][0])
+
+    totals = [[0.0] * 5 for _ in labels]
+    for op, seconds in paused.items():
+        totals[op][0] += seconds
+    for n, (length, speed, entry, leave, kind, on, op, sync) in enumerate(kept):
+        if accel > 0:
+            w0, w1 = max(joints[n], 0.0), max(joints[n + 1], 0.0)
+            cruise = length - (2 * speed ** 2 - w0 - w1) / (2 * accel)
+            peak = speed if cruise >= 0 else math.sqrt(min(max((2 * accel * length + w0 + w1) / 2, 0.0), speed ** 2))
+            seconds = (2 * peak - math.sqrt(w0) - math.sqrt(w1)) / accel + max(cruise, 0.0) / speed
+        else:
+            seconds = length / speed
+        row = totals[op]
+        row[0] += seconds
+        row[1] += seconds if on > 0 and kind > 0 else 0.0
+        row[2] += length if kind == 0 else 0.0
+        row[3] += length if kind > 0 else 0.0
+        row[4] += 1
+
+    def entry(row):
+        return {"seconds": row[0], "laser_on_seconds": row[1], "rapid_mm": row[2], "cut_mm": row[3], "moves": row[4]}
+
+    report = entry([sum(column) for column in zip(*totals)])
+    report["operations"] = [dict(label=label, **entry(row)) for label, row in zip(labels[1:], totals[1:])]
+    return report
+
+
+def estimate_difference(estimate, reference):
+
+    # the first figure --estimate got wrong, None when they all agree
+    pairs = [("program", estimate, reference)]
+    if len(estimate["operations"]) != len(reference["operations"]):
+        return "%d operations, reference %d" % (len(estimate["operations"]), len(reference["operations"]))
+    pairs += [(op["label"], op, ref) for op, ref in zip(estimate["operations"], reference["operations"])]
+    for label, got, want in pairs:
+        for key in ("seconds", "laser_on_seconds", "rapid_mm", "cut_mm", "moves"):
+            # the report is rounded to thousandths
+            if abs(got[key] - want[key]) > 0.0005 + TOLERANCE * abs(want[key]):
+                return "%s %s %s, reference %s" % (label, key, got[key], round(want[key], 3))
+    return None
+
+
+def main(argv=None):
+
+    options = parser.parse_args(argv)
+
+    import headless
+
+    headless.install()
+    laser_post = load_post(options.post)
+    import workloads
+
+    workloads.OPERATION_SIZE = options.operation_size
+
+    failed = 0
+    folder = tempfile.mkdtemp(prefix="laser_check")
+    try:
+        for workload in options.workloads.split(","):
+            for size in [size_value(s) for s in options.sizes.split(",")]:
+                objects = workloads.WORKLOADS[workload](size)
+                target = os.path.join(folder, "out.nc")
+                plain, post = post_text(laser_post, objects, target, options.args + " --estimate")
+                shutil.rmtree(os.path.join(folder, "cache"), ignore_errors=True)
+                for variant in VARIANTS:
+                    text = post_text(laser_post, objects, target, options.args + " --estimate " + variant)[0]
+                    result = "ok" if text == plain else "differs at " + first_difference(text, plain)
+                    failed += text != plain
+                    print("%-8s %9d %-11s %s" % (workload, size, variant, result))
+                    sys.stdout.flush()
+
+                if post._estimate is None:
+                    # --estimate needs numpy, the programs were compared all the same
+                    print("%-8s %9d %-11s %s" % (workload, size, "--estimate", "skipped, needs numpy"))
+                    sys.stdout.flush()
+                    continue
+                settings = {
+                    "scale": 25.4 if post.UNITS == "G20" else 1.0,
+                    "start": [float(post.CORNER_MIN[axis]) for axis in "xyz"],
+                    "acceleration": post._estimate["acceleration"],
+                    "rapid_rate": post._estimate["rapid_rate"],
+                    "junction_deviation": post._estimate["junction_deviation"],
+                }
+                settings["on"], settings["off"] = laser_post._laser_codes(post)
+                program = unrolled(plain, post.REPEAT_BEGIN, post.REPEAT_END)
+                wrong = estimate_difference(post._estimate, reference_estimate(program, settings))
+                failed += wrong is not None
+                print("%-8s %9d %-11s %s" % (workload, size, "--estimate", "differs, " + wrong if wrong else "ok"))
+                sys.stdout.flush()
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+#   Light stand-ins for the parts of FreeCAD laser_post.py imports, so the post
+#   can be loaded and timed without FreeCAD. install() only fills in modules that
+#   cannot be imported, run inside FreeCAD the real ones are used.
+#
+#   The toolpaths keep their commands packed in arrays and build Command objects
+#   only when Commands is read, like the real Path does, so a job of millions of
+#   commands fits in memory.
+
+import importlib
+import math
+import os
+import sys
+import tempfile
+import types
+from array import array
+
+
+class Quantity:
+
+    # Value in FreeCAD's internal units, mm and mm/s. Like the real one it
+    # turns into a float and compares with numbers and other quantities.
+    _units = {"mm": 1.0, "in": 25.4, "mm/s": 1.0, "mm/min": 1.0 / 60.0, "in/min": 25.4 / 60.0}
+
+    def __init__(self, value, unit=None):
+        if isinstance(value, str):
+            value = self._units[value]
+        self.Value = float(value)
+
+    def getValueAs(self, unit):
+        return Quantity(self.Value / self._units[unit])
+
+    def __float__(self):
+        return self.Value
+
+    def __lt__(self, other):
+        return self.Value < float(other)
+
+    def __le__(self, other):
+        return self.Value <= float(other)
+
+    def __gt__(self, other):
+        return self.Value > float(other)
+
+    def __ge__(self, other):
+        return self.Value >= float(other)
+
+    def __eq__(self, other):
+        return self.Value == float(other)
+
+    def __hash__(self):
+        return hash(self.Value)
+
+
+class Command:
+
+    __slots__ = ("Name", "_parameters")
+
+    def __init__(self, name="", parameters=None):
+        self.Name = name
+        self._parameters = {k.upper(): float(v) for k, v in (parameters or {}).items()}
+
+    @property
+    def Parameters(self):
+        # the real Command builds a new dict on every access as well
+        return dict(self._parameters)
+
+    def toGCode(self):
+        return self.Name + "".join(" %s%f" % item for item in self._parameters.items())
+
+
+class Toolpath:
+
+    def __init__(self, commands=()):
+        self._commands = list(commands)
+
+    @property
+    def Commands(self):
+        return list(self._commands)
+
+    @property
+    def Size(self):
+        return len(self._commands)
+
+    def toGCode(self):
+        return "".join(c.toGCode() + "\n" for c in self.Commands)
+
+
+class PackedToolpath(Toolpath):
+
+    #   Commands kept as a list of names and one array per parameter letter,
+    #   nan where a command has no such parameter.
+
+    def __init__(self, letters="XYZIJF"):
+        self._names = []
+        self._letters = letters
+        self._columns = [array("d") for _ in letters]
+
+    def append(self, name, **parameters):
+        self._names.append(name)
+        for letter, column in zip(self._letters, self._columns):
+            column.append(parameters.get(letter, math.nan))
+
+    @property
+    def Commands(self):
+        letters = self._letters
+        isnan = math.isnan
+        commands = []
+        for i, name in enumerate(self._names):
+            command = Command(name)
+            command._parameters = {
+                letter: column[i] for letter, column in zip(letters, self._columns) if not isnan(column[i])
+            }
+            commands.append(command)
+        return commands
+
+    @property
+    def Size(self):
+        return len(self._names)
+
+
+class Operation:
+
+    def __init__(self, name, path, **properties):
+        self.Name = self.Label = name
+        self.Path = path
+        self.Active = True
+        self.__dict__.update(properties)
+
+
+def _freecad():
+    module = types.ModuleType("FreeCAD")
+    module.GuiUp = False
+    module.Units = types.SimpleNamespace(Quantity=Quantity, Length="Length", Velocity="Velocity")
+    module.getUserCachePath = lambda: os.path.join(tempfile.gettempdir(), "freecad-bench")
+    return module
+
+
+def _path():
+    module = types.ModuleType("Path")
+    module.__path__ = []
+    module.Command = Command
+    module.Path = Toolpath
+    return module
+
+
+def _post():
+    module = types.ModuleType("Path.Post")
+    module.__path__ = []
+    return module
+
+
+def _post_utils():
+    module = types.ModuleType("Path.Post.Utils")
+
+    class GCodeEditorDialog:
+        pass
+
+    module.GCodeEditorDialog = GCodeEditorDialog
+    return module
+
+
+def _pathscripts():
+    module = types.ModuleType("PathScripts")
+    module.__path__ = []
+    return module
+
+
+def _path_utils():
+    module = types.ModuleType("PathScripts.PathUtils")
+    module.getPathWithPlacement = lambda obj: obj.Path
+    return module
+
+
+_STAND_INS = (
+    ("FreeCAD", _freecad),
+    ("Path", _path),
+    ("Path.Post", _post),
+    ("Path.Post.Utils", _post_utils),
+    ("PathScripts", _pathscripts),
+    ("PathScripts.PathUtils", _path_utils),
+)
+
+
+def install():
+
+    # returns the names that were stood in for
+    installed = []
+    for name, build in _STAND_INS:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            module = sys.modules[name] = build()
+            parent, _, child = name.rpartition(".")
+            if parent:
+                setattr(sys.modules[parent], child, module)
+            installed.append(name)
+    return installed
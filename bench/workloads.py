@@ -0,0 +1,150 @@
+#   Synthetic jobs shaped like the ones the post sees in practice. Each generator
+#   returns the objects list export() gets: a tool controller followed by
+#   operations of at most OPERATION_SIZE commands, about n commands in all.
+#   The same n and seed always give the same job.
+
+import math
+import random
+
+from headless import Command, Operation, PackedToolpath, Toolpath
+
+OPERATION_SIZE = 50000  # commands per operation at most
+SAFE_Z = 5.0
+FEED = 20.0  # mm/s
+PLUNGE = 5.0
+
+
+class _Job:
+
+    def __init__(self, name, n):
+        self.name = name
+        self.n = n
+        self.count = 0
+        self.objects = [
+            Operation(
+                "TC",
+                Toolpath([Command("(TC: Laser)"), Command("M6", {"T": 1}), Command("M3", {"S": 1000})]),
+            )
+        ]
+        self.path = None
+
+    def full(self):
+        return self.count >= self.n
+
+    def move(self, name, **parameters):
+        if self.path is None or self.path.Size >= OPERATION_SIZE:
+            self.path = PackedToolpath()
+            self.objects.append(Operation("%s%03d" % (self.name, len(self.objects)), self.path))
+            self.path.append("(%s)" % self.name)
+            self.path.append("G0", Z=SAFE_Z)
+            self.count += 2
+        self.path.append(name, **parameters)
+        self.count += 1
+
+    def start(self, x, y, z=-1.0):
+        # rapid over the start point and plunge, as the FreeCAD ops do
+        self.move("G0", Z=SAFE_Z)
+        self.move("G0", X=x, Y=y, Z=SAFE_Z)
+        self.move("G1", X=x, Y=y, Z=z, F=PLUNGE)
+
+
+def engrave(n, seed=0):
+
+    #   Text and artwork: many short dense polylines with tiny steps.
+
+    rng = random.Random(seed)
+    job = _Job("Engrave", n)
+    while not job.full():
+        x, y = rng.uniform(0, 480), rng.uniform(0, 280)
+        heading = rng.uniform(0, 2 * math.pi)
+        job.start(x, y)
+        for _ in range(rng.randint(5, 60)):
+            heading += rng.gauss(0, 0.3)
+            step = rng.uniform(0.05, 0.5)
+            x += step * math.cos(heading)
+            y += step * math.sin(heading)
+            job.move("G1", X=round(x, 4), Y=round(y, 4), Z=-1.0, F=FEED)
+    return job.objects
+
+
+def nested(n, seed=0):
+
+    #   Sheet of small parts: a rounded outline with a few round and slotted holes,
+    #   cut holes first like the profile op does.
+
+    rng = random.Random(seed)
+    job = _Job("Nested", n)
+    col = row = 0
+    while not job.full():
+        ox, oy = col * 25.0, row * 25.0
+        col += 1
+        if col == 20:
+            col, row = 0, row + 1
+        for _ in range(rng.randint(1, 4)):
+            cx, cy, r = ox + rng.uniform(6, 14), oy + rng.uniform(6, 14), rng.uniform(0.5, 3)
+            if rng.random() < 0.5:
+                # tessellated hole
+                steps = rng.randint(16, 48)
+                job.start(cx + r, cy)
+                for k in range(1, steps + 1):
+                    a = 2 * math.pi * k / steps
+                    job.move("G1", X=cx + r * math.cos(a), Y=cy + r * math.sin(a), Z=-1.0, F=FEED)
+            else:
+                job.start(cx + r, cy)
+                job.move("G3", X=cx - r, Y=cy, Z=-1.0, I=-r, J=0.0, F=FEED)
+                job.move("G3", X=cx + r, Y=cy, Z=-1.0, I=r, J=0.0, F=FEED)
+        w, h, c = rng.uniform(16, 20), rng.uniform(16, 20), 2.0
+        job.start(ox + c, oy)
+        job.move("G1", X=ox + w - c, Y=oy, Z=-1.0, F=FEED)
+        job.move("G3", X=ox + w, Y=oy + c, Z=-1.0, I=0.0, J=c, F=FEED)
+        job.move("G1", X=ox + w, Y=oy + h - c, Z=-1.0, F=FEED)
+        job.move("G3", X=ox + w - c, Y=oy + h, Z=-1.0, I=-c, J=0.0, F=FEED)
+        job.move("G1", X=ox + c, Y=oy + h, Z=-1.0, F=FEED)
+        job.move("G3", X=ox, Y=oy + h - c, Z=-1.0, I=0.0, J=-c, F=FEED)
+        job.move("G1", X=ox, Y=oy + c, Z=-1.0, F=FEED)
+        job.move("G3", X=ox + c, Y=oy, Z=-1.0, I=c, J=0.0, F=FEED)
+    return job.objects
+
+
+def arcs(n, seed=0):
+
+    #   Profiles made mostly of arcs: a wavy outline of short lines and
+    #   alternating G2/G3 bulges.
+
+    rng = random.Random(seed)
+    job = _Job("Arcs", n)
+    while not job.full():
+        x, y = rng.uniform(0, 400), rng.uniform(0, 200)
+        job.start(x, y)
+        for _ in range(rng.randint(20, 200)):
+            if rng.random() < 0.25:
+                x += rng.uniform(0.5, 3)
+                job.move("G1", X=x, Y=y, Z=-1.0, F=FEED)
+            else:
+                r = rng.uniform(0.5, 5)
+                job.move(rng.choice(("G2", "G3")), X=x + 2 * r, Y=y, Z=-1.0, I=r, J=0.0, F=FEED)
+                x += 2 * r
+    return job.objects
+
+
+def depth(n, seed=0):
+
+    #   Thick material cut in several passes: each contour is repeated at every
+    #   step down without leaving the cut.
+
+    rng = random.Random(seed)
+    job = _Job("Depth", n)
+    while not job.full():
+        cx, cy, r = rng.uniform(20, 460), rng.uniform(20, 260), rng.uniform(2, 15)
+        steps = rng.randint(40, 200)
+        points = [(cx + r * math.cos(2 * math.pi * k / steps), cy + r * math.sin(2 * math.pi * k / steps)) for k in range(steps + 1)]
+        job.start(points[0][0], points[0][1], -0.5)
+        for z in range(1, rng.randint(2, 8) + 1):
+            z = -0.5 * z
+            job.move("G1", X=points[0][0], Y=points[0][1], Z=z, F=PLUNGE)
+            for x, y in points[1:]:
+                job.move("G1", X=x, Y=y, Z=z, F=FEED)
+    return job.objects
+
+
+WORKLOADS = {"engrave": engrave, "nested": nested, "arcs": arcs, "depth": depth}
@@ -0,0 +1,262 @@
+#   Posts FreeCAD Path jobs with laser_post.py outside the GUI, many at a time.
+#   Part of laser_post, same license (LGPL v2.1).
+#
+#   python laser_batch.py --output-dir gcode nightly/*.FCStd
+#   python laser_batch.py --post-args="--compact --order-cuts" --summary summary.json dumps/*.json
+#
+#   Needs a Python that can import FreeCAD, e.g. FreeCAD's own or one with the
+#   FreeCAD lib directory on PYTHONPATH. Every worker imports FreeCAD, Path and
+#   the post once and posts one input file after the other.
+#
+#   Inputs are FreeCAD documents, every Path job in them is posted, or command
+#   dumps: json files with the commands of one job, written by dump() or --dump.
+#   A dump can be posted without the document or the workbench that made it.
+#   Toolpath files written by the post with --toolpath are posted the same way.
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DUMP_VERSION = 1
+
+parser = argparse.ArgumentParser(prog="laser_batch", description="post FreeCAD Path jobs with laser_post")
+parser.add_argument("files", nargs="+", help="FreeCAD documents (.FCStd), command dumps (.json) or toolpath files (.toolpath)")
+parser.add_argument("--workers", type=int, default=0, help="worker processes, default every cpu")
+parser.add_argument("--output-dir", help="where the output goes, default next to each input")
+parser.add_argument("--suffix", default=".nc", help="output file extension, default .nc")
+parser.add_argument(
+    "--post-args",
+    help='laser_post arguments for every job, written as --post-args="...", default the arguments saved in each job',
+)
+parser.add_argument("--summary", help="also write the summary to this json file")
+parser.add_argument("--dump", action="store_true", help="write a command dump of every job instead of posting it")
+
+laser_post = None
+
+
+def load_post():
+    global laser_post
+
+    if HERE not in sys.path:
+        sys.path.insert(0, HERE)
+    import FreeCAD  # noqa: F401 once per process, the post reuses it
+    import Path  # noqa: F401
+    import laser_post
+
+
+class _DumpObject:
+
+    #   Just what laser_post reads from an operation.
+
+    def __init__(self, data):
+        import Path
+
+        self.Name = data["Name"]
+        self.Label = data.get("Label", self.Name)
+        for prop in ("Active", "CoolantMode"):
+            if prop in data:
+                setattr(self, prop, data[prop])
+        if "Group" in data:
+            self.Group = [_DumpObject(child) for child in data["Group"]]
+        self.Path = Path.Path([Path.Command(name, parameters) for name, parameters in data.get("Commands", ())])
+
+
+def _dump_object(obj):
+    data = {"Name": obj.Name, "Label": obj.Label}
+    for prop in ("Active", "CoolantMode"):
+        if hasattr(obj, prop):
+            data[prop] = getattr(obj, prop)
+    if hasattr(obj, "Group"):
+        data["Group"] = [_dump_object(child) for child in obj.Group]
+    elif hasattr(obj, "Path"):
+        data["Commands"] = [[c.Name, c.Parameters] for c in obj.Path.Commands]
+    return data
+
+
+def dump(objectslist, filename, label="", args=""):
+
+    #   Writes the objects export() would get to a command dump. Can be called
+    #   from the FreeCAD python console as well.
+
+    data = {
+        "version": DUMP_VERSION,
+        "label": label,
+        "args": args,
+        "objects": [_dump_object(obj) for obj in objectslist],
+    }
+    with open(filename, "w") as f:
+        json.dump(data, f)
+
+
+def _job_objects(job):
+
+    # operations in job order, each tool controller in front of its first operation
+    objects = []
+    tool = None
+    for op in job.Operations.Group:
+        controller = getattr(op, "ToolController", None)
+        if controller is not None and controller is not tool:
+            objects.append(controller)
+            tool = controller
+        objects.append(op)
+    return objects
+
+
+def dump_jobs(data):
+
+    # the one job of a command dump that has been read already
+    if data.get("version") != DUMP_VERSION:
+        raise ValueError("unknown command dump version %r" % data.get("version"))
+    yield data.get("label", ""), [_DumpObject(obj) for obj in data["objects"]], data.get("args", ""), ""
+
+
+def read_jobs(filename):
+
+    # (label, objects, saved post arguments, name tag) for every job in the file,
+    # the tag tells the outputs of several jobs in one document apart
+    if filename.lower().endswith(".json"):
+        with open(filename) as f:
+            yield from dump_jobs(json.load(f))
+        return
+    if filename.lower().endswith(".toolpath"):
+        yield "", laser_post.load_toolpath(filename), "", ""
+        return
+
+    import FreeCAD
+
+    doc = FreeCAD.openDocument(filename)
+    try:
+        jobs = [obj for obj in doc.Objects if hasattr(obj, "Operations") and hasattr(obj.Operations, "Group")]
+        for job in jobs:
+            tag = job.Label if len(jobs) > 1 else ""
+            yield job.Label, _job_objects(job), getattr(job, "PostProcessorArgs", ""), tag
+    finally:
+        FreeCAD.closeDocument(doc.Name)
+
+
+def output_name(filename, tag, directory, suffix):
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    if tag:
+        stem += "_" + "".join(c if c.isalnum() or c in "-_." else "_" for c in tag)
+    return os.path.join(directory or os.path.dirname(os.path.abspath(filename)), stem + suffix)
+
+
+def _count_lines(filename):
+    lines = 0
+    with open(filename, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            lines += block.count(b"\n")
+    return lines
+
+
+def post_job(objects, args, filename):
+
+    #   Posts one job with the post's own defaults plus args. filename "-" keeps
+    #   the output in memory. Returns what export() returned, the files written,
+    #   several with --split, or None when the post refused the job, and what
+    #   the post had to say about it.
+
+    log = io.StringIO()
+    post = laser_post.PostProcessor()
+    try:
+        with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+            gcode = post.export(objects, filename, args + " --no-show-editor")
+    except SystemExit:
+        # argparse gives up on arguments it does not know
+        gcode = None
+    said = log.getvalue().strip().splitlines()
+    if gcode is None:
+        return None, None, said[-1] if said else "bad post arguments"
+    return gcode, post.outputs, ""
+
+
+def _post_file(filename, options):
+
+    #   Runs in a worker. Returns one summary row per job in the file.
+
+    rows = []
+    start = time.time()
+    try:
+        for label, objects, saved_args, tag in read_jobs(filename):
+            row = {"input": filename, "job": label, "status": "ok"}
+            rows.append(row)
+            job_start = time.time()
+            args = saved_args if options["post_args"] is None else options["post_args"]
+            try:
+                if options["dump"]:
+                    row["output"] = output_name(filename, tag, options["output_dir"], ".json")
+                    dump(objects, row["output"], label, args)
+                else:
+                    row["output"] = output_name(filename, tag, options["output_dir"], options["suffix"])
+                    _, outputs, message = post_job(objects, args, row["output"])
+                    if outputs is None:
+                        row["status"] = "failed"
+                        row["message"] = message
+                    elif len(outputs) > 1:
+                        # --split wrote one program per machine
+                        row["outputs"] = outputs
+                        row["lines"] = sum(_count_lines(name) for name in outputs)
+                    else:
+                        row["lines"] = _count_lines(row["output"])
+                if row["status"] == "ok":
+                    row["bytes"] = sum(os.path.getsize(name) for name in row.get("outputs", [row["output"]]))
+            except Exception:
+                row["status"] = "failed"
+                row["message"] = traceback.format_exc().strip().splitlines()[-1]
+            row["seconds"] = round(time.time() - job_start, 3)
+    except Exception:
+        rows.append({
+            "input": filename, "job": "", "status": "failed",
+            "message": traceback.format_exc().strip().splitlines()[-1],
+            "seconds": round(time.time() - start, 3),
+        })
+    if not rows:
+        rows.append({"input": filename, "job": "", "status": "failed", "message": "no Path job in the file", "seconds": 0.0})
+    return rows
+
+
+def main(argv=None):
+
+    options = parser.parse_args(argv)
+    if options.output_dir:
+        os.makedirs(options.output_dir, exist_ok=True)
+    settings = {
+        "output_dir": options.output_dir,
+        "suffix": options.suffix,
+        "post_args": options.post_args,
+        "dump": options.dump,
+    }
+    workers = min(options.workers or os.cpu_count() or 1, len(options.files))
+
+    rows = []
+    start = time.time()
+    with ProcessPoolExecutor(max_workers=workers, initializer=load_post) as pool:
+        futures = [pool.submit(_post_file, filename, settings) for filename in options.files]
+        for future in futures:
+            for row in future.result():
+                rows.append(row)
+                print("%-6s %8.2fs %12s  %s%s" % (
+                    row["status"], row["seconds"], row.get("bytes", ""), row.get("output", row["input"]),
+                    "  " + str(row["message"]) if "message" in row else ""))
+                sys.stdout.flush()
+
+    failed = sum(1 for row in rows if row["status"] != "ok")
+    print("%d jobs from %d files, %d failed, %.1fs on %d workers" % (
+        len(rows), len(options.files), failed, time.time() - start, workers))
+
+    if options.summary:
+        with open(options.summary, "w") as f:
+            json.dump({"workers": workers, "seconds": round(time.time() - start, 3), "jobs": rows}, f, indent=1)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+#   Keeps FreeCAD, Path and laser_post.py loaded and posts jobs sent over a
+#   local Unix socket, so a job costs the post and nothing else.
+#   Part of laser_post, same license (LGPL v2.1).
+#
+#   python laser_daemon.py --socket /run/user/1000/laser_post.sock --workers 4
+#
+#   Requests and replies are json, one per line, as many as wanted on one
+#   connection:
+#
+#   {"input": "/jobs/part.FCStd"}                   every job in a document, dump or toolpath file
+#   {"dump": {...}, "args": "--compact"}            a command dump sent inline
+#   {"input": "...", "output": "/gcode/part.nc"}    write the gcode to a file
+#   {"command": "ping"}
+#
+#   "args" replaces the post arguments saved with the job. Without "output" the
+#   gcode comes back in the reply:
+#
+#   {"status": "ok", "seconds": 0.004, "jobs": [{"job": "Job", "gcode": "..."}]}
+#   {"status": "ok", "seconds": 0.004, "jobs": [{"job": "Job", "output": "...", "bytes": 1234}]}
+#   {"status": "ok", "seconds": 0.004, "jobs": [{"job": "Job", "outputs": ["...", "..."], "bytes": [1234, 987]}]}
+#   {"status": "failed", "message": "..."}
+#
+#   With --split in the arguments a file output is written as several programs,
+#   all of them are listed.
+#
+#   Each worker process serves one connection at a time; --workers starts that
+#   many, all taking connections from the same socket. The socket is only open
+#   to the user running the daemon.
+
+import argparse
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import time
+import traceback
+
+import laser_batch
+
+parser = argparse.ArgumentParser(prog="laser_daemon", description="post laser jobs sent over a Unix socket")
+parser.add_argument("--socket", required=True, help="path of the Unix socket to listen on")
+parser.add_argument("--workers", type=int, default=1, help="processes serving connections, default 1")
+
+
+def handle(request):
+    if request.get("command") == "ping":
+        return {"status": "ok"}
+
+    start = time.time()
+    if "dump" in request:
+        jobs = laser_batch.dump_jobs(request["dump"])
+        source = "job"
+    elif "input" in request:
+        jobs = laser_batch.read_jobs(request["input"])
+        source = request["input"]
+    else:
+        return {"status": "failed", "message": "a request needs an input or a dump"}
+
+    replies = []
+    for label, objects, saved_args, tag in jobs:
+        args = request.get("args", saved_args)
+        output = request.get("output")
+        if output:
+            # several jobs in one document each get their label added
+            output = laser_batch.output_name(output, tag, os.path.dirname(os.path.abspath(output)), os.path.splitext(output)[1])
+        gcode, outputs, message = laser_batch.post_job(objects, args, output or "-")
+        if outputs is None:
+            return {"status": "failed", "message": "%s %s: %s" % (source, label, message)}
+        if len(outputs) > 1:
+            # --split wrote one program per machine
+            replies.append({"job": label, "outputs": outputs, "bytes": [os.path.getsize(name) for name in outputs]})
+        elif output:
+            replies.append({"job": label, "output": output, "bytes": os.path.getsize(output)})
+        else:
+            replies.append({"job": label, "gcode": gcode})
+    if not replies:
+        return {"status": "failed", "message": "no Path job in " + source}
+    return {"status": "ok", "seconds": round(time.time() - start, 4), "jobs": replies}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                reply = handle(json.loads(line))
+            except Exception:
+                reply = {"status": "failed", "message": traceback.format_exc().strip().splitlines()[-1]}
+            self.wfile.write(json.dumps(reply).encode() + b"\n")
+            self.wfile.flush()
+
+
+def request(path, **fields):
+
+    #   Sends one request to a running daemon and returns the reply, for Python
+    #   clients. request(path, input="part.FCStd", args="--compact")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(path)
+        client.sendall(json.dumps(fields).encode() + b"\n")
+        with client.makefile("rb") as reply:
+            return json.loads(reply.readline())
+
+
+def _remove_stale(path):
+
+    # a socket file nobody listens on is left over from a daemon that died
+    if not os.path.exists(path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except OSError:
+            os.remove(path)
+            return
+    raise SystemExit("a daemon is already listening on " + path)
+
+
+def main(argv=None):
+
+    options = parser.parse_args(argv)
+
+    _remove_stale(options.socket)
+    old_mask = os.umask(0o177)
+    try:
+        server = socketserver.UnixStreamServer(options.socket, _Handler)
+    finally:
+        os.umask(old_mask)
+
+    # FreeCAD starts threads of its own as it loads, and a fork copies only the
+    # thread that forks, so the workers are forked first and each one loads it
+    children = []
+    for _ in range(max(options.workers, 1) - 1):
+        pid = os.fork()
+        if pid == 0:
+            children = None
+            break
+        children.append(pid)
+    laser_batch.load_post()
+
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop)
+    try:
+        if children is not None:
+            print("laser_daemon listening on %s with %d workers" % (options.socket, len(children) + 1))
+            sys.stdout.flush()
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if children is not None:
+            for pid in children:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                    os.waitpid(pid, 0)
+                except OSError:
+                    pass
+            if os.path.exists(options.socket):
+                os.remove(options.socket)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
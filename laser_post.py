@@ -27,12 +27,44 @@ import FreeCAD
 from FreeCAD import Units
 import Path
 import argparse
+import array
+import collections
+import copy
+import cProfile
 import datetime
+import functools
+import hashlib
+import json
+import math
+import mmap
 import shlex
+import shutil
+import struct
+import sys
 import Path.Post.Utils as PostUtils
 import PathScripts.PathUtils as PathUtils
 from builtins import open as pyopen
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import itertools
+import multiprocessing
+import os
 import re
+import tempfile
+import threading
+import time
+import types
+import zlib
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
 
 TOOLTIP = """
 This is a postprocessor file for the Path workbench. Generate g-code that is compatible with a laser.
@@ -88,6 +120,195 @@ parser.add_argument(
     help='"Laser power command, use \\n for newline.Default is spindle speed "S####"Use "NONE" or "" to suppress any power commands.',
 )
 
+parser.add_argument(
+    "--stream",
+    action="store_true",
+    help="write output to the file while it is generated, skips the editor",
+)
+
+parser.add_argument(
+    "--numpy",
+    action="store_true",
+    help="process long runs of moves with NumPy, same output, needs numpy",
+)
+
+parser.add_argument(
+    "--jobs",
+    type=int,
+    help="post operations on this many worker processes, 0 uses every cpu, same output; forked where that "
+    "is safe, otherwise (FreeCAD GUI, threads, Windows) started afresh, which needs numpy",
+)
+
+parser.add_argument(
+    "--fit-tolerance",
+    type=float,
+    help="merge straight runs of moves and fit arcs to curved ones within this distance, default 0 (off)",
+)
+
+parser.add_argument(
+    "--order-cuts",
+    action="store_true",
+    help="reorder the contours of each operation to cut down rapid travel",
+)
+
+parser.add_argument(
+    "--inner-first",
+    action="store_true",
+    help="with --order-cuts, cut contours inside other contours first",
+)
+
+parser.add_argument(
+    "--compact",
+    action="store_true",
+    help="shorter output: no trailing zeros, repeated G codes, unchanged axis values or spaces",
+)
+
+parser.add_argument(
+    "--cache",
+    action="store_true",
+    help="reuse the output of operations that did not change since the last post",
+)
+
+parser.add_argument(
+    "--estimate",
+    action="store_true",
+    help="estimate the run time and laser on time into the header and a .estimate.json file, needs numpy",
+)
+
+parser.add_argument(
+    "--acceleration",
+    type=float,
+    help="machine acceleration for --estimate in mm/s^2, default 1000",
+)
+
+parser.add_argument(
+    "--rapid-rate",
+    type=float,
+    help="speed of G0 moves for --estimate in mm/min, default 6000",
+)
+
+parser.add_argument(
+    "--profile",
+    action="store_true",
+    help="time every stage of the post and count the lines each rule dropped, into a .profile.json file",
+)
+
+parser.add_argument(
+    "--cprofile",
+    action="store_true",
+    help="as --profile and also write cProfile statistics to a .prof file",
+)
+
+parser.add_argument(
+    "--dedupe",
+    type=float,
+    help="cut edges shared by neighbouring parts once, where two cuts run within this distance, default 0 (off), needs numpy",
+)
+
+parser.add_argument(
+    "--repeat-passes",
+    choices=("linuxcnc", "marlin"),
+    help="write passes that repeat the same lines once, in a LinuxCNC o-word repeat or a Marlin M808 loop",
+)
+
+parser.add_argument(
+    "--repeat-begin",
+    help='gcode that starts a block written once for passes that repeat, {count} is the passes, {n} numbers the blocks, e.g. "o{n} repeat [{count}]"',
+)
+
+parser.add_argument(
+    "--repeat-end",
+    help='gcode that ends such a block, e.g. "o{n} endrepeat"',
+)
+
+parser.add_argument(
+    "--toolpath",
+    action="store_true",
+    help="also save the Path commands to a .toolpath file, which posts again with other settings without FreeCAD's objects",
+)
+
+parser.add_argument(
+    "--index",
+    action="store_true",
+    help="write a .index.json file of line offsets and machine states, for laser_resume.py",
+)
+
+parser.add_argument(
+    "--validate",
+    action="store_true",
+    help="check every move against the bed, rapids with the laser on and cuts without a feed, into a .validate.json file, needs numpy",
+)
+
+parser.add_argument(
+    "--bed",
+    help='width and height of the bed for --validate as "WxH" in mm, from CORNER_MIN, default 500x300',
+)
+
+parser.add_argument(
+    "--preview",
+    action="store_true",
+    help="draw the moves into a .preview.png picture, laser off in blue and on in red, needs numpy",
+)
+
+parser.add_argument(
+    "--preview-size",
+    type=int,
+    help="pixels along the longer side of the --preview picture, default 1024",
+)
+
+parser.add_argument(
+    "--split",
+    type=int,
+    help="share the parts out over this many programs of about the same cut time, one per machine, part_1.nc and on",
+)
+
+parser.add_argument(
+    "--raster",
+    help="grayscale image to engrave after the operations, dark is more power, needs numpy; "
+    "PGM and PPM are read directly, PNG, JPEG, BMP and the rest through Qt (PySide, PySide6 or PySide2), "
+    "an image that cannot be read refuses the job",
+)
+
+parser.add_argument(
+    "--raster-dpi",
+    type=float,
+    help="scanlines and pixels per inch of the engraving, default 254 (0.1 mm)",
+)
+
+parser.add_argument(
+    "--raster-size",
+    help='width and height of the engraving as "WxH", or just the width, default the image at --raster-dpi',
+)
+
+parser.add_argument(
+    "--raster-origin",
+    help='lower left corner of the engraving as "X,Y", default 0,0',
+)
+
+parser.add_argument(
+    "--raster-feed",
+    type=float,
+    help="feed rate of the scanlines, default 3000 mm/min",
+)
+
+parser.add_argument(
+    "--raster-levels",
+    type=int,
+    help="power levels of the engraving from 2 (on/off) to 256, default 16",
+)
+
+parser.add_argument(
+    "--raster-power",
+    type=float,
+    help="power of the darkest pixels, default the captured laser power or 1000",
+)
+
+parser.add_argument(
+    "--overscan",
+    type=float,
+    help="distance the head runs on past the ends of each scanline, default 2 mm",
+)
+
 TOOLTIP_ARGS = parser.format_help()
 
 # These globals set common customization preferences
@@ -130,167 +351,523 @@ LASER_ON = "M3"
 LASER_OFF = "M5"
 LASER_POWER = "S0"
 PRINT_LINE_NUMBERS = False
+STREAM_OUTPUT = False  # if true output is written while it is generated instead of built in memory
+NUMPY_ENGINE = False  # if true long runs of moves are processed as NumPy arrays
+WRITE_BUFFER = 1 << 20  # characters collected before each write to the output file
+JOBS = 1  # worker processes posting operations side by side
+FIT_TOLERANCE = 0.0  # if above zero runs of G1 moves are merged and fitted with arcs within this distance
+ORDER_CUTS = False  # if true contours are reordered to shorten the rapids between them
+INNER_FIRST = False  # if true inner contours are always cut before the contours around them
+COMPACT_OUTPUT = False  # if true the finished lines are written as short as the gcode allows
+CACHE_OUTPUT = False  # if true the output of every operation is kept for the next post
+CACHE_DIR = ""  # where the cache lives, empty for the FreeCAD cache directory
+CACHE_SIZE = 256 << 20  # bytes the cache may take before old entries are dropped
+PROGRESS_STEP = 4096  # Path commands between two progress reports of a background export
+ESTIMATE_TIME = False  # if true the run time is estimated and written to the header and a sidecar file
+ACCELERATION = 1000.0  # mm/s^2, used by the estimate
+RAPID_RATE = 6000.0  # mm/min, speed of G0 moves in the estimate
+JUNCTION_DEVIATION = 0.01  # mm, how far corners are rounded to keep speed, as in GRBL
+PROFILE_OUTPUT = False  # if true stage times and rule counts are written to a sidecar file
+CPROFILE_OUTPUT = False  # if true cProfile statistics are written as well
+DEDUPE_TOLERANCE = 0.0  # if above zero cuts along an earlier cut within this distance are not cut again
+REPEAT_BEGIN = ""  # if set passes that repeat the same lines are written once between this and REPEAT_END
+REPEAT_END = ""
+TOOLPATH_OUTPUT = False  # if true the Path commands are saved next to the output to be posted again
+INDEX_OUTPUT = False  # if true a sidecar index is written to restart the program at any line
+INDEX_STEP = 1000  # lines between two entries of the index
+VALIDATE_OUTPUT = False  # if true every move is checked against the bed and the laser rules
+PREVIEW_OUTPUT = False  # if true a picture of the moves is drawn next to the output
+PREVIEW_SIZE = 1024  # pixels along the longer side of the picture
+SPLIT_PROGRAMS = 1  # if above one the parts are shared out over this many programs of about the same cut time
+RASTER_IMAGE = ""  # grayscale image engraved after the operations, a file name or a 2D array of gray values
+RASTER_DPI = 254.0  # scanlines and pixels per inch
+RASTER_SIZE = (0.0, 0.0)  # width and height of the engraving, 0 follows the image
+RASTER_ORIGIN = (0.0, 0.0)  # lower left corner of the engraving
+RASTER_FEED = 3000.0  # feed rate of the scanlines
+RASTER_LEVELS = 16  # power levels, the lightest one is off
+RASTER_POWER = 0.0  # power of the darkest pixels, 0 for the captured laser power
+RASTER_OVERSCAN = 2.0  # distance run on past both ends of a scanline with the laser at power 0
 
-def processArguments(argstring):
-    global OUTPUT_HEADER
-    global OUTPUT_COMMENTS
-    global OUTPUT_LINE_NUMBERS
-    global SHOW_EDITOR
-    global PRECISION
-    global PREAMBLE
-    global POSTAMBLE
-    global UNITS
-    global UNIT_SPEED_FORMAT
-    global UNIT_FORMAT
-    global MODAL
-    global USE_TLO
-    global OUTPUT_DOUBLES
-    global LASER_ON
-    global LASER_OFF
-    global LASER_POWER
-    global PRINT_LINE_NUMBERS
+# the settings a PostProcessor copies, the upper case names above
+_SETTINGS = tuple(name for name in dict(globals()) if name.isupper() and not name.startswith(("_", "TOOLTIP")))
 
-    try:
-        args = parser.parse_args(shlex.split(argstring))
-        if args.no_header:
-            OUTPUT_HEADER = False
-        if args.no_comments:
-            OUTPUT_COMMENTS = False
-        if args.line_numbers:
-            PRINT_LINE_NUMBERS = True
-        if args.no_show_editor:
-            SHOW_EDITOR = False
-        print("Show editor = %d" % SHOW_EDITOR)
-        PRECISION = args.precision
-        #if args.preamble is not None:
-         #   PREAMBLE = args.preamble
-        #if args.postamble is not None:
-         #   POSTAMBLE = args.postamble
-        if args.inches:
-            UNITS = "G20"
-            UNIT_SPEED_FORMAT = "in/min"
-            UNIT_FORMAT = "in"
-            PRECISION = 4
-        if args.modal:
-            MODAL = True
-        if args.no_tlo:
-            USE_TLO = False
-        if args.axis_modal:
-            print("here")
-            OUTPUT_DOUBLES = False
-
-        if args.preamble is not None:
-            #new_argstring += "--preamble TOP_MARKER "
-            #PREAMBLE = "TOP_MARKER" + args.preamble
-            PREAMBLE = args.preamble.replace("\\n", '\n')
-
-        if args.postamble is not None:
-            #new_argstring += "--postamble BOTTOM_MARKER "
-            #POSTAMBLE = "BOTTOM_MARKER" + args.preamble
-            POSTAMBLE = args.postamble.replace("\\n", '\n')
-
-        if args.laser_on is not None:
-            LASER_ON = args.laser_on.replace("\\n", '\n')
-
-        if args.laser_off is not None:
-            LASER_OFF = args.laser_off.replace("\\n", '\n')
-
-        if args.laser_power is not None:
-            LASER_POWER = args.laser_power.replace("NONE", "")
-            LASER_POWER = args.laser_power.replace("\\n", '\n')
-
-    except Exception:
-        return False
 
-    return True
+class PostProcessor:
 
-def printlinenumbers():
+    #   One post: its settings and everything a run keeps track of. The settings,
+    #   the upper case names above, are copied from the module as they are when
+    #   the PostProcessor is made, so what a macro set on the module is used;
+    #   from then on they are attributes of the post. The functions of this
+    #   module take the PostProcessor they work for, so posts in different
+    #   threads never see each other's arguments, laser power or line numbers.
+    #
+    #   post = PostProcessor()
+    #   post.PREAMBLE = "G17 G90 G54"
+    #   gcode = post.export(objectslist, "-", "--no-show-editor --compact")
+    #
+    #   post.parse(), post.laser_gcode() and post.stream() work the same way. Use
+    #   one PostProcessor per thread, or a new one per job.
 
-    global LINENR
+    def __init__(self):
+        for name in _SETTINGS:
+            setattr(self, name, copy.deepcopy(globals()[name]))
+        self.outputs = []  # the files the last export() wrote, none for "-"
+        self._task = None  # the BackgroundExport following this post, if any
+        self._profile = None  # what --profile gathered so far
+        self._raster = None  # the image of this post, read by _post()
+        self._job_power = "S0"  # the laser power operation jobs are posted with
+        self._job = None  # while an operation job posts, what it keeps of its lines
+        self._pool_objects = None  # the operations and cache keys the forked workers post
+        self._estimate = None  # what --estimate found for the last program
+        self._validation = None  # what --validate found in the last program
+        self._preview = None  # the picture --preview drew of the last program, as PNG
+        self._index = None  # what --index gathered for the last program
 
-    if PRINT_LINE_NUMBERS is True:
-        LINENR += 10
-        return "N" + str(LINENR) + " "
-    return ""
+    def export(self, objectslist, filename, argstring=""):
+        if not self.processArguments(argstring):
+            return None
+        if self.PROFILE_OUTPUT:
+            return _profile_export(self, objectslist, filename, argstring)
+        return _post(self, objectslist, filename)
 
-def laser_gcode(gcode):
+    def stream(self, objectslist, argstring=""):
+        if not self.processArguments(argstring) or not _prepare(self, objectslist):
+            return None
+        return self.laser_stream(objectslist)
 
-    global LASER_ON
-    global LASER_OFF
-    global LASER_POWER
-    global PRINT_LINE_NUMBERS
+    def processArguments(self, argstring):
+        try:
+            args = parser.parse_args(shlex.split(argstring))
+            if args.no_header:
+                self.OUTPUT_HEADER = False
+            if args.no_comments:
+                self.OUTPUT_COMMENTS = False
+            if args.line_numbers:
+                self.PRINT_LINE_NUMBERS = True
+            if args.no_show_editor:
+                self.SHOW_EDITOR = False
+            print("Show editor = %d" % self.SHOW_EDITOR)
+            self.PRECISION = args.precision
+            #if args.preamble is not None:
+             #   PREAMBLE = args.preamble
+            #if args.postamble is not None:
+             #   POSTAMBLE = args.postamble
+            if args.inches:
+                self.UNITS = "G20"
+                self.UNIT_SPEED_FORMAT = "in/min"
+                self.UNIT_FORMAT = "in"
+                self.PRECISION = 4
+            if args.modal:
+                self.MODAL = True
+            if args.no_tlo:
+                self.USE_TLO = False
+            if args.axis_modal:
+                print("here")
+                self.OUTPUT_DOUBLES = False
 
-    nl = "\n"
-    laser_gcode = ""
-    prev_line = ""
-    temp_gcode = ""
-    cur_state = {"LASER":"ON", "G":"","X":"", "Y":"", "Z":"", "F":""}
-    prev_state = {"LASER":"ON", "G":"NULL", "X":"NULL", "Y":"NULL", "Z":"NULL", "F":"NULL"}
-    g_word = x_word = y_word = z_word = i_word = j_word = f_word = ""
+            if args.preamble is not None:
+                #new_argstring += "--preamble TOP_MARKER "
+                #PREAMBLE = "TOP_MARKER" + args.preamble
+                self.PREAMBLE = args.preamble.replace("\\n", '\n')
 
-    #   Format imported postprocessor gcode.
+            if args.postamble is not None:
+                #new_argstring += "--postamble BOTTOM_MARKER "
+                #POSTAMBLE = "BOTTOM_MARKER" + args.preamble
+                self.POSTAMBLE = args.postamble.replace("\\n", '\n')
 
-    for line in gcode.splitlines(True):
+            if args.laser_on is not None:
+                self.LASER_ON = args.laser_on.replace("\\n", '\n')
 
-        temp_line = ""
+            if args.laser_off is not None:
+                self.LASER_OFF = args.laser_off.replace("\\n", '\n')
 
-        if "(" in line:             #just print comments if included
-            if "linuxcnc" in line:  #replace the imported postprocessor name with ours
-                line = line.replace("linuxcnc", "laser")
-            temp_gcode += line
-            continue
+            if args.laser_power is not None:
+                self.LASER_POWER = args.laser_power.replace("NONE", "")
+                self.LASER_POWER = args.laser_power.replace("\\n", '\n')
+
+            if args.stream:
+                self.STREAM_OUTPUT = True
+
+            if args.numpy:
+                if np is None:
+                    print("numpy is not available, using the default engine")
+                else:
+                    self.NUMPY_ENGINE = True
+
+            if args.jobs is not None:
+                self.JOBS = args.jobs or os.cpu_count() or 1
+
+            if args.fit_tolerance is not None:
+                self.FIT_TOLERANCE = args.fit_tolerance
+
+            if args.order_cuts:
+                self.ORDER_CUTS = True
+
+            if args.inner_first:
+                self.INNER_FIRST = True
+
+            if args.compact:
+                self.COMPACT_OUTPUT = True
+
+            if args.cache:
+                self.CACHE_OUTPUT = True
 
-    #   Store spindle speed for laser power if no command line arg has changed it.
+            if args.estimate:
+                if np is None:
+                    print("numpy is not available, no time estimate")
+                else:
+                    self.ESTIMATE_TIME = True
+
+            if args.acceleration is not None:
+                self.ACCELERATION = args.acceleration
+
+            if args.rapid_rate is not None:
+                self.RAPID_RATE = args.rapid_rate
+
+            if args.profile or args.cprofile:
+                self.PROFILE_OUTPUT = True
+
+            if args.cprofile:
+                self.CPROFILE_OUTPUT = True
+
+            if args.dedupe is not None:
+                if np is None:
+                    print("numpy is not available, shared edges are cut twice")
+                else:
+                    self.DEDUPE_TOLERANCE = args.dedupe
+
+            if args.repeat_passes is not None:
+                self.REPEAT_BEGIN, self.REPEAT_END = _REPEAT_STYLES[args.repeat_passes]
+
+            if args.repeat_begin is not None:
+                self.REPEAT_BEGIN = args.repeat_begin.replace("\\n", '\n')
+
+            if args.repeat_end is not None:
+                self.REPEAT_END = args.repeat_end.replace("\\n", '\n')
+
+            if args.toolpath:
+                self.TOOLPATH_OUTPUT = True
+
+            if args.index:
+                self.INDEX_OUTPUT = True
+
+            if args.validate:
+                if np is None:
+                    print("numpy is not available, no validation")
+                else:
+                    self.VALIDATE_OUTPUT = True
+
+            if args.bed is not None:
+                width, _, height = args.bed.lower().partition("x")
+                self.CORNER_MAX = dict(self.CORNER_MAX, x=self.CORNER_MIN["x"] + float(width), y=self.CORNER_MIN["y"] + float(height))
+
+            if args.preview:
+                if np is None:
+                    print("numpy is not available, no preview")
+                else:
+                    self.PREVIEW_OUTPUT = True
+
+            if args.preview_size is not None:
+                self.PREVIEW_SIZE = max(args.preview_size, 16)
+
+            if args.split is not None:
+                self.SPLIT_PROGRAMS = max(args.split, 1)
+
+            if args.raster is not None:
+                if np is None:
+                    print("numpy is not available, no raster engraving")
+                else:
+                    self.RASTER_IMAGE = args.raster
+
+            if args.raster_dpi is not None:
+                self.RASTER_DPI = args.raster_dpi
+
+            if args.raster_size is not None:
+                width, _, height = args.raster_size.lower().partition("x")
+                self.RASTER_SIZE = (float(width or 0), float(height or 0))
+
+            if args.raster_origin is not None:
+                x, y = args.raster_origin.split(",")
+                self.RASTER_ORIGIN = (float(x), float(y))
+
+            if args.raster_feed is not None:
+                self.RASTER_FEED = args.raster_feed
+
+            if args.raster_levels is not None:
+                self.RASTER_LEVELS = min(max(args.raster_levels, 2), 256)
+
+            if args.raster_power is not None:
+                self.RASTER_POWER = args.raster_power
+
+            if args.overscan is not None:
+                self.RASTER_OVERSCAN = args.overscan
+
+        except Exception:
+            return False
+
+        return True
+
+    def linenumber(self):
+        if self.OUTPUT_LINE_NUMBERS is True:
+            self.LINENR += 10
+            return "N" + str(self.LINENR) + " "
+        return ""
+
+    def printlinenumbers(self):
+        if self.PRINT_LINE_NUMBERS is True:
+            self.LINENR += 10
+            return "N" + str(self.LINENR) + " "
+        return ""
 
-        if "S" in line and "(" not in line and ")" not in line and LASER_POWER == "S0":
-            LASER_POWER = (re.search(r"S.*?(?=\s)", line)).group()
+    def parse(self, pathobj):
+        return "".join(_render(self, rec) for rec in _parse_records(self, pathobj))
 
-    #   Remove unwanted commands.
+    def laser_gcode(self, gcode):
 
-        if "M3 " in line or "M6 " in line or "G43 " in line:
+        #   Format imported postprocessor gcode.
+
+        return "".join(_number_lines(self, _post_stages(self, _laser_units(self, gcode.splitlines(True)))))
+
+    def laser_stream(self, objectslist):
+
+        #   Same output as laser_gcode(parse(...)) for the whole program, but generated
+        #   straight from the Path commands one chunk at a time, so it can be written
+        #   while it is produced.
+
+        units = _post_stages(self, _program_units(self, objectslist))
+        if self.PRINT_LINE_NUMBERS:
+            return _stage(self, "line_numbers", _number_lines(self, units))
+        return units
+
+
+def _program_units(post, objectslist):
+    if _use_jobs(post, objectslist):
+        return _stage(post, "operations", _job_units(post, objectslist))
+    records = _stage(post, "parse", _join_partial(post, _program_records(post, objectslist)))
+    return _stage(post, "laser_gcode", _laser_units(post, records))
+
+
+def _post_stages(post, units):
+
+    #   Optional passes over the finished laser lines.
+
+    return _finish_stages(post, _cut_stages(post, units))
+
+
+def _cut_stages(post, units):
+
+    # the passes that change what is cut, before a program is split
+    if post.DEDUPE_TOLERANCE > 0:
+        units = _stage(post, "dedupe", _dedupe_cuts(post, units))
+    if post.ORDER_CUTS:
+        units = _stage(post, "order_cuts", _order_cuts(post, units))
+    return units
+
+
+def _finish_stages(post, units):
+    if post.COMPACT_OUTPUT:
+        units = _stage(post, "compact", _compact_units(units))
+    if post.ESTIMATE_TIME:
+        units = _stage(post, "estimate", _estimate_units(post, units))
+    if post.REPEAT_BEGIN:
+        units = _stage(post, "repeat_passes", _repeat_units(post, units))
+    if post.VALIDATE_OUTPUT:
+        units = _stage(post, "validate", _validate_units(post, units))
+    if post.PREVIEW_OUTPUT:
+        units = _stage(post, "preview", _preview_units(post, units))
+    return units
+
+
+def _number_lines(post, units):
+
+    if not post.PRINT_LINE_NUMBERS:
+        yield from units
+        return
+
+    for unit in units:
+        for line in unit.splitlines(True):
+            yield post.printlinenumbers() + line
+
+
+_MOTION = ("G0", "G1", "G2", "G3")
+_BLOCK = "block"
+_IMAGE = "image"
+_WORD_RE = {letter: re.compile(letter + r".*?(?=\s|$)") for letter in "GXYZIJF"}
+
+
+def _laser_items(post, records):
+
+    #   Records are either gcode text, word tuples from _parse_records(), lists
+    #   of plain moves for _columnar_units() or a _Raster for _raster_units().
+    #   Plain motion tuples already hold their words, everything else is
+    #   split into lines and searched the same way the text always was.
+    #   Yields (line, words, motion), words is None for comments.
+
+    fast = post.COMMAND_SPACE == " "
+    removed = 0
+
+    for rec in records:
+
+        if rec.__class__ is list or rec.__class__ is _Moves:
+            yield rec, None, _BLOCK
+            continue
+
+        if rec.__class__ is tuple:
+            if fast and rec[0] in _MOTION:
+                words = {w[0]: w for w in rec}
+                if "S" in words and post.LASER_POWER == "S0":
+                    post.LASER_POWER = words["S"]
+                yield None, words, rec[0]
+                continue
+            rec = _render(post, rec)
+        elif rec.__class__ is _Raster:
+            yield rec, None, _IMAGE
             continue
 
-    #   Make sure laser off command matches LASER_OFF
+        for line in rec.splitlines(True):
+
+            if "(" in line:             #just print comments if included
+                if "linuxcnc" in line:  #replace the imported postprocessor name with ours
+                    line = line.replace("linuxcnc", "laser")
+                yield line, None, None
+                continue
+
+        #   Store spindle speed for laser power if no command line arg has changed it.
+
+            if "S" in line and "(" not in line and ")" not in line and post.LASER_POWER == "S0":
+                post.LASER_POWER = (re.search(r"S.*?(?=\s|$)", line)).group()
+
+        #   Remove unwanted commands.
+
+            if "M3 " in line or "M6 " in line or "G43 " in line:
+                removed += 1
+                continue
+
+        #   Make sure laser off command matches LASER_OFF
+
+            if "M5\n" in line or "M5 " in line:
+                line = line.replace("M5", post.LASER_OFF)
+
+            words = {}
+            for letter, word_re in _WORD_RE.items():
+                if letter in line:
+                    words[letter] = (word_re.search(line)).group()
+
+            if "G0 " in line:
+                motion = "G0"
+            elif "G1 " in line:
+                motion = "G1"
+            elif "G2 " in line:
+                motion = "G2"
+            elif "G3 " in line:
+                motion = "G3"
+            else:
+                motion = None
+
+            yield line, words, motion
+
+    _profile_rules(post, (removed,))
+
+
+def _laser_state():
+
+    #   Everything _laser_units() carries from one line to the next.
+
+    return {
+        "cur": {"LASER":"ON", "G":"","X":"", "Y":"", "Z":"", "F":""},
+        "prev": {"LASER":"ON", "G":"NULL", "X":"NULL", "Y":"NULL", "Z":"NULL", "F":"NULL"},
+        "prev_line": "",
+        "g_word": "", "x_word": "", "y_word": "", "i_word": "", "j_word": "", "f_word": "",
+    }
 
-        if "M5\n" in line or "M5 " in line:
-            line = line.replace("M5", LASER_OFF)
 
-    #   Print custom preamble and postamble
+def _laser_units(post, records, state=None):
 
-        #if "TOP_MARKER" in line:
-            #temp_gcode += f'{variables["PREAMBLE"]}{nl}'
-            #continue
+    if state is None:
+        state = _laser_state()
 
-        #if "BOTTOM_MARKER" in line:
-            #temp_gcode += f'{variables["POSTAMBLE"]}{nl}'
-            #continue
+    nl = "\n"
+    prev_line = state["prev_line"]
+    cur_state = state["cur"]
+    prev_state = state["prev"]
+    g_word, x_word, y_word = state["g_word"], state["x_word"], state["y_word"]
+    i_word, j_word, f_word = state["i_word"], state["j_word"], state["f_word"]
+    hits = [0, 0, 0, 0, 0]  # lines dropped by each rule, as in _PROFILE_RULES
+    job = post._job
+
+    def save():
+        state.update(
+            cur=cur_state, prev=prev_state, prev_line=prev_line,
+            g_word=g_word, x_word=x_word, y_word=y_word,
+            i_word=i_word, j_word=j_word, f_word=f_word,
+        )
+        _profile_rules(post, hits)
+        hits[:] = 0, 0, 0, 0, 0
+
+    for line, words, motion in _laser_items(post, records):
+
+        if motion is _BLOCK:
+            save()
+            units = _columnar_units(post, line, state)
+            if units is None:
+                yield from _laser_units(post, _format_records(post, line), state)
+            else:
+                yield from units
+            prev_line = state["prev_line"]
+            cur_state = state["cur"]
+            prev_state = state["prev"]
+            g_word, x_word, y_word = state["g_word"], state["x_word"], state["y_word"]
+            i_word, j_word, f_word = state["i_word"], state["j_word"], state["f_word"]
+            continue
+
+        if motion is _IMAGE:
+            if cur_state["LASER"] == "ON":
+                yield f"{post.LASER_OFF}{nl}"
+            yield from _raster_units(post, line)
+            # the scanlines end with the laser off, the next move is written in full
+            state.update(_laser_state())
+            state["cur"]["LASER"] = "OFF"
+            if job is not None:
+                job["prev_powered"] = False
+            prev_line = state["prev_line"]
+            cur_state = state["cur"]
+            prev_state = state["prev"]
+            g_word, x_word, y_word = state["g_word"], state["x_word"], state["y_word"]
+            i_word, j_word, f_word = state["i_word"], state["j_word"], state["f_word"]
+            continue
+
+        if words is None:
+            yield line
+            continue
+
+        temp_line = ""
+        powered = False
 
     #   Store relevant values.
 
-        if "G" in line:
-            cur_state["G"] = (re.search(r"G.*?(?=\s)", line)).group()
+        if "G" in words:
+            cur_state["G"] = words["G"]
             g_word = f'{cur_state["G"]} '
 
-        if "X" in line:
-            cur_state["X"] = (re.search(r"X.*?(?=\s)", line)).group()
+        if "X" in words:
+            cur_state["X"] = words["X"]
             x_word = f'{cur_state["X"]} '
 
-        if "Y" in line:
-            cur_state["Y"] = (re.search(r"Y.*?(?=\s)", line)).group()
+        if "Y" in words:
+            cur_state["Y"] = words["Y"]
             y_word = f'{cur_state["Y"]} '
 
-        if "Z" in line:
-            cur_state["Z"] = (re.search(r"Z.*?(?=\s)", line)).group()
-            z_word = f'{cur_state["Z"]} '
+        if "Z" in words:
+            cur_state["Z"] = words["Z"]
 
-        if "I" in line:
-            i_word = (re.search(r"I.*?(?=\s)", line)).group() + " "
+        if "I" in words:
+            i_word = words["I"] + " "
 
-        if "J" in line:
-            j_word = (re.search(r"J.*?(?=\s)", line)).group() + " "
+        if "J" in words:
+            j_word = words["J"] + " "
 
-        if "F" in line:
-            cur_state["F"] = (re.search(r"F.*?(?=\s)", line)).group()
+        if "F" in words:
+            cur_state["F"] = words["F"]
             f_word = f'{cur_state["F"]} '
 
     #   Feedrate semi-modal. Freedrate is printed at the beginning of each motion controlled group.
@@ -300,46 +877,54 @@ def laser_gcode(gcode):
 
     #   Remove redundant moves created when ignoring the Z axis.
 
-        if "G0 " in line and prev_state["G"] in ["G0", "G1", "G2", "G3"]\
-            and cur_state["X"] == prev_state["X"] and cur_state["Y"] == prev_state["Y"]:
-                continue
-
-        elif "G1 " in line and prev_state["G"] in ["G0", "G1", "G2", "G3"]\
+        if (motion == "G0" or motion == "G1") and prev_state["G"] in _MOTION\
             and cur_state["X"] == prev_state["X"] and cur_state["Y"] == prev_state["Y"]:
+                hits[1] += 1
                 continue
 
     #   Remove G0 moves that only include the Z axis.
 
-        elif "G0 " in line and "Z" in line and "X" not in line and "Y" not in line:
+        elif motion == "G0" and "Z" in words and "X" not in words and "Y" not in words:
+            hits[2] += 1
             continue
 
     #   Turn the laser on for feed controlled moves and off for rapid moves.
     #   This code could be more compact, but I chose to avoid any nesting
     #   to keep it easy to follow.
 
-        elif "G0 " in line and cur_state["LASER"] == "OFF":
+        elif motion == "G0" and cur_state["LASER"] == "OFF":
             temp_line += f"{g_word}{x_word}{y_word}{nl}"
 
-        elif "G0 " in line and cur_state["LASER"] == "ON":
+        elif motion == "G0" and cur_state["LASER"] == "ON":
             cur_state["LASER"] = "OFF"                      #turn laser off
-            temp_line += f'{LASER_OFF}{nl}'    #print laser off command
+            temp_line += f'{post.LASER_OFF}{nl}'    #print laser off command
             temp_line += f"{g_word}{x_word}{y_word}{nl}"    #print gcode line
 
-        elif "G1 " in line and cur_state["LASER"] == "ON":
+        elif motion == "G1" and cur_state["LASER"] == "ON":
             temp_line += f"{g_word}{x_word}{y_word}{f_word}{nl}"
 
-        elif "G1 " in line and cur_state["LASER"] == "OFF":
+    #   In an operation job the power may not be captured yet and the I and J
+    #   words of the operation before are not known, the job notes the lines
+    #   that wrote them for the seam.
+
+        elif motion == "G1" and cur_state["LASER"] == "OFF":
             cur_state["LASER"] = "ON"
-            temp_line += f'{LASER_ON} {LASER_POWER}{nl}'
+            temp_line += f'{post.LASER_ON} {post.LASER_POWER}{nl}'
             temp_line += f"{g_word}{x_word}{y_word}{f_word}{nl}"
+            powered = job is not None and post.LASER_POWER == "S0"
 
-        elif "G2 " in line or "G3 " in line and cur_state["LASER"] == "ON":
+        elif motion == "G2" or motion == "G3" and cur_state["LASER"] == "ON":
             temp_line += f"{g_word}{x_word}{y_word}{i_word}{j_word}{f_word}{nl}"
+            if job is not None and not (i_word and j_word):
+                job["tainted"] = len(job["units"]) + 1
 
-        elif "G2 " in line or "G3 " in line and cur_state["LASER"] == "OFF":
+        elif motion == "G2" or motion == "G3" and cur_state["LASER"] == "OFF":
             cur_state["LASER"] = "ON"
-            temp_line += f'{LASER_ON} {LASER_POWER}{nl}'
+            temp_line += f'{post.LASER_ON} {post.LASER_POWER}{nl}'
             temp_line += f"{g_word}{x_word}{y_word}{i_word}{j_word}{f_word}{nl}"
+            powered = job is not None and post.LASER_POWER == "S0"
+            if job is not None and not (i_word and j_word):
+                job["tainted"] = len(job["units"]) + 1
 
         else:
             temp_line = line
@@ -347,299 +932,4019 @@ def laser_gcode(gcode):
         temp_line = temp_line.replace(" \n", "\n")  #remove any trailing white space
 
         if temp_line == prev_line:  #remove duplicate lines
+            hits[3] += 1
             continue
 
-        else:
+        prev_state = cur_state.copy()
+        prev_line = temp_line
+        if job is not None:
+            if powered:
+                job["powered"].append(len(job["units"]))
+            job["prev_powered"] = powered
+        yield temp_line
 
-            prev_state = cur_state.copy()
-            prev_line = temp_line
-            temp_gcode += temp_line
+    save()
 
-    if PRINT_LINE_NUMBERS:
 
-        for line in temp_gcode.splitlines(True):
+def export(objectslist, filename, argstring):
 
-            laser_gcode += printlinenumbers() + line
-    else:
-        laser_gcode = temp_gcode
+    #   FreeCAD's entry point. Every call is a post of its own, so settings and the
+    #   captured laser power never carry over from the call before.
 
-    return laser_gcode
+    return PostProcessor().export(objectslist, filename, argstring)
 
 
-def export(objectslist, filename, argstring):
-    if not processArguments(argstring):
-        return None
-    global UNITS
-    global UNIT_FORMAT
-    global UNIT_SPEED_FORMAT
+def stream(objectslist, argstring=""):
 
-    for obj in objectslist:
-        if not hasattr(obj, "Path"):
-            print(
-                "the object " + obj.Name + " is not a path. Please select only path and Compounds."
-            )
-            return None
+    #   The program for a sender: the lines as they are generated, in chunks of
+    #   one or more lines, or None when the post refuses the job. Nothing is
+    #   written and the editor is never shown.
 
-    print("postprocessing...")
-    gcode = ""
+    return PostProcessor().stream(objectslist, argstring)
 
-    # write header
-    if OUTPUT_HEADER:
-        gcode += linenumber() + "(Exported by FreeCAD)\n"
-        gcode += linenumber() + "(Post Processor: " + __name__ + ")\n"
-        gcode += linenumber() + "(Output Time:" + str(now) + ")\n"
 
-    # Write the preamble
-    if OUTPUT_COMMENTS:
-        gcode += linenumber() + "(begin preamble)\n"
-    for line in PREAMBLE.splitlines(False):
-        gcode += linenumber() + line + "\n"
-    gcode += linenumber() + UNITS + "\n"
+def parse(pathobj):
+    return PostProcessor().parse(pathobj)
 
-    for obj in objectslist:
 
-        # Skip inactive operations
-        if hasattr(obj, "Active"):
-            if not obj.Active:
-                continue
-        if hasattr(obj, "Base") and hasattr(obj.Base, "Active"):
-            if not obj.Base.Active:
-                continue
+def laser_gcode(gcode):
+    return PostProcessor().laser_gcode(gcode)
 
-        # do the pre_op
-        if OUTPUT_COMMENTS:
-            gcode += linenumber() + "(begin operation: %s)\n" % obj.Label
-            gcode += linenumber() + "(machine units: %s)\n" % (UNIT_SPEED_FORMAT)
-        for line in PRE_OPERATION.splitlines(True):
-            gcode += linenumber() + line
-
-        # get coolant mode
-        coolantMode = "None"
-        if hasattr(obj, "CoolantMode") or hasattr(obj, "Base") and hasattr(obj.Base, "CoolantMode"):
-            if hasattr(obj, "CoolantMode"):
-                coolantMode = obj.CoolantMode
-            else:
-                coolantMode = obj.Base.CoolantMode
-
-        # turn coolant on if required
-        if OUTPUT_COMMENTS:
-            if not coolantMode == "None":
-                gcode += linenumber() + "(Coolant On:" + coolantMode + ")\n"
-        if coolantMode == "Flood":
-            gcode += linenumber() + "M8" + "\n"
-        if coolantMode == "Mist":
-            gcode += linenumber() + "M7" + "\n"
-
-        # process the operation gcode
-        gcode += parse(obj)
-
-        # do the post_op
-        if OUTPUT_COMMENTS:
-            gcode += linenumber() + "(finish operation: %s)\n" % obj.Label
-        for line in POST_OPERATION.splitlines(True):
-            gcode += linenumber() + line
-
-        # turn coolant off if required
-        if not coolantMode == "None":
-            if OUTPUT_COMMENTS:
-                gcode += linenumber() + "(Coolant Off:" + coolantMode + ")\n"
-            gcode += linenumber() + "M9" + "\n"
 
-    # do the post_amble
-    if OUTPUT_COMMENTS:
-        gcode += "(begin postamble)\n"
-    for line in POSTAMBLE.splitlines(True):
-        gcode += linenumber() + line
-    
-    # format gcode for laser
-    gcode = laser_gcode(gcode)
-
-    if FreeCAD.GuiUp and SHOW_EDITOR:
-        final = gcode
-        if len(gcode) > 100000:
-            print("Skipping editor since output is greater than 100kb")
-        else:
-            dia = PostUtils.GCodeEditorDialog()
-            dia.editor.setText(gcode)
-            result = dia.exec_()
-            if result:
-                final = dia.editor.toPlainText()
-    else:
-        final = gcode
+class ExportCancelled(Exception):
+    pass
 
-    print("done postprocessing.")
 
-    if not filename == "-":
-        gfile = pyopen(filename, "w")
-        gfile.write(final)
-        gfile.close()
+class BackgroundExport:
 
-    return final
+    #   An export() on a thread of its own, so the FreeCAD GUI keeps working while
+    #   a large job posts. It runs a PostProcessor of its own, or the one given,
+    #   never opens the editor and writes a file target while it is generated.
+    #
+    #   task = BackgroundExport(objectslist, "/tmp/part.nc", "--compact", progress=show)
+    #   task.cancel()
+    #   task.result()
+    #
+    #   progress is called with the task after every operation, every
+    #   PROGRESS_STEP Path commands and every block written. It reads
+    #   task.operations of task.total, task.commands and task.written (characters
+    #   of output on disk). It runs on the post's thread: in the GUI, hand the
+    #   numbers on with a queued Qt signal or read them from a QTimer instead of
+    #   touching widgets from there. It is called once more when the post is over.
+    #
+    #   cancel() stops the post at its next report. Nothing of a cancelled post
+    #   is left on disk and an earlier file of the same name stays as it was.
+    #   --jobs spawns its workers rather than fork them, since no worker is
+    #   forked from a process running threads. result() waits for the post and
+    #   returns what export() returns: the program for "-", "" once a file target
+    #   is written and None for a refused job. It raises what stopped the post,
+    #   ExportCancelled for a cancelled one.
 
+    def __init__(self, objectslist, filename, argstring="", progress=None, post=None):
+        self.filename = filename
+        self.total = len(objectslist)
+        self.operations = 0
+        self.commands = 0
+        self.written = 0
+        self._progress = progress
+        self._result = None
+        self._error = None
+        self._cancel = threading.Event()
+        self._finished = threading.Event()
 
-def linenumber():
-    global LINENR
-    if OUTPUT_LINE_NUMBERS is True:
-        LINENR += 10
-        return "N" + str(LINENR) + " "
-    return ""
+        self.post = post or PostProcessor()
+        self.post._task = self
+        self.post.SHOW_EDITOR = False
+        if filename != "-":
+            self.post.STREAM_OUTPUT = True
 
+        self._thread = threading.Thread(
+            target=self._run, args=(objectslist, filename, argstring), name="laser_post export", daemon=True
+        )
+        self._thread.start()
 
-def parse(pathobj):
-    global PRECISION
-    global MODAL
-    global OUTPUT_DOUBLES
-    global UNIT_FORMAT
-    global UNIT_SPEED_FORMAT
+    def _run(self, objectslist, filename, argstring):
+        try:
+            self._result = self.post.export(objectslist, filename, argstring)
+        except BaseException as error:  # argparse exits on bad arguments
+            self._error = error
+        finally:
+            self.post._task = None
+            self._finished.set()
+            if self._progress is not None:
+                self._progress(self)
 
-    out = ""
-    lastcommand = None
-    precision_string = "." + str(PRECISION) + "f"
-    currLocation = {}  # keep track for no doubles
-
-    # the order of parameters
-    # linuxcnc doesn't want K properties on XY plane  Arcs need work.
-    params = [
-        "X",
-        "Y",
-        "Z",
-        "A",
-        "B",
-        "C",
-        "I",
-        "J",
-        "F",
-        "S",
-        "T",
-        "Q",
-        "R",
-        "L",
-        "H",
-        "D",
-        "P",
-    ]
-    firstmove = Path.Command("G0", {"X": -1, "Y": -1, "Z": -1, "F": 0.0})
-    currLocation.update(firstmove.Parameters)  # set First location Parameters
+    def _advance(self, operations, commands, written):
+        if self._cancel.is_set():
+            raise ExportCancelled("export to %s cancelled" % self.filename)
+        self.operations += operations
+        self.commands += commands
+        self.written += written
+        if self._progress is not None:
+            self._progress(self)
+
+    def cancel(self):
+        self._cancel.set()
+
+    def cancelled(self):
+        return isinstance(self._error, ExportCancelled)
+
+    def done(self):
+        return self._finished.is_set()
+
+    def result(self, timeout=None):
+        if not self._finished.wait(timeout):
+            raise TimeoutError("export to %s still running" % self.filename)
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+def _prepare(post, objectslist):
+
+    for obj in objectslist:
+        if not hasattr(obj, "Path"):
+            print(
+                "the object " + obj.Name + " is not a path. Please select only path and Compounds."
+            )
+            return False
+
+    post._raster = None
+    if post.RASTER_IMAGE is not None and len(post.RASTER_IMAGE):
+        try:
+            post._raster = _raster_load(post, post.RASTER_IMAGE)
+        except (OSError, ValueError) as error:
+            print("cannot engrave the raster image: %s" % error)
+            return False
+    return True
+
+
+def _post(post, objectslist, filename):
+
+    #   Returns the program as text, or None when the post refuses the job. A
+    #   program that goes to its files while it is generated, with --stream or
+    #   --split, is not held in memory and comes back as "". The files written
+    #   go into post.outputs.
+
+    post.outputs = []
+    if not _prepare(post, objectslist):
+        return None
+
+    print("postprocessing...")
+
+    if post.TOOLPATH_OUTPUT and not filename == "-":
+        _profiled(post, "toolpath", _write_toolpath, post, objectslist, os.path.splitext(filename)[0] + ".toolpath", chained=False)
+
+    if post.SPLIT_PROGRAMS > 1 and not filename == "-":
+        post.outputs = _write_split(post, objectslist, filename)
+        print("done postprocessing.")
+        return ""
+
+    # format gcode for laser while it is generated
+    gcode = post.laser_stream(objectslist)
+
+    if post.STREAM_OUTPUT and not filename == "-":
+        if post.INDEX_OUTPUT:
+            gcode = _stage(post, "index", _index_units(post, gcode))
+        _profiled(post, "write", write_output, post, filename, gcode, functools.partial(_estimate_head, post))
+        _write_estimate(post, filename)
+        _write_index(post, filename, _estimate_head(post))
+        _write_validation(post, filename, _estimate_head(post))
+        _write_preview(post, filename)
+        post.outputs = [filename]
+        print("done postprocessing.")
+        # the program stays on disk, reading it back would hold it all in memory
+        return ""
+
+    gcode = _profiled(post, "join", "".join, gcode)
+    head = _estimate_head(post)
+    gcode = head + gcode
+
+    if FreeCAD.GuiUp and post.SHOW_EDITOR:
+        final = _profiled(post, "editor", _edit, post, gcode, chained=False)
+    else:
+        final = gcode
+
+    _write_validation(post, filename, head)
+    print("done postprocessing.")
+
+    if not filename == "-":
+        chunks = _index_units(post, (final,)) if post.INDEX_OUTPUT else (final,)
+        _profiled(post, "write", write_output, post, filename, chunks, chained=False)
+        _write_estimate(post, filename)
+        _write_index(post, filename, "")
+        _write_preview(post, filename)
+        post.outputs = [filename]
+
+    return final
+
+
+def _edit(post, gcode):
+    if len(gcode) > 100000:
+        # too long for the editor, the picture of the moves instead
+        picture = None
+        if _qt() is not None:
+            picture = post._preview if post.PREVIEW_OUTPUT else _preview_text(post, gcode)
+        if picture:
+            _show_preview(picture)
+        else:
+            print("Skipping editor since output is greater than 100kb")
+        return gcode
+    dia = PostUtils.GCodeEditorDialog()
+    dia.editor.setText(gcode)
+    result = dia.exec_()
+    if result:
+        return dia.editor.toPlainText()
+    return gcode
+
+
+def write_output(post, filename, chunks, head=None, binary=False):
+
+    # Collect the chunks into blocks of about WRITE_BUFFER characters and write
+    # them to a temporary file next to the target. The target is only replaced
+    # once everything is on disk, so nobody ever reads a half written program
+    # and a failed post leaves the previous file untouched. head, if given, is
+    # called once the chunks are written and what it returns goes before them.
+    # binary chunks are bytes.
+    filename = os.path.abspath(filename)
+    tmpname = os.path.join(
+        os.path.dirname(filename),
+        ".%s.%s.tmp" % (os.path.basename(filename), os.urandom(4).hex()),
+    )
+    fd = os.open(tmpname, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        empty = b"" if binary else ""
+        with pyopen(fd, "wb" if binary else "w") as gfile:
+            block = []
+            size = 0
+            for chunk in chunks:
+                block.append(chunk)
+                size += len(chunk)
+                if size >= post.WRITE_BUFFER:
+                    gfile.write(empty.join(block))
+                    _progress(post, written=size)
+                    block.clear()
+                    size = 0
+            gfile.write(empty.join(block))
+            _progress(post, written=size)
+            gfile.flush()
+            os.fsync(gfile.fileno())
+        if head is not None:
+            text = head()
+            if text:
+                _write_head(post, tmpname, text)
+        if os.path.exists(filename):
+            os.chmod(tmpname, os.stat(filename).st_mode & 0o7777)
+        os.replace(tmpname, filename)
+    except BaseException:
+        if os.path.exists(tmpname):
+            os.remove(tmpname)
+        raise
+
+
+def _write_head(post, tmpname, text):
+
+    # the body is already written, it is copied in behind the head
+    headname = tmpname + ".head"
+    try:
+        with pyopen(headname, "w") as gfile, pyopen(tmpname) as body:
+            gfile.write(text)
+            shutil.copyfileobj(body, gfile, post.WRITE_BUFFER)
+            gfile.flush()
+            os.fsync(gfile.fileno())
+        os.replace(headname, tmpname)
+    except BaseException:
+        if os.path.exists(headname):
+            os.remove(headname)
+        raise
+
+
+def _progress(post, operations=0, commands=0, written=0):
+    if post._task is not None:
+        post._task._advance(operations, commands, written)
+
+
+def _counted(post, commands):
+    count = 0
+    for command in commands:
+        yield command
+        count += 1
+        if count == post.PROGRESS_STEP:
+            _progress(post, commands=count)
+            count = 0
+    _progress(post, commands=count)
+
+
+_PROFILE_RULES = ("removed_command", "redundant_move", "z_only_rapid", "duplicate_line", "shared_edge", "repeated_pass")
+
+
+def _profile_export(post, objectslist, filename, argstring):
+
+    #   Posts as _post() does and reports where the time went. Every stage is
+    #   timed while it hands out its output; the time a stage spends waiting for
+    #   the stage before it is taken off again, so the stage times add up.
+
+    post._profile = {
+        "stages": {},
+        "chain": None,
+        "operations": [],
+        "rules": dict.fromkeys(_PROFILE_RULES, 0),
+    }
+    profiler = cProfile.Profile() if post.CPROFILE_OUTPUT else None
+    rss = _rss_mb()
+    start = time.perf_counter()
+    if profiler is not None:
+        try:
+            profiler.enable()
+        except ValueError:
+            print("another profiler is running, no cProfile statistics")
+            profiler = None
+    try:
+        result = _post(post, objectslist, filename)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        seconds = time.perf_counter() - start
+        profile = post._profile
+        post._profile = None
+
+    stages = profile["stages"]
+    report = {
+        "args": argstring,
+        "output": filename,
+        "seconds": round(seconds, 4),
+        "rss_mb_before": rss,
+        "rss_mb_after": _rss_mb(),
+        "peak_mb": _peak_mb(),
+        "commands": sum(op["commands"] for op in profile["operations"]),
+        "stages": [
+            {
+                "stage": name,
+                "seconds": round(stage["seconds"] - (stages[stage["after"]]["seconds"] if stage["after"] else 0), 4),
+                "items": stage["items"],
+                "rss_mb": stage["rss_mb"],
+            }
+            for name, stage in stages.items()
+        ],
+        "rules": profile["rules"],
+        "operations": profile["operations"],
+    }
+    for stage in report["stages"]:
+        print("%-12s %9.3fs %10d items %8s MB" % (stage["stage"], stage["seconds"], stage["items"], stage["rss_mb"]))
+    print("rules: " + ", ".join("%s %d" % rule for rule in report["rules"].items()))
+
+    if post.outputs:
+        stem = os.path.splitext(filename)[0]
+        write_output(post, stem + ".profile.json", (json.dumps(report, indent=1) + "\n",))
+        if profiler is not None:
+            profiler.dump_stats(stem + ".prof")
+    return result
+
+
+def _stage(post, name, items):
+
+    # items timed as a stage of the post when profiling
+    if post._profile is None:
+        return items
+    return _timed(_profile_stage(post, name, True), items)
+
+
+def _profile_stage(post, name, chained):
+
+    # a chained stage is fed by the one made before it
+    stage = post._profile["stages"][name] = {
+        "seconds": 0.0,
+        "items": 0,
+        "rss_mb": None,
+        "after": post._profile["chain"] if chained else None,
+    }
+    if chained:
+        post._profile["chain"] = name
+    return stage
+
+
+def _timed(stage, items):
+    clock = time.perf_counter
+    items = iter(items)
+    while True:
+        start = clock()
+        try:
+            item = next(items)
+        except StopIteration:
+            stage["seconds"] += clock() - start
+            stage["rss_mb"] = _rss_mb()
+            return
+        stage["seconds"] += clock() - start
+        stage["items"] += 1
+        yield item
+
+
+def _profiled(post, name, function, *args, chained=True):
+    if post._profile is None:
+        return function(*args)
+    stage = _profile_stage(post, name, chained)
+    start = time.perf_counter()
+    result = function(*args)
+    stage["seconds"] += time.perf_counter() - start
+    stage["items"] = 1
+    stage["rss_mb"] = _rss_mb()
+    return result
+
+
+def _profile_operation(post, obj):
+    if post._profile is not None:
+        post._profile["operations"].append({"label": obj.Label, "commands": _command_count(obj)})
+
+
+def _command_count(pathobj):
+
+    # same walk as _parse_records()
+    if hasattr(pathobj, "Group"):
+        return sum(_command_count(p) for p in pathobj.Group)
+    if hasattr(pathobj, "Path"):
+        return pathobj.Path.Size
+    return 0
+
+
+def _profile_rules(post, hits):
+
+    # hits are counts in the order of _PROFILE_RULES
+    if post._profile is not None and hits:
+        rules = post._profile["rules"]
+        for rule, count in zip(_PROFILE_RULES, hits):
+            rules[rule] += count
+
+
+def _rss_mb():
+
+    # resident memory now, in MB, None where it cannot be read
+    try:
+        with pyopen("/proc/self/statm") as f:
+            return round(int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6, 1)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _peak_mb():
+
+    # the most the process ever had resident, in MB
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return round(peak / 1e6 if sys.platform == "darwin" else peak / 1e3, 1)
+
+
+def _program_records(post, objectslist):
+    yield from _header_records(post)
+    for obj in objectslist:
+        _profile_operation(post, obj)
+        yield from _operation_records(post, obj)
+        _progress(post, operations=1)
+    yield from _raster_records(post)
+    yield from _footer_records(post)
+
+
+def _header_records(post):
+
+    # write header
+    if post.OUTPUT_HEADER:
+        yield post.linenumber() + "(Exported by FreeCAD)\n"
+        yield post.linenumber() + "(Post Processor: " + __name__ + ")\n"
+        yield post.linenumber() + "(Output Time:" + str(now) + ")\n"
+
+    # Write the preamble
+    if post.OUTPUT_COMMENTS:
+        yield post.linenumber() + "(begin preamble)\n"
+    for line in post.PREAMBLE.splitlines(False):
+        yield post.linenumber() + line + "\n"
+    yield post.linenumber() + post.UNITS + "\n"
+
+
+def _operation_records(post, obj):
+
+    # Skip inactive operations
+    if hasattr(obj, "Active"):
+        if not obj.Active:
+            return
+    if hasattr(obj, "Base") and hasattr(obj.Base, "Active"):
+        if not obj.Base.Active:
+            return
+
+    # do the pre_op
+    if post.OUTPUT_COMMENTS:
+        yield post.linenumber() + "(begin operation: %s)\n" % obj.Label
+        yield post.linenumber() + "(machine units: %s)\n" % (post.UNIT_SPEED_FORMAT)
+    for line in post.PRE_OPERATION.splitlines(True):
+        yield post.linenumber() + line
+
+    # get coolant mode
+    coolantMode = "None"
+    if hasattr(obj, "CoolantMode") or hasattr(obj, "Base") and hasattr(obj.Base, "CoolantMode"):
+        if hasattr(obj, "CoolantMode"):
+            coolantMode = obj.CoolantMode
+        else:
+            coolantMode = obj.Base.CoolantMode
+
+    # turn coolant on if required
+    if post.OUTPUT_COMMENTS:
+        if not coolantMode == "None":
+            yield post.linenumber() + "(Coolant On:" + coolantMode + ")\n"
+    if coolantMode == "Flood":
+        yield post.linenumber() + "M8" + "\n"
+    if coolantMode == "Mist":
+        yield post.linenumber() + "M7" + "\n"
+
+    # process the operation gcode
+    yield from _parse_records(post, obj)
+
+    # do the post_op
+    if post.OUTPUT_COMMENTS:
+        yield post.linenumber() + "(finish operation: %s)\n" % obj.Label
+    for line in post.POST_OPERATION.splitlines(True):
+        yield post.linenumber() + line
+
+    # turn coolant off if required
+    if not coolantMode == "None":
+        if post.OUTPUT_COMMENTS:
+            yield post.linenumber() + "(Coolant Off:" + coolantMode + ")\n"
+        yield post.linenumber() + "M9" + "\n"
+
+
+def _footer_records(post):
+
+    # do the post_amble
+    if post.OUTPUT_COMMENTS:
+        yield "(begin postamble)\n"
+    for line in post.POSTAMBLE.splitlines(True):
+        yield post.linenumber() + line
+
+
+def _join_partial(post, records):
+
+    # Text that does not end a line runs on into the next record, exactly as it
+    # would when the whole program is concatenated.
+    pending = ""
+    for rec in records:
+        if pending and rec.__class__ is _Raster:
+            # the engraving starts on a line of its own
+            yield pending + "\n"
+            pending = ""
+        elif pending:
+            rec = pending + _render(post, rec)
+            pending = ""
+        if rec.__class__ is str and not rec.endswith("\n"):
+            pending = rec
+            continue
+        yield rec
+    if pending:
+        yield pending
+
+
+def _render(post, rec):
+    if rec.__class__ is str:
+        return rec
+    if rec.__class__ is list or rec.__class__ is _Moves:
+        return "".join(_render(post, r) for r in _format_records(post, rec))
+    return post.COMMAND_SPACE.join(rec) + post.COMMAND_SPACE + "\n"
+
+
+def _parse_records(post, pathobj):
+
+    # Yields one tuple of words per command, or plain text for anything that
+    # is not a single command line.
 
     if hasattr(pathobj, "Group"):  # We have a compound or project.
         # if OUTPUT_COMMENTS:
         #     out += linenumber() + "(compound: " + pathobj.Label + ")\n"
         for p in pathobj.Group:
-            out += parse(p)
-        return out
-    else:  # parsing simple path
+            yield from _parse_records(post, p)
+        return
 
-        # groups might contain non-path things like stock.
-        if not hasattr(pathobj, "Path"):
-            return out
+    # groups might contain non-path things like stock.
+    if not hasattr(pathobj, "Path"):
+        return
 
-        # if OUTPUT_COMMENTS:
-        #     out += linenumber() + "(" + pathobj.Label + ")\n"
-
-        # The following "for" statement was fairly recently added
-        # but seems to be using the A, B, and C parameters in ways
-        # that don't appear to be compatible with how the PATH code
-        # uses the A, B, and C parameters.  I have reverted the
-        # change here until we can figure out what it going on.
-        #
-        # for c in PathUtils.getPathWithPlacement(pathobj).Commands:
-        for c in pathobj.Path.Commands:
-
-            outstring = []
-            command = c.Name
-            outstring.append(command)
-
-            # if modal: suppress the command if it is the same as the last one
-            if MODAL is True:
-                if command == lastcommand:
-                    outstring.pop(0)
-
-            if c.Name[0] == "(" and not OUTPUT_COMMENTS:  # command is a comment
+    # if OUTPUT_COMMENTS:
+    #     out += linenumber() + "(" + pathobj.Label + ")\n"
+
+    if pathobj.Path.__class__ is _ToolpathPath:
+        yield from _toolpath_records(post, pathobj.Path)
+        return
+
+    # The following "for" statement was fairly recently added
+    # but seems to be using the A, B, and C parameters in ways
+    # that don't appear to be compatible with how the PATH code
+    # uses the A, B, and C parameters.  I have reverted the
+    # change here until we can figure out what it going on.
+    #
+    # for c in PathUtils.getPathWithPlacement(pathobj).Commands:
+
+    # Every Parameters access on a Path.Command builds a new dict, so take
+    # a single snapshot of each command and work from plain data after that.
+    commands = ((c.Name, c.Parameters) for c in pathobj.Path.Commands)
+    if post._task is not None:
+        commands = _counted(post, commands)
+    if post.FIT_TOLERANCE > 0:
+        commands = _fit_moves(post, commands)
+    if _use_columnar(post):
+        yield from _columnar_runs(post, commands)
+    else:
+        yield from _format_records(post, commands)
+
+
+# the order of parameters
+# linuxcnc doesn't want K properties on XY plane  Arcs need work.
+PARAMS = ("X", "Y", "Z", "A", "B", "C", "I", "J", "F", "S", "T", "Q", "R", "L", "H", "D", "P")
+
+
+def _unit_value(unit):
+    # size of one output unit in FreeCAD's internal units, getValueAs() divides by this
+    return Units.Quantity(unit).Value
+
+
+def _format_records(post, commands):
+
+    # commands are (name, parameters) pairs in FreeCAD's internal units
+    lastcommand = None
+    precision_string = "." + str(post.PRECISION) + "f"
+    length_unit = _unit_value(post.UNIT_FORMAT)
+    speed_unit = _unit_value(post.UNIT_SPEED_FORMAT)
+    currLocation = {"X": -1.0, "Y": -1.0, "Z": -1.0, "F": 0.0}  # keep track for no doubles
+    param_order = {}  # parameter names in output order, per set of keys seen
+
+    for command, parameters in commands:
+
+        outstring = []
+        outstring.append(command)
+
+        # if modal: suppress the command if it is the same as the last one
+        if post.MODAL is True:
+            if command == lastcommand:
+                outstring.pop(0)
+
+        if command[0] == "(" and not post.OUTPUT_COMMENTS:  # command is a comment
+            continue
+
+        keys = tuple(parameters)
+        order = param_order.get(keys)
+        if order is None:
+            order = param_order[keys] = [param for param in PARAMS if param in parameters]
+
+        # Now add the remaining parameters in order
+        for param in order:
+            value = parameters[param]
+            if param == "F":
+                if currLocation["F"] != value or post.OUTPUT_DOUBLES:
+                    if command not in ("G0", "G00"):  # linuxcnc doesn't use rapid speeds
+                        speed = value / speed_unit
+                        if speed > 0.0:
+                            outstring.append("F" + format(float(speed), precision_string))
+            elif param in ("T", "H", "D", "S"):
+                outstring.append(param + str(int(value)))
+            elif (not post.OUTPUT_DOUBLES) and (param in currLocation) and (currLocation[param] == value):
                 continue
+            elif param in ("A", "B", "C"):
+                outstring.append(param + format(float(value), precision_string))
+            else:
+                outstring.append(param + format(float(value / length_unit), precision_string))
+
+        # store the latest command
+        lastcommand = command
+        currLocation.update(parameters)
+
+        # Check for Tool Change:
+        if command == "M6":
+            # stop the spindle
+            yield post.linenumber() + "M5\n"
+            for line in post.TOOL_CHANGE.splitlines(True):
+                yield post.linenumber() + line
+
+            # add height offset
+            if post.USE_TLO:
+                tool_height = "\nG43 H" + str(int(parameters["T"]))
+                outstring.append(tool_height)
+
+        if command == "message":
+            if post.OUTPUT_COMMENTS is False:
+                outstring = []
+            else:
+                outstring.pop(0)  # remove the command
+
+        # prepend a line number and append a newline
+        if len(outstring) >= 1:
+            if post.OUTPUT_LINE_NUMBERS:
+                outstring.insert(0, (post.linenumber()))
+
+            # hand the words on, they are only joined into text if needed
+            yield tuple(outstring)
+
+
+#   Move fitting. Runs of plain G1 moves at one height and feed are rebuilt from
+#   as few moves as FIT_TOLERANCE allows: a stretch whose points all lie within
+#   the tolerance of a straight line becomes one G1, a stretch that follows a
+#   circle that closely becomes one G2/G3 with I and J. The arc also has to stay
+#   within the tolerance of every original segment, not only of the points.
+
+_FIT_RUN = 500  # points one fitted move may cover at most
+_FIT_KEYS = frozenset("XYZF")
+
+
+def _fit_moves(post, commands):
+
+    # commands are (name, parameters) pairs in FreeCAD's internal units
+    tol = post.FIT_TOLERANCE * _unit_value(post.UNIT_FORMAT)
+    x = y = z = None
+    start = None
+    run = []
+    for name, parameters in commands:
+        plain = name in ("G1", "G01") and _FIT_KEYS.issuperset(parameters) and parameters.get("Z", z) == z
+        if run and not (
+            plain
+            and name == run[0][0]
+            and parameters.keys() == run[0][1].keys()
+            and parameters.get("F") == run[0][1].get("F")
+        ):
+            yield from _fit_run(start, run, tol)
+            run = []
+        if plain and x is not None and y is not None:
+            if not run:
+                start = (x, y)
+            run.append((name, parameters))
+        else:
+            yield name, parameters
+        x = parameters.get("X", x)
+        y = parameters.get("Y", y)
+        z = parameters.get("Z", z)
+    if run:
+        yield from _fit_run(start, run, tol)
+
+
+def _fit_run(start, run, tol):
+    points = [start]
+    for name, parameters in run:
+        points.append((parameters.get("X", points[-1][0]), parameters.get("Y", points[-1][1])))
+
+    i = 0
+    while i < len(run):
+        j_line = _fit_reach(_line_fits, points, i, i + 1, tol)
+        # an arc has to cover three segments at least to be worth it
+        arc = _arc_fits(points, i, i + 3, tol) if i + 3 < len(points) else None
+        j_arc = _fit_reach(_arc_fits, points, i, i + 3, tol) if arc else i
+        if arc:
+            arc = _arc_fits(points, i, j_arc, tol)
+        # _laser_units() never turns the laser on for a G2, so a run does not
+        # start with one
+        if j_arc > j_line and (arc[1] or i):
+            centre, ccw = arc
+            name, parameters = run[j_arc - 1]
+            parameters = dict(parameters)
+            parameters["I"] = centre[0] - points[i][0]
+            parameters["J"] = centre[1] - points[i][1]
+            yield ("G3" if ccw else "G2"), parameters
+            i = j_arc
+        else:
+            yield run[j_line - 1]
+            i = j_line
 
-            # Now add the remaining parameters in order
-            for param in params:
-                if param in c.Parameters:
-                    if param == "F" and (
-                        currLocation[param] != c.Parameters[param] or OUTPUT_DOUBLES
-                    ):
-                        if c.Name not in [
-                            "G0",
-                            "G00",
-                        ]:  # linuxcnc doesn't use rapid speeds
-                            speed = Units.Quantity(c.Parameters["F"], FreeCAD.Units.Velocity)
-                            if speed.getValueAs(UNIT_SPEED_FORMAT) > 0.0:
-                                outstring.append(
-                                    param
-                                    + format(
-                                        float(speed.getValueAs(UNIT_SPEED_FORMAT)),
-                                        precision_string,
-                                    )
-                                )
-                        else:
-                            continue
-                    elif param == "T":
-                        outstring.append(param + str(int(c.Parameters["T"])))
-                    elif param == "H":
-                        outstring.append(param + str(int(c.Parameters["H"])))
-                    elif param == "D":
-                        outstring.append(param + str(int(c.Parameters["D"])))
-                    elif param == "S":
-                        outstring.append(param + str(int(c.Parameters["S"])))
-                    else:
-                        if (
-                            (not OUTPUT_DOUBLES)
-                            and (param in currLocation)
-                            and (currLocation[param] == c.Parameters[param])
-                        ):
-                            continue
-                        else:
-                            if param in ("A", "B", "C"):
-                                outstring.append(
-                                    param + format(float(c.Parameters[param]), precision_string)
-                                )
-                            else:
-                                pos = Units.Quantity(c.Parameters[param], FreeCAD.Units.Length)
-                                outstring.append(
-                                    param
-                                    + format(float(pos.getValueAs(UNIT_FORMAT)), precision_string)
-                                )
-
-            # store the latest command
-            lastcommand = command
-            currLocation.update(c.Parameters)
-
-            # Check for Tool Change:
-            if command == "M6":
-                # stop the spindle
-                out += linenumber() + "M5\n"
-                for line in TOOL_CHANGE.splitlines(True):
-                    out += linenumber() + line
-
-                # add height offset
-                if USE_TLO:
-                    tool_height = "\nG43 H" + str(int(c.Parameters["T"]))
-                    outstring.append(tool_height)
-
-            if command == "message":
-                if OUTPUT_COMMENTS is False:
-                    out = []
+
+def _fit_reach(fits, points, i, j, tol):
+
+    # last point one move from points[i] can reach, given that points[j] can be.
+    # Checking every end point in turn is quadratic, so the reach is doubled until
+    # it fails and the last stretch is halved down instead
+    last = min(len(points), i + _FIT_RUN) - 1
+    step = 1
+    while j < last:
+        k = min(j + step, last)
+        if not fits(points, i, k, tol):
+            while k - j > 1:
+                mid = (j + k) // 2
+                if fits(points, i, mid, tol):
+                    j = mid
                 else:
-                    outstring.pop(0)  # remove the command
+                    k = mid
+            break
+        j = k
+        step *= 2
+    return j
+
+
+def _line_fits(points, i, j, tol):
+    (x0, y0), (x1, y1) = points[i], points[j]
+    dx, dy = x1 - x0, y1 - y0
+    length2 = dx * dx + dy * dy
+    for k in range(i + 1, j):
+        px, py = points[k][0] - x0, points[k][1] - y0
+        t = (px * dx + py * dy) / length2 if length2 else 0.0
+        t = min(max(t, 0.0), 1.0)
+        if math.hypot(px - t * dx, py - t * dy) > tol:
+            return False
+    return True
+
+
+def _arc_fits(points, i, j, tol):
+
+    # centre and direction of an arc from points[i] to points[j] through the
+    # points between them, None when there is none
+    (x0, y0), (xm, ym), (x1, y1) = points[i], points[(i + j) // 2], points[j]
+    d = 2 * ((xm - x0) * (y1 - y0) - (ym - y0) * (x1 - x0))
+    if abs(d) < 1e-12:
+        return None
+    a = (xm - x0) ** 2 + (ym - y0) ** 2
+    b = (x1 - x0) ** 2 + (y1 - y0) ** 2
+    cx = x0 + ((y1 - y0) * a - (ym - y0) * b) / d
+    cy = y0 + ((xm - x0) * b - (x1 - x0) * a) / d
+    r = math.hypot(x0 - cx, y0 - cy)
+    ccw = d > 0
+    swept = 0.0
+    angle = math.atan2(y0 - cy, x0 - cx)
+    for k in range(i + 1, j + 1):
+        px, py = points[k]
+        if abs(math.hypot(px - cx, py - cy) - r) > tol:
+            return None
+        step = math.atan2(py - cy, px - cx) - angle
+        step = (step + math.pi) % (2 * math.pi) - math.pi
+        if (step > 0) != ccw or step == 0:
+            return None
+        swept += abs(step)
+        # the arc bulges out of the chord between two points the most
+        # halfway along it
+        qx, qy = points[k - 1]
+        if abs(math.hypot((px + qx) / 2 - cx, (py + qy) / 2 - cy) - r) > tol:
+            return None
+        angle += step
+    if swept >= 2 * math.pi:
+        return None
+    return (cx, cy), ccw
+
+
+#   Columnar engine. Long runs of plain G0-G3 moves are turned into arrays and
+#   the _laser_units() rules are applied to whole columns at once.
+#
+#   Whether a line is kept depends on the last line that was kept, which in turn
+#   depends on the lines before it. The kept mask is therefore solved by fixed
+#   point iteration: guess it, derive every decision from the guess, repeat until
+#   the decisions reproduce the guess. A mask that reproduces itself is the one the
+#   line by line loop produces, and each pass settles at least one more line, so a
+#   run that does not settle quickly is simply handed back to the loop.
+
+_COLUMN_KEYS = frozenset("XYZIJKF")
+_COLUMNAR_MIN_RUN = 64
+_COLUMNAR_PASSES = 16
+
+
+def _columnar_runs(post, commands):
+
+    # Split off long runs of plain moves as lists for _columnar_units(), format
+    # the rest as usual. Only valid while parse() keeps no state between commands,
+    # that is with OUTPUT_DOUBLES on and MODAL off.
+    rest = []
+    run = []
+    for command in commands:
+        if command[0] in _MOTION and _COLUMN_KEYS.issuperset(command[1]):
+            run.append(command)
+            continue
+        if len(run) >= _COLUMNAR_MIN_RUN:
+            yield from _format_records(post, rest)
+            yield run
+            rest = []
+        else:
+            rest.extend(run)
+        run = []
+        rest.append(command)
+    if len(run) >= _COLUMNAR_MIN_RUN:
+        yield from _format_records(post, rest)
+        yield run
+    else:
+        rest.extend(run)
+        yield from _format_records(post, rest)
+
+
+def _use_columnar(post, always=False):
+    return (
+        (post.NUMPY_ENGINE or always)
+        and np is not None
+        and post.OUTPUT_DOUBLES
+        and not post.MODAL
+        and not post.OUTPUT_LINE_NUMBERS
+        and post.COMMAND_SPACE == " "
+    )
+
+
+def _word_ids(letter, values, present, fmt, words, index):
+
+    # Format every distinct value once and return the index of each record's word
+    # in words (-1 where the word is absent). Values are told apart by their bits
+    # so that -0.0 keeps its own "-0.000" word, words that format the same share
+    # an index.
+    ids = np.full(len(values), -1, dtype=np.intp)
+    if present.any():
+        bits, inverse = np.unique(values[present].view(np.int64), return_inverse=True)
+        uid = np.empty(len(bits), dtype=np.intp)
+        for k, value in enumerate(bits.view(np.float64).tolist()):
+            uid[k] = _intern(letter + format(value, fmt), words, index)
+        ids[present] = uid[inverse.reshape(-1)]
+    return ids
+
+
+def _intern(word, words, index):
+    i = index.get(word)
+    if i is None:
+        i = index[word] = len(words)
+        words.append(word)
+    return i
+
+
+def _ffill(ids, has, entry):
+
+    # value of the last record at or before each position that has one
+    pos = np.where(has, np.arange(len(ids)), -1)
+    np.maximum.accumulate(pos, out=pos)
+    return np.where(pos >= 0, ids[pos], entry), pos
+
+
+def _shift(pos):
+
+    # last position strictly before each record, -1 if there is none
+    before = np.empty_like(pos)
+    before[0] = -1
+    before[1:] = pos[:-1]
+    return before
+
+
+def _columnar_units(post, block, state):
+
+    nl = "\n"
+    n = len(block)
+    fmt = "." + str(post.PRECISION) + "f"
+    length_unit = _unit_value(post.UNIT_FORMAT)
+    speed_unit = _unit_value(post.UNIT_SPEED_FORMAT)
+    cur = state["cur"]
+    prev = state["prev"]
+    idx = np.arange(n)
+
+    if block.__class__ is _Moves:
+        code, present, values = block.code, block.present, block.values.copy()
+    else:
+        code = np.fromiter((_MOTION.index(name) for name, _ in block), dtype=np.int8, count=n)
+        keysets = {}
+        kid = np.fromiter(
+            (keysets.setdefault(tuple(p), len(keysets)) for _, p in block), dtype=np.intp, count=n
+        )
+        present = np.array([[k in ks for k in "XYZIJF"] for ks in keysets], dtype=bool)[kid]
+        values = np.array(
+            [
+                (p.get("X", 0.0), p.get("Y", 0.0), p.get("Z", 0.0),
+                 p.get("I", 0.0), p.get("J", 0.0), p.get("F", 0.0))
+                for _, p in block
+            ],
+            dtype=np.float64,
+        )
+    values[:, :5] /= length_unit
+    values[:, 5] /= speed_unit
+    has_x, has_y, has_z, has_i, has_j = (present[:, k] for k in range(5))
+    has_f = present[:, 5] & (code != 0) & (values[:, 5] > 0.0)  # linuxcnc doesn't use rapid speeds
+
+    # word tables, "" stands for a word that has not been seen yet
+    tables = {}
+    for letter in "XYIJF":
+        tables[letter] = ([], {})
+        _intern("", *tables[letter])
+    xw, yw, iw, jw, fw = (tables[letter][0] for letter in "XYIJF")
+    x_ids = _word_ids("X", values[:, 0], has_x, fmt, *tables["X"])
+    y_ids = _word_ids("Y", values[:, 1], has_y, fmt, *tables["Y"])
+    i_ids = _word_ids("I", values[:, 3], has_i, fmt, *tables["I"])
+    j_ids = _word_ids("J", values[:, 4], has_j, fmt, *tables["J"])
+    f_ids = _word_ids("F", values[:, 5], has_f, fmt, *tables["F"])
+
+    cur_x, _ = _ffill(x_ids, has_x, _intern(cur["X"], *tables["X"]))
+    cur_y, _ = _ffill(y_ids, has_y, _intern(cur["Y"], *tables["Y"]))
+    cur_f, _ = _ffill(f_ids, has_f, _intern(cur["F"], *tables["F"]))
+    cur_i, _ = _ffill(i_ids, has_i, _intern(state["i_word"][:-1], *tables["I"]))
+    cur_j, _ = _ffill(j_ids, has_j, _intern(state["j_word"][:-1], *tables["J"]))
+    _, z_pos = _ffill(idx, has_z, -1)
+
+    entry_g = _MOTION.index(prev["G"]) if prev["G"] in _MOTION else 4
+    entry_x = _intern(prev["X"], *tables["X"])
+    entry_y = _intern(prev["Y"], *tables["Y"])
+    entry_f = _intern(prev["F"], *tables["F"])
+    entry_laser = cur["LASER"] == "ON"
+    entry_f_word = _intern(state["f_word"][:-1], *tables["F"])
+    no_f = 0  # index of ""
+
+    # laser on/off text, equal texts share an index so duplicates are found
+    laser_off = f"{post.LASER_OFF}{nl}".replace(" \n", "\n")
+    laser_on = f"{post.LASER_ON} {post.LASER_POWER}{nl}".replace(" \n", "\n")
+    prefixes = ["", laser_off]
+    pre_on = 1 if laser_on == laser_off else 2
+    if pre_on == 2:
+        prefixes.append(laser_on)
+
+    # Z-only rapids never depend on what came before
+    z_only = (code == 0) & has_z & ~has_x & ~has_y
+
+    kept = np.ones(n, dtype=bool)
+    for _ in range(_COLUMNAR_PASSES):
+
+        last_kept, _ = _ffill(idx, kept, -1)
+        j = _shift(last_kept)
+        has_prev = j >= 0
+        jj = np.where(has_prev, j, 0)
+        prev_g = np.where(has_prev, code[jj], entry_g)
+        prev_x = np.where(has_prev, cur_x[jj], entry_x)
+        prev_y = np.where(has_prev, cur_y[jj], entry_y)
+        prev_f = np.where(has_prev, cur_f[jj], entry_f)
+
+        redundant = (code <= 1) & (prev_g <= 3) & (cur_x == prev_x) & (cur_y == prev_y)
+        reached = ~redundant & ~z_only
+
+        # laser state going into each line, G2 lines leave it alone
+        _, switch = _ffill(idx, reached & (code != 2), -1)
+        switch = _shift(switch)
+        laser = np.where(switch >= 0, code[np.maximum(switch, 0)] != 0, entry_laser)
+
+        # semi-modal feed word
+        clear = (cur_f == prev_f) & (prev_g != 0)
+        f_word, _ = _ffill(np.where(clear, no_f, f_ids), clear | has_f, entry_f_word)
+
+        pre = np.zeros(n, dtype=np.int8)
+        pre[(code == 0) & laser] = 1
+        pre[((code == 1) | (code == 3)) & ~laser] = pre_on
+
+        # duplicate of the last kept line
+        f_key = np.where(code == 0, -1, f_word)
+        i_key = np.where(code >= 2, cur_i, -1)
+        j_key = np.where(code >= 2, cur_j, -1)
+        duplicate = (
+            reached & has_prev
+            & (code == code[jj]) & (pre == pre[jj])
+            & (cur_x == cur_x[jj]) & (cur_y == cur_y[jj])
+            & (f_key == f_key[jj]) & (i_key == i_key[jj]) & (j_key == j_key[jj])
+        )
+        first = np.flatnonzero(reached & ~has_prev)
+        texts = {}
+        for i in first.tolist():
+            texts[i] = _columnar_line(i, code, pre, prefixes, cur_x, cur_y, f_word, cur_i, cur_j, tables)
+            duplicate[i] = texts[i] == state["prev_line"]
+
+        now_kept = reached & ~duplicate
+        if np.array_equal(now_kept, kept):
+            break
+        kept = now_kept
+    else:
+        return None
+
+    if post._profile is not None:
+        _profile_rules(post, (0, int(redundant.sum()), int((z_only & ~redundant).sum()), int(duplicate.sum())))
+
+    # output
+    units = []
+    append = units.append
+    lines = np.flatnonzero(kept).tolist()
+    xs = [w + " " if w else "" for w in xw]
+    ys = [w + " " if w else "" for w in yw]
+    is_ = [w + " " if w else "" for w in iw]
+    js = [w + " " if w else "" for w in jw]
+    fs = [w + " " if w else "" for w in fw]
+    for i, c, p, x, y, f, ii, jj_ in zip(
+        lines,
+        code[lines].tolist(), pre[lines].tolist(),
+        cur_x[lines].tolist(), cur_y[lines].tolist(), f_word[lines].tolist(),
+        cur_i[lines].tolist(), cur_j[lines].tolist(),
+    ):
+        if c == 0:
+            body = f"G0 {xs[x]}{ys[y]}{nl}"
+        elif c == 1:
+            body = f"G1 {xs[x]}{ys[y]}{fs[f]}{nl}"
+        else:
+            body = f"G{c} {xs[x]}{ys[y]}{is_[ii]}{js[jj_]}{fs[f]}{nl}"
+        append(prefixes[p] + body.replace(" \n", "\n"))
+
+    # what an operation job notes for the seam, as _laser_units() does: laser on
+    # lines written before the power is captured and arcs with no I or J yet
+    job = post._job
+    if job is not None and lines:
+        base = len(job["units"])
+        unknown = np.flatnonzero((code[lines] >= 2) & ((cur_i[lines] == 0) | (cur_j[lines] == 0)))
+        if len(unknown):
+            job["tainted"] = base + int(unknown[-1]) + 1
+        powered = (pre[lines] == pre_on) & (code[lines] != 0) & (post.LASER_POWER == "S0")
+        job["powered"].extend((base + np.flatnonzero(powered)).tolist())
+        job["prev_powered"] = bool(powered[-1])
+
+    # hand the state of the last line on
+    def z_word(pos):
+        if pos < 0:
+            return None
+        return "Z" + format(float(values[pos, 2]), fmt)
+
+    last = n - 1
+    laser_after = np.where(reached & (code != 2), code != 0, laser)
+    cur_state = {
+        "LASER": "ON" if laser_after[last] else "OFF",
+        "G": _MOTION[code[last]],
+        "X": xw[cur_x[last]],
+        "Y": yw[cur_y[last]],
+        "Z": z_word(z_pos[last]) or cur["Z"],
+        "F": fw[cur_f[last]],
+    }
+    if lines:
+        k = lines[-1]
+        state["prev"] = {
+            "LASER": "ON" if laser_after[k] else "OFF",
+            "G": _MOTION[code[k]],
+            "X": xw[cur_x[k]],
+            "Y": yw[cur_y[k]],
+            "Z": z_word(z_pos[k]) or cur["Z"],
+            "F": fw[cur_f[k]],
+        }
+        state["prev_line"] = units[-1]
+    state["cur"] = cur_state
+    state["g_word"] = cur_state["G"] + " "
+    state["x_word"] = xs[cur_x[last]]
+    state["y_word"] = ys[cur_y[last]]
+    state["i_word"] = is_[cur_i[last]]
+    state["j_word"] = js[cur_j[last]]
+    state["f_word"] = fs[f_word[last]]
+    return units
+
+
+def _columnar_line(i, code, pre, prefixes, cur_x, cur_y, f_word, cur_i, cur_j, tables):
+    words = [_MOTION[code[i]], tables["X"][0][cur_x[i]], tables["Y"][0][cur_y[i]]]
+    if code[i] >= 2:
+        words += [tables["I"][0][cur_i[i]], tables["J"][0][cur_j[i]]]
+    if code[i] != 0:
+        words.append(tables["F"][0][f_word[i]])
+    body = "".join(w + " " for w in words if w) + "\n"
+    return prefixes[pre[i]] + body.replace(" \n", "\n")
+
+
+#   Toolpath files. With --toolpath the Path commands of every object handed to
+#   the post are saved next to the output, part.toolpath for part.nc, and
+#   load_toolpath() gives back objects the post takes like FreeCAD's own, so the
+#   same part comes out for other laser codes, units or precision without the
+#   document. The file is "LPTP", the length of a json header, the header, and
+#   three arrays each on an 8 byte boundary: the name of every command as an
+#   index into the names of the header, a bit mask of its parameters, and the
+#   values of all parameters one after the other in the order of the parameter
+#   names. The arrays are mapped, not read; runs of plain moves go from them into
+#   the columnar engine as they are, the rest becomes commands again.
+
+_TOOLPATH_MAGIC = b"LPTP"
+_TOOLPATH_VERSION = 1
+_TOOLPATH_ARRAYS = (("code", "<i4"), ("mask", "<u8"), ("values", "<f8"))
+
+
+class _ToolpathObject:
+
+    # just what the post reads from an operation, Active and CoolantMode as in effect
+    def __init__(self, data, path):
+        self.Name = data["Name"]
+        self.Label = data["Label"]
+        for prop in ("Active", "CoolantMode"):
+            if prop in data:
+                setattr(self, prop, data[prop])
+        if "Group" in data:
+            self.Group = [_ToolpathObject(child, path) for child in data["Group"]]
+        self.Path = _ToolpathPath(path, *data.get("rows", (0, 0, 0, 0)))
+
+
+class _ToolpathPath:
+
+    # the rows start to end of a toolpath file, values first to last
+    def __init__(self, path, start, end, first, last):
+        self.names = path["names"]
+        self.params = path["params"]
+        self.code = path["code"][start:end]
+        self.mask = path["mask"][start:end]
+        self.values = path["values"][first:last]
+        self.Size = end - start
+        self._starts = None
+
+    @property
+    def Commands(self):
+        return [types.SimpleNamespace(Name=name, Parameters=params) for name, params in self.commands()]
+
+    def starts(self):
+        # where the values of each row begin, and the end of the last
+        if self._starts is None:
+            self._starts = np.zeros(self.Size + 1, dtype=np.int64)
+            np.cumsum(_bit_count(self.mask), out=self._starts[1:])
+        return self._starts
+
+    def commands(self, start=0, end=None):
+        end = self.Size if end is None else end
+        names = self.names
+        params = self.params
+        keys = {}
+        values = self.values[self.starts()[start] : self.starts()[end]].tolist()
+        k = 0
+        for code, mask in zip(self.code[start:end].tolist(), self.mask[start:end].tolist()):
+            ks = keys.get(mask)
+            if ks is None:
+                ks = keys[mask] = tuple(p for b, p in enumerate(params) if mask >> b & 1)
+            yield names[code], dict(zip(ks, values[k : k + len(ks)]))
+            k += len(ks)
+
+    def digest(self):
+        digest = hashlib.sha256(repr((self.names, self.params)).encode())
+        for data in (self.code, self.mask, self.values):
+            digest.update(data.tobytes())
+        return digest.hexdigest()
+
+
+class _Moves:
+
+    # a run of plain moves as arrays, a block for _columnar_units(): code indexes
+    # _MOTION, present and values have a column each for X, Y, Z, I, J and F
+    def __init__(self, code, present, values):
+        self.code = code
+        self.present = present
+        self.values = values
+
+    def __len__(self):
+        return len(self.code)
+
+    def __getitem__(self, cut):
+        return _Moves(self.code[cut], self.present[cut], self.values[cut])
+
+    def __iter__(self):
+        for code, present, values in zip(self.code.tolist(), self.present.tolist(), self.values.tolist()):
+            yield _MOTION[code], {k: v for k, p, v in zip("XYZIJF", present, values) if p}
+
+
+def _bit_count(mask):
+    bits = np.unpackbits(mask.astype("<u8").view(np.uint8).reshape(-1, 8), axis=1)
+    return bits.sum(axis=1, dtype=np.int64)
+
+
+def save_toolpath(objectslist, filename):
+
+    #   Writes the objects export() would get to a toolpath file. Can be called
+    #   from the FreeCAD python console as well.
+
+    _write_toolpath(PostProcessor(), objectslist, filename)
+
+
+def _write_toolpath(post, objectslist, filename):
+
+    # the progress of the writing is counted for post
+    names = {}
+    params = set()
+    paths = []
+
+    def walk(obj):
+        data = {"Name": obj.Name, "Label": obj.Label}
+        base = getattr(obj, "Base", None)
+        if hasattr(obj, "Active") or hasattr(base, "Active"):
+            data["Active"] = bool(getattr(obj, "Active", True) and getattr(base, "Active", True))
+        if hasattr(obj, "CoolantMode") or hasattr(base, "CoolantMode"):
+            data["CoolantMode"] = getattr(obj, "CoolantMode", getattr(base, "CoolantMode", "None"))
+        if hasattr(obj, "Group"):
+            data["Group"] = [walk(child) for child in obj.Group]
+        elif hasattr(obj, "Path"):
+            commands = [(c.Name, c.Parameters) for c in obj.Path.Commands]
+            for name, parameters in commands:
+                names.setdefault(name, len(names))
+                params.update(parameters)
+            paths.append((data, commands))
+        return data
+
+    objects = [walk(obj) for obj in objectslist]
+    params = sorted(params)
+    if len(params) > 64:
+        raise ValueError("more than 64 parameter names")
+    bit = {p: 1 << b for b, p in enumerate(params)}
+    code = array.array("i")
+    mask = array.array("Q")
+    values = array.array("d")
+    orders = {}  # bit mask and parameter names in file order, per set of keys seen
+    for data, commands in paths:
+        data["rows"] = [len(code), len(code) + len(commands), len(values)]
+        for name, parameters in commands:
+            keys = tuple(parameters)
+            order = orders.get(keys)
+            if order is None:
+                order = orders[keys] = sum(bit[p] for p in keys), sorted(keys)
+            code.append(names[name])
+            mask.append(order[0])
+            values.extend([float(parameters[p]) for p in order[1]])
+        data["rows"].append(len(values))
+
+    arrays = {"code": code, "mask": mask, "values": values}
+    if sys.byteorder != "little":
+        for data in arrays.values():
+            data.byteswap()
+    header = {"version": _TOOLPATH_VERSION, "names": list(names), "params": params, "objects": objects, "arrays": {}}
+    offset = 0
+    for name, dtype in _TOOLPATH_ARRAYS:
+        size = len(arrays[name]) * arrays[name].itemsize
+        header["arrays"][name] = [offset, len(arrays[name])]
+        offset += -(-size // 8) * 8
+    text = json.dumps(header).encode()
+    text += b" " * (-len(text) % 8)
+
+    def chunks():
+        yield _TOOLPATH_MAGIC + len(text).to_bytes(4, "little") + text
+        for name, dtype in _TOOLPATH_ARRAYS:
+            data = arrays[name].tobytes()
+            yield data + b"\0" * (-len(data) % 8)
+
+    write_output(post, filename, chunks(), binary=True)
+
+
+def load_toolpath(filename):
+
+    #   The objects of a toolpath file, to post with export(). The file stays
+    #   mapped for as long as they are around.
+    if np is None:
+        raise ValueError("numpy is not available, cannot read " + filename)
+    with pyopen(filename, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if data[:4] != _TOOLPATH_MAGIC:
+        raise ValueError(filename + " is not a toolpath file")
+    size = int.from_bytes(data[4:8], "little")
+    header = json.loads(data[8 : 8 + size])
+    if header.get("version") != _TOOLPATH_VERSION:
+        raise ValueError("unknown toolpath version %r" % header.get("version"))
+    path = {"names": header["names"], "params": header["params"]}
+    for name, dtype in _TOOLPATH_ARRAYS:
+        offset, count = header["arrays"][name]
+        path[name] = np.frombuffer(data, dtype=dtype, count=count, offset=8 + size + offset)
+    return [_ToolpathObject(obj, path) for obj in header["objects"]]
+
+
+def _toolpath_records(post, path):
+
+    # as _parse_records() does for FreeCAD's commands, with the runs of plain
+    # moves cut out of the arrays instead of out of the commands
+    if post.FIT_TOLERANCE > 0 or not _use_columnar(post, always=True):
+        commands = path.commands()
+        if post._task is not None:
+            commands = _counted(post, commands)
+        if post.FIT_TOLERANCE > 0:
+            commands = _fit_moves(post, commands)
+        if _use_columnar(post):
+            yield from _columnar_runs(post, commands)
+        else:
+            yield from _format_records(post, commands)
+        return
+
+    params = path.params
+    motion = np.array([_MOTION.index(name) if name in _MOTION else -1 for name in path.names], dtype=np.int8)
+    other = sum(1 << b for b, p in enumerate(params) if p not in _COLUMN_KEYS)
+    plain = (motion[path.code] >= 0) & ((path.mask & np.uint64(other)) == 0)
+
+    # runs of plain rows, kept if long enough
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], plain.view(np.int8), [0]))))
+    runs = [(a, b) for a, b in zip(edges[0::2].tolist(), edges[1::2].tolist()) if b - a >= _COLUMNAR_MIN_RUN]
+
+    starts = path.starts()
+    done = 0
+    for a, b in runs + [(path.Size, path.Size)]:
+        if done < a:
+            yield from _format_records(post, path.commands(done, a))
+        if a < b:
+            mask = path.mask[a:b]
+            present = np.zeros((b - a, 6), dtype=bool)
+            values = np.zeros((b - a, 6), dtype=np.float64)
+            for k, letter in enumerate("XYZIJF"):
+                if letter not in params:
+                    continue
+                n = params.index(letter)
+                present[:, k] = mask >> np.uint64(n) & np.uint64(1)
+                rank = _bit_count(mask & np.uint64((1 << n) - 1))
+                rows = np.flatnonzero(present[:, k])
+                values[rows, k] = path.values[starts[a:b][rows] + rank[rows]]
+            yield _Moves(motion[path.code[a:b]], present, values)
+        _progress(post, commands=b - done)
+        done = b
+
+
+#   Raster engraving. A grayscale image is engraved after the operations, one
+#   scanline per row of pixels, back and forth. The image is resampled to
+#   RASTER_DPI over RASTER_SIZE and its darkness is cut into RASTER_LEVELS power
+#   levels, the lightest of which is off. Pixels of one level next to each other
+#   become a single move, rows without a lit pixel are skipped and every row only
+#   runs from its first to its last lit pixel, plus RASTER_OVERSCAN on both ends
+#   at power 0 so the head is up to speed when it burns, as far as the bed goes.
+#   The power goes into each move as a word like LASER_POWER, S450. A LASER_POWER
+#   without a number cannot be scaled; then the lit pixels are switched with
+#   LASER_ON and LASER_OFF.
+#   Lengths and the feed are in mm and converted for --inches.
+
+_RASTER_ROWS = 256  # scanlines turned into text at a time
+_RASTER_POWER = re.compile(r"([A-Z])(\d+\.?\d*)")
+
+
+class _Raster:
+
+    # the image as power levels, row 0 at the bottom, for _raster_units()
+    def __init__(self, levels, pitch, label):
+        self.levels = levels
+        self.pitch = pitch
+        self.label = label
+
+
+def _raster_records(post):
+    if post._raster is None:
+        return
+    if post.OUTPUT_COMMENTS:
+        yield post.linenumber() + "(begin operation: %s)\n" % post._raster.label
+        yield post.linenumber() + "(machine units: %s)\n" % (post.UNIT_SPEED_FORMAT)
+    for line in post.PRE_OPERATION.splitlines(True):
+        yield post.linenumber() + line
+    yield post._raster
+    if post.OUTPUT_COMMENTS:
+        yield post.linenumber() + "(finish operation: %s)\n" % post._raster.label
+    for line in post.POST_OPERATION.splitlines(True):
+        yield post.linenumber() + line
+
+
+def _raster_load(post, source):
+
+    if np is None:
+        raise ValueError("raster engraving needs numpy")
+    if isinstance(source, str):
+        gray = _raster_gray(source)
+        label = "raster " + os.path.basename(source)
+    else:
+        gray = np.asarray(source, dtype=np.float32)
+        label = "raster"
+    if gray.ndim != 2 or not gray.size:
+        raise ValueError("the image has to be a 2D array of gray values")
+
+    rows, cols = gray.shape
+    width, height = post.RASTER_SIZE
+    if not width and not height:
+        width, height = cols * 25.4 / post.RASTER_DPI, rows * 25.4 / post.RASTER_DPI
+    elif not height:
+        height = width * rows / cols
+    elif not width:
+        width = height * cols / rows
+    cols = max(int(round(width * post.RASTER_DPI / 25.4)), 1)
+    rows = max(int(round(height * post.RASTER_DPI / 25.4)), 1)
+    gray = _raster_resample(gray, rows, cols)
+
+    top = post.RASTER_LEVELS - 1
+    levels = np.rint((255.0 - np.clip(gray, 0.0, 255.0)) * (top / 255.0)).astype(np.uint8)
+    return _Raster(levels[::-1], (width / cols, height / rows), label)
+
+
+@functools.lru_cache(maxsize=None)
+def _qt():
+
+    # Qt for the preview dialog and for images other than PGM and PPM: the
+    # PySide FreeCAD provides, or PySide6 and PySide2 run outside of it. Only
+    # imported once one of them is needed; None when there is no Qt at all
+    for binding in ("PySide", "PySide6", "PySide2"):
+        try:
+            QtGui = __import__(binding + ".QtGui", fromlist=["QtGui"])
+        except ImportError:
+            continue
+        try:
+            QtWidgets = __import__(binding + ".QtWidgets", fromlist=["QtWidgets"])
+        except ImportError:
+            QtWidgets = QtGui  # Qt4 keeps the widgets in QtGui
+        return QtGui, QtWidgets
+    return None
+
+
+def _raster_gray(filename):
+
+    # gray values from 0 (black) to 255, row 0 at the top
+    with pyopen(filename, "rb") as f:
+        data = f.read()
+    if data[:2] in (b"P2", b"P3", b"P5", b"P6"):
+        return _raster_pnm(data)
+    qt = _qt()
+    if qt is None:
+        raise ValueError(
+            "%s is not a PGM or PPM image, and PNG, JPEG, BMP and the rest need PySide, PySide6 or PySide2" % filename
+        )
+    QtGui = qt[0]
+    image = QtGui.QImage(filename)
+    if image.isNull():
+        formats = b", ".join(bytes(name) for name in QtGui.QImageReader.supportedImageFormats()).decode()
+        raise ValueError("%s is not an image Qt can read, it reads PGM, PPM, %s" % (filename, formats))
+    image = image.convertToFormat(QtGui.QImage.Format_ARGB32)
+    rows, cols = image.height(), image.width()
+    pixels = np.frombuffer(image.constBits(), np.uint8, image.bytesPerLine() * rows)
+    pixels = pixels.reshape(rows, -1)[:, : 4 * cols].reshape(rows, cols, 4).astype(np.float32)
+    if sys.byteorder == "little":
+        pixels = pixels[:, :, ::-1]  # stored as B, G, R, A
+    # transparent parts count as white
+    alpha = pixels[:, :, 0] / 255.0
+    return _raster_luma(pixels[:, :, 1:]) * alpha + 255.0 * (1.0 - alpha)
+
+
+def _raster_pnm(data):
+
+    # binary or plain text PGM (P5, P2) and PPM (P6, P3)
+    header = re.compile(rb"(?:\s|#[^\n]*\n)*(\d+)")
+    pos = 2
+    fields = []
+    for _ in range(3):
+        match = header.match(data, pos)
+        if match is None:
+            raise ValueError("broken PGM/PPM header")
+        fields.append(int(match.group(1)))
+        pos = match.end()
+    cols, rows, maxval = fields
+    channels = 3 if data[1:2] in b"36" else 1
+    count = rows * cols * channels
+    if data[1:2] in b"56":
+        values = np.frombuffer(data, ">u2" if maxval > 255 else np.uint8, count, pos + 1)
+    else:
+        values = np.array(data[pos:].split()[:count], dtype=np.float32)
+        if len(values) < count:
+            raise ValueError("the image data is cut short")
+    pixels = values.reshape(rows, cols, channels).astype(np.float32) * (255.0 / maxval)
+    return _raster_luma(pixels) if channels == 3 else pixels[:, :, 0]
+
+
+def _raster_luma(rgb):
+    return rgb[:, :, 0] * 0.299 + rgb[:, :, 1] * 0.587 + rgb[:, :, 2] * 0.114
+
+
+def _raster_resample(gray, rows, cols):
+
+    # Every new pixel is the mean of the old ones it covers, or a copy of the
+    # nearest one when the image is enlarged.
+    for axis, size in ((0, rows), (1, cols)):
+        old = gray.shape[axis]
+        if size == old:
+            continue
+        starts = np.arange(size) * old // size
+        counts = np.maximum(np.diff(np.append(starts, old)), 1).astype(np.float32)
+        gray = np.add.reduceat(gray, starts, axis=axis)
+        gray /= counts.reshape((-1, 1) if axis == 0 else (1, -1))
+    return gray
+
+
+def _raster_units(post, raster):
+
+    scale = 25.4 if post.UNITS == "G20" else 1.0
+    fmt = "." + str(post.PRECISION) + "f"
+    levels = raster.levels
+    top = post.RASTER_LEVELS - 1
+    cols = levels.shape[1]
+    width, height = raster.pitch
+    x0, y0 = post.RASTER_ORIGIN
+
+    # With --compact the lines are written short right away and the compact pass
+    # lets them through. Reordered or split cuts are read again by the compact pass
+    # anyway.
+    compact = post.COMPACT_OUTPUT and not post.ORDER_CUTS and post.SPLIT_PROGRAMS == 1
+
+    def short(text):
+        if not compact:
+            return text
+        return "".join(_compact_line(line, {}) for line in text.splitlines(True))
+
+    match = _RASTER_POWER.fullmatch(post.LASER_POWER)
+    if post.LASER_POWER == "S0":
+        letter, power = "S", 0.0
+    elif match:
+        letter, power = match.group(1), float(match.group(2))
+    else:
+        letter = None
+    laser_on = f"{post.LASER_ON} {post.LASER_POWER}\n".replace(" \n", "\n")
+    laser_off = short(f"{post.LASER_OFF}\n")
+
+    # the X word of every pixel edge
+    edges = ["X" + format(x, fmt) for x in ((x0 + np.arange(cols + 1) * width) / scale).tolist()]
+    if letter is not None:
+        power = post.RASTER_POWER or power or 1000.0
+        whole = power == int(power)
+        words = [
+            short(" " + letter + (str(int(round(power * k / top))) if whole else format(power * k / top, fmt)) + "\n")
+            for k in range(top + 1)
+        ]
+        # the laser stays on at power 0 from the lead in to the lead out, a
+        # compact move does not need its G1 again
+        moves = [short(x + "\n")[:-1] for x in edges] if compact else ["G1 " + x for x in edges]
+        lead_in = f"{post.LASER_ON} {letter}0\n"
+        lead_out = ("", " " + letter + "0\n" + laser_off)
+    else:
+        # on from half power up, every lit move then follows an unlit one and
+        # the other way round
+        levels = (2 * levels.astype(np.int16) >= top).view(np.uint8)
+        words = [laser_off, short(laser_on)]
+        moves = [short("G1 " + x + "\n") for x in edges]
+        lead_in = ""
+        lead_out = (laser_off, "\n")
+    words = np.array(words, dtype=object)
+    moves = np.array(moves, dtype=object)
+    feed = "F" + format(post.RASTER_FEED / scale, fmt)
+
+    # the overscan stops at the edges of the bed, a line that burns up to an
+    # edge gets up to speed over what is left
+    overscan = post.RASTER_OVERSCAN / scale
+    bed = (float(post.CORNER_MIN["x"]) / scale, float(post.CORNER_MAX["x"]) / scale)
+    lit_rows = np.flatnonzero(levels.any(axis=1))
+    for start in range(0, len(lit_rows), _RASTER_ROWS):
+        picked = lit_rows[start : start + _RASTER_ROWS]
+        block = levels[picked]
+        n = len(picked)
+        lit = block > 0
+        first = lit.argmax(axis=1)
+        last = cols - lit[:, ::-1].argmax(axis=1)
+
+        # runs start at column 0 and wherever the level changes, the margins go
+        change = np.ones(block.shape, dtype=bool)
+        change[:, 1:] = block[:, 1:] != block[:, :-1]
+        row, col = np.nonzero(change)
+        end = np.empty_like(col)
+        end[:-1] = col[1:]
+        end[np.append(row[1:] != row[:-1], True)] = cols
+        keep = (col >= first[row]) & (col < last[row])
+        row, col, end = row[keep], col[keep], end[keep]
+
+        # every other row runs right to left, through its runs backwards
+        counts = np.bincount(row, minlength=n)
+        offsets = np.cumsum(counts) - counts
+        back = (start + row) % 2 == 1
+        index = np.arange(len(row))
+        order = np.where(back, 2 * offsets[row] + counts[row] - 1 - index, index)
+        target = np.where(back, col, end)[order]
+        kind = block[row, col][order]
+        if letter is not None:
+            lines = moves[target] + words[kind]
+        else:
+            lines = words[kind] + moves[target]
+
+        # a lead in and a lead out around the runs of each row
+        pieces = np.empty(len(lines) + 2 * n, dtype=object)
+        heads = offsets + 2 * np.arange(n)
+        pieces[index + 2 * row + 1] = lines
+        ys = ((y0 + (picked + 0.5) * height) / scale).tolist()
+        lefts = (x0 + first * width) / scale
+        rights = (x0 + last * width) / scale
+        before = np.minimum(lefts, np.maximum(lefts - overscan, bed[0])).tolist()
+        after = np.maximum(rights, np.minimum(rights + overscan, bed[1])).tolist()
+        lefts = lefts.tolist()
+        rights = rights.tolist()
+        for k in range(n):
+            if (start + k) % 2:
+                begin, burn, finish = after[k], rights[k], before[k]
+            else:
+                begin, burn, finish = before[k], lefts[k], after[k]
+            pieces[heads[k]] = short(
+                "G0 X" + format(begin, fmt) + " Y" + format(ys[k], fmt) + "\n" + lead_in
+                + "G1 X" + format(burn, fmt) + " " + feed + "\n"
+            )
+            pieces[heads[k] + counts[k] + 1] = lead_out[0] + short("G1 X" + format(finish, fmt) + lead_out[1])
+        text = "".join(pieces.tolist())
+        yield _Compacted(text) if compact else text
+
+
+#   Operation jobs. Each operation can be posted on its own, by a forked worker
+#   or ahead of time into the cache, starting from a fresh laser state. What the
+#   job cannot know yet it notes next to its lines: which laser on lines it wrote
+#   while the power was not captured, and up to which line it wrote arcs with no
+#   I or J word of its own, which would have taken those of the operation before.
+#   The job also keeps its state after each of the first records. At the seam
+#   those records are replayed from the real state until both states agree; from
+#   there on the job's lines are the real ones, with the power filled in. An
+#   operation that never lines up is simply posted again in place.
+
+_PARALLEL_SYNC = 16  # records replayed at most to line up an operation
+_CACHE_VERSION = 2  # bump when the output of a job changes
+_WORKER = None  # in a worker process, the PostProcessor it posts for
+
+
+def _use_jobs(post, objectslist):
+    return (
+        (post.CACHE_OUTPUT or post.JOBS > 1 and len(objectslist) > 1)
+        and not post.OUTPUT_LINE_NUMBERS
+        and (not post.POST_OPERATION or post.POST_OPERATION.endswith("\n"))
+    )
+
+
+def _job_units(post, objectslist):
+
+    state = _laser_state()
+    yield from _laser_units(post, _join_partial(post, _header_records(post)), state)
+
+    # The jobs start from the power the header leaves. While that is S0 the
+    # first operation with an S word captures it, and the jobs that wrote S0
+    # before it are filled in at the seam.
+    post._job_power = post.LASER_POWER
+
+    if post.CACHE_OUTPUT:
+        keys = []
+        for obj in objectslist:
+            keys.append(_operation_key(post, obj))
+            _progress(post)
+    else:
+        keys = [None] * len(objectslist)
+    todo = [n for n, key in enumerate(keys) if key is None or not os.path.exists(_cache_path(post, key))]
+
+    pool = None
+    toolpath = None
+    if post.JOBS > 1 and len(todo) > 1 and _can_fork():
+        # the workers are forked with this post and find the objects on it
+        post._pool_objects = [(objectslist[n], keys[n]) for n in todo]
+        pool = ProcessPoolExecutor(
+            post.JOBS, mp_context=multiprocessing.get_context("fork"),
+            initializer=_fork_worker, initargs=(post,),
+        )
+    elif post.JOBS > 1 and len(todo) > 1:
+        context = _spawn_context()
+        if context is not None:
+            # No fork to be had, the workers start afresh and read the
+            # operations from a toolpath file, with the settings of this post.
+            toolpath = _spawn_toolpath(post, [objectslist[n] for n in todo])
+            pool = ProcessPoolExecutor(
+                post.JOBS, mp_context=context,
+                initializer=_spawn_worker, initargs=(toolpath, [keys[n] for n in todo], _spawn_settings(post)),
+            )
+    if pool is not None:
+        posted = _pool_results(post, pool, [pool.submit(_pool_job, index) for index in range(len(todo))], objectslist, keys, todo)
+    else:
+        posted = (_post_operation(post, objectslist[n], keys[n]) for n in todo)
+
+    finished = False
+    try:
+        todo = set(todo)
+        for n, obj in enumerate(objectslist):
+            _profile_operation(post, obj)
+            if n in todo:
+                job = next(posted)
+            else:
+                job = _cache_load(post, keys[n]) or _post_operation(post, obj, keys[n])
+            yield from _stitch(post, obj, job, state)
+            _progress(post, operations=1)
+        finished = True
+    finally:
+        if pool is not None:
+            # a cancelled post does not wait for the operations still being posted
+            pool.shutdown(wait=finished, cancel_futures=True)
+        if toolpath is not None:
+            try:
+                os.remove(toolpath)
+            except OSError:
+                pass
+        post._pool_objects = None
+
+    yield from _laser_units(post, _join_partial(post, itertools.chain(_raster_records(post), _footer_records(post))), state)
+
+    if post.CACHE_OUTPUT:
+        _cache_trim(post)
+
+
+def _sync_key(state):
+
+    # Z is stored but never looked at again, so it is left out, and so is the
+    # last line, which may still need its power
+    cur = state["cur"]
+    prev = state["prev"]
+    return (
+        cur["LASER"], cur["G"], cur["X"], cur["Y"], cur["F"],
+        prev["LASER"], prev["G"], prev["X"], prev["Y"], prev["F"],
+        state["g_word"], state["x_word"], state["y_word"], state["f_word"],
+    )
+
+
+def _snapshot(post, state, count):
+    job = post._job
+    hits = list(post._profile["rules"].values())
+    return (
+        _sync_key(state), state["prev_line"], job["prev_powered"],
+        state["i_word"], state["j_word"], post.LASER_POWER, count, hits,
+    )
+
+
+def _pool_job(index):
+    return _post_operation(_WORKER, *_WORKER._pool_objects[index])
+
+
+def _fork_worker(post):
+
+    global _WORKER
+
+    _WORKER = post
+
+
+def _can_fork():
+
+    # A fork copies only the thread that forks, and a lock some other thread
+    # holds at that moment stays locked in the worker for good, so nothing is
+    # forked inside the FreeCAD GUI, which runs threads of Qt and Coin, nor
+    # while any other Python thread runs, a BackgroundExport's own included.
+    # The work is pickled by name, so the module must be the one imported
+    # under its name.
+    return (
+        "fork" in multiprocessing.get_all_start_methods()
+        and not FreeCAD.GuiUp
+        and threading.active_count() == 1
+        and getattr(sys.modules.get(__name__), "_pool_job", None) is _pool_job
+    )
+
+
+#   Where there is no fork the workers are spawned: a new Python imports this
+#   module by its name, takes the settings of the post and reads the operations
+#   from a toolpath file, the same form --toolpath saves. Inside FreeCAD
+#   sys.executable is FreeCAD itself, so the Python that comes with it is
+#   started instead. A worker that cannot start, or a module that cannot be
+#   imported by its name, leaves the operations to this process with a note.
+
+
+def _spawn_context():
+    note = None
+    if np is None:
+        note = "numpy is not available"
+    elif getattr(sys.modules.get(__name__), "_spawn_worker", None) is not _spawn_worker:
+        note = "the post is not imported as " + __name__
+    else:
+        python = _spawn_python()
+        if python is None:
+            note = "no Python found next to " + sys.executable
+    if note is not None:
+        print("--jobs posts on this process alone, %s" % note)
+        return None
+    context = multiprocessing.get_context("spawn")
+    context.set_executable(python)
+    return context
+
+
+def _spawn_python():
+    here = os.path.dirname(sys.executable)
+    for python in (sys.executable, os.path.join(here, "python.exe"), os.path.join(here, "python3"), os.path.join(here, "python")):
+        if os.path.basename(python).lower().startswith("python") and os.path.isfile(python):
+            return python
+    return None
+
+
+def _spawn_settings(post):
+    settings = {name: getattr(post, name) for name in _SETTINGS}
+    settings["_job_power"] = post._job_power
+    return settings
+
+
+def _spawn_toolpath(post, objectslist):
+
+    # written here, not counted as output
+    fd, filename = tempfile.mkstemp(".toolpath", "laser_post_")
+    os.close(fd)
+    task, post._task = post._task, None
+    try:
+        _write_toolpath(post, objectslist, filename)
+    except BaseException:
+        os.remove(filename)
+        raise
+    finally:
+        post._task = task
+    return filename
+
+
+def _spawn_worker(toolpath, keys, settings):
+
+    global _WORKER
+
+    post = PostProcessor()
+    for name, value in settings.items():
+        setattr(post, name, value)
+    post._pool_objects = list(zip(load_toolpath(toolpath), keys))
+    _WORKER = post
+
+
+def _pool_results(post, pool, futures, objectslist, keys, todo):
+
+    # the operations in order, posted here from where the pool broke down
+    for future, n in zip(futures, todo):
+        try:
+            yield future.result()
+        except BrokenProcessPool:
+            print("--jobs posts on this process alone, the workers stopped")
+            pool.shutdown(wait=False, cancel_futures=True)
+            break
+    else:
+        return
+    for n in todo[todo.index(n):]:
+        yield _post_operation(post, objectslist[n], keys[n])
+
+
+def _post_operation(post, obj, key=None):
+
+    # The lines each rule drops are counted with the job, whether --profile
+    # asks for them or not, so a job from the cache has them too. Only the
+    # lines the seam keeps go into the profile.
+    power = post.LASER_POWER
+    profile = post._profile
+    post.LASER_POWER = post._job_power
+    post._profile = {"rules": dict.fromkeys(_PROFILE_RULES, 0)}
+    post._job = job = {"units": [], "powered": [], "prev_powered": False, "tainted": 0}
+    try:
+        state = _laser_state()
+
+        records = iter(_join_partial(post, _operation_records(post, obj)))
+        head = []
+        for rec in records:
+            if rec.__class__ is list or rec.__class__ is _Moves:
+                # only the start of a run goes into the head
+                need = _PARALLEL_SYNC - len(head)
+                head.extend(_format_records(post, rec[:need]))
+                if len(rec) > need:
+                    records = itertools.chain((rec[need:],), records)
+                break
+            head.append(rec)
+            if len(head) == _PARALLEL_SYNC:
+                break
+        head = [_render(post, rec) for rec in head]
+
+        # one unit at a time, the lines note where they go in units
+        units = job["units"]
+        snapshots = [_snapshot(post, state, 0)]
+        for rec in head:
+            for unit in _laser_units(post, (rec,), state):
+                units.append(unit)
+            snapshots.append(_snapshot(post, state, len(units)))
+        for unit in _laser_units(post, records, state):
+            units.append(unit)
+
+        done = (
+            units, head, snapshots, state, post.LASER_POWER,
+            job["powered"], job["prev_powered"], job["tainted"], list(post._profile["rules"].values()),
+        )
+    finally:
+        post.LASER_POWER = power
+        post._profile = profile
+        post._job = None
+
+    if key is not None:
+        _cache_store(post, key, done)
+    return done
+
+
+def _stitch(post, obj, job, state):
+
+    units, head, snapshots, done, power, powered, prev_powered, tainted, hits = job
+    entry_power = post.LASER_POWER
+
+    # A job posted with S0 while an operation before it captured the power wrote
+    # S0 on the laser on lines that come before its own capture. It only fits if
+    # it captures nothing or the same power.
+    job_on = f"{post.LASER_ON} {post._job_power}\n".replace(" \n", "\n")
+    laser_on = f"{post.LASER_ON} {entry_power}\n".replace(" \n", "\n")
+    fill = entry_power != post._job_power
+
+    def filled(unit):
+        return laser_on + unit[len(job_on):]
+
+    # the replayed records count their rules as they go, the job's own lines
+    # count from where they are taken on
+    counted = dict(post._profile["rules"]) if post._profile is not None else None
+    trial = {key: value.copy() if value.__class__ is dict else value for key, value in state.items()}
+    replayed = []
+    for n, (key, prev_line, at_powered, i_word, j_word, at_power, count, at_hits) in enumerate(snapshots):
+        if n:
+            replayed.extend(_laser_units(post, (head[n - 1],), trial))
+        if fill and at_powered:
+            prev_line = filled(prev_line)
+        if (
+            tainted <= count
+            and key == _sync_key(trial)
+            and prev_line == trial["prev_line"]
+            and i_word in ("", trial["i_word"])
+            and j_word in ("", trial["j_word"])
+            and (
+                at_power in (post._job_power, entry_power) and power in (post._job_power, entry_power)
+                if fill else at_power == post.LASER_POWER
+            )
+        ):
+            break
+    else:
+        post.LASER_POWER = entry_power
+        if counted is not None:
+            post._profile["rules"] = counted
+        yield from _laser_units(post, _join_partial(post, _operation_records(post, obj)), state)
+        return
+
+    _profile_rules(post, [total - at for total, at in zip(hits, at_hits)])
+    yield from replayed
+    if fill and powered:
+        rest = units[count:]
+        for k in powered:
+            if k >= count:
+                rest[k - count] = filled(rest[k - count])
+        yield from rest
+    else:
+        yield from itertools.islice(units, count, None)
+
+    # an I or J the job never wrote is the one from before
+    done = dict(done, i_word=done["i_word"] or trial["i_word"], j_word=done["j_word"] or trial["j_word"])
+    if fill:
+        if prev_powered:
+            done["prev_line"] = filled(done["prev_line"])
+        power = entry_power
+    state.update(done)
+    post.LASER_POWER = power
+
+
+def _operation_key(post, obj):
+
+    # Hash of everything _operation_records() reads from the operation and of the
+    # settings that shape its lines. The commands are taken as toGCode() text,
+    # the same form the document stores them in.
+    if hasattr(obj, "Active") and not obj.Active:
+        return None
+    if hasattr(obj, "Base") and hasattr(obj.Base, "Active") and not obj.Base.Active:
+        return None
+    coolantMode = getattr(obj, "CoolantMode", getattr(getattr(obj, "Base", None), "CoolantMode", "None"))
+    digest = hashlib.sha256(repr((
+        _CACHE_VERSION, post._job_power, obj.Label, coolantMode,
+        post.OUTPUT_COMMENTS, post.MODAL, post.USE_TLO, post.OUTPUT_DOUBLES, post.COMMAND_SPACE,
+        post.UNITS, post.UNIT_FORMAT, post.UNIT_SPEED_FORMAT, post.PRECISION, post.FIT_TOLERANCE,
+        post.PRE_OPERATION, post.POST_OPERATION, post.TOOL_CHANGE, post.LASER_ON, post.LASER_OFF,
+    )).encode())
+    for text in _path_texts(obj):
+        digest.update(text.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _path_texts(pathobj):
+
+    # same walk as _parse_records()
+    if hasattr(pathobj, "Group"):
+        for p in pathobj.Group:
+            yield from _path_texts(p)
+        return
+    if hasattr(pathobj, "Path"):
+        yield pathobj.Path.digest() if pathobj.Path.__class__ is _ToolpathPath else pathobj.Path.toGCode()
+
+
+def _cache_dir(post):
+    if post.CACHE_DIR:
+        return post.CACHE_DIR
+    if hasattr(FreeCAD, "getUserCachePath"):
+        return os.path.join(FreeCAD.getUserCachePath(), "laser_post")
+    return os.path.join(tempfile.gettempdir(), "laser_post")
+
+
+def _cache_path(post, key):
+    return os.path.join(_cache_dir(post), key + ".json")
+
+
+def _cache_load(post, key):
+    filename = _cache_path(post, key)
+    try:
+        with pyopen(filename, "r") as cfile:
+            units, head, snapshots, *rest = json.load(cfile)
+        os.utime(filename)
+    except (OSError, ValueError):
+        return None
+    snapshots = [(tuple(key), *fields) for key, *fields in snapshots]
+    return (units, head, snapshots, *rest)
+
+
+def _cache_store(post, key, job):
+
+    # The cache is only a shortcut, a job that can not be stored is just posted
+    # again next time.
+    filename = _cache_path(post, key)
+    tmpname = "%s.%s.tmp" % (filename, os.urandom(4).hex())
+    try:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with pyopen(tmpname, "w") as cfile:
+            json.dump(job, cfile)
+        os.replace(tmpname, filename)
+    except OSError:
+        if os.path.exists(tmpname):
+            os.remove(tmpname)
+
+
+def _cache_trim(post):
+
+    # drop the least recently used entries until the cache fits in CACHE_SIZE
+    try:
+        entries = []
+        with os.scandir(_cache_dir(post)) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        size = sum(entry[1] for entry in entries)
+        for mtime, length, filename in sorted(entries):
+            if size <= post.CACHE_SIZE:
+                break
+            os.remove(filename)
+            size -= length
+    except OSError:
+        pass
+
+
+#   Shared edges. Runs over the finished laser lines, before --order-cuts.
+#   Neighbouring parts often share an edge that each of them cuts. Every straight
+#   cut is put into a grid, split into pieces no longer than a cell, and the cuts
+#   that share a cell are compared. Where a cut runs within DEDUPE_TOLERANCE of an
+#   earlier one it is not cut again: the laser goes off and the head goes on to
+#   the end of that stretch in a rapid. Stretches shorter than _DEDUPE_MIN times
+#   the tolerance are only dropped when they are the whole cut, so cuts that
+#   merely cross keep their laser on. Contours that lie where an earlier contour
+#   lay, the passes through thick material, are left alone, and so are arcs.
+#   The whole program is read before the first line is passed on.
+
+_DEDUPE_MIN = 10  # tolerances a cut has to run along an earlier one to be dropped there
+
+
+def _dedupe_cuts(post, units):
+
+    units = list(units)
+    index = []
+    ends = []
+    contours = []
+    states = []  # laser before and feed after every cut
+    contour = 0
+    pos = None
+    laser = "ON"
+    feed = ""
+    for n, unit in enumerate(units):
+        words = _move_words(unit)
+        if words is not None:
+            end = (float(words[1][1:]), float(words[2][1:]))
+            if "F" in unit:
+                for word in words[3:]:
+                    if word[0] == "F":
+                        feed = word
+            if words[0] == "G0":
+                contour += 1
+            elif words[0] == "G1" and pos is not None and end != pos:
+                index.append(n)
+                ends.append(pos + end)
+                contours.append(contour)
+                states.append((laser, feed))
+            if words[0] == "G0":
+                laser = "OFF"
+            elif words[0] != "G2":
+                laser = "ON"
+            pos = end
+        elif any(("X" in text or "Y" in text) and text[:1] != "(" for text in unit.splitlines()):
+            # a move that cannot be followed, such as a scanline
+            pos = None
+            contour += 1
+
+    stretches = {}
+    if len(ends) > 1:
+        cuts, lo, hi = _shared_stretches(np.array(ends), np.array(contours), post.DEDUPE_TOLERANCE)
+        for k, a, b in zip(cuts.tolist(), lo.tolist(), hi.tolist()):
+            stretches.setdefault(k, []).append((a, b))
+        _profile_rules(post, (0, 0, 0, 0, len(cuts)))
+    if not stretches:
+        yield from units
+        return
+
+    # "laser" follows the lines as they were, "on" as they are written now;
+    # the laser can only be off where it was on after a dropped stretch. Lines
+    # pass as they are once both agree again, up to the next shared cut.
+    laser_on = f"{post.LASER_ON} {post.LASER_POWER}\n".replace(" \n", "\n")
+    laser_off = f"{post.LASER_OFF}\n".replace(" \n", "\n")
+    fmt = "." + str(post.PRECISION) + "f"
+    laser = on = "ON"
+    rapid = None  # the rapid over dropped stretches, held until it is clear where it ends
+    n = 0
+    for k in sorted(stretches) + [None]:
+        m = len(units) if k is None else index[k]
+        while n < m and (rapid is not None or on != laser):
+            unit = units[n]
+            n += 1
+            words = _move_words(unit)
+            if words is None:
+                if rapid is not None:
+                    yield "".join(rapid)
+                    rapid = None
+                yield unit
+                continue
+            line = unit[unit.rfind("\n", 0, len(unit) - 1) + 1 :]
+            if "F" in line:
+                for word in words[3:]:
+                    if word[0] == "F":
+                        feed = word
+            if words[0] == "G0":
+                if rapid is not None:
+                    unit = rapid[0] + line
+                    rapid = None
+                elif on == "OFF":
+                    unit = line
+                laser = on = "OFF"
+            else:
+                if rapid is not None:
+                    yield "".join(rapid)
+                    rapid = None
+                if on == "OFF" and laser == "ON":
+                    unit = laser_on + line
+                    if feed and not any(word[0] == "F" for word in words):
+                        unit = unit[:-1] + " " + feed + "\n"
+                    on = "ON"
+                if words[0] != "G2":
+                    laser = on = "ON"
+            yield unit
+        if k is None:
+            yield from units[n:]
+            break
+        if n < m:
+            yield from units[n:m]
+            on = states[k][0]
+
+        # the cut in pieces, dropped and kept in turn
+        words = _move_words(units[m])
+        n = m + 1
+        laser, feed = states[k]
+        x0, y0, x1, y1 = ends[k]
+        length = math.hypot(x1 - x0, y1 - y0)
+        pieces = []
+        mark = 0.0
+        for a, b in stretches[k]:
+            if a > mark:
+                pieces.append((a, True))
+            pieces.append((b, False))
+            mark = b
+        if mark < length:
+            pieces.append((length, True))
+        for s, kept in pieces:
+            if s >= length:
+                x, y = words[1], words[2]
+            else:
+                x = "X" + format(x0 + (x1 - x0) * s / length, fmt)
+                y = "Y" + format(y0 + (y1 - y0) * s / length, fmt)
+            if kept:
+                if rapid is not None:
+                    yield "".join(rapid)
+                    rapid = None
+                text = "G1 %s %s" % (x, y)
+                if on == "OFF":
+                    text = laser_on + text + (" " + feed if feed else "")
+                else:
+                    text += "".join(" " + word for word in words[3:] if word[0] == "F")
+                on = "ON"
+                yield text + "\n"
+            else:
+                if rapid is None:
+                    rapid = (laser_off if on == "ON" else "", "")
+                rapid = (rapid[0], "G0 %s %s\n" % (x, y))
+                on = "OFF"
+        laser = "ON"
+    if rapid is not None:
+        yield "".join(rapid)
+
+
+def _move_words(unit):
+
+    # the words of the move a unit ends with, as _order_cuts() reads them
+    line = unit[unit.rfind("\n", 0, len(unit) - 1) + 1 :]
+    words = line.split()
+    if line.startswith(("G0 ", "G1 ", "G2 ", "G3 ")) and len(words) > 2 \
+            and words[1][0] == "X" and words[2][0] == "Y":
+        return words
+    return None
+
+
+def _shared_stretches(ends, contours, tol):
+
+    # ends holds x0, y0, x1, y1 of every cut in the order they are cut and
+    # contours the contour each belongs to. Returns the cuts that run along
+    # earlier ones and where those stretches start and end, as distances from
+    # the start of the cut.
+    n = len(ends)
+    start = ends[:, :2]
+    delta = ends[:, 2:] - start
+    length = np.hypot(delta[:, 0], delta[:, 1])
+    direction = delta / length[:, None]
+
+    # about a few cuts to a cell, never smaller than the stretches looked for
+    low = ends.reshape(-1, 2).min(axis=0)
+    area = np.prod(ends.reshape(-1, 2).max(axis=0) - low)
+    cell = max(min(float(np.median(length)), 4.0 * math.sqrt(area / n)), _DEDUPE_MIN * tol)
+
+    # every piece of a cut goes into the cells within tol of it
+    parts = np.ceil(length / cell).astype(np.int64)
+    owner = np.repeat(np.arange(n), parts)
+    k = (np.arange(len(owner)) - np.repeat(np.cumsum(parts) - parts, parts)) / parts[owner]
+    a = start[owner] + delta[owner] * k[:, None]
+    b = a + delta[owner] / parts[owner][:, None]
+    first = np.floor((np.minimum(a, b) - low - tol) / cell).astype(np.int64) + 1
+    last = np.floor((np.maximum(a, b) - low + tol) / cell).astype(np.int64) + 1
+    span = last - first + 1
+    count = span[:, 0] * span[:, 1]
+    owner = np.repeat(owner, count)
+    r = np.arange(len(owner)) - np.repeat(np.cumsum(count) - count, count)
+    wide = np.repeat(span[:, 0], count)
+    cx = np.repeat(first[:, 0], count) + r % wide
+    cy = np.repeat(first[:, 1], count) + r // wide
+    entry = _sorted_unique((cx * (cy.max() + 1) + cy) * n + owner)
+    key, owner = np.divmod(entry, n)
+
+    # every two cuts that share a cell, the earlier one first
+    heads = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+    size = np.diff(np.r_[heads, len(key)])
+    later = np.repeat(heads + size, size) - np.arange(len(key)) - 1
+    left = np.repeat(np.arange(len(key)), later)
+    right = left + 1 + np.arange(len(left)) - np.repeat(np.cumsum(later) - later, later)
+    pair = _sorted_unique(owner[left] * n + owner[right])
+    i, j = np.divmod(pair, n)
+
+    # a contour cut again where it was, a further pass, is no shared edge
+    heads = np.flatnonzero(np.r_[True, contours[1:] != contours[:-1]])
+    group = np.cumsum(np.r_[0, contours[1:] != contours[:-1]])
+    box = np.concatenate([
+        np.minimum.reduceat(np.minimum(ends[:, :2], ends[:, 2:]), heads),
+        np.maximum.reduceat(np.maximum(ends[:, :2], ends[:, 2:]), heads),
+    ], axis=1)
+    other = (np.abs(box[group[i]] - box[group[j]]) > tol).any(axis=1)
+    i, j = i[other], j[other]
+
+    # the stretch of j within tol of the line through i and alongside i
+    w = direction[i]
+    u = direction[j]
+    rel = start[j] - start[i]
+    lo = np.zeros(len(j))
+    hi = length[j].copy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for c0, c1, bottom, top in (
+            (w[:, 0] * rel[:, 1] - w[:, 1] * rel[:, 0], w[:, 0] * u[:, 1] - w[:, 1] * u[:, 0], -tol, tol),
+            ((w * rel).sum(axis=1), (w * u).sum(axis=1), 0.0, length[i]),
+        ):
+            flat = np.abs(c1) < 1e-12
+            s1 = np.where(flat, -np.inf, (bottom - c0) / c1)
+            s2 = np.where(flat, np.inf, (top - c0) / c1)
+            outside = flat & ((c0 < bottom) | (c0 > top))
+            lo = np.maximum(lo, np.minimum(s1, s2))
+            hi = np.minimum(hi, np.where(outside, -np.inf, np.maximum(s1, s2)))
+    keep = hi > lo
+    j, lo, hi = j[keep], lo[keep], hi[keep]
+
+    # joined per cut where they touch or overlap
+    order = np.lexsort((lo, j))
+    j, lo, hi = j[order], lo[order], hi[order]
+    if not len(j):
+        return j, lo, hi
+    offset = np.cumsum(np.r_[0, j[1:] != j[:-1]]) * (float(length.max()) + 4.0 * tol)
+    reach = np.maximum.accumulate(hi + offset) - offset
+    heads = np.flatnonzero(np.r_[True, (j[1:] != j[:-1]) | (lo[1:] > reach[:-1] + tol)])
+    j, lo, hi = j[heads], lo[heads], np.maximum.reduceat(hi, heads)
+
+    # the rest of a cut shorter than tol is not worth the laser on and off
+    full = length[j]
+    lo = np.where(lo <= tol, 0.0, lo)
+    hi = np.where(hi >= full - tol, full, hi)
+    keep = (hi - lo >= _DEDUPE_MIN * tol) | ((lo == 0.0) & (hi == full))
+    return j[keep], lo[keep], hi[keep]
+
+
+def _sorted_unique(values):
+
+    # np.unique() without its extras, a good deal quicker on large arrays
+    values = np.sort(values)
+    return values[np.r_[True, values[1:] != values[:-1]]]
+
+
+#   Cut ordering. Runs over the finished laser lines. Between two lines that are
+#   not moves (comments, tool changes, coolant) the moves are split into contours:
+#   the rapids up to a cut and the cuts that follow. The contours are put into a
+#   nearest neighbour tour over a grid of their end points, improved by 2-opt
+#   against the nearest end points, and written out again. Open contours may be
+#   cut backwards, closed ones keep their direction since that saves nothing.
+#   With INNER_FIRST a contour is never cut before the contours inside it.
+
+_ORDER_SPAN = 1000  # longest stretch of contours 2-opt reverses
+_ARC_SWAP = {"G2": "G3", "G3": "G2"}
+_ARC_STEP = math.radians(10)  # outline steps along arcs when nesting
+
+
+def _order_cuts(post, units):
+
+    # The lines after a run of moves are held back until the next move shows
+    # whether it carries on from where the run ended, the last contour then has
+    # to stay last.
+    ctx = {"laser": "ON", "feed": "", "was": "", "pos": None}
+    moves = []
+    held = []
+    for unit in units:
+        cut = unit.rfind("\n", 0, len(unit) - 1) + 1
+        line = unit[cut:]
+        words = line.split()
+        if line.startswith(("G0 ", "G1 ", "G2 ", "G3 ")) and len(words) > 2 \
+                and words[1][0] == "X" and words[2][0] == "Y":
+            if held:
+                yield from _ordered_moves(post, moves, ctx, words[0] != "G0")
+                yield from held
+                moves = []
+                held = []
+            moves.append((unit[:cut], line, words))
+        elif moves:
+            held.append(unit)
+        else:
+            yield unit
+    if moves:
+        yield from _ordered_moves(post, moves, ctx, False)
+        yield from held
+
+
+def _track(ctx, line, words):
+
+    # same laser flag as _laser_units(), G2 never switches it
+    if words[0] == "G0":
+        ctx["laser"] = "OFF"
+    elif words[0] != "G2":
+        ctx["laser"] = "ON"
+    for word in words:
+        if word[0] == "F":
+            ctx["feed"] = word
+    ctx["pos"] = (words[1], words[2])
+
+
+def _ordered_moves(post, moves, ctx, pinned):
+
+    # Cuts before the first rapid carry on from before, rapids after the last cut
+    # lead away, both stay where they are. ctx["was"] is the feed in effect at
+    # this point in the original order.
+    first = next((n for n, move in enumerate(moves) if move[2][0] == "G0"), len(moves))
+    after = max((n for n, move in enumerate(moves) if move[2][0] != "G0"), default=-1) + 1
+
+    contours = []
+    feed = ctx["was"]
+    for n, (prefix, line, words) in enumerate(moves):
+        if first <= n < after:
+            if words[0] == "G0":
+                if not contours or contours[-1]["cuts"]:
+                    contours.append({"rapids": [], "cuts": [], "feed": feed})
+                contours[-1]["rapids"].append((prefix, line, words))
+            else:
+                contours[-1]["cuts"].append((prefix, line, words))
+        for word in words:
+            if word[0] == "F":
+                feed = word
+
+    for n, (prefix, line, words) in enumerate(moves[:first]):
+        if not n:
+            line, words = _with_feed(line, words, ctx["was"], ctx)
+        _track(ctx, line, words)
+        yield prefix + line
+    ctx["was"] = feed
+
+    for contour in contours:
+        _contour_shape(contour)
+    last = contours.pop() if pinned and contours else None
+    if len(contours) > 1:
+        # with no move before, start where the first contour starts
+        start = ctx["pos"] or contours[0]["points"][0]
+        tour = _cut_tour(post, contours, start, last and last["xy"][0])
+    else:
+        tour = [(contour, False) for contour in contours]
+    if last is not None:
+        tour.append((last, False))
+    for contour, backwards in tour:
+        yield from _contour_units(post, contour, backwards, ctx)
+
+    for prefix, line, words in moves[after:]:
+        yield _rapid_unit(post, line, words, ctx)
+
+
+def _with_feed(line, words, feed, ctx):
+
+    # a cut that relied on a feed no longer in effect gets it back
+    if feed in ("", ctx["feed"]) or any(word[0] == "F" for word in words):
+        return line, words
+    line = line[:-1] + " " + feed + "\n"
+    return line, line.split()
+
+
+def _contour_shape(contour):
+
+    # Points of the contour as words and numbers, the feed each cut runs at and
+    # the arc centres, everything needed to cut it in either direction.
+    words = contour["rapids"][-1][2]
+    points = [(words[1], words[2])]
+    xy = [(float(words[1][1:]), float(words[2][1:]))]
+    feeds = []
+    centres = []
+    feed = contour["feed"]
+    fixed = False
+    for prefix, line, words in contour["cuts"]:
+        x, y = xy[-1]
+        i = j = None
+        for word in words[3:]:
+            if word[0] == "F":
+                feed = word
+            elif word[0] == "I":
+                i = float(word[1:])
+            elif word[0] == "J":
+                j = float(word[1:])
+        if words[0] in _ARC_SWAP:
+            if i is None and j is None:
+                fixed = True
+            centres.append((x + (i or 0.0), y + (j or 0.0)))
+        else:
+            centres.append(None)
+        points.append((words[1], words[2]))
+        xy.append((float(words[1][1:]), float(words[2][1:])))
+        feeds.append(feed)
+    contour["points"] = points
+    contour["xy"] = xy
+    contour["feeds"] = feeds
+    contour["centres"] = centres
+    contour["closed"] = points[0] == points[-1]
+    # a leading G2 never turns the laser on, backwards it would be cut
+    contour["fixed"] = fixed or contour["closed"] or contour["cuts"][0][2][0] == "G2"
+
+
+def _contour_units(post, contour, backwards, ctx):
+
+    if not backwards:
+        for prefix, line, words in contour["rapids"]:
+            yield _rapid_unit(post, line, words, ctx)
+        for n, (prefix, line, words) in enumerate(contour["cuts"]):
+            if not n:
+                line, words = _with_feed(line, words, contour["feeds"][0], ctx)
+            _track(ctx, line, words)
+            yield prefix + line
+        return
+
+    points = contour["points"]
+    yield _rapid_unit(post, "G0 %s %s\n" % points[-1], ["G0", points[-1][0], points[-1][1]], ctx)
+    fmt = "%." + str(post.PRECISION) + "f"
+    feed = None
+    for n in range(len(points) - 1, 0, -1):
+        g = contour["cuts"][n - 1][2][0]
+        words = [_ARC_SWAP.get(g, g), points[n - 1][0], points[n - 1][1]]
+        centre = contour["centres"][n - 1]
+        if centre is not None:
+            x, y = contour["xy"][n]
+            words.append("I" + fmt % (centre[0] - x))
+            words.append("J" + fmt % (centre[1] - y))
+        if contour["feeds"][n - 1] != feed:
+            feed = contour["feeds"][n - 1]
+            if feed:
+                words.append(feed)
+        prefix = ""
+        if ctx["laser"] == "OFF":
+            prefix = f"{post.LASER_ON} {post.LASER_POWER}\n".replace(" \n", "\n")
+        line = " ".join(words) + "\n"
+        _track(ctx, line, words)
+        ctx["laser"] = "ON"
+        yield prefix + line
+
+
+def _rapid_unit(post, line, words, ctx):
+    prefix = ""
+    if ctx["laser"] == "ON":
+        prefix = f"{post.LASER_OFF}\n".replace(" \n", "\n")
+    _track(ctx, line, words)
+    return prefix + line
+
+
+def _end_grid(contours, ends, cell):
+    grid = {}
+    for n, pair in enumerate(ends):
+        for side, (x, y) in enumerate(pair):
+            if side and contours[n]["fixed"]:
+                break
+            grid.setdefault((int(x // cell), int(y // cell)), []).append((n, side))
+    return grid
+
+
+def _cut_tour(post, contours, start, finish=None):
+
+    # Returns (contour, backwards) in cutting order, ending near finish if given.
+    count = len(contours)
+    start = (float(start[0][1:]), float(start[1][1:]))
+    ends = [(contour["xy"][0], contour["xy"][-1]) for contour in contours]
+
+    xs = [p[0] for pair in ends for p in pair] + [start[0]]
+    ys = [p[1] for pair in ends for p in pair] + [start[1]]
+    span = max(max(xs) - min(xs), max(ys) - min(ys))
+    cell = span / math.sqrt(count) or 1.0
+    reach = int(span // cell) + 2
+
+    outer = [[] for contour in contours]
+    inner = [0] * count
+    if post.INNER_FIRST:
+        _nest(contours, outer, inner)
+
+    # nearest neighbour, an end point leaves the grid once its contour is cut
+    grid = _end_grid(contours, ends, cell)
+    tour = []
+    flip = [False] * count
+    here = start
+    for step in range(count):
+        n, side = _nearest(grid, cell, reach, here, ends, inner)
+        flip[n] = bool(side)
+        for m in outer[n]:
+            inner[m] -= 1
+        for item in ((n, 0), (n, 1)):
+            x, y = ends[n][item[1]]
+            bucket = grid.get((int(x // cell), int(y // cell)), [])
+            if item in bucket:
+                bucket.remove(item)
+        tour.append(n)
+        here = ends[n][0 if flip[n] else 1]
+
+    # 2-opt over the neighbouring end points, reversing a stretch of the tour
+    # also reverses every contour in it. Only contours next to a change are
+    # looked at again.
+    grid = _end_grid(contours, ends, cell)
+    pos = {n: k for k, n in enumerate(tour)}
+
+    def enter(n):
+        return ends[n][1 if flip[n] else 0]
+
+    def leave(n):
+        return ends[n][0 if flip[n] else 1]
+
+    queue = collections.deque([None] + tour)
+    queued = set(queue)
+    while queue:
+        c = queue.popleft()
+        queued.discard(c)
+        i = -1 if c is None else pos[c]
+        if i > count - 3:
+            continue
+        o = start if c is None else leave(c)
+        cx, cy = int(o[0] // cell), int(o[1] // cell)
+        near = {m for dx in (-1, 0, 1) for dy in (-1, 0, 1) for m, side in grid.get((cx + dx, cy + dy), ())}
+        for m in near:
+            j = pos[m]
+            if j <= i + 1 or j - i > _ORDER_SPAN:
+                continue
+            a, b = tour[i + 1], tour[j]
+            old = math.dist(o, enter(a))
+            new = math.dist(o, leave(b))
+            if j + 1 < count:
+                old += math.dist(leave(b), enter(tour[j + 1]))
+                new += math.dist(enter(a), enter(tour[j + 1]))
+            elif finish is not None:
+                old += math.dist(leave(b), finish)
+                new += math.dist(enter(a), finish)
+            if new >= old - 1e-9:
+                continue
+            stretch = tour[i + 1:j + 1]
+            if post.INNER_FIRST:
+                inside = set(stretch)
+                if any(k in inside for n in stretch for k in outer[n]):
+                    continue
+            stretch.reverse()
+            tour[i + 1:j + 1] = stretch
+            for k, n in enumerate(stretch, i + 1):
+                pos[n] = k
+                flip[n] = not flip[n]
+            for n in (c, a, b):
+                if n not in queued:
+                    queue.append(n)
+                    queued.add(n)
+            break
+
+    return [(contours[n], flip[n] and not contours[n]["fixed"]) for n in tour]
+
+
+def _nearest(grid, cell, reach, point, ends, inner):
+
+    # Searches the grid ring by ring around the point. Everything in ring r is
+    # at least (r - 1) * cell away, so once the best is closer than that the
+    # search can stop. Contours with uncut contours inside them are skipped.
+    cx, cy = int(point[0] // cell), int(point[1] // cell)
+    best = None
+    best_d = math.inf
+    for r in range(reach + 1):
+        if best is not None and best_d <= (r - 1) * cell:
+            break
+        for dx in range(-r, r + 1):
+            for dy in ((-r, r) if abs(dx) != r else range(-r, r + 1)):
+                for n, side in grid.get((cx + dx, cy + dy), ()):
+                    if inner[n]:
+                        continue
+                    d = math.dist(point, ends[n][side])
+                    if d < best_d:
+                        best, best_d = (n, side), d
+    return best
+
+
+def _nest(contours, outer, inner):
+
+    # A contour lies inside a closed one when its box fits in the closed one's
+    # box and its first point is inside the outline. Closed outlines go into a
+    # grid over every cell their box touches.
+    outlines = [_outline(contour) for contour in contours]
+    boxes = []
+    for outline in outlines:
+        xs = [p[0] for p in outline]
+        ys = [p[1] for p in outline]
+        boxes.append((min(xs), min(ys), max(xs), max(ys)))
+    spans = sorted(max(box[2] - box[0], box[3] - box[1]) for box in boxes)
+    cell = spans[len(spans) // 2] or 1.0
+
+    grid = {}
+    for n, contour in enumerate(contours):
+        if contour["closed"]:
+            x0, y0, x1, y1 = boxes[n]
+            for gx in range(int(x0 // cell), int(x1 // cell) + 1):
+                for gy in range(int(y0 // cell), int(y1 // cell) + 1):
+                    grid.setdefault((gx, gy), []).append(n)
+
+    for n, contour in enumerate(contours):
+        x, y = contour["xy"][0]
+        box = boxes[n]
+        for m in grid.get((int(x // cell), int(y // cell)), ()):
+            other = boxes[m]
+            if m == n or box == other:
+                continue
+            if other[0] <= box[0] and other[1] <= box[1] and box[2] <= other[2] and box[3] <= other[3] \
+                    and _inside(x, y, outlines[m]):
+                outer[n].append(m)
+                inner[m] += 1
+
+
+def _outline(contour):
+    xy = contour["xy"]
+    outline = [xy[0]]
+    for n, centre in enumerate(contour["centres"]):
+        if centre is not None:
+            start, sweep = _arc_sweep(contour, n)
+            radius = math.dist(centre, xy[n])
+            steps = int(abs(sweep) // _ARC_STEP)
+            for k in range(1, steps + 1):
+                angle = start + sweep * k / (steps + 1)
+                outline.append((centre[0] + radius * math.cos(angle), centre[1] + radius * math.sin(angle)))
+        outline.append(xy[n + 1])
+    return outline
+
+
+def _arc_sweep(contour, n):
+
+    # start angle and signed sweep of arc cut n, a full circle when it ends
+    # where it starts
+    centre = contour["centres"][n]
+    (x0, y0), (x1, y1) = contour["xy"][n], contour["xy"][n + 1]
+    start = math.atan2(y0 - centre[1], x0 - centre[0])
+    sweep = math.atan2(y1 - centre[1], x1 - centre[0]) - start
+    if contour["cuts"][n][2][0] == "G3":
+        return start, sweep % (2 * math.pi) or 2 * math.pi
+    return start, -((-sweep) % (2 * math.pi) or 2 * math.pi)
+
+
+def _inside(x, y, outline):
+    inside = False
+    x0, y0 = outline[-1]
+    for x1, y1 in outline:
+        if (y1 > y) != (y0 > y) and x < x0 + (y - y0) * (x1 - x0) / (y1 - y0):
+            inside = not inside
+        x0, y0 = x1, y1
+    return inside
+
+
+#   Split programs. With --split the parts of a job are shared out over
+#   SPLIT_PROGRAMS programs, one for every machine of a fleet, part_1.nc to
+#   part_N.nc for part.nc. The moves are split into contours as for --order-cuts
+#   and the contours into parts: a closed contour with everything inside it, in
+#   any operation, and the further passes along the same outline. A part is timed
+#   by the length of its cuts at their feed plus a stop and start for every
+#   contour, and the parts go, the longest first, to the program with the least
+#   time so far. Every program keeps its parts in the order they had and gets
+#   every line that is not a move, the header, preamble, tool changes and
+#   postamble included; its rapids and laser switching follow from its own moves.
+#   The whole program is read before the first program is written.
+
+
+def _write_split(post, objectslist, filename):
+
+    # one program after the other, each with its own line numbers, estimate and
+    # index
+
+    stem, ext = os.path.splitext(filename)
+    programs = _profiled(post, "split", _split_units, post, _cut_stages(post, _program_units(post, objectslist)), post.SPLIT_PROGRAMS)
+    first = post.LINENR
+    names = []
+    for n, program in enumerate(programs, 1):
+        post.LINENR = first
+        units = _finish_stages(post, program)
+        if post.PRINT_LINE_NUMBERS:
+            units = _stage(post, "line_numbers", _number_lines(post, units))
+        if post.INDEX_OUTPUT:
+            units = _stage(post, "index", _index_units(post, units))
+        name = "%s_%d%s" % (stem, n, ext)
+        _profiled(post, "write", write_output, post, name, units, functools.partial(_estimate_head, post))
+        _write_estimate(post, name)
+        _write_index(post, name, _estimate_head(post))
+        _write_validation(post, name, _estimate_head(post))
+        _write_preview(post, name)
+        names.append(name)
+    return names
+
+
+def _split_units(post, units, count):
+
+    # Items are the units every program gets, contours, the rapids after the
+    # last cut of a run ("rapid", line, words) and the cuts before its first
+    # rapid, which carry on from the contour before them ("carry", contour,
+    # prefix, line, words, feed in effect).
+    items = []
+    contours = []
+    state = {"feed": "", "contour": None}
+    moves = []
+    for unit in units:
+        cut = unit.rfind("\n", 0, len(unit) - 1) + 1
+        line = unit[cut:]
+        words = line.split()
+        if line.startswith(("G0 ", "G1 ", "G2 ", "G3 ")) and len(words) > 2 \
+                and words[1][0] == "X" and words[2][0] == "Y":
+            moves.append((unit[:cut], line, words))
+            continue
+        if moves:
+            _split_moves(moves, items, contours, state)
+            moves = []
+        items.append(unit)
+    if moves:
+        _split_moves(moves, items, contours, state)
+
+    times = _split_parts(post, contours, count)
+    return [_split_program(post, items, k, count, times[k]) for k in range(count)]
+
+
+def _split_moves(moves, items, contours, state):
+
+    # the same contours _ordered_moves() makes of a run of moves
+    first = next((n for n, move in enumerate(moves) if move[2][0] == "G0"), len(moves))
+    after = max((n for n, move in enumerate(moves) if move[2][0] != "G0"), default=-1) + 1
+
+    run = []
+    feed = state["feed"]
+    for n, (prefix, line, words) in enumerate(moves):
+        if n < first:
+            items.append(("carry", state["contour"], prefix, line, words, feed))
+        elif n < after:
+            if words[0] == "G0":
+                if not run or run[-1]["cuts"]:
+                    run.append({"rapids": [], "cuts": [], "feed": feed})
+                run[-1]["rapids"].append((prefix, line, words))
+            else:
+                run[-1]["cuts"].append((prefix, line, words))
+        else:
+            items.append(("rapid", line, words))
+        for word in words:
+            if word[0] == "F":
+                feed = word
+        if n + 1 == after and run:
+            for contour in run:
+                _contour_shape(contour)
+            items.extend(run)
+            contours.extend(run)
+            state["contour"] = run[-1]
+    state["feed"] = feed
+
+
+def _split_parts(post, contours, count):
+
+    # Shares the parts out, the longest first, and marks every contour with its
+    # program. Returns the cut time of every program.
+    times = [0.0] * count
+    if not contours:
+        return times
+    outer = [[] for contour in contours]
+    _nest(contours, outer, [0] * len(contours))
+    outline = {}
+    same = [
+        outline.setdefault(tuple(contour["points"]), n) if contour["closed"] else n
+        for n, contour in enumerate(contours)
+    ]
+    seconds = {}
+    parts = []
+    for n, contour in enumerate(contours):
+        part = same[min(outer[n], key=lambda m: len(outer[m]), default=n)]
+        seconds[part] = seconds.get(part, 0.0) + _contour_seconds(post, contour)
+        parts.append(part)
+
+    program = {}
+    for part in sorted(seconds, key=seconds.get, reverse=True):
+        k = min(range(count), key=times.__getitem__)
+        program[part] = k
+        times[k] += seconds[part]
+    for contour, part in zip(contours, parts):
+        contour["program"] = program[part]
+    return times
+
+
+def _contour_seconds(post, contour):
+
+    # cut length over feed, plus the time lost braking to a stop and speeding
+    # up again at ACCELERATION
+    scale = 25.4 if post.UNITS == "G20" else 1.0
+    seconds = 0.0
+    rate = post.RAPID_RATE / scale
+    xy = contour["xy"]
+    for n, feed in enumerate(contour["feeds"]):
+        rate = float(feed[1:]) if feed else 0.0
+        if not rate > 0.0:
+            rate = post.RAPID_RATE / scale
+        if contour["centres"][n] is None:
+            length = math.dist(xy[n], xy[n + 1])
+        else:
+            length = math.dist(contour["centres"][n], xy[n]) * abs(_arc_sweep(contour, n)[1])
+        seconds += length / rate * 60.0
+    return seconds + rate * scale / 60.0 / post.ACCELERATION
+
+
+def _split_program(post, items, k, count, seconds):
+
+    # the items of program k, with a laser state of its own
+    ctx = {"laser": "ON", "feed": "", "was": "", "pos": None}
+    if post.OUTPUT_COMMENTS:
+        yield "(program %d of %d, cut time %s)\n" % (k + 1, count, _clock(seconds))
+    for item in items:
+        if item.__class__ is dict:
+            if item["program"] == k:
+                yield from _contour_units(post, item, False, ctx)
+        elif item.__class__ is not tuple:
+            yield item
+        elif item[0] == "rapid":
+            yield _rapid_unit(post, item[1], item[2], ctx)
+        elif (0 if item[1] is None else item[1]["program"]) == k:
+            tag, contour, prefix, line, words, feed = item
+            line, words = _with_feed(line, words, feed, ctx)
+            _track(ctx, line, words)
+            yield prefix + line
+
+#   Compact output. Runs over the finished laser lines, after any reordering.
+#   Lines made of nothing but gcode words lose their spaces and the trailing
+#   zeros of their numbers. Motion lines also lose a G code that is already in
+#   effect and X, Y, Z or F values the machine already has; arcs keep their axis
+#   words. Anything the pass cannot read for certain (a G code outside G0-G3,
+#   text that is not gcode) makes it forget what is in effect, so the next move
+#   is written out in full again.
+
+_COMPACT_LINE = re.compile(r"\s*(?:[A-Z]\s*[-+]?(?:\d+\.?\d*|\.\d+)\s*)+")
+_COMPACT_WORD = re.compile(r"([A-Z])\s*([-+]?[\d.]+)")
+_COMPACT_NUMBER = (
+    # 1.500 -> 1.5, 10.000 -> 10
+    (re.compile(r"(\.\d*?[1-9])0+(?!\d)|\.0*(?!\d)"), r"\1"),
+    # G01 -> G1, -0 -> 0
+    (re.compile(r"(?<![\d.])0+(?=\d)|-(?=0(?![\d.]))"), ""),
+)
+_COMPACT_MODAL = frozenset("XYZF")
+
+
+class _Compacted(str):
+
+    # text that is written short already, such as the scanlines of a raster
+    pass
+
+
+def _compact_units(units):
+
+    modal = {}
+    for unit in units:
+        if unit.__class__ is _Compacted:
+            # what it leaves in effect is not known here
+            modal.clear()
+            yield unit
+            continue
+        lines = []
+        for line in unit.splitlines(True):
+            line = _compact_line(line, modal)
+            if line:
+                lines.append(line)
+        if lines:
+            yield "".join(lines)
+
+
+def _compact_line(line, modal):
+
+    # modal holds the words in effect, "G" the motion mode
+    body = line.rstrip("\r\n")
+    if not body.strip() or body.lstrip()[0] in "(;%":
+        return line
+    if not _COMPACT_LINE.fullmatch(body):
+        modal.clear()
+        return line
+
+    for number_re, short in _COMPACT_NUMBER:
+        body = number_re.sub(short, body)
+    words = _COMPACT_WORD.findall(body)
+    codes = ["G" + value for letter, value in words if letter == "G"]
+    if codes and (len(codes) > 1 or codes[0] not in _MOTION):
+        modal.clear()
+        return "".join(letter + value for letter, value in words) + "\n"
+
+    motion = codes[0] if codes else modal.get("G")
+    if motion is None:
+        if any(letter in _COMPACT_MODAL for letter, value in words):
+            modal.clear()
+        return "".join(letter + value for letter, value in words) + "\n"
+
+    arc = motion in ("G2", "G3")
+    out = []
+    for letter, value in words:
+        if letter == "G":
+            if modal.get("G") == "G" + value:
+                continue
+            modal["G"] = "G" + value
+        elif letter in _COMPACT_MODAL:
+            if modal.get(letter) == value and (letter == "F" or not arc):
+                continue
+            modal[letter] = value
+        out.append(letter + value)
+    if not out:
+        # a move to where the machine already is
+        return ""
+    return "".join(out) + "\n"
+
+
+#   Repeated passes. Runs last over the finished lines, after the estimate has
+#   timed every pass. Once the Z moves are gone, thick material cut in several
+#   passes comes out as the same lines over and over. Where a block of lines
+#   follows itself unchanged it is written once between REPEAT_BEGIN and
+#   REPEAT_END, with {count} the number of times it ran and {n} the number of
+#   the block. The machine runs the very same lines as before, whatever the
+#   compact or modal output left out of them. Blocks up to _REPEAT_SPAN units
+#   long are found, and lines are held back that long.
+
+_REPEAT_SPAN = 100000  # longest block looked for, in units
+_REPEAT_STYLES = {
+    "linuxcnc": ("o{n} repeat [{count}]", "o{n} endrepeat"),
+    "marlin": ("M808 L{count}", "M808"),  # from the SD card only
+}
+
+
+def _repeat_units(post, units):
+
+    # Every unit is compared with the unit one period before, the period taken
+    # from where the unit was seen last. A run of equal units at least a period
+    # long holds the block twice or more.
+    held = []  # units not written yet, the first one is unit number base
+    base = 0
+    seen = {}
+    period = 0
+    run = 0  # first unit equal to the one a period before
+    blocks = 0
+    for i, unit in enumerate(itertools.chain(units, (None,))):
+        if period and unit == held[i - period - base]:
+            held.append(unit)
+            seen[unit] = i
+            continue
+
+        start = run - period
+        count = (i - start) // period if period else 0
+        if count > 1 and (count - 1) * period > 2:
+            blocks += 1
+            yield from held[: start - base]
+            yield post.REPEAT_BEGIN.format(n=blocks, count=count) + "\n"
+            yield from held[start - base : start - base + period]
+            yield post.REPEAT_END.format(n=blocks, count=count) + "\n"
+            del held[: start - base + count * period]
+            base = start + count * period
+            _profile_rules(post, (0, 0, 0, 0, 0, count - 1))
+        if unit is None:
+            break
+
+        last = seen.get(unit, -1)
+        period = i - last if base <= last and i - last <= _REPEAT_SPAN else 0
+        run = i
+        held.append(unit)
+        seen[unit] = i
+
+        if len(held) > 2 * _REPEAT_SPAN:
+            # no block can start this far back any more
+            done = min(run - period, i + 1 - _REPEAT_SPAN) - base
+            yield from held[:done]
+            del held[:done]
+            base += done
+            seen = {text: n for text, n in seen.items() if n >= base}
+    yield from held
+
+
+_ESTIMATE_MOVE = b"GXYZIJKFNABC"  # letters that leave the machine moving
+_ESTIMATE_OPERATION = b"(begin operation: "
+_ESTIMATE_DIGITS = 15  # digits of a number read as columns, more go to float()
+_ESTIMATE_NUMBER = np.isin(np.arange(256), list(b"+-.0123456789")) if np is not None else None
+_ESTIMATE_POWERS = 10.0 ** np.arange(_ESTIMATE_DIGITS + 3) if np is not None else None
+# columns of the moves waiting to be timed
+_E_START = slice(0, 3)
+_E_END = slice(3, 6)
+_E_I, _E_J, _E_KIND, _E_FEED, _E_LASER, _E_OP, _E_SYNC = range(6, 13)
+# columns of the totals of every operation
+_E_SECONDS, _E_LASER_ON, _E_RAPID, _E_CUT, _E_MOVES = range(5)
+
+
+def _blocks(post, units, consume):
+
+    # Passes the units on and hands them to consume() joined, a block of about
+    # WRITE_BUFFER characters ending at a newline at a time, and what is left
+    # once they run out.
+    block = []
+    size = 0
+    for unit in units:
+        yield unit
+        block.append(unit)
+        size += len(unit)
+        if size >= post.WRITE_BUFFER and unit.endswith("\n"):
+            consume("".join(block))
+            block.clear()
+            size = 0
+    consume("".join(block))
+
+
+def _estimate_units(post, units):
+
+    #   Passes the finished lines on and times them on the way, a block of about
+    #   WRITE_BUFFER characters at a time. The machine accelerates and brakes at
+    #   ACCELERATION, takes corners at the speed JUNCTION_DEVIATION allows and
+    #   comes to a stop for every line that is not a move, laser on and off
+    #   included. It starts at CORNER_MIN.
+
+    state = _estimate_state(post)
+    yield from _blocks(post, units, lambda text: _estimate_block(post, text, state))
+    _estimate_moves(post, state, True)
+    post._estimate = _estimate_report(post, state)
+
+
+def _estimate_state(post):
+    on, off = _laser_codes(post)
+    return {
+        "scale": 25.4 if post.UNITS == "G20" else 1.0,  # mm per output unit
+        "on": on,
+        "off": off,
+        "pos": [float(post.CORNER_MIN[axis]) for axis in "xyz"],
+        "g": 0.0,
+        "feed": np.nan,
+        "laser": 0.0,
+        "op": 0.0,
+        "synced": True,
+        "labels": [""],  # the first holds what is outside the operations
+        "moves": np.empty((0, 13)),
+        "totals": np.zeros((1, 5)),
+    }
+
+
+def _laser_codes(post):
+
+    # the M codes that turn the laser on and off
+    on = {3.0, 4.0}
+    off = {5.0}
+    for codes, text in ((on, post.LASER_ON), (off, post.LASER_OFF)):
+        codes.update(float(value) for letter, value in _COMPACT_WORD.findall(text) if letter == "M")
+    return sorted(on), sorted(off)
+
+
+def _estimate_block(post, text, state):
+
+    if not text:
+        return
+
+    data, newlines, lines, wline, code, value = _read_words(text)
+
+    def column(name, pick=None):
+        pick = code == ord(name) if pick is None else pick
+        values = np.full(lines, np.nan)
+        values[wline[pick]] = value[pick]
+        return values
+
+    motion = (code == 71) & np.isin(value, (0.0, 1.0, 2.0, 3.0))
+    dwell = (code == 71) & (value == 4.0)
+    laser = np.full(lines, np.nan)
+    laser[wline[(code == 77) & np.isin(value, state["off"])]] = 0.0
+    laser[wline[(code == 77) & np.isin(value, state["on"])]] = 1.0
+    stops = np.zeros(lines, bool)
+    stops[wline[~np.isin(code, np.frombuffer(_ESTIMATE_MOVE, np.uint8)) | (code == 71) & ~motion]] = True
+
+    # operations begin at their comment
+    ops = np.full(lines, np.nan)
+    found = data.find(_ESTIMATE_OPERATION)
+    while found >= 0:
+        close = data.find(b")", found)
+        state["labels"].append(data[found + len(_ESTIMATE_OPERATION):close].decode(errors="replace"))
+        ops[np.searchsorted(newlines, found)] = len(state["labels"]) - 1
+        found = data.find(_ESTIMATE_OPERATION, close)
+    totals = state["totals"]
+    if len(totals) < len(state["labels"]):
+        state["totals"] = totals = np.concatenate((totals, np.zeros((len(state["labels"]) - len(totals), 5))))
+
+    scale = state["scale"]
+    x, y, z, i, j, feed = (column(letter) for letter in "XYZIJF")
+    g = column("G", motion)
+    g, _ = _ffill(g, ~np.isnan(g), state["g"])
+    op, _ = _ffill(ops, ~np.isnan(ops), state["op"])
+    circle = np.isin(g, (2.0, 3.0)) & ~(np.isnan(i) & np.isnan(j))
+    moving = np.flatnonzero(~(np.isnan(x) & np.isnan(y) & np.isnan(z)) | circle)
+    position = [_ffill(axis * scale, ~np.isnan(axis), start)[0] for axis, start in zip((x, y, z), state["pos"])]
+    feed, _ = _ffill(feed * (scale / 60), ~np.isnan(feed), state["feed"])
+    laser, _ = _ffill(laser, ~np.isnan(laser), state["laser"])
+
+    paused = np.flatnonzero(column("G", dwell) == 4.0)
+    if len(paused):
+        np.add.at(totals[:, _E_SECONDS], op[paused].astype(int), np.nan_to_num(column("P")[paused]))
+
+    stopped = np.cumsum(stops)
+    state["op"] = op[-1]
+    state["g"] = g[-1]
+    state["feed"] = feed[-1]
+    state["laser"] = laser[-1]
+    if not len(moving):
+        state["synced"] = state["synced"] or bool(stopped[-1])
+        return
+
+    rows = np.empty((len(moving), 13))
+    for axis in range(3):
+        rows[:, 3 + axis] = position[axis][moving]
+        rows[0, axis] = state["pos"][axis]
+        rows[1:, axis] = rows[:-1, 3 + axis]
+    rows[:, _E_I] = np.nan_to_num(i[moving]) * scale
+    rows[:, _E_J] = np.nan_to_num(j[moving]) * scale
+    rows[:, _E_KIND] = g[moving]
+    rows[:, _E_FEED] = feed[moving]
+    rows[:, _E_LASER] = laser[moving]
+    rows[:, _E_OP] = op[moving]
+    rows[:, _E_SYNC] = np.diff(stopped[moving], prepend=0) > 0
+    rows[0, _E_SYNC] = rows[0, _E_SYNC] or state["synced"]
+    state["synced"] = bool(stopped[-1] - stopped[moving[-1]])
+    state["pos"] = list(rows[-1, _E_END])
+
+    state["moves"] = np.concatenate((state["moves"], rows))
+    _estimate_moves(post, state, False)
+
+
+def _read_words(text):
+
+    # Reads the words of every line straight from the bytes. A word is a
+    # capital letter outside a comment with a number right behind it. Returns
+    # the bytes, where the newlines are, the number of lines, and the line,
+    # letter and value of every word.
+    data = text.encode()
+    b = np.frombuffer(data + b"\n" * (_ESTIMATE_DIGITS + 3), np.uint8)
+    starts = np.flatnonzero(b - 65 < 26)
+    starts = starts[_ESTIMATE_NUMBER[b[starts + 1]]]
+    opens = np.flatnonzero(b == 40)
+    if len(opens):
+        starts = starts[np.searchsorted(opens, starts) <= np.searchsorted(np.flatnonzero(b == 41), starts)]
+    newlines = np.flatnonzero(b[: len(data)] == 10)
+    lines = len(newlines) + (not data.endswith(b"\n"))
+
+    # The numbers are read a character of all of them at a time, digits and
+    # one point up to the first character that does not go on. The digits
+    # make an integer that is exact in a float, divided by the power of ten of
+    # those behind the point it comes out as float() reads the number.
+    at = starts + 1
+    negative = b[at] == 45
+    at += negative | (b[at] == 43)
+    value = np.zeros(len(at))
+    digits = np.zeros(len(at), np.int8)
+    behind = np.zeros(len(at), np.int8)
+    point = np.zeros(len(at), bool)
+    going = np.ones(len(at), bool)
+    for _ in range(_ESTIMATE_DIGITS + 2):
+        byte = b[at]
+        digit = byte - 48
+        is_digit = going & (digit < 10)
+        is_point = going & (byte == 46) & ~point
+        going = is_digit | is_point
+        if not going.any():
+            break
+        value = np.where(is_digit, value * 10 + digit, value)
+        digits += is_digit
+        behind += is_digit & point
+        point |= is_point
+        at += going
+    value /= _ESTIMATE_POWERS[behind]
+    value[negative] *= -1
+
+    # anything else, a second point or sign, no digit or too many, is left
+    # to float(), and what it cannot read is nan
+    for k in np.flatnonzero((digits == 0) | (digits > _ESTIMATE_DIGITS) | _ESTIMATE_NUMBER[b[at]]).tolist():
+        end = first = starts[k] + 1
+        while _ESTIMATE_NUMBER[b[end]]:
+            end += 1
+        value[k] = _estimate_float(data[first:end])
+    return data, newlines, lines, np.searchsorted(newlines, starts), b[starts], value
+
+
+def _estimate_float(word):
+    try:
+        return float(word)
+    except ValueError:
+        return np.nan
+
+
+def _estimate_moves(post, state, final):
+
+    # Times the moves up to the last stop, the ones after it may still be
+    # slowed down by what follows.
+    moves = state["moves"]
+    cut = len(moves)
+    if not final:
+        stops = np.flatnonzero(moves[:, _E_SYNC])
+        cut = stops[-1] if len(stops) else 0
+    if not cut:
+        return
+    moves, state["moves"] = moves[:cut], moves[cut:]
+
+    accel = post.ACCELERATION
+    kind = moves[:, _E_KIND]
+    start = moves[:, _E_START]
+    delta = moves[:, _E_END] - start
+    length = np.sqrt((delta ** 2).sum(1))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        entry = delta / length[:, None]
+    leave = entry.copy()
+    speed = np.where(kind == 0, post.RAPID_RATE / 60, np.nan_to_num(moves[:, _E_FEED], nan=post.RAPID_RATE / 60))
+
+    arcs = np.flatnonzero((kind >= 2) & (np.hypot(moves[:, _E_I], moves[:, _E_J]) > 1e-9))
+    if len(arcs):
+        i = moves[arcs, _E_I]
+        j = moves[arcs, _E_J]
+        radius = np.hypot(i, j)
+        ex = delta[arcs, 0] - i
+        ey = delta[arcs, 1] - j
+        turn = np.where(kind[arcs] == 3, 1.0, -1.0)
+        sweep = (turn * (np.arctan2(ey, ex) - np.arctan2(-j, -i))) % (2 * math.pi)
+        sweep[sweep < 1e-9] = 2 * math.pi
+        arc = radius * sweep
+        length[arcs] = np.hypot(arc, delta[arcs, 2])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            flat = arc / length[arcs] / radius
+            rise = delta[arcs, 2] / length[arcs]
+            entry[arcs] = np.column_stack((turn * j * flat, -turn * i * flat, rise))
+            leave[arcs] = np.column_stack((-turn * ey * flat, turn * ex * flat, rise))
+        if accel > 0:
+            speed[arcs] = np.minimum(speed[arcs], np.sqrt(accel * radius))
+
+    # moves that go nowhere take no time, a stop before one stays for the next
+    keep = np.flatnonzero(length > 1e-9)
+    sync = np.diff(np.cumsum(moves[:, _E_SYNC])[keep], prepend=0) > 0
+    length = length[keep]
+    speed = np.maximum(speed[keep], 1e-6)
+    kind = kind[keep]
+    op = moves[keep, _E_OP].astype(int)
+    laser_on = (moves[keep, _E_LASER] > 0) & (kind > 0)
+
+    if accel > 0:
+        # squared speed at every joint, limited by the corner and by the
+        # distance there is to speed up before it and to brake after it
+        cos = -(leave[keep][:-1] * entry[keep][1:]).sum(1)
+        half = np.sqrt(np.clip(0.5 * (1 - cos), 0, 1))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corner = np.where(half < 1 - 1e-9, accel * post.JUNCTION_DEVIATION * half / (1 - half), np.inf)
+        corner = np.minimum(corner, np.minimum(speed[:-1], speed[1:]) ** 2)
+        corner[sync[1:]] = 0.0
+        joint = np.concatenate(([0.0], corner, [0.0]))
+        reach = np.concatenate(([0.0], np.cumsum(2 * accel * length)))
+        joint = reach + np.minimum.accumulate(joint - reach)
+        joint = np.minimum.accumulate((joint + reach)[::-1])[::-1] - reach
+        joint = np.maximum(joint, 0.0)
+        w0 = joint[:-1]
+        w1 = joint[1:]
+        top = speed ** 2
+        cruise = length - (2 * top - w0 - w1) / (2 * accel)
+        peak = np.sqrt(np.where(cruise >= 0, top, np.clip((2 * accel * length + w0 + w1) / 2, 0, top)))
+        seconds = (2 * peak - np.sqrt(w0) - np.sqrt(w1)) / accel + np.maximum(cruise, 0) / speed
+    else:
+        seconds = length / speed
+
+    totals = state["totals"]
+    size = len(totals)
+    totals[:, _E_SECONDS] += np.bincount(op, seconds, size)
+    totals[:, _E_LASER_ON] += np.bincount(op, seconds * laser_on, size)
+    totals[:, _E_RAPID] += np.bincount(op, length * (kind == 0), size)
+    totals[:, _E_CUT] += np.bincount(op, length * (kind > 0), size)
+    totals[:, _E_MOVES] += np.bincount(op, minlength=size)
+
+
+def _estimate_report(post, state):
+
+    def entry(row):
+        return {
+            "seconds": round(float(row[_E_SECONDS]), 3),
+            "laser_on_seconds": round(float(row[_E_LASER_ON]), 3),
+            "rapid_mm": round(float(row[_E_RAPID]), 3),
+            "cut_mm": round(float(row[_E_CUT]), 3),
+            "moves": int(row[_E_MOVES]),
+        }
+
+    report = entry(state["totals"].sum(0))
+    report["acceleration"] = post.ACCELERATION
+    report["rapid_rate"] = post.RAPID_RATE
+    report["junction_deviation"] = post.JUNCTION_DEVIATION
+    report["operations"] = [
+        dict(label=label, **entry(row)) for label, row in zip(state["labels"][1:], state["totals"][1:])
+    ]
+    return report
+
+
+def _estimate_head(post):
+
+    # the estimate as header comments, once the program is done
+    if not (post.ESTIMATE_TIME and post.OUTPUT_HEADER and post._estimate):
+        return ""
+    scale = 25.4 if post.UNITS == "G20" else 1.0
+    head = [
+        "(Estimated time: %s)\n" % _clock(post._estimate["seconds"]),
+        "(Estimated laser on time: %s)\n" % _clock(post._estimate["laser_on_seconds"]),
+        "(Rapid distance: %.1f %s)\n" % (post._estimate["rapid_mm"] / scale, post.UNIT_FORMAT),
+    ]
+    for op in post._estimate["operations"]:
+        if op["moves"]:
+            head.append(
+                "(Estimated %s: %s, laser on %s)\n" % (op["label"], _clock(op["seconds"]), _clock(op["laser_on_seconds"]))
+            )
+    return "".join(head)
+
+
+def _clock(seconds):
+    seconds = int(round(seconds))
+    return "%d:%02d:%02d" % (seconds // 3600, seconds // 60 % 60, seconds % 60)
+
+
+def _write_estimate(post, filename):
+    if post.ESTIMATE_TIME and post._estimate:
+        write_output(post, os.path.splitext(filename)[0] + ".estimate.json", (json.dumps(post._estimate, indent=1) + "\n",))
+
+
+#   Validation. With --validate the finished lines are read as --estimate reads
+#   them and every move is checked on the columns of all moves of a block at
+#   once: where it ends, and for an arc the farthest it reaches on either axis
+#   from its centre, has to lie between CORNER_MIN and CORNER_MAX (mm), a rapid
+#   must not run with the laser on and a cut with the laser on needs a feed
+#   above zero. An arc needs a radius, and its end has to lie on the circle its
+#   start is on, within what GRBL lets pass: 0.005 mm, or 0.1% of the radius up
+#   to 0.5 mm. A letter outside a comment with no number behind it is flagged
+#   as well. Every line that breaks a rule is collected; the counts and the first
+#   lines of each are printed once the program is written, and all of them go
+#   into a sidecar, part.validate.json for part.nc, numbered as a sender counts.
+
+_VALIDATE_RULES = (
+    ("outside", "moves outside the bed"),
+    ("laser_on_rapid", "rapids with the laser on"),
+    ("no_feed", "cuts with the laser on and no feed"),
+    ("arc", "arcs without a radius or with the end off the circle"),
+    ("malformed", "words without a number"),
+)
+_VALIDATE_SHOWN = 10  # lines of each rule printed
+_VALIDATE_ARC = (0.005, 0.001, 0.5)  # radius change of an arc let pass: mm, or part of it up to mm, as GRBL
+
+
+def _validate_units(post, units):
+
+    # passes the finished lines on and checks them on the way, in blocks as
+    # _estimate_units() times them
+
+    state = _validate_state(post)
+    yield from _blocks(post, units, lambda text: _validate_block(text, state))
+    post._validation = {
+        "lines": state["line"],
+        "bed_min": state["low"].tolist(),
+        "bed_max": state["high"].tolist(),
+        "violations": {
+            rule: np.concatenate(state["found"][rule]).tolist() if state["found"][rule] else []
+            for rule, text in _VALIDATE_RULES
+        },
+    }
+
+
+def _validate_state(post):
+    on, off = _laser_codes(post)
+    return {
+        "scale": 25.4 if post.UNITS == "G20" else 1.0,  # mm per output unit
+        "on": on,
+        "off": off,
+        "low": np.array([float(post.CORNER_MIN[axis]) for axis in "xyz"]),
+        "high": np.array([float(post.CORNER_MAX[axis]) for axis in "xyz"]),
+        "pos": np.array([float(post.CORNER_MIN[axis]) for axis in "xyz"]),
+        "g": 0.0,
+        "feed": np.nan,
+        "laser": 0.0,
+        "line": 0,  # lines before the block
+        "found": {rule: [] for rule, text in _VALIDATE_RULES},
+    }
+
+
+def _validate_block(text, state):
+
+    if not text:
+        return
+    first = state["line"] + 1
+    found = state["found"]
+    words, moves = _read_moves(text, state)
+    data, newlines, lines, wline, code, value = words
+    state["line"] += lines
+
+    # words that cannot be read, and capitals outside comments followed by
+    # nothing or a space
+    b = np.frombuffer(data + b"\n", np.uint8)
+    capital = b - 65 < 26
+    empty = np.flatnonzero(capital[:-1] & (b[1:] <= 32) & ~np.r_[False, capital[:-2]])
+    opens = np.flatnonzero(b == 40)
+    if len(opens):
+        empty = empty[np.searchsorted(opens, empty) <= np.searchsorted(np.flatnonzero(b == 41), empty)]
+    bad = np.union1d(wline[np.isnan(value)], np.searchsorted(newlines, empty))
+    if len(bad):
+        found["malformed"].append(bad + first)
+
+    if moves is not None:
+        _validate_moves(moves, first, state)
+
+
+def _validate_moves(moves, first, state):
+
+    # the rules over the moves of a block, first the number of its first line
+    moving, start, end, kind, on, feed, centre, arcs = moves
+    low = state["low"] - 1e-9
+    high = state["high"] + 1e-9
+    outside = ((end < low) | (end > high)).any(1)
+
+    bad_arc = np.zeros(len(kind), dtype=bool)
+    if len(arcs):
+        # the end of an arc has to be as far from the centre as its start
+        radius = np.hypot(centre[:, 0], centre[:, 1])
+        change = np.abs(np.hypot(*(end[:, axis] - start[:, axis] - centre[:, axis] for axis in (0, 1))) - radius)
+        fixed, part, most = _VALIDATE_ARC
+        bad = (radius < 1e-9) | (change > fixed) & ((change > most) | (change > part * radius))
+        bad_arc[arcs] = bad[arcs]
+
+        # an arc reaches past its ends where it crosses an axis through its
+        # centre, which only matters for the arcs whose circle leaves the bed
+        wide = np.zeros(len(kind), dtype=bool)
+        for axis in (0, 1):
+            middle = start[:, axis] + centre[:, axis]
+            wide |= (middle - radius < low[axis]) | (middle + radius > high[axis])
+        arcs = arcs[wide[arcs]]
+
+    if len(arcs):
+        cx, cy, radius, turn, begin, sweep = _arc_angles(start[arcs], end[arcs], centre[arcs], kind[arcs])
+        for angle, axis, middle, side in ((0.0, 0, cx, 1), (0.5, 1, cy, 1), (1.0, 0, cx, -1), (1.5, 1, cy, -1)):
+            reach = middle + side * radius
+            k = np.flatnonzero(reach > high[axis] if side > 0 else reach < low[axis])
+            crossed = (turn[k] * (angle * math.pi - begin[k])) % (2 * math.pi) <= sweep[k]
+            outside[arcs[k[crossed]]] = True
+
+    line = moving + first
+    for rule, hit in (
+        ("outside", outside),
+        ("laser_on_rapid", on & (kind == 0)),
+        ("no_feed", on & (kind > 0) & ~(feed > 0)),
+        ("arc", bad_arc),
+    ):
+        if hit.any():
+            state["found"][rule].append(line[hit])
+
+
+def _read_moves(text, state):
+
+    # The words of a block as _read_words() gives them and the moves among its
+    # lines: the line of each, where it starts and ends (mm), its motion mode,
+    # whether the laser is on, its feed, the I and J of an arc (mm) and which
+    # of the moves are arcs. None when no line moves. state carries the
+    # position and the modes from one block to the next.
+    words = _read_words(text)
+    data, newlines, lines, wline, code, value = words
+
+    def column(name, pick=None):
+        pick = code == ord(name) if pick is None else pick
+        values = np.full(lines, np.nan)
+        values[wline[pick]] = value[pick]
+        return values
+
+    motion = (code == 71) & np.isin(value, (0.0, 1.0, 2.0, 3.0))
+    laser = np.full(lines, np.nan)
+    laser[wline[(code == 77) & np.isin(value, state["off"])]] = 0.0
+    laser[wline[(code == 77) & np.isin(value, state["on"])]] = 1.0
+
+    scale = state["scale"]
+    x, y, z, i, j, feed = (column(letter) for letter in "XYZIJF")
+    g = column("G", motion)
+    g, _ = _ffill(g, ~np.isnan(g), state["g"])
+    circle = np.isin(g, (2.0, 3.0)) & ~(np.isnan(i) & np.isnan(j))
+    moving = np.flatnonzero(~(np.isnan(x) & np.isnan(y) & np.isnan(z)) | circle)
+    position = [_ffill(axis * scale, ~np.isnan(axis), start)[0] for axis, start in zip((x, y, z), state["pos"])]
+    feed, _ = _ffill(feed, ~np.isnan(feed), state["feed"])
+    laser, _ = _ffill(laser, ~np.isnan(laser), state["laser"])
+    state["g"] = g[-1]
+    state["feed"] = feed[-1]
+    state["laser"] = laser[-1]
+    if not len(moving):
+        return words, None
+
+    end = np.column_stack([axis[moving] for axis in position])
+    start = np.vstack((state["pos"], end[:-1]))
+    state["pos"] = end[-1]
+    centre = np.column_stack((np.nan_to_num(i[moving]), np.nan_to_num(j[moving]))) * scale
+    moves = (moving, start, end, g[moving], laser[moving] > 0, feed[moving], centre, np.flatnonzero(circle[moving]))
+    return words, moves
+
+
+def _arc_angles(start, end, centre, kind):
+
+    # centre, radius, direction (1 for G3), start angle and sweep of arcs
+    cx = start[:, 0] + centre[:, 0]
+    cy = start[:, 1] + centre[:, 1]
+    radius = np.hypot(centre[:, 0], centre[:, 1])
+    turn = np.where(kind == 3, 1.0, -1.0)
+    begin = np.arctan2(-centre[:, 1], -centre[:, 0])
+    sweep = (turn * (np.arctan2(end[:, 1] - cy, end[:, 0] - cx) - begin)) % (2 * math.pi)
+    sweep[sweep < 1e-9] = 2 * math.pi
+    return cx, cy, radius, turn, begin, sweep
+
+
+def _write_validation(post, filename, head):
+
+    # What --validate found, with the lines moved down by what is written in
+    # front of the program afterwards. filename "-" only prints it.
+    if not (post.VALIDATE_OUTPUT and post._validation):
+        return
+    shift = head.count("\n")
+    report = dict(post._validation)
+    report["lines"] += shift
+    report["violations"] = {rule: [n + shift for n in lines] for rule, lines in post._validation["violations"].items()}
+    problems = 0
+    for rule, text in _VALIDATE_RULES:
+        lines = report["violations"][rule]
+        if lines:
+            problems += len(lines)
+            shown = ", ".join(str(n) for n in lines[:_VALIDATE_SHOWN])
+            print("validation: %d %s, line %s%s" % (len(lines), text, shown, ", ..." if len(lines) > _VALIDATE_SHOWN else ""))
+    if not problems:
+        print("validation: %d lines, no problems found" % report["lines"])
+    if not filename == "-":
+        report["program"] = os.path.basename(filename)
+        write_output(post, os.path.splitext(filename)[0] + ".validate.json", (json.dumps(report) + "\n",))
+
+
+#   Preview. With --preview the finished lines are read as --validate reads
+#   them and the moves are drawn from above into a picture, part.preview.png
+#   for part.nc, PREVIEW_SIZE pixels along its longer side: the bed in light
+#   grey, moves with the laser off in blue and moves with the laser on in red
+#   over them. The picture frames the bed and every move. Each move is set as
+#   points one pixel apart, arcs first become chords within half a pixel of
+#   them, and the points of many moves are set at once, so drawing takes a
+#   fraction of the time reading takes. The PNG is put together here, a palette
+#   image packed with zlib; nothing but numpy is needed and no display. In
+#   FreeCAD the picture is shown where the editor would be when the program is
+#   too long for it, with or without --preview.
+
+_PREVIEW_PALETTE = (255, 255, 255, 232, 232, 232, 90, 140, 220, 200, 30, 30)  # margin, bed, laser off, laser on
+_PREVIEW_MARGIN = 0.02  # of the longer side, around bed and moves
+_PREVIEW_POINTS = 1 << 22  # points set at a time
+_PREVIEW_ARCS = 1 << 14  # arcs turned into chords at a time
+
+
+def _preview_units(post, units):
+
+    # passes the finished lines on and gathers the moves on the way, in blocks
+    # as _validate_units() checks them; the picture is drawn at the end
+
+    state = _preview_state(post)
+    yield from _blocks(post, units, lambda text: _preview_block(text, state))
+    post._preview = _preview_png(post, state)
+
+
+def _preview_state(post):
+    on, off = _laser_codes(post)
+    return {
+        "scale": 25.4 if post.UNITS == "G20" else 1.0,  # mm per output unit
+        "on": on,
+        "off": off,
+        "low": np.array([float(post.CORNER_MIN[axis]) for axis in "xy"]),
+        "high": np.array([float(post.CORNER_MAX[axis]) for axis in "xy"]),
+        "pos": np.array([float(post.CORNER_MIN[axis]) for axis in "xyz"]),
+        "g": 0.0,
+        "feed": np.nan,
+        "laser": 0.0,
+        "lines": [],  # x0, y0, x1, y1, laser of the straight moves
+        "arcs": [],  # centre, radius, start angle, sweep (G2 below zero), laser
+    }
+
+
+def _preview_block(text, state):
+
+    if not text:
+        return
+
+    words, moves = _read_moves(text, state)
+    if moves is None:
+        return
+    moving, start, end, kind, on, feed, centre, arcs = moves
+    state["low"] = np.minimum(state["low"], end[:, :2].min(0))
+    state["high"] = np.maximum(state["high"], end[:, :2].max(0))
+    straight = np.ones(len(moving), bool)
+    straight[arcs] = False
+    state["lines"].append(np.column_stack((start[straight, :2], end[straight, :2], on[straight])).astype(np.float32))
+    if len(arcs):
+        cx, cy, radius, turn, begin, sweep = _arc_angles(start[arcs], end[arcs], centre[arcs], kind[arcs])
+        state["arcs"].append(np.column_stack((cx, cy, radius, begin, turn * sweep, on[arcs])))
+
+
+def _preview_png(post, state):
+
+    # the frame, and the image as one palette index per pixel
+    margin = _PREVIEW_MARGIN * (state["high"] - state["low"]).max()
+    low = state["low"] - margin
+    high = state["high"] + margin
+    ppm = (post.PREVIEW_SIZE - 1) / max((high - low).max(), 1e-9)  # pixels per mm
+    width, height = (np.ceil((high - low) * ppm).astype(int) + 1).tolist()
+    image = np.zeros((height, width), np.uint8)
+    bed = np.rint([
+        (high[1] - post.CORNER_MAX["y"]) * ppm, (high[1] - post.CORNER_MIN["y"]) * ppm,
+        (post.CORNER_MIN["x"] - low[0]) * ppm, (post.CORNER_MAX["x"] - low[0]) * ppm,
+    ]).astype(int)
+    image[bed[0]:bed[1] + 1, bed[2]:bed[3] + 1] = 1
+
+    lines = np.concatenate(state["lines"]) if state["lines"] else np.empty((0, 5))
+    arcs = np.concatenate(state["arcs"]) if state["arcs"] else np.empty((0, 6))
+    for colour, laser in ((2, False), (3, True)):
+        pick_lines = lines[(lines[:, 4] > 0) == laser]
+        pick_arcs = arcs[(arcs[:, 5] > 0) == laser]
+        for segments in [pick_lines] + [_preview_chords(pick_arcs[k:k + _PREVIEW_ARCS], ppm)
+                                        for k in range(0, len(pick_arcs), _PREVIEW_ARCS)]:
+            x = (segments[:, [0, 2]] - low[0]) * ppm
+            y = (high[1] - segments[:, [1, 3]]) * ppm
+            _preview_draw(image, x, y, colour)
+
+    return _png(image, _PREVIEW_PALETTE)
+
+
+def _preview_chords(arcs, ppm):
+
+    # every arc as chords that stay within half a pixel of it
+    radius = arcs[:, 2] * ppm
+    step = 2 * np.arccos(np.clip(1 - 0.5 / np.maximum(radius, 1e-9), -1, 1))
+    count = np.maximum(np.ceil(np.abs(arcs[:, 4]) / step), 1).astype(np.int64)
+    arc = np.repeat(np.arange(len(arcs)), count)
+    k = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+    sweep = arcs[arc, 4] / count[arc]
+    a0 = arcs[arc, 3] + sweep * k
+    a1 = a0 + sweep
+    cx, cy, r = arcs[arc, 0], arcs[arc, 1], arcs[arc, 2]
+    return np.column_stack((cx + r * np.cos(a0), cy + r * np.sin(a0), cx + r * np.cos(a1), cy + r * np.sin(a1)))
+
+
+def _preview_draw(image, x, y, colour):
+
+    # Sets every segment (columns of x and y in pixels) as points no more than
+    # a pixel apart: both ends at once, which is all of a segment up to a pixel
+    # long, then the points between, _PREVIEW_POINTS points at a time.
+    if not len(x):
+        return
+    height, width = image.shape
+    flat = image.reshape(-1)
+
+    def put(px, py):
+        px = np.rint(px).astype(np.int64)
+        py = np.rint(py).astype(np.int64)
+        inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+        flat[(py * width + px)[inside]] = colour
+
+    put(x.ravel(), y.ravel())
+    dx = x[:, 1] - x[:, 0]
+    dy = y[:, 1] - y[:, 0]
+    count = np.ceil(np.maximum(np.abs(dx), np.abs(dy))).astype(np.int64) - 1  # points between the ends
+    long = np.flatnonzero(count > 0)
+    if not len(long):
+        return
+    count = count[long]
+    x0 = x[long, 0]
+    y0 = y[long, 0]
+    sx = dx[long] / (count + 1)
+    sy = dy[long] / (count + 1)
+    total = np.cumsum(count)
+    cuts = np.searchsorted(total, np.arange(_PREVIEW_POINTS, total[-1], _PREVIEW_POINTS))
+    for first, last in zip(np.r_[0, cuts], np.r_[cuts, len(count)]):
+        part = count[first:last]
+        segment = np.repeat(np.arange(first, last), part)
+        k = np.arange(1, len(segment) + 1) - np.repeat(np.cumsum(part) - part, part)
+        put(x0[segment] + sx[segment] * k, y0[segment] + sy[segment] * k)
+
+
+def _png(image, palette):
+
+    # an 8 bit palette PNG, every row without a filter
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    height, width = image.shape
+    rows = np.zeros((height, width + 1), np.uint8)
+    rows[:, 1:] = image
+    return b"".join((
+        b"\x89PNG\r\n\x1a\n",
+        chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0)),
+        chunk(b"PLTE", bytes(palette)),
+        chunk(b"IDAT", zlib.compress(rows.tobytes(), 6)),
+        chunk(b"IEND", b""),
+    ))
+
+
+def _preview_text(post, gcode):
+
+    # the picture of a program that is already joined, read in blocks of about
+    # WRITE_BUFFER characters; None without numpy
+    if np is None:
+        return None
+
+    state = _preview_state(post)
+    start = 0
+    while start < len(gcode):
+        end = gcode.find("\n", start + post.WRITE_BUFFER) + 1 or len(gcode)
+        _preview_block(gcode[start:end], state)
+        start = end
+    return _preview_png(post, state)
+
+
+def _show_preview(picture):
+    QtGui, QtWidgets = _qt()
+    dia = QtWidgets.QDialog()
+    dia.setWindowTitle("Toolpath preview")
+    layout = QtWidgets.QVBoxLayout(dia)
+    pixmap = QtGui.QPixmap()
+    pixmap.loadFromData(picture, "PNG")
+    label = QtWidgets.QLabel()
+    label.setPixmap(pixmap)
+    layout.addWidget(label)
+    buttons = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Ok)
+    buttons.accepted.connect(dia.accept)
+    layout.addWidget(buttons)
+    dia.exec_()
+
+
+def _write_preview(post, filename):
+    if post.PREVIEW_OUTPUT and post._preview:
+        write_output(post, os.path.splitext(filename)[0] + ".preview.png", (post._preview,), binary=True)
+
+
+#   Resume index. With --index a sidecar next to the output, part.index.json
+#   for part.nc, holds the byte offset of every INDEX_STEP-th line and the state
+#   the machine is in before it: motion mode, units, plane, distance mode, the
+#   laser code given last and the last X, Y, Z, F and S, each word as written.
+#   laser_resume.py restarts the program from it at any line. The state at an
+#   entry is that of the entry before, updated with the last of each word in
+#   the lines between, which are searched from the back; most words turn up
+#   within a line or two. With --repeat-passes an entry inside a repeated block
+#   also holds where the block's lines begin, its count and its {n}, so a
+#   restart inside it can open the block again for the passes that are left.
+
+_INDEX_VERSION = 1
+_INDEX_FIELDS = ("motion", "units", "plane", "distance", "laser", "X", "Y", "Z", "F", "S", "repeat")
+_INDEX_CODES = {
+    "motion": ("G0", "G1", "G2", "G3", "G00", "G01", "G02", "G03"),
+    "units": ("G20", "G21"),
+    "plane": ("G17", "G18", "G19"),
+    "distance": ("G90", "G91"),
+}
+_INDEX_NUMBER = frozenset("+-.0123456789")
+
+
+def _index_units(post, units):
+
+    # passes the finished text on and indexes it a block at a time
+
+    state = _index_state(post)
+    yield from _blocks(post, units, lambda text: _index_block(post, text, state))
+    post._index = {
+        "version": _INDEX_VERSION,
+        "lines": state["line"],
+        "bytes": state["offset"],
+        "step": post.INDEX_STEP,
+        "laser_on": state["on"],
+        "laser_off": state["off"],
+        "fields": _INDEX_FIELDS,
+        "repeat": [post.REPEAT_BEGIN, post.REPEAT_END] if post.REPEAT_BEGIN else None,
+        "entries": state["entries"],
+    }
+
+
+def _index_state(post):
+    on, off = _laser_codes(post)
+    both = sorted(set(on + off))
+    codes = dict(_INDEX_CODES)
+    codes["laser"] = ["M%g" % code for code in both] + ["M0%g" % code for code in both if code < 10]
+    return {
+        "on": ["M%g" % code for code in on],
+        "off": ["M%g" % code for code in off],
+        "codes": codes,
+        "repeat": (_repeat_pattern(post.REPEAT_BEGIN), _repeat_pattern(post.REPEAT_END)) if post.REPEAT_BEGIN else None,
+        "words": dict.fromkeys(_INDEX_FIELDS),
+        "line": 0,  # lines and bytes before the block
+        "offset": 0,
+        "entries": [],
+    }
+
+
+def _index_block(post, text, state):
+
+    # a huge block, as from the editor, is taken in pieces ending at a newline
+    while len(text) > 2 * post.WRITE_BUFFER:
+        cut = text.find("\n", post.WRITE_BUFFER) + 1 or len(text)
+        _index_block(post, text[:cut], state)
+        text = text[cut:]
+    if not text:
+        return
+
+    words = state["words"]
+    ascii = text.isascii()
+    parts = text.split("\n")
+    lines = len(parts) - 1
+    pos = 0
+    start = 0
+    offset = state["offset"]
+    for n in range(-state["line"] % post.INDEX_STEP, lines + (not text.endswith("\n")), post.INDEX_STEP):
+        end = pos + sum(map(len, parts[start:n])) + n - start
+        _index_search(text, pos, end, state)
+        _index_repeat(text, pos, end, state)
+        offset += end - pos if ascii else len(text[pos:end].encode())
+        state["entries"].append([state["line"] + n + 1, offset] + [words[field] for field in _INDEX_FIELDS])
+        pos = end
+        start = n
+    _index_search(text, pos, len(text), state)
+    _index_repeat(text, pos, len(text), state)
+    state["line"] += lines
+    state["offset"] += len(text) if ascii else len(text.encode())
+
+
+def _index_search(text, start, end, state):
+
+    # the last of each word in text[start:end] outside comments
+    words = state["words"]
+    for field, codes in state["codes"].items():
+        last = -1
+        for code in codes:
+            at = _index_find(text, code, start, end, False)
+            if at > last:
+                last = at
+                words[field] = code
+    for letter in "XYZFS":
+        at = _index_find(text, letter, start, end, True)
+        if at >= 0:
+            stop = at + 1
+            while stop < len(text) and text[stop] in _INDEX_NUMBER:
+                stop += 1
+            words[letter] = text[at:stop]
+
+
+def _index_repeat(text, start, end, state):
+
+    # the repeated block text[start:end] leaves open, from the last line that
+    # begins or ends one
+    if not state["repeat"]:
+        return
+    begin, close = state["repeat"]
+    opened = None
+    for opened in begin.finditer(text, start, end):
+        pass
+    closed = None
+    for closed in close.finditer(text, start, end):
+        pass
+    if opened and not (closed and closed.start() > opened.start()):
+        body = min(opened.end() + 1, len(text))
+        state["words"]["repeat"] = [
+            state["line"] + text.count("\n", 0, body) + 1,
+            state["offset"] + len(text[:body].encode()),
+            int(opened.group("count")) if "count" in begin.groupindex else None,
+            int(opened.group("n")) if "n" in begin.groupindex else None,
+        ]
+    elif closed:
+        state["words"]["repeat"] = None
+
+
+def _repeat_pattern(template):
+
+    # the lines written from a --repeat-passes template, line numbers and all,
+    # with its {count} and {n} read back
+    pattern = re.escape(template).replace(re.escape("\n"), r"[ \t]*\n(?:N\d+ )?")
+    for name in ("count", "n"):
+        field = re.escape("{%s}" % name)
+        pattern = pattern.replace(field, r"(?P<%s>\d+)" % name, 1).replace(field, r"(?P=%s)" % name)
+    return re.compile(r"^(?:N\d+ )?" + pattern + r"[ \t]*$", re.M)
+
+
+def _index_find(text, token, start, end, number):
+    at = text.rfind(token, start, end)
+    while at >= 0:
+        after = text[at + len(token) : at + len(token) + 1]
+        if after in _INDEX_NUMBER if number else not (after.isdigit() or after == "."):
+            head = text.rfind("\n", 0, at) + 1
+            if ";" not in text[head:at] and text.rfind("(", head, at) <= text.rfind(")", head, at):
+                return at
+        at = text.rfind(token, start, at)
+    return -1
+
+
+def _write_index(post, filename, head):
 
-            # prepend a line number and append a newline
-            if len(outstring) >= 1:
-                if OUTPUT_LINE_NUMBERS:
-                    outstring.insert(0, (linenumber()))
+    # lines written in front of the program afterwards move every entry down
+    if not (post.INDEX_OUTPUT and post._index):
+        return
+    index = dict(post._index)
+    index["program"] = os.path.basename(filename)
+    if head:
+        lines = head.count("\n")
+        size = len(head.encode())
+        index["lines"] += lines
+        index["bytes"] += size
+        index["entries"] = [[1, 0] + [None] * len(_INDEX_FIELDS)] + [
+            [entry[0] + lines, entry[1] + size] + entry[2:-1] + [_index_moved(entry[-1], lines, size)]
+            for entry in index["entries"]
+        ]
+    write_output(post, os.path.splitext(filename)[0] + ".index.json", (json.dumps(index) + "\n",))
 
-                # append the line to the final output
-                for w in outstring:
-                    out += w + COMMAND_SPACE
-                # Note: Do *not* strip `out`, since that forces the allocation
-                # of a contiguous string & thus quadratic complexity.
-                out += "\n"
 
-        return out
+def _index_moved(repeat, lines, size):
+    return repeat and [repeat[0] + lines, repeat[1] + size] + repeat[2:]
 
 
 # print(__name__ + " gcode postprocessor loaded.")
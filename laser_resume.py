@@ -0,0 +1,236 @@
+#   Restarts a program posted with laser_post.py --index at any line, without
+#   posting it again. Part of laser_post, same license (LGPL v2.1).
+#
+#   python laser_resume.py part.nc 1800000
+#   python laser_resume.py part.nc 1800000 --output part.resume.nc
+#   python laser_resume.py part.nc 5200 --pass 3
+#
+#   The line is the first one to run again, counted from 1 as senders count
+#   them. The index next to the program, part.index.json, holds the byte offset
+#   of every few thousand lines and the state of the machine before them; the
+#   program is opened with mmap, and only the lines from the entry before up to
+#   the restart line are read to bring that state up to date. The new program
+#   sets the units, plane and distance mode, turns the laser off, moves to where
+#   the head was, sets the feed, turns the laser back on if it was on and goes
+#   on with the rest of the program as it is. Does not need FreeCAD.
+#
+#   A line inside a block of --repeat-passes runs once per pass, so the pass it
+#   stopped in has to be given with --pass. The new program finishes that pass,
+#   opens the block again for the passes that are left and goes on after it.
+
+import argparse
+import bisect
+import json
+import mmap
+import os
+import re
+import sys
+
+INDEX_VERSION = 1
+BLOCK = 1 << 20  # bytes copied at a time
+
+parser = argparse.ArgumentParser(prog="laser_resume", description="restart a laser_post program at any line")
+parser.add_argument("program", help="gcode written by laser_post.py with --index")
+parser.add_argument("line", type=int, help="first line to run again, counted from 1")
+parser.add_argument("--output", help='where the restarted program goes, "-" for stdout, default part.resume.nc for part.nc')
+parser.add_argument("--index", help="the index of the program, default part.index.json for part.nc")
+parser.add_argument("--pass", type=int, dest="repeat_pass", help="for a line in a block of --repeat-passes, the pass it stopped in, from 1")
+
+_COMMENT = re.compile(r"\([^)]*\)?|;.*")
+_WORD = re.compile(r"([A-Z])\s*([-+]?[\d.]+)")
+_AXES = frozenset("XYZIJ")
+_NUMBER = re.compile(r"N\d+\s*")
+
+
+def load_index(filename, program):
+    with open(filename) as f:
+        index = json.load(f)
+    if index.get("version") != INDEX_VERSION:
+        raise ValueError("unknown index version %r" % index.get("version"))
+    if index["bytes"] != os.path.getsize(program):
+        raise ValueError("%s changed since its index was written, post it again" % program)
+    return index
+
+
+def _words(line):
+    return _WORD.findall(_COMMENT.sub("", line))
+
+
+def advance(state, line, index):
+
+    # state after the line, kept the way laser_post writes it: words as written
+    laser = {float(code[1:]) for code in index["laser_on"] + index["laser_off"]}
+    for letter, value in _words(line):
+        if letter == "G":
+            code = float(value)
+            field = {0: "motion", 1: "motion", 2: "motion", 3: "motion", 20: "units", 21: "units",
+                     17: "plane", 18: "plane", 19: "plane", 90: "distance", 91: "distance"}.get(code)
+            if field:
+                state[field] = letter + value
+        elif letter == "M" and float(value) in laser:
+            state["laser"] = letter + value
+        elif letter in "XYZFS":
+            state[letter] = letter + value
+
+
+def repeat_pattern(template):
+
+    # the lines written from a --repeat-passes template, as laser_post reads them
+    pattern = re.escape(template).replace(re.escape("\n"), r"[ \t]*\n(?:N\d+ )?")
+    for name in ("count", "n"):
+        field = re.escape("{%s}" % name)
+        pattern = pattern.replace(field, r"(?P<%s>\d+)" % name, 1).replace(field, r"(?P=%s)" % name)
+    return re.compile((r"^(?:N\d+ )?" + pattern + r"[ \t]*$").encode(), re.M)
+
+
+def restart_head(state, index, line, name, repeat_pass=None):
+
+    # what the machine needs before the line to be where it was
+    head = ["(resumed at line %d of %s)" % (line, name)]
+    if repeat_pass:
+        head[0] = "(resumed at line %d of %s in pass %d of %d)" % (line, name, repeat_pass, state["repeat"][2])
+    setup = [state[field] for field in ("units", "plane", "distance") if state.get(field)]
+    if setup:
+        head.append(" ".join(setup))
+    head.append(index["laser_off"][0])
+    axes = [state[axis] for axis in "XYZ" if state.get(axis)]
+    if axes:
+        head.append("G0 " + " ".join(axes))
+    if state.get("F"):
+        head.append(state["F"])
+    laser = state.get("laser")
+    if laser and float(laser[1:]) in {float(code[1:]) for code in index["laser_on"]}:
+        head.append(laser + (" " + state["S"] if state.get("S") else ""))
+    return "".join(text + "\n" for text in head).encode()
+
+
+def resume(program, line, output, index_name=None, repeat_pass=None):
+
+    #   Writes program from line on, behind a head that restores the state the
+    #   machine was in. Returns the number of the index entry it started from.
+    index = load_index(index_name or os.path.splitext(program)[0] + ".index.json", program)
+    if not 1 <= line <= index["lines"]:
+        raise ValueError("%s has lines 1 to %d" % (program, index["lines"]))
+    entries = index["entries"]
+    n = bisect.bisect_right([entry[0] for entry in entries], line) - 1
+    entry = entries[n]
+    state = dict(zip(index["fields"], entry[2:]))
+    begin = close = None
+    if index.get("repeat"):
+        begin, close = (repeat_pattern(template) for template in index["repeat"])
+
+    with open(program, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        pos = entry[1]
+        for number in range(entry[0], line):
+            end = data.find(b"\n", pos)
+            advance(state, data[pos:end].decode(errors="replace"), index)
+            opened = begin.match(data, pos) if begin else None
+            if opened:
+                # the block's lines begin after it: line, offset, count and {n}
+                body = min(opened.end() + 1, len(data))
+                words = opened.groupdict()
+                state["repeat"] = [number + data[pos:body].count(b"\n") + 1, body] + [
+                    int(words[name]) if words.get(name) else None for name in ("count", "n")
+                ]
+            elif close and close.match(data, pos):
+                state["repeat"] = None
+            pos = end + 1
+
+        # the rest of the pass, and the block again for the passes after it
+        pieces = [(pos, len(data))]
+        reopen = b""
+        repeat = state.get("repeat")
+        if repeat:
+            closed = close.search(data, pos)
+            if not closed:
+                raise ValueError("%s has no end to the block repeated from line %d" % (program, repeat[0]))
+            last = line + data[pos : closed.start()].count(b"\n")
+            if repeat_pass is None:
+                raise ValueError(
+                    "line %d is in the block of lines %d to %d that runs %s times, give the pass it stopped in with --pass"
+                    % (line, repeat[0], last, repeat[2] if repeat[2] else "several")
+                )
+            if not repeat[2]:
+                raise ValueError("the block of lines %d to %d does not say how often it runs" % (repeat[0], last))
+            if not 1 <= repeat_pass <= repeat[2]:
+                raise ValueError("the block of lines %d to %d runs %d passes" % (repeat[0], last, repeat[2]))
+            if repeat_pass > 1:
+                # where the pass before left the machine: the lines to the end
+                # of the block and then its lines up to this one
+                for start, stop in ((pos, closed.start()), (repeat[1], pos)):
+                    for text in data[start:stop].decode(errors="replace").splitlines():
+                        advance(state, text, index)
+            if repeat_pass < repeat[2]:
+                reopen = index["repeat"][0].format(n=repeat[3], count=repeat[2] - repeat_pass).encode() + b"\n"
+                pieces = [(pos, closed.start()), (repeat[1], len(data))]
+            else:
+                pieces = [(pos, closed.start()), (min(closed.end() + 1, len(data)), len(data))]
+        elif repeat_pass is not None:
+            raise ValueError("line %d is not in a block of --repeat-passes, leave out --pass" % line)
+
+        out = sys.stdout.buffer if output == "-" else open(output + ".tmp", "wb")
+        try:
+            out.write(restart_head(state, index, line, os.path.basename(program), repeat_pass))
+            motion = state.get("motion")
+            for piece, (start, stop) in enumerate(pieces):
+                if piece:
+                    out.write(reopen)
+                motion = _copy(out, data, start, stop, motion)
+            out.flush()
+        except BaseException:
+            if out is not sys.stdout.buffer:
+                out.close()
+                os.remove(output + ".tmp")
+            raise
+        if out is not sys.stdout.buffer:
+            out.close()
+            os.replace(output + ".tmp", output)
+    return n
+
+
+def _copy(out, data, pos, stop, motion):
+
+    # Copies data[pos:stop]. The first move carries on in the motion mode it
+    # was written for: until it is out, motion is that mode, and a move
+    # without a motion code of its own gets it. Returns the motion still to
+    # give, None once the first move is out.
+    while motion and pos < stop:
+        end = data.find(b"\n", pos, stop)
+        end = stop if end < 0 else end + 1
+        text = data[pos:end].decode(errors="replace")
+        words = _words(text)
+        given = [letter + value for letter, value in words if letter == "G" and float(value) in (0, 1, 2, 3)]
+        if any(letter in _AXES for letter, value in words):
+            if not given:
+                cut = _NUMBER.match(text)
+                cut = cut.end() if cut else 0
+                text = text[:cut] + motion + " " + text[cut:]
+            out.write(text.encode())
+            pos = end
+            motion = None
+            break
+        motion = given[-1] if given else motion
+        out.write(data[pos:end])
+        pos = end
+    for start in range(pos, stop, BLOCK):
+        out.write(data[start : min(start + BLOCK, stop)])
+    return motion
+
+
+def main(argv=None):
+
+    options = parser.parse_args(argv)
+    stem, ext = os.path.splitext(options.program)
+    output = options.output or stem + ".resume" + ext
+    try:
+        resume(options.program, options.line, output, options.index, options.repeat_pass)
+    except (OSError, ValueError) as error:
+        print("laser_resume: %s" % error, file=sys.stderr)
+        return 1
+    if output != "-":
+        print("%s runs %s from line %d" % (output, options.program, options.line))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
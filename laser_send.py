@@ -0,0 +1,359 @@
+#   Streams gcode to a GRBL style controller over a serial line and keeps its
+#   receive buffer full. Part of laser_post, same license (LGPL v2.1).
+#
+#   python laser_send.py /dev/ttyUSB0 part.nc
+#   python laser_send.py /dev/ttyUSB0 part.toolpath --post-args="--laser-on M4"
+#   python laser_send.py --simulate part.nc
+#
+#   A sender that waits for the "ok" of each line before it sends the next leaves
+#   the controller without work for a round trip per line, and on dense laser
+#   output, many short moves, its planner runs dry and the head stops and starts.
+#   This one counts characters as GRBL's own stream.py does: lines go out as long
+#   as all bytes sent and not answered yet fit the controller's receive buffer
+#   (--rx-buffer, 128 bytes on GRBL), and every "ok" or "error" frees the oldest
+#   line. Comments and blank lines are not sent. --ping-pong sends the simple way,
+#   to compare.
+#
+#   A program file is sent as it is read. FreeCAD documents, command dumps and
+#   toolpath files are posted with laser_post.py while they are sent, on a thread
+#   of their own, so the machine starts at once; this needs a Python that can
+#   import FreeCAD, as laser_batch.py does. --simulate sends to a laser_sim.py
+#   controller on a pseudo-terminal instead of a machine, --sim-args sets it up.
+#
+#   At the end the lines and bytes per second are printed, how often and how long
+#   every line sent had been answered while there were more to come (the receive
+#   buffer ran empty, the sender could not keep up), and in how many of the status
+#   reports, asked for every --status seconds, the controller stood idle in the
+#   middle of the job (its planner ran dry). The sender stops at the first error or
+#   alarm; the lines already in the controller still run.
+
+import argparse
+import collections
+import contextlib
+import io
+import json
+import os
+import queue
+import re
+import select
+import sys
+import threading
+import time
+
+try:
+    import serial
+except ImportError:
+    serial = None
+
+try:
+    import termios
+    import tty
+except ImportError:
+    termios = None
+
+parser = argparse.ArgumentParser(prog="laser_send", description="stream gcode to a GRBL style controller")
+parser.add_argument("device", nargs="?", help="serial port of the controller, not needed with --simulate")
+parser.add_argument("program", help="gcode file, or a FreeCAD document, command dump (.json) or toolpath file to post")
+parser.add_argument("--baud", type=int, default=115200, help="default 115200")
+parser.add_argument("--rx-buffer", type=int, default=128, help="receive buffer of the controller in bytes, default 128")
+parser.add_argument("--ping-pong", action="store_true", help="wait for the answer to every line before the next")
+parser.add_argument("--status", type=float, default=0.2, help="seconds between status reports, 0 for none, default 0.2")
+parser.add_argument("--wait", type=float, default=5.0, help="seconds to wait for the controller to start, default 5")
+parser.add_argument("--post-args", default=None, help='laser_post arguments for a job that is posted, written as --post-args="..."')
+parser.add_argument("--simulate", action="store_true", help="send to a simulated controller, see laser_sim.py")
+parser.add_argument("--sim-args", default="", help='laser_sim arguments, written as --sim-args="..."')
+parser.add_argument("--summary", help="also write the statistics to this json file")
+
+_COMMENT = re.compile(r"\([^)]*\)|;.*")
+_STATE = re.compile(r"<([A-Za-z]+)")
+_END = None  # the last item of the line queue
+
+
+class SendError(Exception):
+    pass
+
+
+class _Port:
+
+    #   The serial port, through pyserial where it is installed, else straight
+    #   through the terminal of a POSIX system.
+
+    def __init__(self, device, baud):
+        if serial is not None:
+            self.serial = serial.Serial(device, baud, timeout=0)
+            return
+        if termios is None:
+            raise SendError("pyserial is needed to open %s on this system" % device)
+        self.serial = None
+        self.fd = os.open(device, os.O_RDWR | os.O_NOCTTY)
+        tty.setraw(self.fd)
+        attrs = termios.tcgetattr(self.fd)
+        speed = getattr(termios, "B%d" % baud, None)
+        if speed is None:
+            raise SendError("baud rate %d is not supported" % baud)
+        attrs[4] = attrs[5] = speed
+        termios.tcsetattr(self.fd, termios.TCSANOW, attrs)
+
+    def write(self, data):
+        if self.serial is not None:
+            self.serial.write(data)
+            return
+        while data:
+            data = data[os.write(self.fd, data):]
+
+    def read(self, timeout):
+        if self.serial is not None:
+            self.serial.timeout = timeout
+            data = self.serial.read(1)
+            return data + self.serial.read(self.serial.in_waiting) if data else data
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        return os.read(self.fd, 4096) if ready else b""
+
+    def close(self):
+        if self.serial is not None:
+            self.serial.close()
+        else:
+            os.close(self.fd)
+
+
+def program_lines(chunks):
+
+    # the lines worth sending, as bytes with a newline
+    for chunk in chunks:
+        for line in chunk.splitlines():
+            line = _COMMENT.sub("", line).strip()
+            if line:
+                yield line.encode("ascii", "replace") + b"\n"
+
+
+def _produce(lines, out):
+
+    # runs on a thread of its own, so a slow post never keeps answers waiting
+    try:
+        for line in lines:
+            out.put(line)
+        out.put(_END)
+    except BaseException as error:
+        out.put(error)
+
+
+def _file_chunks(filename):
+    with open(filename, errors="replace") as f:
+        while True:
+            chunk = f.read(1 << 16)
+            if not chunk:
+                return
+            # whole lines only, the rest waits for the next read
+            chunk += f.readline()
+            yield chunk
+
+
+def _job_chunks(filename, post_args):
+    import laser_batch
+
+    laser_batch.load_post()
+    for label, objects, saved_args, tag in laser_batch.read_jobs(filename):
+        args = saved_args if post_args is None else post_args
+        log = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+                chunks = laser_batch.laser_post.stream(objects, args)
+        except SystemExit:
+            # argparse gives up on arguments it does not know
+            chunks = None
+        if chunks is None:
+            said = log.getvalue().strip().splitlines()
+            raise SendError("%s: %s" % (" ".join(filter(None, (filename, label))), said[-1] if said else "bad post arguments"))
+        yield from chunks
+
+
+def _replies(port, pending, timeout):
+
+    # complete lines from the controller, pending holds what came of the last
+    data = port.read(timeout)
+    if not data:
+        return []
+    pending += data
+    *lines, rest = bytes(pending).split(b"\n")
+    pending[:] = rest
+    return [line.strip().decode(errors="replace") for line in lines if line.strip()]
+
+
+def start(port, wait):
+
+    # A soft reset, then whatever the controller says until it greets and falls
+    # silent. Opening the port may have reset it as well, so there can be two.
+    port.write(b"\x18")
+    pending = bytearray()
+    greeting = None
+    end = time.monotonic() + wait
+    while time.monotonic() < end:
+        replies = _replies(port, pending, min(end - time.monotonic(), 0.25))
+        if not replies and greeting is not None:
+            return greeting
+        for reply in replies:
+            if reply.startswith("Grbl"):
+                greeting = reply
+    if greeting is not None:
+        return greeting
+    raise SendError("the controller did not answer within %gs" % wait)
+
+
+def send(port, lines, rx_buffer=128, ping_pong=False, status=0.2):
+
+    #   Sends lines (bytes ending in a newline, or text chunks from the post or a
+    #   file through program_lines()) and waits until the controller is idle.
+    #   Returns the statistics; raises SendError at an error or alarm.
+
+    source = queue.Queue(maxsize=4096)
+    threading.Thread(target=_produce, args=(lines, source), name="laser_send program", daemon=True).start()
+
+    sent = collections.deque()  # bytes of the lines not answered yet
+    in_flight = 0
+    pending = bytearray()
+    stats = {
+        "lines": 0, "bytes": 0, "seconds": 0.0, "starved": 0, "starved_seconds": 0.0,
+        "status_reports": 0, "idle_reports": 0,
+    }
+    line = None
+    finished = False
+    starved_since = None
+    start_time = time.monotonic()
+    next_status = start_time + status if status else None
+    error = None
+
+    while True:
+        # fill the receive buffer
+        while not finished and error is None:
+            if line is None:
+                try:
+                    line = source.get_nowait()
+                except queue.Empty:
+                    break
+                if line is _END:
+                    finished = True
+                    line = None
+                    break
+                if isinstance(line, BaseException):
+                    raise line
+            if sent and (ping_pong or in_flight + len(line) > rx_buffer):
+                break
+            port.write(line)
+            sent.append(len(line))
+            in_flight += len(line)
+            stats["lines"] += 1
+            stats["bytes"] += len(line)
+            line = None
+            if starved_since is not None:
+                stats["starved_seconds"] += time.monotonic() - starved_since
+                starved_since = None
+
+        now = time.monotonic()
+        if not sent and line is None and not finished and error is None:
+            # everything has been answered and the next line is not there yet
+            if starved_since is None and stats["lines"]:
+                stats["starved"] += 1
+                starved_since = now
+            timeout = 0.001
+        else:
+            timeout = 0.05
+        if next_status is not None:
+            if now >= next_status:
+                port.write(b"?")
+                next_status = now + status
+            timeout = min(timeout, max(next_status - now, 0.0))
+        if not sent and (finished or error is not None):
+            if next_status is None:
+                break
+            timeout = min(timeout, status)
+
+        for reply in _replies(port, pending, timeout):
+            if reply == "ok" or reply.startswith("error"):
+                if not sent:
+                    continue
+                in_flight -= sent.popleft()
+                if reply != "ok" and error is None:
+                    error = "line %d: %s" % (stats["lines"] - len(sent), reply)
+            elif reply.startswith("ALARM"):
+                raise SendError(reply)
+            elif reply.startswith("Grbl"):
+                raise SendError("the controller was reset")
+            elif reply.startswith("<"):
+                state = _STATE.match(reply)
+                state = state.group(1) if state else ""
+                stats["status_reports"] += 1
+                if state == "Idle":
+                    if not sent and (finished or error is not None):
+                        # done, the last move has been made
+                        next_status = None
+                    elif stats["lines"]:
+                        stats["idle_reports"] += 1
+
+        if next_status is None and not sent and (finished or error is not None):
+            break
+
+    stats["seconds"] = round(time.monotonic() - start_time, 3)
+    stats["starved_seconds"] = round(stats["starved_seconds"], 3)
+    if error is not None:
+        raise SendError(error)
+    return stats
+
+
+def report(stats):
+    seconds = stats["seconds"] or 1e-9
+    text = "%d lines, %d bytes in %.2fs, %.0f lines/s, %.0f bytes/s\n" % (
+        stats["lines"], stats["bytes"], stats["seconds"], stats["lines"] / seconds, stats["bytes"] / seconds,
+    )
+    text += "receive buffer ran empty %d times for %.2fs" % (stats["starved"], stats["starved_seconds"])
+    if stats["status_reports"]:
+        text += ", controller idle in %d of %d status reports" % (stats["idle_reports"], stats["status_reports"])
+    return text
+
+
+def main(argv=None):
+
+    options = parser.parse_args(argv)
+    if options.device is None and not options.simulate:
+        parser.error("a device is needed, or --simulate")
+
+    controller = None
+    if options.simulate:
+        import laser_sim
+
+        sim = laser_sim.parser.parse_args(options.sim_args.split())
+        controller = laser_sim.Controller(
+            sim.rx_buffer, sim.planner, sim.baud, sim.latency, sim.time_scale, sim.rapid_rate,
+        ).start()
+        options.device = controller.device
+
+    if os.path.splitext(options.program)[1].lower() in (".fcstd", ".json", ".toolpath"):
+        chunks = _job_chunks(options.program, options.post_args)
+    else:
+        chunks = _file_chunks(options.program)
+
+    port = None
+    try:
+        port = _Port(options.device, options.baud)
+        print(start(port, options.wait))
+        stats = send(port, program_lines(chunks), options.rx_buffer, options.ping_pong, options.status)
+    except (OSError, SendError) as error:
+        print("laser_send: %s" % error, file=sys.stderr)
+        return 1
+    finally:
+        if port is not None:
+            port.close()
+        if controller is not None:
+            controller.stop()
+
+    print(report(stats))
+    if controller is not None:
+        stats["controller"] = {name: round(value, 3) for name, value in controller.stats.items()}
+        print("controller: " + laser_sim.report(controller.stats))
+    if options.summary:
+        with open(options.summary, "w") as f:
+            json.dump(stats, f, indent=1)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
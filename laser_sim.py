@@ -0,0 +1,306 @@
+#   A GRBL style laser controller on a pseudo-terminal, to try laser_send.py or
+#   any other sender without a machine. Part of laser_post, same license (LGPL v2.1).
+#
+#   python laser_sim.py
+#   python laser_sim.py --baud 115200 --latency 0.004 --time-scale 0.01
+#
+#   Prints the device to connect to and runs until Ctrl-C, then prints what it
+#   saw. Towards a sender it behaves the way GRBL 1.1 does: bytes come in at the
+#   speed of the serial line into a receive buffer of --rx-buffer bytes, a line
+#   is answered "ok" once it is planned, the planner holds --planner moves, and
+#   each move takes as long as its length at its feed, times --time-scale. "?" is
+#   answered at once with a status report, "!" and "~" hold and resume, Ctrl-X
+#   resets. Answers reach the sender --latency seconds late, as over USB. Bytes
+#   that arrive while the receive buffer is full are lost and counted, as are the
+#   times the planner ran dry in the middle of a job and the time it stood still.
+#   Needs a POSIX system.
+
+import argparse
+import collections
+import math
+import os
+import re
+import select
+import sys
+import threading
+import time
+import tty
+
+BANNER = b"\r\nGrbl 1.1h ['$' for help]\r\n"
+LINE_SIZE = 80  # characters in a line at most, as GRBL's LINE_BUFFER_SIZE
+
+parser = argparse.ArgumentParser(prog="laser_sim", description="a GRBL style controller on a pseudo-terminal")
+parser.add_argument("--rx-buffer", type=int, default=128, help="receive buffer in bytes, default 128")
+parser.add_argument("--planner", type=int, default=16, help="moves the planner holds, default 16")
+parser.add_argument("--baud", type=int, default=115200, help="speed of the serial line, default 115200")
+parser.add_argument("--latency", type=float, default=0.002, help="seconds until an answer reaches the sender, default 0.002")
+parser.add_argument("--time-scale", type=float, default=1.0, help="how long moves take against real time, default 1")
+parser.add_argument("--rapid-rate", type=float, default=6000.0, help="G0 speed in mm/min, default 6000")
+
+_COMMENT = re.compile(r"\([^)]*\)|;.*")
+_WORD = re.compile(r"([A-Z])([-+]?(?:\d+\.?\d*|\.\d+))")
+_G_CODES = {0, 1, 2, 3, 4, 17, 18, 19, 20, 21, 40, 49, 54, 55, 56, 57, 58, 59, 80, 90, 91, 93, 94}
+_M_CODES = {0, 1, 2, 3, 4, 5, 7, 8, 9, 30}
+
+
+class Controller:
+
+    #   The controller and its pseudo-terminal. start() runs it on a thread of its
+    #   own, stop() ends it; run() does the same on the calling thread.
+
+    def __init__(self, rx_buffer=128, planner=16, baud=115200, latency=0.002, time_scale=1.0, rapid_rate=6000.0):
+        self.rx_size = rx_buffer
+        self.planner_size = planner
+        self.byte_time = 10.0 / baud  # start, 8 data and stop bit
+        self.latency = latency
+        self.time_scale = time_scale
+        self.rapid_rate = rapid_rate
+        self.master, self.slave = os.openpty()
+        tty.setraw(self.slave)
+        self.device = os.ttyname(self.slave)
+        self._stop = threading.Event()
+        self._thread = None
+        self.stats = {
+            "lines": 0, "moves": 0, "errors": 0, "overflows": 0,
+            "underruns": 0, "starved_seconds": 0.0, "moving_seconds": 0.0,
+        }
+        self._reset(time.monotonic())
+
+    def _reset(self, now):
+        self.transit = collections.deque()  # [first arrival, bytes] on the line
+        self.line_free = now
+        self.rx = bytearray()
+        self.planner = collections.deque()  # seconds of every planned move
+        self.block_end = None
+        self.held = None  # seconds left of the move a hold stopped
+        self.idle_since = None
+        self.replies = collections.deque()  # [due, bytes]
+        self.motion = 0
+        self.inches = False
+        self.relative = False
+        self.feed = 0.0
+        self.position = [0.0, 0.0, 0.0]
+        self.replies.append([now + self.latency, BANNER])
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, name="laser_sim", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        os.close(self.master)
+        os.close(self.slave)
+
+    def run(self):
+        while not self._stop.is_set():
+            now = time.monotonic()
+            self._execute(now)
+            self._parse(now)
+            self._deliver(now)
+            while self.replies and self.replies[0][0] <= now:
+                os.write(self.master, self.replies.popleft()[1])
+
+            # sleep until something is due, but look at the stop flag now and then
+            due = [now + 0.05]
+            if self.transit and len(self.rx) < self.rx_size:
+                # the next line is in, or the buffer is full
+                start, data = self.transit[0]
+                end = data.find(b"\n") + 1 or len(data)
+                due.append(start + min(end, self.rx_size - len(self.rx)) * self.byte_time)
+            if self.block_end is not None and self.held is None:
+                due.append(self.block_end)
+            if self.replies:
+                due.append(self.replies[0][0])
+            ready, _, _ = select.select([self.master], [], [], max(min(due) - now, 0.0))
+            if ready:
+                try:
+                    data = os.read(self.master, 4096)
+                except OSError:  # the sender closed the device
+                    data = b""
+                self._receive(data, time.monotonic())
+
+    def _receive(self, data, now):
+
+        # realtime commands are picked out as they come in, the rest is on the
+        # line for as long as the baud rate takes
+        for byte in re.findall(rb"[?!~\x18]", data):
+            if byte == b"?":
+                self.replies.append([now + self.latency, self._status().encode()])
+            elif byte == b"!" and self.held is None and self.block_end is not None:
+                self.held = max(self.block_end - now, 0.0)
+            elif byte == b"~" and self.held is not None:
+                self.block_end = now + self.held
+                self.held = None
+            elif byte == b"\x18":
+                self._reset(now)
+        data = re.sub(rb"[?!~\x18]", b"", data)
+        if data:
+            start = max(self.line_free, now)
+            self.transit.append([start, data])
+            self.line_free = start + len(data) * self.byte_time
+
+    def _deliver(self, now):
+
+        # what has come in by now goes into the receive buffer and is read from
+        # there as it comes; what comes while the buffer is full is lost
+        while self.transit:
+            start, data = self.transit[0]
+            arrived = min(int((now - start) / self.byte_time), len(data))
+            if arrived <= 0:
+                return
+            taken = min(arrived, self.rx_size - len(self.rx))
+            if taken:
+                self.rx += data[:taken]
+                self._parse(now)
+            else:
+                taken = arrived
+                self.stats["overflows"] += arrived
+            if taken == len(data):
+                self.transit.popleft()
+            else:
+                self.transit[0] = [start + taken * self.byte_time, data[taken:]]
+
+    def _parse(self, now):
+
+        # lines wait in the buffer while the planner is full
+        while len(self.planner) < self.planner_size:
+            end = self.rx.find(b"\n")
+            if end < 0:
+                if len(self.rx) >= self.rx_size:
+                    # a line longer than the buffer can never be read, as on GRBL
+                    self.rx.clear()
+                    self._answer(b"error:11", now)
+                return
+            line = self.rx[:end].decode(errors="replace").strip().upper()
+            seconds = None
+            if line and not line.startswith(("$", "%")):
+                if len(line) > LINE_SIZE:
+                    del self.rx[: end + 1]
+                    self._answer(b"error:11", now)
+                    continue
+                seconds = self._move(line)
+                if isinstance(seconds, bytes):
+                    del self.rx[: end + 1]
+                    self._answer(seconds, now)
+                    continue
+            del self.rx[: end + 1]
+            self.stats["lines"] += 1
+            if seconds is not None:
+                self._plan(seconds, now)
+            self._answer(b"ok", now)
+
+    def _answer(self, text, now):
+        if text != b"ok":
+            self.stats["errors"] += 1
+        self.replies.append([now + self.latency, text + b"\r\n"])
+
+    def _move(self, line):
+
+        # seconds the line moves for, None for a line without a move, or an error
+        words = _WORD.findall(_COMMENT.sub("", line).replace(" ", ""))
+        target = None
+        centre = {}
+        for letter, value in words:
+            number = float(value)
+            if letter == "G":
+                if number not in _G_CODES:
+                    return b"error:20"
+                if number in (0, 1, 2, 3):
+                    self.motion = int(number)
+                elif number in (20, 21):
+                    self.inches = number == 20
+                elif number in (90, 91):
+                    self.relative = number == 91
+            elif letter == "M" and number not in _M_CODES:
+                return b"error:20"
+            elif letter == "F":
+                self.feed = number * (25.4 if self.inches else 1.0)
+            elif letter in "XYZ":
+                target = target or list(self.position)
+                axis = "XYZ".index(letter)
+                value = number * (25.4 if self.inches else 1.0)
+                target[axis] = target[axis] + value if self.relative else value
+            elif letter in "IJ":
+                centre[letter] = number * (25.4 if self.inches else 1.0)
+        if target is None:
+            return None
+        if self.motion and self.feed <= 0.0:
+            return b"error:22"  # undefined feed rate
+
+        start, self.position = self.position, target
+        length = math.dist(start, target)
+        if self.motion in (2, 3) and centre:
+            cx, cy = start[0] + centre.get("I", 0.0), start[1] + centre.get("J", 0.0)
+            radius = math.hypot(start[0] - cx, start[1] - cy)
+            sweep = math.atan2(target[1] - cy, target[0] - cx) - math.atan2(start[1] - cy, start[0] - cx)
+            if self.motion == 2:
+                sweep = -sweep
+            sweep %= 2 * math.pi
+            if sweep == 0.0:
+                sweep = 2 * math.pi
+            length = math.hypot(radius * sweep, target[2] - start[2])
+        if length == 0.0:
+            return None  # nothing to plan, as on GRBL
+        rate = self.rapid_rate if self.motion == 0 else self.feed
+        return length / rate * 60.0 * self.time_scale
+
+    def _plan(self, seconds, now):
+        self.stats["moves"] += 1
+        if self.idle_since is not None:
+            # the planner ran dry before this move came, the head stood still
+            self.stats["underruns"] += 1
+            self.stats["starved_seconds"] += now - self.idle_since
+            self.idle_since = None
+        self.planner.append(seconds)
+        if self.block_end is None:
+            self.block_end = now + seconds
+
+    def _execute(self, now):
+        if self.held is not None:
+            return
+        while self.block_end is not None and self.block_end <= now:
+            self.stats["moving_seconds"] += self.planner.popleft()
+            if self.planner:
+                self.block_end += self.planner[0]
+            else:
+                self.idle_since = self.block_end
+                self.block_end = None
+
+    def _status(self):
+        if self.held is not None:
+            state = "Hold:0"
+        else:
+            state = "Run" if self.planner else "Idle"
+        return "<%s|MPos:%.3f,%.3f,%.3f|Bf:%d,%d|FS:%d,0>\r\n" % (
+            state, *self.position, self.planner_size - len(self.planner) - 1, self.rx_size - len(self.rx), self.feed,
+        )
+
+
+def report(stats):
+    return "%d lines, %d moves, %d errors, %d bytes lost, planner ran dry %d times for %.2fs, moved %.2fs" % (
+        stats["lines"], stats["moves"], stats["errors"], stats["overflows"],
+        stats["underruns"], stats["starved_seconds"], stats["moving_seconds"],
+    )
+
+
+def main(argv=None):
+
+    options = parser.parse_args(argv)
+    controller = Controller(
+        options.rx_buffer, options.planner, options.baud, options.latency, options.time_scale, options.rapid_rate,
+    )
+    print("laser_sim on %s" % controller.device)
+    sys.stdout.flush()
+    try:
+        controller.run()
+    except KeyboardInterrupt:
+        pass
+    print(report(controller.stats))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#   The tests post the synthetic jobs of bench without FreeCAD, on the stand-ins
+#   of bench/headless.py.
+#
+#   python -m pytest tests
+
+import collections
+import contextlib
+import io
+import math
+import os
+import re
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(HERE), "bench"))
+sys.path.insert(1, os.path.dirname(HERE))
+
+import headless  # noqa: E402
+
+headless.install()
+
+from headless import Command, Operation, Toolpath  # noqa: E402
+
+import laser_post  # noqa: E402
+import workloads  # noqa: E402
+
+SIZE = 1500  # commands per job
+OPERATION_SIZE = 400  # commands per operation, so the jobs have seams where --jobs and --cache join them
+
+_OUTPUT_TIME = re.compile(r"\(Output Time:.*\)")
+_WORD = re.compile(r"([A-Z])([-+.0-9]+)")
+_COMMENT = re.compile(r"\([^)]*\)")
+
+
+@pytest.fixture(params=sorted(workloads.WORKLOADS))
+def job(request, monkeypatch):
+    # the name of a workload and its objects
+    monkeypatch.setattr(workloads, "OPERATION_SIZE", OPERATION_SIZE)
+    return request.param, workloads.WORKLOADS[request.param](SIZE)
+
+
+@pytest.fixture
+def post_text(tmp_path):
+
+    # posts objects to a file and returns the program without the time it was
+    # written, and the PostProcessor that wrote it
+    def post_text(objects, args="", name="part.nc"):
+        target = str(tmp_path / name)
+        post = laser_post.PostProcessor()
+        post.CACHE_DIR = str(tmp_path / "cache")
+        with contextlib.redirect_stdout(io.StringIO()):
+            post.export(objects, target, args + " --no-show-editor")
+        with open(target) as f:
+            return _OUTPUT_TIME.sub("", f.read()), post
+
+    return post_text
+
+
+def operation(name, *commands):
+    # an operation of (name, parameters) commands
+    return Operation(name, Toolpath([Command(command, parameters) for command, parameters in commands]))
+
+
+def square(x, y, size, feed=300.0):
+    # the commands of a square cut from its lower left corner
+    corners = [(x + size, y), (x + size, y + size), (x, y + size), (x, y)]
+    return [("G0", {"X": x, "Y": y})] + [("G1", {"X": cx, "Y": cy, "F": feed}) for cx, cy in corners]
+
+
+def moves(text, post):
+
+    # every move the machine makes, as (motion, X, Y, I, J, feed, laser on),
+    # with the modal words filled in
+    on = {3.0, 4.0} | _m_codes(post.LASER_ON)
+    off = {5.0} | _m_codes(post.LASER_OFF)
+    state = {"G": None, "X": None, "Y": None, "F": None}
+    laser = False
+    found = []
+    for line in text.splitlines():
+        words = {}
+        for letter, digits in _WORD.findall(_COMMENT.sub("", line)):
+            value = float(digits)
+            if letter == "G" and value in (0.0, 1.0, 2.0, 3.0):
+                state["G"] = value
+            elif letter == "M" and value in on | off:
+                laser = value in on
+            else:
+                words[letter] = value
+        state.update((letter, words[letter]) for letter in "XYF" if letter in words)
+        if any(letter in words for letter in "XYIJ"):
+            found.append((state["G"], state["X"], state["Y"], words.get("I"), words.get("J"), state["F"], laser))
+    return found
+
+
+def cuts(text, post):
+
+    # every cut the laser makes as its kind and its end points, in either
+    # direction, with how often it is made
+    found = collections.Counter()
+    here = None
+    for motion, x, y, i, j, feed, laser in moves(text, post):
+        if here is not None and laser and motion != 0.0:
+            found["arc" if motion in (2.0, 3.0) else "line", frozenset((here, (x, y)))] += 1
+        here = (x, y)
+    return found
+
+
+def rapid_length(text, post):
+    here = None
+    length = 0.0
+    for motion, x, y, i, j, feed, laser in moves(text, post):
+        if here is not None and motion == 0.0:
+            length += math.dist(here, (x, y))
+        here = (x, y)
+    return length
+
+
+def _m_codes(text):
+    return {float(digits) for letter, digits in _WORD.findall(text) if letter == "M"}
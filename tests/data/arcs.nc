@@ -0,0 +1,1669 @@
+(Exported by FreeCAD)
+(Post Processor: laser_post)
+
+(begin preamble)
+G17 G90
+G21
+(begin operation: TC)
+(machine units: mm/min)
+(TC: Laser) 
+M5
+(finish operation: TC)
+(begin operation: Arcs001)
+(machine units: mm/min)
+(Arcs) 
+M5
+G0 X337.769 Y151.591
+M3 S1000
+G1 X340.682 Y151.591 F1200.000
+G3 X349.947 Y151.591 I4.632 J0.000
+G2 X354.169 Y151.591 I2.111 J0.000
+G2 X357.705 Y151.591 I1.768 J0.000
+G2 X360.960 Y151.591 I1.627 J0.000
+G3 X368.529 Y151.591 I3.784 J0.000
+G3 X370.435 Y151.591 I0.953 J0.000
+G2 X377.199 Y151.591 I3.382 J0.000
+G3 X382.492 Y151.591 I2.647 J0.000
+G1 X385.288 Y151.591
+G3 X387.127 Y151.591 I0.920 J0.000
+G2 X395.193 Y151.591 I4.033 J0.000
+G3 X403.645 Y151.591 I4.226 J0.000
+G1 X404.958 Y151.591
+G2 X407.678 Y151.591 I1.360 J0.000
+G1 X410.597 Y151.591
+G2 X415.629 Y151.591 I2.516 J0.000
+G3 X424.504 Y151.591 I4.438 J0.000
+G1 X426.383 Y151.591
+G2 X432.309 Y151.591 I2.963 J0.000
+G3 X438.738 Y151.591 I3.214 J0.000
+G3 X445.105 Y151.591 I3.183 J0.000
+G2 X448.284 Y151.591 I1.589 J0.000
+G1 X449.251 Y151.591
+G3 X456.160 Y151.591 I3.455 J0.000
+G1 X458.357 Y151.591
+G1 X459.231 Y151.591
+G1 X459.932 Y151.591
+G3 X468.396 Y151.591 I4.232 J0.000
+G2 X474.117 Y151.591 I2.861 J0.000
+G3 X483.173 Y151.591 I4.528 J0.000
+G3 X488.228 Y151.591 I2.528 J0.000
+G1 X490.260 Y151.591
+G2 X496.931 Y151.591 I3.336 J0.000
+G1 X499.260 Y151.591
+G1 X500.311 Y151.591
+G2 X504.304 Y151.591 I1.996 J0.000
+G1 X505.169 Y151.591
+G2 X506.577 Y151.591 I0.704 J0.000
+G1 X508.664 Y151.591
+G3 X514.848 Y151.591 I3.092 J0.000
+G1 X517.432 Y151.591
+G1 X519.446 Y151.591
+G1 X522.373 Y151.591
+G2 X527.686 Y151.591 I2.657 J0.000
+G3 X528.891 Y151.591 I0.603 J0.000
+G2 X537.414 Y151.591 I4.262 J0.000
+G1 X539.531 Y151.591
+G3 X542.154 Y151.591 I1.311 J0.000
+G1 X542.906 Y151.591
+G3 X545.701 Y151.591 I1.397 J0.000
+G2 X550.933 Y151.591 I2.616 J0.000
+G2 X553.763 Y151.591 I1.415 J0.000
+G2 X556.187 Y151.591 I1.212 J0.000
+G3 X559.443 Y151.591 I1.628 J0.000
+G3 X560.562 Y151.591 I0.559 J0.000
+G3 X569.436 Y151.591 I4.437 J0.000
+G3 X573.933 Y151.591 I2.249 J0.000
+G1 X576.160 Y151.591
+G2 X577.872 Y151.591 I0.856 J0.000
+G3 X580.086 Y151.591 I1.107 J0.000
+G3 X583.676 Y151.591 I1.795 J0.000
+G2 X592.704 Y151.591 I4.514 J0.000
+G3 X597.196 Y151.591 I2.246 J0.000
+G2 X598.923 Y151.591 I0.863 J0.000
+G2 X601.363 Y151.591 I1.220 J0.000
+G3 X605.771 Y151.591 I2.204 J0.000
+G1 X608.450 Y151.591
+G2 X616.400 Y151.591 I3.975 J0.000
+G1 X617.060 Y151.591
+G3 X622.077 Y151.591 I2.509 J0.000
+G2 X628.513 Y151.591 I3.218 J0.000
+G3 X633.964 Y151.591 I2.726 J0.000
+G3 X635.413 Y151.591 I0.724 J0.000
+G1 X638.411 Y151.591
+G2 X640.163 Y151.591 I0.876 J0.000
+G3 X644.779 Y151.591 I2.308 J0.000
+G2 X647.701 Y151.591 I1.461 J0.000
+G2 X654.782 Y151.591 I3.541 J0.000
+G1 X656.803 Y151.591
+G1 X658.059 Y151.591
+G3 X660.699 Y151.591 I1.320 J0.000
+G2 X665.270 Y151.591 I2.285 J0.000
+G1 X668.054 Y151.591
+G3 X670.096 Y151.591 I1.021 J0.000
+G1 X671.899 Y151.591
+G2 X676.022 Y151.591 I2.062 J0.000
+G2 X677.189 Y151.591 I0.584 J0.000
+G1 X678.338 Y151.591
+G2 X682.640 Y151.591 I2.151 J0.000
+G3 X692.291 Y151.591 I4.825 J0.000
+G3 X701.416 Y151.591 I4.562 J0.000
+G2 X707.257 Y151.591 I2.921 J0.000
+G2 X710.876 Y151.591 I1.810 J0.000
+G1 X712.210 Y151.591
+G3 X719.676 Y151.591 I3.733 J0.000
+G3 X720.997 Y151.591 I0.660 J0.000
+G1 X723.952 Y151.591
+G2 X728.505 Y151.591 I2.277 J0.000
+G2 X733.808 Y151.591 I2.651 J0.000
+G2 X737.579 Y151.591 I1.885 J0.000
+G3 X746.099 Y151.591 I4.260 J0.000
+G3 X747.993 Y151.591 I0.947 J0.000
+G3 X756.561 Y151.591 I4.284 J0.000
+G1 X757.351 Y151.591
+G3 X758.691 Y151.591 I0.670 J0.000
+G2 X767.741 Y151.591 I4.525 J0.000
+G2 X772.121 Y151.591 I2.190 J0.000
+G1 X772.833 Y151.591
+G2 X774.383 Y151.591 I0.775 J0.000
+G1 X776.274 Y151.591
+G2 X785.556 Y151.591 I4.641 J0.000
+G3 X789.871 Y151.591 I2.157 J0.000
+G2 X792.370 Y151.591 I1.250 J0.000
+G2 X793.945 Y151.591 I0.787 J0.000
+G2 X799.009 Y151.591 I2.532 J0.000
+G1 X800.504 Y151.591
+G1 X801.109 Y151.591
+G2 X804.052 Y151.591 I1.472 J0.000
+G1 X805.698 Y151.591
+G2 X814.141 Y151.591 I4.221 J0.000
+G2 X823.988 Y151.591 I4.923 J0.000
+G3 X830.734 Y151.591 I3.373 J0.000
+G3 X836.192 Y151.591 I2.729 J0.000
+G2 X846.176 Y151.591 I4.992 J0.000
+G2 X855.558 Y151.591 I4.691 J0.000
+G3 X865.221 Y151.591 I4.832 J0.000
+M5
+G0 X327.247 Y7.094
+G2 X333.671 Y7.094 I3.212 J0.000 F1200.000
+M3 S1000
+G3 X339.917 Y7.094 I3.123 J0.000
+G1 X340.629 Y7.094
+G2 X341.984 Y7.094 I0.677 J0.000
+G1 X343.235 Y7.094
+G2 X348.272 Y7.094 I2.519 J0.000
+G3 X357.090 Y7.094 I4.409 J0.000
+G2 X362.635 Y7.094 I2.772 J0.000
+G2 X369.742 Y7.094 I3.554 J0.000
+G2 X378.894 Y7.094 I4.576 J0.000
+G3 X388.005 Y7.094 I4.555 J0.000
+G3 X393.345 Y7.094 I2.670 J0.000
+G2 X396.447 Y7.094 I1.551 J0.000
+G2 X397.449 Y7.094 I0.501 J0.000
+G3 X403.581 Y7.094 I3.066 J0.000
+G1 X406.231 Y7.094
+G3 X409.956 Y7.094 I1.863 J0.000
+G2 X414.409 Y7.094 I2.227 J0.000
+G3 X416.555 Y7.094 I1.073 J0.000
+G2 X420.561 Y7.094 I2.003 J0.000
+G2 X422.830 Y7.094 I1.134 J0.000
+G3 X425.192 Y7.094 I1.181 J0.000
+G3 X431.698 Y7.094 I3.253 J0.000
+G2 X433.611 Y7.094 I0.957 J0.000
+G1 X435.607 Y7.094
+G1 X436.917 Y7.094
+G2 X443.758 Y7.094 I3.420 J0.000
+G3 X451.745 Y7.094 I3.994 J0.000
+G1 X452.396 Y7.094
+G3 X458.925 Y7.094 I3.264 J0.000
+G3 X468.650 Y7.094 I4.863 J0.000
+G3 X470.794 Y7.094 I1.072 J0.000
+G2 X480.046 Y7.094 I4.626 J0.000
+G2 X488.116 Y7.094 I4.035 J0.000
+G1 X489.596 Y7.094
+G3 X492.310 Y7.094 I1.357 J0.000
+G2 X493.988 Y7.094 I0.839 J0.000
+G3 X495.348 Y7.094 I0.680 J0.000
+G2 X504.851 Y7.094 I4.752 J0.000
+G1 X507.292 Y7.094
+G3 X513.939 Y7.094 I3.323 J0.000
+G2 X523.448 Y7.094 I4.755 J0.000
+G2 X529.542 Y7.094 I3.047 J0.000
+G2 X534.283 Y7.094 I2.370 J0.000
+G2 X536.688 Y7.094 I1.203 J0.000
+G3 X541.568 Y7.094 I2.440 J0.000
+G1 X544.366 Y7.094
+G2 X551.869 Y7.094 I3.751 J0.000
+G2 X553.961 Y7.094 I1.046 J0.000
+G2 X556.563 Y7.094 I1.301 J0.000
+G2 X558.197 Y7.094 I0.817 J0.000
+G1 X559.209 Y7.094
+G2 X568.654 Y7.094 I4.722 J0.000
+G2 X572.293 Y7.094 I1.820 J0.000
+G2 X575.389 Y7.094 I1.548 J0.000
+G1 X576.170 Y7.094
+G2 X585.802 Y7.094 I4.816 J0.000
+M5
+G0 X11.174 Y41.624
+M3 S1000
+G3 X14.808 Y41.624 I1.817 J0.000 F1200.000
+G1 X17.791 Y41.624
+G1 X19.743 Y41.624
+G1 X22.487 Y41.624
+G3 X30.726 Y41.624 I4.120 J0.000
+G2 X33.856 Y41.624 I1.565 J0.000
+G2 X38.634 Y41.624 I2.389 J0.000
+G3 X45.045 Y41.624 I3.205 J0.000
+G1 X45.728 Y41.624
+G2 X51.685 Y41.624 I2.978 J0.000
+G3 X55.368 Y41.624 I1.841 J0.000
+G1 X56.980 Y41.624
+G2 X66.520 Y41.624 I4.770 J0.000
+G3 X67.596 Y41.624 I0.538 J0.000
+G3 X71.940 Y41.624 I2.172 J0.000
+G1 X72.904 Y41.624
+G1 X73.684 Y41.624
+G3 X76.069 Y41.624 I1.192 J0.000
+G3 X78.738 Y41.624 I1.334 J0.000
+G3 X81.969 Y41.624 I1.616 J0.000
+G3 X87.679 Y41.624 I2.855 J0.000
+G3 X94.415 Y41.624 I3.368 J0.000
+G3 X98.068 Y41.624 I1.826 J0.000
+G3 X99.138 Y41.624 I0.535 J0.000
+G1 X102.085 Y41.624
+G3 X108.567 Y41.624 I3.241 J0.000
+G3 X113.810 Y41.624 I2.621 J0.000
+G3 X116.901 Y41.624 I1.546 J0.000
+G2 X126.757 Y41.624 I4.928 J0.000
+G2 X133.774 Y41.624 I3.508 J0.000
+G3 X139.509 Y41.624 I2.867 J0.000
+G3 X147.228 Y41.624 I3.859 J0.000
+G2 X155.025 Y41.624 I3.899 J0.000
+G3 X156.344 Y41.624 I0.660 J0.000
+G2 X160.403 Y41.624 I2.030 J0.000
+G2 X168.261 Y41.624 I3.929 J0.000
+G2 X171.868 Y41.624 I1.804 J0.000
+G2 X178.512 Y41.624 I3.322 J0.000
+G3 X185.224 Y41.624 I3.356 J0.000
+G3 X194.360 Y41.624 I4.568 J0.000
+G2 X198.706 Y41.624 I2.173 J0.000
+G1 X200.949 Y41.624
+G2 X207.268 Y41.624 I3.160 J0.000
+G3 X210.959 Y41.624 I1.845 J0.000
+G3 X213.921 Y41.624 I1.481 J0.000
+G2 X217.785 Y41.624 I1.932 J0.000
+G3 X220.071 Y41.624 I1.143 J0.000
+G1 X222.123 Y41.624
+G1 X223.802 Y41.624
+G2 X224.893 Y41.624 I0.545 J0.000
+G3 X226.626 Y41.624 I0.866 J0.000
+G1 X227.228 Y41.624
+G3 X237.226 Y41.624 I4.999 J0.000
+G3 X240.266 Y41.624 I1.520 J0.000
+G1 X241.851 Y41.624
+G3 X246.308 Y41.624 I2.229 J0.000
+G3 X255.383 Y41.624 I4.537 J0.000
+G1 X258.216 Y41.624
+G1 X259.506 Y41.624
+G1 X260.473 Y41.624
+G3 X270.325 Y41.624 I4.926 J0.000
+G2 X274.830 Y41.624 I2.253 J0.000
+G2 X279.784 Y41.624 I2.477 J0.000
+G3 X281.232 Y41.624 I0.724 J0.000
+G1 X283.315 Y41.624
+G2 X287.587 Y41.624 I2.136 J0.000
+G1 X288.831 Y41.624
+G1 X291.503 Y41.624
+G3 X299.446 Y41.624 I3.971 J0.000
+G3 X300.932 Y41.624 I0.743 J0.000
+G3 X306.343 Y41.624 I2.706 J0.000
+G1 X307.508 Y41.624
+G1 X308.415 Y41.624
+G1 X310.552 Y41.624
+G1 X313.019 Y41.624
+G3 X322.755 Y41.624 I4.868 J0.000
+G2 X325.743 Y41.624 I1.494 J0.000
+G2 X327.664 Y41.624 I0.961 J0.000
+G3 X331.571 Y41.624 I1.953 J0.000
+G2 X334.870 Y41.624 I1.650 J0.000
+G1 X335.571 Y41.624
+G2 X339.682 Y41.624 I2.056 J0.000
+G3 X347.244 Y41.624 I3.781 J0.000
+G3 X355.984 Y41.624 I4.370 J0.000
+G2 X364.831 Y41.624 I4.424 J0.000
+G1 X367.667 Y41.624
+G1 X369.319 Y41.624
+G3 X370.746 Y41.624 I0.714 J0.000
+G2 X375.891 Y41.624 I2.572 J0.000
+G1 X376.994 Y41.624
+G2 X379.378 Y41.624 I1.192 J0.000
+G3 X381.072 Y41.624 I0.847 J0.000
+G3 X390.052 Y41.624 I4.490 J0.000
+G1 X391.003 Y41.624
+G3 X393.155 Y41.624 I1.076 J0.000
+G3 X397.032 Y41.624 I1.938 J0.000
+G1 X399.781 Y41.624
+G3 X407.882 Y41.624 I4.051 J0.000
+G3 X413.508 Y41.624 I2.813 J0.000
+G2 X416.857 Y41.624 I1.674 J0.000
+G1 X418.895 Y41.624
+G3 X421.448 Y41.624 I1.277 J0.000
+G1 X422.659 Y41.624
+G3 X429.596 Y41.624 I3.468 J0.000
+G3 X431.692 Y41.624 I1.048 J0.000
+M5
+G0 X47.298 Y147.457
+M3 S1000
+G1 X49.589 Y147.457 F1200.000
+G2 X53.129 Y147.457 I1.770 J0.000
+G1 X54.397 Y147.457
+G3 X58.756 Y147.457 I2.179 J0.000
+G2 X61.299 Y147.457 I1.271 J0.000
+G2 X65.250 Y147.457 I1.975 J0.000
+G2 X74.141 Y147.457 I4.446 J0.000
+G2 X79.735 Y147.457 I2.797 J0.000
+G1 X80.752 Y147.457
+G2 X86.222 Y147.457 I2.735 J0.000
+G1 X87.053 Y147.457
+G1 X88.514 Y147.457
+G3 X90.707 Y147.457 I1.096 J0.000
+G2 X92.679 Y147.457 I0.986 J0.000
+G3 X96.907 Y147.457 I2.114 J0.000
+G2 X106.534 Y147.457 I4.814 J0.000
+G3 X111.987 Y147.457 I2.726 J0.000
+G2 X119.325 Y147.457 I3.669 J0.000
+G2 X125.763 Y147.457 I3.219 J0.000
+G3 X133.832 Y147.457 I4.034 J0.000
+G3 X136.710 Y147.457 I1.439 J0.000
+G3 X146.365 Y147.457 I4.828 J0.000
+G2 X153.381 Y147.457 I3.508 J0.000
+G3 X160.425 Y147.457 I3.522 J0.000
+G1 X162.359 Y147.457
+G1 X164.435 Y147.457
+G2 X169.855 Y147.457 I2.710 J0.000
+G1 X170.468 Y147.457
+G1 X172.602 Y147.457
+G1 X173.258 Y147.457
+G2 X178.062 Y147.457 I2.402 J0.000
+G3 X180.341 Y147.457 I1.139 J0.000
+G1 X181.663 Y147.457
+G3 X189.388 Y147.457 I3.863 J0.000
+G1 X192.116 Y147.457
+G3 X200.357 Y147.457 I4.121 J0.000
+G2 X206.440 Y147.457 I3.041 J0.000
+G2 X210.952 Y147.457 I2.256 J0.000
+G2 X217.549 Y147.457 I3.298 J0.000
+G1 X218.642 Y147.457
+G2 X221.229 Y147.457 I1.293 J0.000
+G2 X230.296 Y147.457 I4.533 J0.000
+G2 X235.140 Y147.457 I2.422 J0.000
+G2 X240.258 Y147.457 I2.559 J0.000
+G3 X241.618 Y147.457 I0.680 J0.000
+G2 X249.213 Y147.457 I3.797 J0.000
+G3 X258.218 Y147.457 I4.503 J0.000
+G1 X259.450 Y147.457
+G1 X260.540 Y147.457
+G3 X268.160 Y147.457 I3.810 J0.000
+G3 X276.390 Y147.457 I4.115 J0.000
+G1 X278.216 Y147.457
+G2 X283.436 Y147.457 I2.610 J0.000
+G3 X289.570 Y147.457 I3.067 J0.000
+G3 X290.915 Y147.457 I0.672 J0.000
+G3 X295.549 Y147.457 I2.317 J0.000
+G1 X296.732 Y147.457
+G3 X300.017 Y147.457 I1.643 J0.000
+G3 X307.876 Y147.457 I3.929 J0.000
+G3 X316.385 Y147.457 I4.255 J0.000
+G1 X318.300 Y147.457
+G2 X328.017 Y147.457 I4.858 J0.000
+G3 X335.498 Y147.457 I3.740 J0.000
+G1 X338.168 Y147.457
+G1 X340.784 Y147.457
+G2 X347.048 Y147.457 I3.132 J0.000
+G3 X356.619 Y147.457 I4.785 J0.000
+G3 X360.260 Y147.457 I1.820 J0.000
+G2 X366.666 Y147.457 I3.203 J0.000
+G1 X367.518 Y147.457
+G1 X368.333 Y147.457
+G3 X377.870 Y147.457 I4.769 J0.000
+G3 X384.848 Y147.457 I3.489 J0.000
+G3 X387.537 Y147.457 I1.344 J0.000
+G2 X396.008 Y147.457 I4.236 J0.000
+G1 X398.107 Y147.457
+G3 X407.581 Y147.457 I4.737 J0.000
+G3 X410.973 Y147.457 I1.696 J0.000
+G1 X413.420 Y147.457
+G3 X416.944 Y147.457 I1.762 J0.000
+G3 X422.935 Y147.457 I2.996 J0.000
+G1 X425.391 Y147.457
+G2 X433.994 Y147.457 I4.301 J0.000
+G3 X441.306 Y147.457 I3.656 J0.000
+G3 X450.852 Y147.457 I4.773 J0.000
+G2 X459.038 Y147.457 I4.093 J0.000
+G2 X463.298 Y147.457 I2.130 J0.000
+G3 X469.976 Y147.457 I3.339 J0.000
+G1 X472.315 Y147.457
+G2 X475.493 Y147.457 I1.589 J0.000
+G2 X484.832 Y147.457 I4.669 J0.000
+G3 X487.962 Y147.457 I1.565 J0.000
+G2 X497.017 Y147.457 I4.527 J0.000
+G2 X499.497 Y147.457 I1.240 J0.000
+G3 X506.210 Y147.457 I3.356 J0.000
+G3 X515.146 Y147.457 I4.468 J0.000
+G2 X516.962 Y147.457 I0.908 J0.000
+(finish operation: Arcs001)
+(begin operation: Arcs002)
+(machine units: mm/min)
+(Arcs) 
+G2 X524.825 Y147.457 I3.931 J0.000
+G3 X529.304 Y147.457 I2.240 J0.000
+G3 X537.707 Y147.457 I4.201 J0.000
+G3 X543.826 Y147.457 I3.060 J0.000
+G3 X545.045 Y147.457 I0.609 J0.000
+G2 X547.263 Y147.457 I1.109 J0.000
+G2 X551.390 Y147.457 I2.063 J0.000
+G1 X553.683 Y147.457
+G3 X558.923 Y147.457 I2.620 J0.000
+G2 X567.529 Y147.457 I4.303 J0.000
+G3 X576.676 Y147.457 I4.574 J0.000
+G2 X578.955 Y147.457 I1.140 J0.000
+G2 X582.710 Y147.457 I1.877 J0.000
+G1 X585.442 Y147.457
+M5
+G0 X364.248 Y141.063
+M3 S1000
+G3 X369.925 Y141.063 I2.838 J0.000 F1200.000
+G2 X374.027 Y141.063 I2.051 J0.000
+G1 X374.963 Y141.063
+G3 X383.165 Y141.063 I4.101 J0.000
+G3 X386.450 Y141.063 I1.642 J0.000
+G2 X391.558 Y141.063 I2.554 J0.000
+G2 X396.598 Y141.063 I2.520 J0.000
+G1 X398.561 Y141.063
+G3 X399.866 Y141.063 I0.652 J0.000
+G3 X401.510 Y141.063 I0.822 J0.000
+G2 X409.821 Y141.063 I4.155 J0.000
+G2 X419.035 Y141.063 I4.607 J0.000
+G2 X425.038 Y141.063 I3.002 J0.000
+G2 X429.128 Y141.063 I2.045 J0.000
+G1 X431.147 Y141.063
+G3 X435.170 Y141.063 I2.011 J0.000
+G2 X445.055 Y141.063 I4.943 J0.000
+G1 X447.869 Y141.063
+G1 X448.681 Y141.063
+G2 X455.149 Y141.063 I3.234 J0.000
+G3 X456.707 Y141.063 I0.779 J0.000
+G2 X465.912 Y141.063 I4.603 J0.000
+G2 X474.429 Y141.063 I4.258 J0.000
+G3 X479.395 Y141.063 I2.483 J0.000
+G3 X485.460 Y141.063 I3.032 J0.000
+G3 X486.736 Y141.063 I0.638 J0.000
+G1 X488.205 Y141.063
+G3 X490.315 Y141.063 I1.055 J0.000
+G1 X491.825 Y141.063
+G3 X500.898 Y141.063 I4.536 J0.000
+G3 X506.884 Y141.063 I2.993 J0.000
+M5
+G0 X190.613 Y171.595
+M3 S1000
+G3 X198.730 Y171.595 I4.058 J0.000 F1200.000
+G1 X200.519 Y171.595
+G3 X202.240 Y171.595 I0.860 J0.000
+G2 X207.483 Y171.595 I2.621 J0.000
+G1 X209.274 Y171.595
+G2 X218.913 Y171.595 I4.819 J0.000
+G2 X221.324 Y171.595 I1.206 J0.000
+G1 X223.773 Y171.595
+G1 X225.972 Y171.595
+G3 X235.379 Y171.595 I4.704 J0.000
+G3 X240.726 Y171.595 I2.673 J0.000
+G1 X241.826 Y171.595
+G2 X244.357 Y171.595 I1.265 J0.000
+G3 X246.829 Y171.595 I1.236 J0.000
+G2 X255.718 Y171.595 I4.444 J0.000
+G2 X263.655 Y171.595 I3.968 J0.000
+G3 X264.705 Y171.595 I0.525 J0.000
+G2 X267.253 Y171.595 I1.274 J0.000
+G1 X269.813 Y171.595
+G2 X271.157 Y171.595 I0.672 J0.000
+G2 X273.486 Y171.595 I1.165 J0.000
+G2 X277.905 Y171.595 I2.209 J0.000
+G3 X284.017 Y171.595 I3.056 J0.000
+G3 X293.320 Y171.595 I4.651 J0.000
+G2 X299.120 Y171.595 I2.900 J0.000
+G1 X301.036 Y171.595
+G3 X302.905 Y171.595 I0.935 J0.000
+G1 X304.359 Y171.595
+G3 X307.519 Y171.595 I1.580 J0.000
+G3 X313.752 Y171.595 I3.116 J0.000
+G3 X322.717 Y171.595 I4.483 J0.000
+G3 X329.154 Y171.595 I3.218 J0.000
+G3 X332.640 Y171.595 I1.743 J0.000
+G2 X337.157 Y171.595 I2.258 J0.000
+G2 X345.830 Y171.595 I4.337 J0.000
+G3 X347.071 Y171.595 I0.621 J0.000
+G3 X356.860 Y171.595 I4.894 J0.000
+G3 X364.278 Y171.595 I3.709 J0.000
+G1 X365.630 Y171.595
+G3 X371.942 Y171.595 I3.156 J0.000
+G3 X373.954 Y171.595 I1.006 J0.000
+G3 X380.612 Y171.595 I3.329 J0.000
+G2 X388.392 Y171.595 I3.890 J0.000
+G3 X391.711 Y171.595 I1.659 J0.000
+G3 X398.421 Y171.595 I3.355 J0.000
+G3 X399.735 Y171.595 I0.657 J0.000
+G3 X407.286 Y171.595 I3.775 J0.000
+G1 X408.062 Y171.595
+G3 X409.343 Y171.595 I0.641 J0.000
+G2 X416.120 Y171.595 I3.389 J0.000
+G2 X422.024 Y171.595 I2.952 J0.000
+G1 X423.043 Y171.595
+G1 X424.856 Y171.595
+G3 X429.069 Y171.595 I2.106 J0.000
+G2 X433.085 Y171.595 I2.008 J0.000
+G3 X442.312 Y171.595 I4.614 J0.000
+G2 X445.668 Y171.595 I1.678 J0.000
+G3 X451.182 Y171.595 I2.757 J0.000
+G3 X453.484 Y171.595 I1.151 J0.000
+G3 X461.178 Y171.595 I3.847 J0.000
+G1 X463.965 Y171.595
+G3 X468.477 Y171.595 I2.256 J0.000
+G3 X478.159 Y171.595 I4.841 J0.000
+G2 X485.310 Y171.595 I3.575 J0.000
+G1 X487.268 Y171.595
+G2 X497.098 Y171.595 I4.915 J0.000
+G2 X503.924 Y171.595 I3.413 J0.000
+G2 X510.352 Y171.595 I3.214 J0.000
+G2 X517.939 Y171.595 I3.794 J0.000
+G2 X526.080 Y171.595 I4.070 J0.000
+G1 X527.485 Y171.595
+G3 X531.350 Y171.595 I1.933 J0.000
+G3 X538.620 Y171.595 I3.635 J0.000
+G2 X541.679 Y171.595 I1.529 J0.000
+G2 X550.124 Y171.595 I4.223 J0.000
+G2 X555.696 Y171.595 I2.786 J0.000
+G1 X557.804 Y171.595
+G1 X560.788 Y171.595
+G3 X567.734 Y171.595 I3.473 J0.000
+G2 X572.379 Y171.595 I2.323 J0.000
+G2 X581.656 Y171.595 I4.638 J0.000
+G3 X587.741 Y171.595 I3.042 J0.000
+G3 X589.522 Y171.595 I0.891 J0.000
+G3 X595.083 Y171.595 I2.781 J0.000
+G1 X597.133 Y171.595
+G3 X602.700 Y171.595 I2.784 J0.000
+G3 X605.330 Y171.595 I1.315 J0.000
+G1 X607.960 Y171.595
+G2 X610.253 Y171.595 I1.146 J0.000
+G3 X615.556 Y171.595 I2.652 J0.000
+G2 X618.945 Y171.595 I1.695 J0.000
+G3 X622.616 Y171.595 I1.835 J0.000
+G2 X624.863 Y171.595 I1.124 J0.000
+G2 X627.095 Y171.595 I1.116 J0.000
+G1 X629.750 Y171.595
+G3 X637.548 Y171.595 I3.899 J0.000
+G3 X639.511 Y171.595 I0.982 J0.000
+G3 X648.384 Y171.595 I4.436 J0.000
+G2 X655.555 Y171.595 I3.586 J0.000
+G1 X658.152 Y171.595
+G3 X661.173 Y171.595 I1.511 J0.000
+G3 X670.767 Y171.595 I4.797 J0.000
+G1 X672.029 Y171.595
+G3 X679.680 Y171.595 I3.825 J0.000
+G3 X681.989 Y171.595 I1.155 J0.000
+G3 X689.671 Y171.595 I3.841 J0.000
+G3 X697.705 Y171.595 I4.017 J0.000
+G2 X699.869 Y171.595 I1.082 J0.000
+G3 X705.372 Y171.595 I2.751 J0.000
+G1 X707.645 Y171.595
+G3 X711.874 Y171.595 I2.114 J0.000
+G3 X716.481 Y171.595 I2.304 J0.000
+G3 X721.799 Y171.595 I2.659 J0.000
+G1 X722.685 Y171.595
+G3 X730.375 Y171.595 I3.845 J0.000
+G3 X732.364 Y171.595 I0.995 J0.000
+G3 X737.548 Y171.595 I2.592 J0.000
+G2 X747.337 Y171.595 I4.895 J0.000
+G3 X752.857 Y171.595 I2.760 J0.000
+G1 X754.652 Y171.595
+G1 X756.332 Y171.595
+G3 X765.880 Y171.595 I4.774 J0.000
+G2 X772.058 Y171.595 I3.089 J0.000
+G3 X775.429 Y171.595 I1.686 J0.000
+G1 X776.381 Y171.595
+G2 X777.636 Y171.595 I0.627 J0.000
+G1 X779.472 Y171.595
+G1 X782.026 Y171.595
+G2 X791.238 Y171.595 I4.606 J0.000
+G2 X794.018 Y171.595 I1.390 J0.000
+G3 X800.610 Y171.595 I3.296 J0.000
+G1 X801.553 Y171.595
+G1 X804.374 Y171.595
+G3 X812.640 Y171.595 I4.133 J0.000
+G1 X815.581 Y171.595
+G1 X818.467 Y171.595
+G1 X819.835 Y171.595
+G3 X823.870 Y171.595 I2.018 J0.000
+G2 X830.234 Y171.595 I3.182 J0.000
+G2 X832.163 Y171.595 I0.965 J0.000
+G2 X839.394 Y171.595 I3.616 J0.000
+G3 X845.553 Y171.595 I3.079 J0.000
+G1 X847.323 Y171.595
+G1 X848.087 Y171.595
+G3 X850.207 Y171.595 I1.060 J0.000
+G3 X855.302 Y171.595 I2.547 J0.000
+G1 X856.438 Y171.595
+G1 X858.201 Y171.595
+G3 X866.971 Y171.595 I4.385 J0.000
+G1 X868.672 Y171.595
+G2 X869.887 Y171.595 I0.608 J0.000
+G3 X879.514 Y171.595 I4.814 J0.000
+G1 X880.617 Y171.595
+G3 X882.886 Y171.595 I1.134 J0.000
+G2 X889.766 Y171.595 I3.440 J0.000
+G2 X895.467 Y171.595 I2.851 J0.000
+G1 X898.299 Y171.595
+M5
+G0 X252.361 Y24.551
+M3 S1000
+G1 X252.953 Y24.551 F1200.000
+G3 X261.200 Y24.551 I4.123 J0.000
+G3 X263.888 Y24.551 I1.344 J0.000
+G1 X265.365 Y24.551
+G3 X273.582 Y24.551 I4.108 J0.000
+G2 X280.721 Y24.551 I3.569 J0.000
+G3 X283.370 Y24.551 I1.324 J0.000
+G1 X285.592 Y24.551
+G2 X292.560 Y24.551 I3.484 J0.000
+G3 X293.857 Y24.551 I0.648 J0.000
+G2 X302.448 Y24.551 I4.296 J0.000
+G1 X303.104 Y24.551
+G1 X305.789 Y24.551
+G2 X312.737 Y24.551 I3.474 J0.000
+G3 X320.552 Y24.551 I3.908 J0.000
+G3 X327.259 Y24.551 I3.353 J0.000
+G2 X331.302 Y24.551 I2.022 J0.000
+G1 X333.195 Y24.551
+G3 X338.139 Y24.551 I2.472 J0.000
+G3 X341.996 Y24.551 I1.929 J0.000
+G1 X343.046 Y24.551
+G1 X343.935 Y24.551
+G2 X353.492 Y24.551 I4.778 J0.000
+G2 X360.830 Y24.551 I3.669 J0.000
+G3 X362.618 Y24.551 I0.894 J0.000
+G3 X371.483 Y24.551 I4.433 J0.000
+G2 X378.183 Y24.551 I3.350 J0.000
+G3 X387.341 Y24.551 I4.579 J0.000
+G2 X393.176 Y24.551 I2.917 J0.000
+G2 X400.750 Y24.551 I3.787 J0.000
+G1 X402.793 Y24.551
+G2 X404.546 Y24.551 I0.877 J0.000
+G2 X407.698 Y24.551 I1.576 J0.000
+G3 X417.323 Y24.551 I4.813 J0.000
+G1 X418.469 Y24.551
+M5
+G0 X237.407 Y55.691
+M3 S1000
+G3 X245.121 Y55.691 I3.857 J0.000 F1200.000
+G1 X247.096 Y55.691
+G3 X248.492 Y55.691 I0.698 J0.000
+G2 X254.564 Y55.691 I3.036 J0.000
+G3 X260.310 Y55.691 I2.873 J0.000
+G2 X267.873 Y55.691 I3.781 J0.000
+G1 X269.891 Y55.691
+G2 X272.093 Y55.691 I1.101 J0.000
+G3 X274.163 Y55.691 I1.035 J0.000
+G1 X276.236 Y55.691
+G3 X278.275 Y55.691 I1.019 J0.000
+G2 X286.503 Y55.691 I4.114 J0.000
+G2 X292.378 Y55.691 I2.938 J0.000
+G2 X298.348 Y55.691 I2.985 J0.000
+G3 X306.724 Y55.691 I4.188 J0.000
+G2 X310.820 Y55.691 I2.048 J0.000
+G2 X315.579 Y55.691 I2.379 J0.000
+G2 X317.517 Y55.691 I0.969 J0.000
+G3 X323.793 Y55.691 I3.138 J0.000
+G1 X326.394 Y55.691
+G1 X327.136 Y55.691
+G2 X330.089 Y55.691 I1.476 J0.000
+G3 X339.746 Y55.691 I4.828 J0.000
+G1 X341.992 Y55.691
+G3 X344.414 Y55.691 I1.211 J0.000
+G2 X350.339 Y55.691 I2.963 J0.000
+G1 X352.910 Y55.691
+G2 X356.401 Y55.691 I1.746 J0.000
+G1 X358.949 Y55.691
+G3 X366.307 Y55.691 I3.679 J0.000
+G1 X368.336 Y55.691
+G3 X370.368 Y55.691 I1.016 J0.000
+G3 X375.982 Y55.691 I2.807 J0.000
+G3 X377.783 Y55.691 I0.900 J0.000
+G1 X379.766 Y55.691
+G3 X383.684 Y55.691 I1.959 J0.000
+G1 X385.276 Y55.691
+G2 X386.558 Y55.691 I0.641 J0.000
+G3 X389.982 Y55.691 I1.712 J0.000
+G3 X395.912 Y55.691 I2.965 J0.000
+G1 X398.184 Y55.691
+G2 X405.414 Y55.691 I3.615 J0.000
+G3 X406.919 Y55.691 I0.752 J0.000
+G3 X413.161 Y55.691 I3.121 J0.000
+G3 X422.356 Y55.691 I4.597 J0.000
+G3 X429.730 Y55.691 I3.687 J0.000
+G2 X435.417 Y55.691 I2.843 J0.000
+G2 X440.713 Y55.691 I2.648 J0.000
+G1 X441.983 Y55.691
+G3 X451.121 Y55.691 I4.569 J0.000
+G1 X453.505 Y55.691
+G2 X455.626 Y55.691 I1.061 J0.000
+G3 X459.043 Y55.691 I1.708 J0.000
+G2 X468.474 Y55.691 I4.716 J0.000
+G1 X471.192 Y55.691
+G2 X474.014 Y55.691 I1.411 J0.000
+G1 X475.266 Y55.691
+G1 X477.145 Y55.691
+G2 X478.390 Y55.691 I0.623 J0.000
+G2 X485.886 Y55.691 I3.748 J0.000
+G1 X487.786 Y55.691
+G2 X494.019 Y55.691 I3.116 J0.000
+G3 X499.735 Y55.691 I2.858 J0.000
+G2 X508.435 Y55.691 I4.350 J0.000
+G2 X516.544 Y55.691 I4.055 J0.000
+G1 X517.464 Y55.691
+G3 X520.376 Y55.691 I1.456 J0.000
+G1 X523.016 Y55.691
+G2 X532.108 Y55.691 I4.546 J0.000
+G1 X534.475 Y55.691
+G1 X535.965 Y55.691
+G3 X545.827 Y55.691 I4.931 J0.000
+G2 X549.151 Y55.691 I1.662 J0.000
+G2 X551.571 Y55.691 I1.210 J0.000
+G2 X560.293 Y55.691 I4.361 J0.000
+G3 X561.896 Y55.691 I0.802 J0.000
+M5
+G0 X99.595 Y142.028
+M3 S1000
+G1 X101.662 Y142.028 F1200.000
+G2 X102.784 Y142.028 I0.561 J0.000
+G3 X107.006 Y142.028 I2.111 J0.000
+G2 X114.200 Y142.028 I3.597 J0.000
+G1 X116.717 Y142.028
+G3 X125.416 Y142.028 I4.349 J0.000
+G2 X129.129 Y142.028 I1.856 J0.000
+G3 X132.792 Y142.028 I1.832 J0.000
+G3 X139.533 Y142.028 I3.370 J0.000
+G3 X144.144 Y142.028 I2.306 J0.000
+G2 X151.959 Y142.028 I3.907 J0.000
+G1 X153.000 Y142.028
+G3 X158.587 Y142.028 I2.793 J0.000
+G3 X161.917 Y142.028 I1.665 J0.000
+G2 X168.772 Y142.028 I3.427 J0.000
+G3 X171.521 Y142.028 I1.374 J0.000
+G2 X173.140 Y142.028 I0.809 J0.000
+G2 X181.841 Y142.028 I4.351 J0.000
+G2 X184.790 Y142.028 I1.475 J0.000
+G3 X193.955 Y142.028 I4.582 J0.000
+G2 X197.364 Y142.028 I1.705 J0.000
+G1 X200.156 Y142.028
+G1 X202.831 Y142.028
+G3 X205.956 Y142.028 I1.563 J0.000
+G2 X214.680 Y142.028 I4.362 J0.000
+G2 X222.719 Y142.028 I4.019 J0.000
+G3 X223.847 Y142.028 I0.564 J0.000
+G3 X226.725 Y142.028 I1.439 J0.000
+G1 X227.686 Y142.028
+G1 X229.831 Y142.028
+G2 X235.382 Y142.028 I2.775 J0.000
+G2 X236.870 Y142.028 I0.744 J0.000
+G2 X243.704 Y142.028 I3.417 J0.000
+G3 X248.478 Y142.028 I2.387 J0.000
+G2 X255.114 Y142.028 I3.318 J0.000
+G2 X259.166 Y142.028 I2.026 J0.000
+G3 X268.987 Y142.028 I4.910 J0.000
+G3 X274.318 Y142.028 I2.666 J0.000
+G3 X281.132 Y142.028 I3.407 J0.000
+G2 X283.568 Y142.028 I1.218 J0.000
+G3 X289.598 Y142.028 I3.015 J0.000
+G2 X294.390 Y142.028 I2.396 J0.000
+G2 X299.162 Y142.028 I2.386 J0.000
+G2 X307.478 Y142.028 I4.158 J0.000
+G2 X309.481 Y142.028 I1.001 J0.000
+G2 X314.822 Y142.028 I2.670 J0.000
+G3 X319.654 Y142.028 I2.416 J0.000
+G2 X326.371 Y142.028 I3.359 J0.000
+G1 X328.391 Y142.028
+G2 X337.971 Y142.028 I4.790 J0.000
+G3 X346.025 Y142.028 I4.027 J0.000
+G2 X349.845 Y142.028 I1.910 J0.000
+G1 X351.325 Y142.028
+G2 X361.201 Y142.028 I4.938 J0.000
+G1 X363.989 Y142.028
+G3 X365.413 Y142.028 I0.712 J0.000
+G1 X367.741 Y142.028
+G2 X372.384 Y142.028 I2.321 J0.000
+G2 X377.395 Y142.028 I2.506 J0.000
+G2 X386.512 Y142.028 I4.559 J0.000
+G2 X389.027 Y142.028 I1.258 J0.000
+G3 X392.618 Y142.028 I1.795 J0.000
+G1 X394.829 Y142.028
+G2 X403.590 Y142.028 I4.380 J0.000
+G2 X410.345 Y142.028 I3.378 J0.000
+G2 X418.839 Y142.028 I4.247 J0.000
+G3 X420.869 Y142.028 I1.015 J0.000
+G1 X423.421 Y142.028
+G2 X427.393 Y142.028 I1.986 J0.000
+G1 X428.411 Y142.028
+(finish operation: Arcs002)
+(begin operation: Arcs003)
+(machine units: mm/min)
+(Arcs) 
+G3 X435.551 Y142.028 I3.570 J0.000
+G3 X437.311 Y142.028 I0.880 J0.000
+G3 X445.300 Y142.028 I3.994 J0.000
+G2 X450.967 Y142.028 I2.834 J0.000
+G1 X452.466 Y142.028
+G2 X456.287 Y142.028 I1.910 J0.000
+G1 X456.873 Y142.028
+G2 X458.916 Y142.028 I1.021 J0.000
+G3 X465.004 Y142.028 I3.044 J0.000
+G3 X473.828 Y142.028 I4.412 J0.000
+G3 X482.162 Y142.028 I4.167 J0.000
+G2 X485.253 Y142.028 I1.545 J0.000
+G3 X493.288 Y142.028 I4.017 J0.000
+G2 X498.898 Y142.028 I2.805 J0.000
+G3 X504.176 Y142.028 I2.639 J0.000
+G2 X510.747 Y142.028 I3.286 J0.000
+G2 X512.752 Y142.028 I1.002 J0.000
+G3 X514.110 Y142.028 I0.679 J0.000
+G1 X515.283 Y142.028
+G3 X524.511 Y142.028 I4.614 J0.000
+G1 X526.630 Y142.028
+G1 X528.767 Y142.028
+G2 X537.751 Y142.028 I4.492 J0.000
+G3 X545.602 Y142.028 I3.925 J0.000
+G2 X555.583 Y142.028 I4.990 J0.000
+G3 X562.841 Y142.028 I3.629 J0.000
+G1 X563.409 Y142.028
+G2 X570.017 Y142.028 I3.304 J0.000
+G3 X573.854 Y142.028 I1.919 J0.000
+G2 X579.965 Y142.028 I3.055 J0.000
+G3 X584.488 Y142.028 I2.261 J0.000
+G3 X587.653 Y142.028 I1.583 J0.000
+G3 X593.481 Y142.028 I2.914 J0.000
+G3 X596.625 Y142.028 I1.572 J0.000
+G2 X598.943 Y142.028 I1.159 J0.000
+G1 X601.343 Y142.028
+G2 X607.171 Y142.028 I2.914 J0.000
+G2 X612.193 Y142.028 I2.511 J0.000
+G2 X618.596 Y142.028 I3.201 J0.000
+G3 X620.396 Y142.028 I0.900 J0.000
+G3 X624.039 Y142.028 I1.822 J0.000
+G3 X628.225 Y142.028 I2.093 J0.000
+G2 X629.411 Y142.028 I0.593 J0.000
+G2 X635.847 Y142.028 I3.218 J0.000
+G3 X640.972 Y142.028 I2.563 J0.000
+G3 X648.169 Y142.028 I3.599 J0.000
+G3 X656.806 Y142.028 I4.318 J0.000
+G1 X659.593 Y142.028
+G2 X663.604 Y142.028 I2.006 J0.000
+G3 X670.139 Y142.028 I3.267 J0.000
+G3 X679.231 Y142.028 I4.546 J0.000
+G2 X688.745 Y142.028 I4.757 J0.000
+G2 X698.705 Y142.028 I4.980 J0.000
+G3 X699.863 Y142.028 I0.579 J0.000
+G2 X708.213 Y142.028 I4.175 J0.000
+G2 X711.327 Y142.028 I1.557 J0.000
+G3 X719.739 Y142.028 I4.206 J0.000
+G1 X721.710 Y142.028
+G2 X723.865 Y142.028 I1.078 J0.000
+G2 X726.294 Y142.028 I1.214 J0.000
+G2 X729.328 Y142.028 I1.517 J0.000
+G3 X732.649 Y142.028 I1.660 J0.000
+G1 X734.690 Y142.028
+G1 X735.530 Y142.028
+G2 X740.193 Y142.028 I2.331 J0.000
+G1 X742.165 Y142.028
+G2 X749.091 Y142.028 I3.463 J0.000
+G2 X756.763 Y142.028 I3.836 J0.000
+G3 X764.058 Y142.028 I3.647 J0.000
+G2 X771.686 Y142.028 I3.814 J0.000
+G2 X780.101 Y142.028 I4.208 J0.000
+G2 X782.411 Y142.028 I1.155 J0.000
+G2 X791.957 Y142.028 I4.773 J0.000
+G3 X798.934 Y142.028 I3.489 J0.000
+G1 X801.057 Y142.028
+G2 X808.135 Y142.028 I3.539 J0.000
+G1 X809.860 Y142.028
+G3 X816.158 Y142.028 I3.149 J0.000
+G1 X818.039 Y142.028
+G1 X819.478 Y142.028
+G2 X828.654 Y142.028 I4.588 J0.000
+G3 X830.900 Y142.028 I1.123 J0.000
+G1 X832.054 Y142.028
+G2 X834.810 Y142.028 I1.378 J0.000
+G3 X838.196 Y142.028 I1.693 J0.000
+G3 X839.657 Y142.028 I0.731 J0.000
+G2 X844.113 Y142.028 I2.228 J0.000
+G2 X851.525 Y142.028 I3.706 J0.000
+G3 X855.273 Y142.028 I1.874 J0.000
+G3 X861.452 Y142.028 I3.090 J0.000
+G1 X862.461 Y142.028
+G3 X864.339 Y142.028 I0.939 J0.000
+G1 X866.523 Y142.028
+G2 X869.034 Y142.028 I1.256 J0.000
+G1 X869.772 Y142.028
+G2 X871.399 Y142.028 I0.813 J0.000
+G2 X874.365 Y142.028 I1.483 J0.000
+G1 X877.013 Y142.028
+G3 X883.448 Y142.028 I3.217 J0.000
+G3 X892.230 Y142.028 I4.391 J0.000
+G2 X897.472 Y142.028 I2.621 J0.000
+G2 X907.295 Y142.028 I4.911 J0.000
+G2 X908.607 Y142.028 I0.656 J0.000
+G2 X914.268 Y142.028 I2.831 J0.000
+G3 X916.558 Y142.028 I1.145 J0.000
+G3 X922.997 Y142.028 I3.219 J0.000
+G3 X930.639 Y142.028 I3.821 J0.000
+G2 X932.437 Y142.028 I0.899 J0.000
+G2 X936.772 Y142.028 I2.168 J0.000
+G1 X937.612 Y142.028
+G2 X940.773 Y142.028 I1.580 J0.000
+G3 X943.069 Y142.028 I1.148 J0.000
+G3 X945.379 Y142.028 I1.155 J0.000
+G3 X952.901 Y142.028 I3.761 J0.000
+G2 X961.469 Y142.028 I4.284 J0.000
+G3 X967.162 Y142.028 I2.846 J0.000
+G3 X974.801 Y142.028 I3.819 J0.000
+G1 X976.403 Y142.028
+G2 X983.354 Y142.028 I3.475 J0.000
+M5
+G0 X332.039 Y97.856
+M3 S1000
+G3 X340.925 Y97.856 I4.443 J0.000 F1200.000
+G2 X343.829 Y97.856 I1.452 J0.000
+G1 X346.619 Y97.856
+G2 X356.052 Y97.856 I4.716 J0.000
+G2 X361.283 Y97.856 I2.616 J0.000
+G2 X368.110 Y97.856 I3.413 J0.000
+G1 X369.224 Y97.856
+G1 X371.876 Y97.856
+G3 X378.180 Y97.856 I3.152 J0.000
+G3 X385.814 Y97.856 I3.817 J0.000
+G2 X393.951 Y97.856 I4.068 J0.000
+G1 X394.756 Y97.856
+G2 X404.289 Y97.856 I4.767 J0.000
+G2 X411.141 Y97.856 I3.426 J0.000
+G1 X412.000 Y97.856
+G2 X419.902 Y97.856 I3.951 J0.000
+G2 X429.645 Y97.856 I4.872 J0.000
+G1 X430.844 Y97.856
+G3 X436.055 Y97.856 I2.605 J0.000
+G2 X445.982 Y97.856 I4.964 J0.000
+G1 X448.930 Y97.856
+G1 X450.262 Y97.856
+G2 X454.776 Y97.856 I2.257 J0.000
+G2 X461.653 Y97.856 I3.438 J0.000
+G2 X467.986 Y97.856 I3.166 J0.000
+G1 X469.793 Y97.856
+G2 X479.560 Y97.856 I4.883 J0.000
+G2 X484.347 Y97.856 I2.394 J0.000
+G3 X491.789 Y97.856 I3.721 J0.000
+G3 X495.473 Y97.856 I1.842 J0.000
+G3 X498.900 Y97.856 I1.714 J0.000
+G3 X502.656 Y97.856 I1.878 J0.000
+G1 X503.222 Y97.856
+G3 X508.248 Y97.856 I2.513 J0.000
+G3 X516.195 Y97.856 I3.974 J0.000
+G2 X522.316 Y97.856 I3.060 J0.000
+G1 X522.835 Y97.856
+G1 X524.297 Y97.856
+G3 X529.660 Y97.856 I2.682 J0.000
+G3 X534.298 Y97.856 I2.319 J0.000
+G2 X543.159 Y97.856 I4.431 J0.000
+G1 X544.313 Y97.856
+G2 X552.641 Y97.856 I4.164 J0.000
+G2 X556.544 Y97.856 I1.952 J0.000
+G2 X564.559 Y97.856 I4.007 J0.000
+G3 X566.674 Y97.856 I1.058 J0.000
+G3 X575.883 Y97.856 I4.605 J0.000
+G1 X578.478 Y97.856
+G3 X583.405 Y97.856 I2.464 J0.000
+G3 X593.283 Y97.856 I4.939 J0.000
+G1 X593.822 Y97.856
+G3 X602.551 Y97.856 I4.364 J0.000
+G2 X605.688 Y97.856 I1.568 J0.000
+G3 X612.765 Y97.856 I3.539 J0.000
+G2 X616.478 Y97.856 I1.856 J0.000
+G2 X623.578 Y97.856 I3.550 J0.000
+G3 X624.592 Y97.856 I0.507 J0.000
+G2 X629.663 Y97.856 I2.536 J0.000
+G1 X632.366 Y97.856
+M5
+G0 X228.600 Y52.306
+G2 X233.202 Y52.306 I2.301 J0.000 F1200.000
+M3 S1000
+G1 X234.527 Y52.306
+G1 X236.388 Y52.306
+G2 X240.100 Y52.306 I1.856 J0.000
+G1 X242.141 Y52.306
+G2 X245.353 Y52.306 I1.606 J0.000
+G2 X250.355 Y52.306 I2.501 J0.000
+G2 X259.493 Y52.306 I4.569 J0.000
+G2 X267.978 Y52.306 I4.243 J0.000
+G2 X269.125 Y52.306 I0.573 J0.000
+G1 X269.832 Y52.306
+G3 X272.710 Y52.306 I1.439 J0.000
+G1 X274.823 Y52.306
+G2 X283.356 Y52.306 I4.266 J0.000
+G3 X291.612 Y52.306 I4.128 J0.000
+G3 X298.034 Y52.306 I3.211 J0.000
+G3 X301.859 Y52.306 I1.912 J0.000
+G3 X309.319 Y52.306 I3.730 J0.000
+G2 X317.298 Y52.306 I3.989 J0.000
+G3 X326.399 Y52.306 I4.550 J0.000
+G3 X330.749 Y52.306 I2.175 J0.000
+G2 X331.938 Y52.306 I0.595 J0.000
+G2 X337.597 Y52.306 I2.829 J0.000
+G1 X339.068 Y52.306
+G2 X343.054 Y52.306 I1.993 J0.000
+G1 X344.589 Y52.306
+G3 X354.170 Y52.306 I4.791 J0.000
+G2 X356.947 Y52.306 I1.388 J0.000
+G1 X359.927 Y52.306
+G3 X367.399 Y52.306 I3.736 J0.000
+G3 X370.269 Y52.306 I1.435 J0.000
+G1 X371.962 Y52.306
+G2 X379.615 Y52.306 I3.827 J0.000
+G1 X380.853 Y52.306
+G3 X389.841 Y52.306 I4.494 J0.000
+G3 X395.466 Y52.306 I2.812 J0.000
+G1 X396.063 Y52.306
+G3 X402.853 Y52.306 I3.395 J0.000
+G2 X410.113 Y52.306 I3.630 J0.000
+G2 X419.859 Y52.306 I4.873 J0.000
+G3 X426.576 Y52.306 I3.358 J0.000
+G1 X428.762 Y52.306
+G3 X438.480 Y52.306 I4.859 J0.000
+G3 X442.808 Y52.306 I2.164 J0.000
+G2 X449.080 Y52.306 I3.136 J0.000
+G3 X453.900 Y52.306 I2.410 J0.000
+G3 X461.035 Y52.306 I3.568 J0.000
+G1 X461.596 Y52.306
+G3 X464.243 Y52.306 I1.324 J0.000
+G2 X472.225 Y52.306 I3.991 J0.000
+G2 X473.512 Y52.306 I0.644 J0.000
+G1 X475.313 Y52.306
+G3 X482.425 Y52.306 I3.556 J0.000
+G1 X483.917 Y52.306
+G2 X489.699 Y52.306 I2.891 J0.000
+G2 X498.760 Y52.306 I4.531 J0.000
+G3 X504.023 Y52.306 I2.631 J0.000
+G3 X507.770 Y52.306 I1.874 J0.000
+G1 X510.320 Y52.306
+G2 X515.471 Y52.306 I2.576 J0.000
+G3 X522.871 Y52.306 I3.700 J0.000
+G1 X525.704 Y52.306
+G2 X531.638 Y52.306 I2.967 J0.000
+M5
+G0 X151.047 Y13.609
+M3 S1000
+G1 X153.861 Y13.609 F1200.000
+G2 X157.512 Y13.609 I1.826 J0.000
+G1 X159.574 Y13.609
+G1 X161.559 Y13.609
+G1 X163.682 Y13.609
+G2 X164.864 Y13.609 I0.591 J0.000
+G2 X166.556 Y13.609 I0.846 J0.000
+G2 X173.505 Y13.609 I3.475 J0.000
+G3 X182.915 Y13.609 I4.705 J0.000
+G1 X184.599 Y13.609
+G2 X194.484 Y13.609 I4.942 J0.000
+G3 X196.728 Y13.609 I1.122 J0.000
+G2 X201.527 Y13.609 I2.400 J0.000
+G1 X203.293 Y13.609
+G1 X205.992 Y13.609
+G1 X208.315 Y13.609
+G3 X217.382 Y13.609 I4.534 J0.000
+G3 X223.529 Y13.609 I3.073 J0.000
+G2 X226.708 Y13.609 I1.590 J0.000
+G1 X228.221 Y13.609
+G3 X232.500 Y13.609 I2.140 J0.000
+G2 X238.049 Y13.609 I2.774 J0.000
+G1 X238.907 Y13.609
+G2 X246.142 Y13.609 I3.618 J0.000
+G1 X248.713 Y13.609
+G3 X255.712 Y13.609 I3.500 J0.000
+G2 X264.069 Y13.609 I4.178 J0.000
+G1 X266.210 Y13.609
+G2 X270.122 Y13.609 I1.956 J0.000
+G3 X275.576 Y13.609 I2.727 J0.000
+M5
+G0 X128.360 Y126.958
+M3 S1000
+G3 X131.547 Y126.958 I1.593 J0.000 F1200.000
+G3 X141.164 Y126.958 I4.808 J0.000
+G3 X142.452 Y126.958 I0.644 J0.000
+G1 X143.036 Y126.958
+G2 X148.870 Y126.958 I2.917 J0.000
+G3 X150.290 Y126.958 I0.710 J0.000
+G3 X160.252 Y126.958 I4.981 J0.000
+G1 X162.447 Y126.958
+G1 X165.419 Y126.958
+G2 X174.165 Y126.958 I4.373 J0.000
+G2 X183.505 Y126.958 I4.670 J0.000
+G1 X184.503 Y126.958
+G3 X190.843 Y126.958 I3.170 J0.000
+G2 X198.087 Y126.958 I3.622 J0.000
+G2 X199.357 Y126.958 I0.635 J0.000
+G2 X208.366 Y126.958 I4.504 J0.000
+G2 X216.732 Y126.958 I4.183 J0.000
+G2 X224.510 Y126.958 I3.889 J0.000
+G3 X230.430 Y126.958 I2.960 J0.000
+G3 X240.086 Y126.958 I4.828 J0.000
+G2 X248.028 Y126.958 I3.971 J0.000
+G2 X250.703 Y126.958 I1.337 J0.000
+G3 X258.307 Y126.958 I3.802 J0.000
+G2 X259.440 Y126.958 I0.567 J0.000
+G3 X264.889 Y126.958 I2.724 J0.000
+G1 X267.086 Y126.958
+G2 X272.089 Y126.958 I2.501 J0.000
+G2 X279.398 Y126.958 I3.655 J0.000
+G2 X280.418 Y126.958 I0.510 J0.000
+G1 X281.304 Y126.958
+G1 X282.445 Y126.958
+G3 X287.236 Y126.958 I2.395 J0.000
+G3 X289.316 Y126.958 I1.040 J0.000
+G3 X296.811 Y126.958 I3.748 J0.000
+G2 X298.021 Y126.958 I0.605 J0.000
+G3 X305.600 Y126.958 I3.790 J0.000
+G3 X315.288 Y126.958 I4.844 J0.000
+G3 X324.857 Y126.958 I4.785 J0.000
+G3 X326.086 Y126.958 I0.615 J0.000
+G3 X330.596 Y126.958 I2.255 J0.000
+G3 X336.312 Y126.958 I2.858 J0.000
+G2 X344.567 Y126.958 I4.128 J0.000
+G3 X347.460 Y126.958 I1.446 J0.000
+G1 X348.203 Y126.958
+G2 X353.282 Y126.958 I2.539 J0.000
+G3 X358.756 Y126.958 I2.737 J0.000
+G3 X368.595 Y126.958 I4.920 J0.000
+G3 X377.203 Y126.958 I4.304 J0.000
+G2 X382.927 Y126.958 I2.862 J0.000
+G3 X387.174 Y126.958 I2.123 J0.000
+G2 X392.990 Y126.958 I2.908 J0.000
+G2 X395.158 Y126.958 I1.084 J0.000
+G1 X397.993 Y126.958
+G1 X398.560 Y126.958
+G2 X404.723 Y126.958 I3.082 J0.000
+G1 X406.389 Y126.958
+G1 X407.535 Y126.958
+G3 X416.815 Y126.958 I4.640 J0.000
+G2 X418.199 Y126.958 I0.692 J0.000
+G2 X424.818 Y126.958 I3.309 J0.000
+G3 X428.593 Y126.958 I1.888 J0.000
+G1 X429.111 Y126.958
+G2 X433.755 Y126.958 I2.322 J0.000
+G1 X436.392 Y126.958
+G3 X441.280 Y126.958 I2.444 J0.000
+G2 X443.588 Y126.958 I1.154 J0.000
+G2 X450.241 Y126.958 I3.326 J0.000
+G3 X458.525 Y126.958 I4.142 J0.000
+G3 X462.148 Y126.958 I1.811 J0.000
+G2 X464.608 Y126.958 I1.230 J0.000
+G3 X472.838 Y126.958 I4.115 J0.000
+G1 X474.680 Y126.958
+G2 X482.242 Y126.958 I3.781 J0.000
+G1 X483.532 Y126.958
+G2 X487.739 Y126.958 I2.103 J0.000
+G1 X489.044 Y126.958
+G2 X493.043 Y126.958 I2.000 J0.000
+G1 X495.167 Y126.958
+G2 X497.695 Y126.958 I1.264 J0.000
+G3 X500.862 Y126.958 I1.583 J0.000
+G3 X502.814 Y126.958 I0.976 J0.000
+G3 X507.333 Y126.958 I2.260 J0.000
+G2 X514.695 Y126.958 I3.681 J0.000
+G2 X517.056 Y126.958 I1.180 J0.000
+G2 X523.524 Y126.958 I3.234 J0.000
+G2 X529.714 Y126.958 I3.095 J0.000
+G1 X532.083 Y126.958
+G2 X540.517 Y126.958 I4.217 J0.000
+G3 X547.841 Y126.958 I3.662 J0.000
+G3 X554.662 Y126.958 I3.411 J0.000
+G2 X563.721 Y126.958 I4.529 J0.000
+G3 X565.492 Y126.958 I0.886 J0.000
+G2 X570.594 Y126.958 I2.551 J0.000
+G3 X575.413 Y126.958 I2.410 J0.000
+G3 X576.920 Y126.958 I0.753 J0.000
+G1 X577.985 Y126.958
+G1 X578.799 Y126.958
+G3 X583.707 Y126.958 I2.454 J0.000
+G2 X585.797 Y126.958 I1.045 J0.000
+G1 X587.839 Y126.958
+G3 X593.308 Y126.958 I2.735 J0.000
+G3 X600.046 Y126.958 I3.369 J0.000
+G3 X609.920 Y126.958 I4.937 J0.000
+G2 X611.084 Y126.958 I0.582 J0.000
+G2 X616.588 Y126.958 I2.752 J0.000
+G2 X619.154 Y126.958 I1.283 J0.000
+G3 X628.998 Y126.958 I4.922 J0.000
+G3 X632.856 Y126.958 I1.929 J0.000
+G1 X634.183 Y126.958
+G2 X639.859 Y126.958 I2.838 J0.000
+G2 X645.196 Y126.958 I2.668 J0.000
+G1 X647.101 Y126.958
+G1 X647.947 Y126.958
+G3 X649.441 Y126.958 I0.747 J0.000
+G2 X657.335 Y126.958 I3.947 J0.000
+(finish operation: Arcs003)
+(begin operation: Arcs004)
+(machine units: mm/min)
+(Arcs) 
+G3 X664.922 Y126.958 I3.794 J0.000
+G3 X674.801 Y126.958 I4.939 J0.000
+G2 X677.689 Y126.958 I1.444 J0.000
+G2 X680.696 Y126.958 I1.503 J0.000
+G3 X688.337 Y126.958 I3.821 J0.000
+G1 X689.340 Y126.958
+G3 X691.503 Y126.958 I1.082 J0.000
+G3 X700.451 Y126.958 I4.474 J0.000
+G3 X705.171 Y126.958 I2.360 J0.000
+G3 X710.818 Y126.958 I2.824 J0.000
+G3 X716.626 Y126.958 I2.904 J0.000
+G3 X725.995 Y126.958 I4.684 J0.000
+G3 X727.123 Y126.958 I0.564 J0.000
+G2 X731.752 Y126.958 I2.314 J0.000
+G2 X734.362 Y126.958 I1.305 J0.000
+G2 X736.899 Y126.958 I1.269 J0.000
+G1 X739.728 Y126.958
+G2 X745.285 Y126.958 I2.778 J0.000
+G2 X747.377 Y126.958 I1.046 J0.000
+G2 X750.030 Y126.958 I1.327 J0.000
+G2 X757.357 Y126.958 I3.664 J0.000
+G2 X764.862 Y126.958 I3.752 J0.000
+G1 X765.886 Y126.958
+G3 X767.785 Y126.958 I0.949 J0.000
+G2 X771.806 Y126.958 I2.010 J0.000
+G3 X779.677 Y126.958 I3.936 J0.000
+G3 X781.536 Y126.958 I0.930 J0.000
+G2 X783.396 Y126.958 I0.930 J0.000
+G3 X785.569 Y126.958 I1.086 J0.000
+G2 X792.656 Y126.958 I3.544 J0.000
+G2 X800.050 Y126.958 I3.697 J0.000
+G2 X804.617 Y126.958 I2.283 J0.000
+G1 X806.205 Y126.958
+G1 X807.532 Y126.958
+G2 X809.648 Y126.958 I1.058 J0.000
+G2 X815.086 Y126.958 I2.719 J0.000
+G3 X822.517 Y126.958 I3.715 J0.000
+G3 X832.321 Y126.958 I4.902 J0.000
+G2 X833.376 Y126.958 I0.528 J0.000
+G3 X840.988 Y126.958 I3.806 J0.000
+G2 X846.076 Y126.958 I2.544 J0.000
+G3 X854.448 Y126.958 I4.186 J0.000
+G2 X855.710 Y126.958 I0.631 J0.000
+G2 X860.811 Y126.958 I2.550 J0.000
+G1 X863.357 Y126.958
+G3 X869.819 Y126.958 I3.231 J0.000
+G3 X870.881 Y126.958 I0.531 J0.000
+G2 X875.608 Y126.958 I2.363 J0.000
+G2 X878.214 Y126.958 I1.303 J0.000
+G1 X880.875 Y126.958
+G2 X885.951 Y126.958 I2.538 J0.000
+G3 X894.343 Y126.958 I4.196 J0.000
+G1 X897.175 Y126.958
+G2 X903.493 Y126.958 I3.159 J0.000
+G1 X904.274 Y126.958
+G2 X913.413 Y126.958 I4.569 J0.000
+G1 X916.056 Y126.958
+G3 X920.251 Y126.958 I2.098 J0.000
+G2 X925.924 Y126.958 I2.836 J0.000
+G2 X930.936 Y126.958 I2.506 J0.000
+G3 X938.568 Y126.958 I3.816 J0.000
+G1 X941.117 Y126.958
+G3 X951.035 Y126.958 I4.959 J0.000
+M5
+G0 X85.749 Y194.167
+M3 S1000
+G3 X88.214 Y194.167 I1.232 J0.000 F1200.000
+G1 X91.139 Y194.167
+G1 X93.479 Y194.167
+G1 X96.008 Y194.167
+G2 X102.614 Y194.167 I3.303 J0.000
+G2 X103.863 Y194.167 I0.625 J0.000
+G3 X113.203 Y194.167 I4.670 J0.000
+G1 X115.394 Y194.167
+G1 X116.063 Y194.167
+G2 X121.137 Y194.167 I2.537 J0.000
+G2 X129.432 Y194.167 I4.147 J0.000
+G2 X135.727 Y194.167 I3.148 J0.000
+G3 X140.668 Y194.167 I2.471 J0.000
+G1 X141.320 Y194.167
+G1 X143.442 Y194.167
+G2 X145.984 Y194.167 I1.271 J0.000
+G2 X152.158 Y194.167 I3.087 J0.000
+G1 X154.773 Y194.167
+G3 X155.780 Y194.167 I0.504 J0.000
+G2 X164.829 Y194.167 I4.525 J0.000
+G3 X165.939 Y194.167 I0.555 J0.000
+G3 X169.897 Y194.167 I1.979 J0.000
+G2 X174.011 Y194.167 I2.057 J0.000
+G2 X176.353 Y194.167 I1.171 J0.000
+G3 X184.889 Y194.167 I4.268 J0.000
+G1 X185.972 Y194.167
+G2 X191.157 Y194.167 I2.593 J0.000
+G1 X193.090 Y194.167
+G2 X199.921 Y194.167 I3.416 J0.000
+G2 X208.099 Y194.167 I4.089 J0.000
+G2 X214.479 Y194.167 I3.190 J0.000
+G2 X216.447 Y194.167 I0.984 J0.000
+G2 X224.794 Y194.167 I4.174 J0.000
+G3 X226.030 Y194.167 I0.618 J0.000
+G3 X231.700 Y194.167 I2.835 J0.000
+G3 X238.799 Y194.167 I3.549 J0.000
+G2 X248.566 Y194.167 I4.884 J0.000
+G3 X251.366 Y194.167 I1.400 J0.000
+G2 X257.477 Y194.167 I3.056 J0.000
+G1 X258.275 Y194.167
+G3 X262.245 Y194.167 I1.985 J0.000
+G3 X264.869 Y194.167 I1.312 J0.000
+G2 X274.377 Y194.167 I4.754 J0.000
+G3 X284.149 Y194.167 I4.886 J0.000
+G1 X285.599 Y194.167
+G1 X288.003 Y194.167
+G1 X290.083 Y194.167
+G3 X297.282 Y194.167 I3.599 J0.000
+G2 X304.072 Y194.167 I3.395 J0.000
+G1 X305.571 Y194.167
+G1 X307.893 Y194.167
+G2 X310.272 Y194.167 I1.190 J0.000
+G2 X314.145 Y194.167 I1.936 J0.000
+G2 X320.883 Y194.167 I3.369 J0.000
+G3 X324.191 Y194.167 I1.654 J0.000
+G1 X325.979 Y194.167
+G3 X332.982 Y194.167 I3.502 J0.000
+G2 X341.735 Y194.167 I4.377 J0.000
+G2 X348.039 Y194.167 I3.152 J0.000
+G3 X349.985 Y194.167 I0.973 J0.000
+G2 X358.465 Y194.167 I4.240 J0.000
+G3 X365.739 Y194.167 I3.637 J0.000
+G2 X374.989 Y194.167 I4.625 J0.000
+G1 X377.566 Y194.167
+G1 X379.012 Y194.167
+G2 X382.275 Y194.167 I1.631 J0.000
+G3 X386.392 Y194.167 I2.059 J0.000
+G1 X388.226 Y194.167
+G1 X389.810 Y194.167
+G1 X392.322 Y194.167
+G1 X393.573 Y194.167
+G1 X396.494 Y194.167
+G3 X401.294 Y194.167 I2.400 J0.000
+G1 X403.787 Y194.167
+G3 X412.410 Y194.167 I4.311 J0.000
+G1 X415.158 Y194.167
+G1 X417.950 Y194.167
+G2 X424.172 Y194.167 I3.111 J0.000
+G1 X426.674 Y194.167
+G3 X430.091 Y194.167 I1.709 J0.000
+G2 X440.056 Y194.167 I4.982 J0.000
+G2 X446.702 Y194.167 I3.323 J0.000
+G1 X449.117 Y194.167
+G3 X454.456 Y194.167 I2.670 J0.000
+G3 X458.006 Y194.167 I1.775 J0.000
+G2 X459.603 Y194.167 I0.799 J0.000
+G1 X460.386 Y194.167
+G2 X464.012 Y194.167 I1.813 J0.000
+G3 X470.655 Y194.167 I3.321 J0.000
+G2 X479.841 Y194.167 I4.593 J0.000
+G3 X487.517 Y194.167 I3.838 J0.000
+G1 X489.956 Y194.167
+G1 X492.086 Y194.167
+G2 X497.904 Y194.167 I2.909 J0.000
+G2 X503.272 Y194.167 I2.684 J0.000
+G2 X505.614 Y194.167 I1.171 J0.000
+G2 X508.246 Y194.167 I1.316 J0.000
+G3 X510.172 Y194.167 I0.963 J0.000
+G2 X513.403 Y194.167 I1.615 J0.000
+G3 X518.701 Y194.167 I2.649 J0.000
+G2 X527.632 Y194.167 I4.466 J0.000
+G1 X529.717 Y194.167
+G3 X535.327 Y194.167 I2.805 J0.000
+G1 X537.298 Y194.167
+G2 X544.805 Y194.167 I3.753 J0.000
+G2 X549.856 Y194.167 I2.526 J0.000
+G1 X550.598 Y194.167
+G3 X554.127 Y194.167 I1.765 J0.000
+G3 X555.288 Y194.167 I0.580 J0.000
+M5
+G0 X255.251 Y163.127
+M3 S1000
+G3 X264.440 Y163.127 I4.594 J0.000 F1200.000
+G1 X265.924 Y163.127
+G3 X271.770 Y163.127 I2.923 J0.000
+G2 X272.968 Y163.127 I0.599 J0.000
+G2 X277.875 Y163.127 I2.453 J0.000
+G3 X279.332 Y163.127 I0.728 J0.000
+G3 X287.116 Y163.127 I3.892 J0.000
+G1 X289.029 Y163.127
+G3 X296.038 Y163.127 I3.505 J0.000
+G3 X303.303 Y163.127 I3.633 J0.000
+G1 X304.956 Y163.127
+G2 X309.390 Y163.127 I2.217 J0.000
+G2 X314.466 Y163.127 I2.538 J0.000
+G2 X316.966 Y163.127 I1.250 J0.000
+G1 X319.385 Y163.127
+G3 X328.167 Y163.127 I4.391 J0.000
+G3 X334.259 Y163.127 I3.046 J0.000
+G3 X340.087 Y163.127 I2.914 J0.000
+G2 X346.637 Y163.127 I3.275 J0.000
+G1 X348.990 Y163.127
+G2 X350.874 Y163.127 I0.942 J0.000
+G1 X352.773 Y163.127
+G3 X360.312 Y163.127 I3.769 J0.000
+G2 X365.361 Y163.127 I2.525 J0.000
+G3 X373.223 Y163.127 I3.931 J0.000
+G3 X376.120 Y163.127 I1.448 J0.000
+G2 X383.175 Y163.127 I3.528 J0.000
+G3 X389.277 Y163.127 I3.051 J0.000
+G2 X396.239 Y163.127 I3.481 J0.000
+G3 X402.399 Y163.127 I3.080 J0.000
+G3 X408.022 Y163.127 I2.812 J0.000
+G3 X417.268 Y163.127 I4.623 J0.000
+G3 X418.954 Y163.127 I0.843 J0.000
+G2 X426.642 Y163.127 I3.844 J0.000
+G3 X436.605 Y163.127 I4.981 J0.000
+G2 X438.554 Y163.127 I0.975 J0.000
+G2 X445.564 Y163.127 I3.505 J0.000
+G1 X447.936 Y163.127
+G1 X450.100 Y163.127
+G1 X452.452 Y163.127
+G3 X461.642 Y163.127 I4.595 J0.000
+G3 X465.019 Y163.127 I1.688 J0.000
+G3 X474.188 Y163.127 I4.584 J0.000
+G3 X482.015 Y163.127 I3.914 J0.000
+G1 X484.249 Y163.127
+G1 X485.890 Y163.127
+G2 X489.395 Y163.127 I1.753 J0.000
+G3 X495.355 Y163.127 I2.980 J0.000
+G2 X500.637 Y163.127 I2.641 J0.000
+G2 X510.613 Y163.127 I4.988 J0.000
+G3 X514.855 Y163.127 I2.121 J0.000
+G3 X519.310 Y163.127 I2.228 J0.000
+G1 X520.522 Y163.127
+G3 X526.387 Y163.127 I2.933 J0.000
+G3 X529.818 Y163.127 I1.716 J0.000
+G1 X532.363 Y163.127
+G2 X540.639 Y163.127 I4.138 J0.000
+G3 X547.179 Y163.127 I3.270 J0.000
+G2 X552.188 Y163.127 I2.505 J0.000
+G2 X555.288 Y163.127 I1.550 J0.000
+G2 X563.416 Y163.127 I4.064 J0.000
+G3 X570.520 Y163.127 I3.552 J0.000
+G2 X573.430 Y163.127 I1.455 J0.000
+G3 X580.690 Y163.127 I3.630 J0.000
+G2 X584.069 Y163.127 I1.689 J0.000
+G1 X585.213 Y163.127
+G3 X593.184 Y163.127 I3.985 J0.000
+G3 X597.185 Y163.127 I2.001 J0.000
+G2 X600.268 Y163.127 I1.541 J0.000
+G3 X607.635 Y163.127 I3.683 J0.000
+G2 X613.354 Y163.127 I2.859 J0.000
+G2 X615.381 Y163.127 I1.014 J0.000
+G1 X617.714 Y163.127
+G2 X620.062 Y163.127 I1.174 J0.000
+G3 X625.928 Y163.127 I2.933 J0.000
+G1 X627.084 Y163.127
+G1 X629.968 Y163.127
+G3 X638.600 Y163.127 I4.316 J0.000
+G2 X641.661 Y163.127 I1.531 J0.000
+G1 X644.369 Y163.127
+G3 X646.271 Y163.127 I0.951 J0.000
+G2 X648.757 Y163.127 I1.243 J0.000
+G2 X658.171 Y163.127 I4.707 J0.000
+G1 X659.049 Y163.127
+G1 X660.521 Y163.127
+G2 X664.620 Y163.127 I2.049 J0.000
+G1 X667.418 Y163.127
+G3 X675.345 Y163.127 I3.963 J0.000
+G1 X677.282 Y163.127
+G3 X681.569 Y163.127 I2.144 J0.000
+G1 X684.437 Y163.127
+G2 X692.635 Y163.127 I4.099 J0.000
+G2 X695.305 Y163.127 I1.335 J0.000
+G2 X700.855 Y163.127 I2.775 J0.000
+G2 X707.099 Y163.127 I3.122 J0.000
+G3 X711.318 Y163.127 I2.110 J0.000
+G3 X713.983 Y163.127 I1.332 J0.000
+G3 X717.838 Y163.127 I1.927 J0.000
+G3 X720.452 Y163.127 I1.307 J0.000
+G3 X724.819 Y163.127 I2.184 J0.000
+G2 X731.781 Y163.127 I3.481 J0.000
+G2 X734.644 Y163.127 I1.431 J0.000
+G3 X744.577 Y163.127 I4.967 J0.000
+G2 X750.857 Y163.127 I3.140 J0.000
+G2 X755.147 Y163.127 I2.145 J0.000
+G2 X764.867 Y163.127 I4.860 J0.000
+G3 X774.831 Y163.127 I4.982 J0.000
+G2 X777.625 Y163.127 I1.397 J0.000
+G3 X784.145 Y163.127 I3.260 J0.000
+G3 X789.510 Y163.127 I2.683 J0.000
+G3 X799.355 Y163.127 I4.922 J0.000
+G1 X800.295 Y163.127
+M5
+G0 X345.042 Y64.083
+M3 S1000
+G3 X347.475 Y64.083 I1.216 J0.000 F1200.000
+G1 X348.289 Y64.083
+G1 X351.051 Y64.083
+G3 X354.874 Y64.083 I1.911 J0.000
+G2 X357.845 Y64.083 I1.486 J0.000
+G2 X360.082 Y64.083 I1.118 J0.000
+G3 X368.847 Y64.083 I4.382 J0.000
+G2 X371.886 Y64.083 I1.520 J0.000
+G1 X374.377 Y64.083
+G2 X383.118 Y64.083 I4.371 J0.000
+G3 X392.230 Y64.083 I4.556 J0.000
+G3 X399.187 Y64.083 I3.478 J0.000
+G3 X408.054 Y64.083 I4.434 J0.000
+G2 X416.252 Y64.083 I4.099 J0.000
+G3 X420.818 Y64.083 I2.283 J0.000
+G3 X428.996 Y64.083 I4.089 J0.000
+G2 X432.338 Y64.083 I1.671 J0.000
+G2 X437.496 Y64.083 I2.579 J0.000
+G3 X442.965 Y64.083 I2.735 J0.000
+G1 X445.734 Y64.083
+G3 X448.557 Y64.083 I1.411 J0.000
+G3 X453.385 Y64.083 I2.414 J0.000
+G2 X455.741 Y64.083 I1.178 J0.000
+G2 X458.215 Y64.083 I1.237 J0.000
+G2 X464.552 Y64.083 I3.168 J0.000
+G1 X465.368 Y64.083
+G3 X471.541 Y64.083 I3.086 J0.000
+G1 X472.739 Y64.083
+G3 X477.079 Y64.083 I2.170 J0.000
+G3 X484.500 Y64.083 I3.711 J0.000
+G2 X494.147 Y64.083 I4.824 J0.000
+G1 X496.469 Y64.083
+G2 X504.621 Y64.083 I4.076 J0.000
+G1 X506.176 Y64.083
+G3 X512.509 Y64.083 I3.167 J0.000
+G2 X518.419 Y64.083 I2.955 J0.000
+G1 X519.234 Y64.083
+G3 X527.530 Y64.083 I4.148 J0.000
+G3 X533.177 Y64.083 I2.824 J0.000
+G2 X542.394 Y64.083 I4.608 J0.000
+G1 X544.278 Y64.083
+G1 X546.384 Y64.083
+G2 X547.754 Y64.083 I0.685 J0.000
+G2 X554.484 Y64.083 I3.365 J0.000
+G2 X560.615 Y64.083 I3.065 J0.000
+G2 X564.661 Y64.083 I2.023 J0.000
+G2 X572.455 Y64.083 I3.897 J0.000
+G2 X581.772 Y64.083 I4.659 J0.000
+G1 X584.393 Y64.083
+G2 X593.110 Y64.083 I4.359 J0.000
+G2 X596.635 Y64.083 I1.762 J0.000
+G3 X598.551 Y64.083 I0.958 J0.000
+G3 X605.263 Y64.083 I3.356 J0.000
+G3 X610.847 Y64.083 I2.792 J0.000
+G2 X616.942 Y64.083 I3.048 J0.000
+G2 X623.709 Y64.083 I3.384 J0.000
+G1 X625.036 Y64.083
+G2 X634.744 Y64.083 I4.854 J0.000
+G1 X637.213 Y64.083
+G3 X638.797 Y64.083 I0.792 J0.000
+G2 X647.955 Y64.083 I4.579 J0.000
+G1 X648.800 Y64.083
+G3 X650.288 Y64.083 I0.744 J0.000
+G2 X653.404 Y64.083 I1.558 J0.000
+G1 X655.943 Y64.083
+G2 X663.388 Y64.083 I3.722 J0.000
+G3 X666.205 Y64.083 I1.408 J0.000
+G3 X671.516 Y64.083 I2.655 J0.000
+G3 X677.940 Y64.083 I3.212 J0.000
+G2 X681.299 Y64.083 I1.680 J0.000
+G1 X683.291 Y64.083
+G3 X691.473 Y64.083 I4.091 J0.000
+G2 X697.565 Y64.083 I3.046 J0.000
+G2 X706.390 Y64.083 I4.412 J0.000
+G3 X709.994 Y64.083 I1.802 J0.000
+G1 X712.532 Y64.083
+G2 X720.112 Y64.083 I3.790 J0.000
+G2 X726.737 Y64.083 I3.313 J0.000
+G3 X728.218 Y64.083 I0.740 J0.000
+G3 X735.011 Y64.083 I3.397 J0.000
+G1 X736.195 Y64.083
+G2 X744.396 Y64.083 I4.101 J0.000
+G1 X746.530 Y64.083
+G2 X753.506 Y64.083 I3.488 J0.000
+G2 X759.238 Y64.083 I2.866 J0.000
+G2 X767.027 Y64.083 I3.895 J0.000
+G1 X768.980 Y64.083
+G2 X770.886 Y64.083 I0.953 J0.000
+G1 X771.775 Y64.083
+G1 X773.483 Y64.083
+G2 X776.822 Y64.083 I1.670 J0.000
+G1 X778.647 Y64.083
+G2 X787.492 Y64.083 I4.423 J0.000
+G3 X796.900 Y64.083 I4.704 J0.000
+G1 X797.971 Y64.083
+G3 X800.037 Y64.083 I1.033 J0.000
+G3 X805.455 Y64.083 I2.709 J0.000
+G2 X808.182 Y64.083 I1.364 J0.000
+G3 X815.458 Y64.083 I3.638 J0.000
+G1 X817.192 Y64.083
+G3 X819.441 Y64.083 I1.125 J0.000
+G3 X824.759 Y64.083 I2.659 J0.000
+G3 X832.986 Y64.083 I4.113 J0.000
+G2 X841.808 Y64.083 I4.411 J0.000
+G2 X845.498 Y64.083 I1.845 J0.000
+(finish operation: Arcs004)
+(begin operation: Arcs005)
+(machine units: mm/min)
+(Arcs) 
+G3 X853.927 Y64.083 I4.214 J0.000
+G1 X855.705 Y64.083
+G3 X863.797 Y64.083 I4.046 J0.000
+G2 X873.652 Y64.083 I4.927 J0.000
+G2 X877.381 Y64.083 I1.865 J0.000
+G1 X878.903 Y64.083
+G3 X882.744 Y64.083 I1.921 J0.000
+G2 X891.548 Y64.083 I4.402 J0.000
+G3 X900.992 Y64.083 I4.722 J0.000
+G3 X907.260 Y64.083 I3.134 J0.000
+G2 X909.130 Y64.083 I0.935 J0.000
+G3 X917.404 Y64.083 I4.137 J0.000
+G2 X921.916 Y64.083 I2.256 J0.000
+G1 X922.823 Y64.083
+G1 X924.387 Y64.083
+G3 X932.626 Y64.083 I4.119 J0.000
+G1 X935.437 Y64.083
+G2 X941.590 Y64.083 I3.077 J0.000
+G2 X942.909 Y64.083 I0.659 J0.000
+G1 X945.557 Y64.083
+G3 X947.815 Y64.083 I1.129 J0.000
+G2 X957.119 Y64.083 I4.652 J0.000
+G2 X960.544 Y64.083 I1.712 J0.000
+G1 X961.077 Y64.083
+G3 X966.053 Y64.083 I2.488 J0.000
+G3 X967.236 Y64.083 I0.591 J0.000
+G2 X976.970 Y64.083 I4.867 J0.000
+G1 X979.104 Y64.083
+G1 X980.603 Y64.083
+G1 X983.262 Y64.083
+G1 X985.456 Y64.083
+G3 X991.039 Y64.083 I2.791 J0.000
+G3 X992.571 Y64.083 I0.766 J0.000
+G2 X995.062 Y64.083 I1.246 J0.000
+G2 X1003.805 Y64.083 I4.371 J0.000
+G3 X1010.463 Y64.083 I3.329 J0.000
+G2 X1013.542 Y64.083 I1.539 J0.000
+G3 X1020.610 Y64.083 I3.534 J0.000
+G2 X1029.595 Y64.083 I4.493 J0.000
+G1 X1032.037 Y64.083
+G2 X1035.288 Y64.083 I1.626 J0.000
+G1 X1037.105 Y64.083
+G2 X1041.977 Y64.083 I2.436 J0.000
+G2 X1051.530 Y64.083 I4.776 J0.000
+(finish operation: Arcs005)
+(begin postamble)
+M5 G17 G90 M2
\ No newline at end of file
@@ -0,0 +1,1662 @@
+(Exported by FreeCAD)
+(Post Processor: laser_post)
+
+(begin preamble)
+G17 G90
+G21
+(begin operation: TC)
+(machine units: mm/min)
+(TC: Laser) 
+M5
+(finish operation: TC)
+(begin operation: Depth001)
+(machine units: mm/min)
+(Depth) 
+M5
+G0 X399.013 Y201.909
+M3 S1000
+G1 X399.000 Y202.351 F1200.000
+G1 X398.961 Y202.792
+G1 X398.895 Y203.230
+G1 X398.804 Y203.663
+G1 X398.687 Y204.090
+G1 X398.546 Y204.509
+G1 X398.379 Y204.919
+G1 X398.189 Y205.319
+G1 X397.975 Y205.706
+G1 X397.739 Y206.081
+G1 X397.481 Y206.440
+G1 X397.202 Y206.784
+G1 X396.904 Y207.111
+G1 X396.586 Y207.419
+G1 X396.251 Y207.708
+G1 X395.899 Y207.976
+G1 X395.532 Y208.223
+G1 X395.151 Y208.449
+G1 X394.757 Y208.651
+G1 X394.352 Y208.829
+G1 X393.937 Y208.983
+G1 X393.514 Y209.112
+G1 X393.084 Y209.216
+G1 X392.648 Y209.295
+G1 X392.209 Y209.347
+G1 X391.767 Y209.373
+G1 X391.324 Y209.373
+G1 X390.883 Y209.347
+G1 X390.443 Y209.295
+G1 X390.007 Y209.216
+G1 X389.577 Y209.112
+G1 X389.154 Y208.983
+G1 X388.739 Y208.829
+G1 X388.334 Y208.651
+G1 X387.940 Y208.449
+G1 X387.559 Y208.223
+G1 X387.192 Y207.976
+G1 X386.840 Y207.708
+G1 X386.505 Y207.419
+G1 X386.188 Y207.111
+G1 X385.889 Y206.784
+G1 X385.610 Y206.440
+G1 X385.352 Y206.081
+G1 X385.116 Y205.706
+G1 X384.902 Y205.319
+G1 X384.712 Y204.919
+G1 X384.545 Y204.509
+G1 X384.404 Y204.090
+G1 X384.287 Y203.663
+G1 X384.196 Y203.230
+G1 X384.131 Y202.792
+G1 X384.091 Y202.351
+G1 X384.078 Y201.909
+G1 X384.091 Y201.467
+G1 X384.131 Y201.026
+G1 X384.196 Y200.588
+G1 X384.287 Y200.155
+G1 X384.404 Y199.728
+G1 X384.545 Y199.309
+G1 X384.712 Y198.899
+G1 X384.902 Y198.499
+G1 X385.116 Y198.112
+G1 X385.352 Y197.737
+G1 X385.610 Y197.378
+G1 X385.889 Y197.034
+G1 X386.188 Y196.708
+G1 X386.505 Y196.399
+G1 X386.840 Y196.110
+G1 X387.192 Y195.842
+G1 X387.559 Y195.595
+G1 X387.940 Y195.370
+G1 X388.334 Y195.167
+G1 X388.739 Y194.989
+G1 X389.154 Y194.835
+G1 X389.577 Y194.706
+G1 X390.007 Y194.602
+G1 X390.443 Y194.523
+G1 X390.883 Y194.471
+G1 X391.324 Y194.445
+G1 X391.767 Y194.445
+G1 X392.209 Y194.471
+G1 X392.648 Y194.523
+G1 X393.084 Y194.602
+G1 X393.514 Y194.706
+G1 X393.937 Y194.835
+G1 X394.352 Y194.989
+G1 X394.757 Y195.167
+G1 X395.151 Y195.370
+G1 X395.532 Y195.595
+G1 X395.899 Y195.842
+G1 X396.251 Y196.110
+G1 X396.586 Y196.399
+G1 X396.904 Y196.708
+G1 X397.202 Y197.034
+G1 X397.481 Y197.378
+G1 X397.739 Y197.737
+G1 X397.975 Y198.112
+G1 X398.189 Y198.499
+G1 X398.379 Y198.899
+G1 X398.546 Y199.309
+G1 X398.687 Y199.728
+G1 X398.804 Y200.155
+G1 X398.895 Y200.588
+G1 X398.961 Y201.026
+G1 X399.000 Y201.467
+G1 X399.013 Y201.909
+G1 X399.000 Y202.351
+G1 X398.961 Y202.792
+G1 X398.895 Y203.230
+G1 X398.804 Y203.663
+G1 X398.687 Y204.090
+G1 X398.546 Y204.509
+G1 X398.379 Y204.919
+G1 X398.189 Y205.319
+G1 X397.975 Y205.706
+G1 X397.739 Y206.081
+G1 X397.481 Y206.440
+G1 X397.202 Y206.784
+G1 X396.904 Y207.111
+G1 X396.586 Y207.419
+G1 X396.251 Y207.708
+G1 X395.899 Y207.976
+G1 X395.532 Y208.223
+G1 X395.151 Y208.449
+G1 X394.757 Y208.651
+G1 X394.352 Y208.829
+G1 X393.937 Y208.983
+G1 X393.514 Y209.112
+G1 X393.084 Y209.216
+G1 X392.648 Y209.295
+G1 X392.209 Y209.347
+G1 X391.767 Y209.373
+G1 X391.324 Y209.373
+G1 X390.883 Y209.347
+G1 X390.443 Y209.295
+G1 X390.007 Y209.216
+G1 X389.577 Y209.112
+G1 X389.154 Y208.983
+G1 X388.739 Y208.829
+G1 X388.334 Y208.651
+G1 X387.940 Y208.449
+G1 X387.559 Y208.223
+G1 X387.192 Y207.976
+G1 X386.840 Y207.708
+G1 X386.505 Y207.419
+G1 X386.188 Y207.111
+G1 X385.889 Y206.784
+G1 X385.610 Y206.440
+G1 X385.352 Y206.081
+G1 X385.116 Y205.706
+G1 X384.902 Y205.319
+G1 X384.712 Y204.919
+G1 X384.545 Y204.509
+G1 X384.404 Y204.090
+G1 X384.287 Y203.663
+G1 X384.196 Y203.230
+G1 X384.131 Y202.792
+G1 X384.091 Y202.351
+G1 X384.078 Y201.909
+G1 X384.091 Y201.467
+G1 X384.131 Y201.026
+G1 X384.196 Y200.588
+G1 X384.287 Y200.155
+G1 X384.404 Y199.728
+G1 X384.545 Y199.309
+G1 X384.712 Y198.899
+G1 X384.902 Y198.499
+G1 X385.116 Y198.112
+G1 X385.352 Y197.737
+G1 X385.610 Y197.378
+G1 X385.889 Y197.034
+G1 X386.188 Y196.708
+G1 X386.505 Y196.399
+G1 X386.840 Y196.110
+G1 X387.192 Y195.842
+G1 X387.559 Y195.595
+G1 X387.940 Y195.370
+G1 X388.334 Y195.167
+G1 X388.739 Y194.989
+G1 X389.154 Y194.835
+G1 X389.577 Y194.706
+G1 X390.007 Y194.602
+G1 X390.443 Y194.523
+G1 X390.883 Y194.471
+G1 X391.324 Y194.445
+G1 X391.767 Y194.445
+G1 X392.209 Y194.471
+G1 X392.648 Y194.523
+G1 X393.084 Y194.602
+G1 X393.514 Y194.706
+G1 X393.937 Y194.835
+G1 X394.352 Y194.989
+G1 X394.757 Y195.167
+G1 X395.151 Y195.370
+G1 X395.532 Y195.595
+G1 X395.899 Y195.842
+G1 X396.251 Y196.110
+G1 X396.586 Y196.399
+G1 X396.904 Y196.708
+G1 X397.202 Y197.034
+G1 X397.481 Y197.378
+G1 X397.739 Y197.737
+G1 X397.975 Y198.112
+G1 X398.189 Y198.499
+G1 X398.379 Y198.899
+G1 X398.546 Y199.309
+G1 X398.687 Y199.728
+G1 X398.804 Y200.155
+G1 X398.895 Y200.588
+G1 X398.961 Y201.026
+G1 X399.000 Y201.467
+G1 X399.013 Y201.909
+G1 X399.000 Y202.351
+G1 X398.961 Y202.792
+G1 X398.895 Y203.230
+G1 X398.804 Y203.663
+G1 X398.687 Y204.090
+G1 X398.546 Y204.509
+G1 X398.379 Y204.919
+G1 X398.189 Y205.319
+G1 X397.975 Y205.706
+G1 X397.739 Y206.081
+G1 X397.481 Y206.440
+G1 X397.202 Y206.784
+G1 X396.904 Y207.111
+G1 X396.586 Y207.419
+G1 X396.251 Y207.708
+G1 X395.899 Y207.976
+G1 X395.532 Y208.223
+G1 X395.151 Y208.449
+G1 X394.757 Y208.651
+G1 X394.352 Y208.829
+G1 X393.937 Y208.983
+G1 X393.514 Y209.112
+G1 X393.084 Y209.216
+G1 X392.648 Y209.295
+G1 X392.209 Y209.347
+G1 X391.767 Y209.373
+G1 X391.324 Y209.373
+G1 X390.883 Y209.347
+G1 X390.443 Y209.295
+G1 X390.007 Y209.216
+G1 X389.577 Y209.112
+G1 X389.154 Y208.983
+G1 X388.739 Y208.829
+G1 X388.334 Y208.651
+G1 X387.940 Y208.449
+G1 X387.559 Y208.223
+G1 X387.192 Y207.976
+G1 X386.840 Y207.708
+G1 X386.505 Y207.419
+G1 X386.188 Y207.111
+G1 X385.889 Y206.784
+G1 X385.610 Y206.440
+G1 X385.352 Y206.081
+G1 X385.116 Y205.706
+G1 X384.902 Y205.319
+G1 X384.712 Y204.919
+G1 X384.545 Y204.509
+G1 X384.404 Y204.090
+G1 X384.287 Y203.663
+G1 X384.196 Y203.230
+G1 X384.131 Y202.792
+G1 X384.091 Y202.351
+G1 X384.078 Y201.909
+G1 X384.091 Y201.467
+G1 X384.131 Y201.026
+G1 X384.196 Y200.588
+G1 X384.287 Y200.155
+G1 X384.404 Y199.728
+G1 X384.545 Y199.309
+G1 X384.712 Y198.899
+G1 X384.902 Y198.499
+G1 X385.116 Y198.112
+G1 X385.352 Y197.737
+G1 X385.610 Y197.378
+G1 X385.889 Y197.034
+G1 X386.188 Y196.708
+G1 X386.505 Y196.399
+G1 X386.840 Y196.110
+G1 X387.192 Y195.842
+G1 X387.559 Y195.595
+G1 X387.940 Y195.370
+G1 X388.334 Y195.167
+G1 X388.739 Y194.989
+G1 X389.154 Y194.835
+G1 X389.577 Y194.706
+G1 X390.007 Y194.602
+G1 X390.443 Y194.523
+G1 X390.883 Y194.471
+G1 X391.324 Y194.445
+G1 X391.767 Y194.445
+G1 X392.209 Y194.471
+G1 X392.648 Y194.523
+G1 X393.084 Y194.602
+G1 X393.514 Y194.706
+G1 X393.937 Y194.835
+G1 X394.352 Y194.989
+G1 X394.757 Y195.167
+G1 X395.151 Y195.370
+G1 X395.532 Y195.595
+G1 X395.899 Y195.842
+G1 X396.251 Y196.110
+G1 X396.586 Y196.399
+G1 X396.904 Y196.708
+G1 X397.202 Y197.034
+G1 X397.481 Y197.378
+G1 X397.739 Y197.737
+G1 X397.975 Y198.112
+G1 X398.189 Y198.499
+G1 X398.379 Y198.899
+G1 X398.546 Y199.309
+G1 X398.687 Y199.728
+G1 X398.804 Y200.155
+G1 X398.895 Y200.588
+G1 X398.961 Y201.026
+G1 X399.000 Y201.467
+G1 X399.013 Y201.909
+G1 X399.000 Y202.351
+G1 X398.961 Y202.792
+G1 X398.895 Y203.230
+G1 X398.804 Y203.663
+G1 X398.687 Y204.090
+G1 X398.546 Y204.509
+G1 X398.379 Y204.919
+G1 X398.189 Y205.319
+G1 X397.975 Y205.706
+G1 X397.739 Y206.081
+G1 X397.481 Y206.440
+G1 X397.202 Y206.784
+G1 X396.904 Y207.111
+G1 X396.586 Y207.419
+G1 X396.251 Y207.708
+G1 X395.899 Y207.976
+G1 X395.532 Y208.223
+G1 X395.151 Y208.449
+G1 X394.757 Y208.651
+G1 X394.352 Y208.829
+G1 X393.937 Y208.983
+G1 X393.514 Y209.112
+G1 X393.084 Y209.216
+G1 X392.648 Y209.295
+G1 X392.209 Y209.347
+G1 X391.767 Y209.373
+G1 X391.324 Y209.373
+G1 X390.883 Y209.347
+G1 X390.443 Y209.295
+G1 X390.007 Y209.216
+G1 X389.577 Y209.112
+G1 X389.154 Y208.983
+G1 X388.739 Y208.829
+G1 X388.334 Y208.651
+G1 X387.940 Y208.449
+G1 X387.559 Y208.223
+G1 X387.192 Y207.976
+G1 X386.840 Y207.708
+G1 X386.505 Y207.419
+G1 X386.188 Y207.111
+G1 X385.889 Y206.784
+G1 X385.610 Y206.440
+G1 X385.352 Y206.081
+G1 X385.116 Y205.706
+G1 X384.902 Y205.319
+G1 X384.712 Y204.919
+G1 X384.545 Y204.509
+G1 X384.404 Y204.090
+G1 X384.287 Y203.663
+G1 X384.196 Y203.230
+G1 X384.131 Y202.792
+G1 X384.091 Y202.351
+G1 X384.078 Y201.909
+G1 X384.091 Y201.467
+G1 X384.131 Y201.026
+G1 X384.196 Y200.588
+G1 X384.287 Y200.155
+G1 X384.404 Y199.728
+G1 X384.545 Y199.309
+G1 X384.712 Y198.899
+G1 X384.902 Y198.499
+G1 X385.116 Y198.112
+G1 X385.352 Y197.737
+G1 X385.610 Y197.378
+G1 X385.889 Y197.034
+G1 X386.188 Y196.708
+G1 X386.505 Y196.399
+G1 X386.840 Y196.110
+G1 X387.192 Y195.842
+G1 X387.559 Y195.595
+G1 X387.940 Y195.370
+G1 X388.334 Y195.167
+G1 X388.739 Y194.989
+(finish operation: Depth001)
+(begin operation: Depth002)
+(machine units: mm/min)
+(Depth) 
+G1 X389.154 Y194.835
+G1 X389.577 Y194.706
+G1 X390.007 Y194.602
+G1 X390.443 Y194.523
+G1 X390.883 Y194.471
+G1 X391.324 Y194.445
+G1 X391.767 Y194.445
+G1 X392.209 Y194.471
+G1 X392.648 Y194.523
+G1 X393.084 Y194.602
+G1 X393.514 Y194.706
+G1 X393.937 Y194.835
+G1 X394.352 Y194.989
+G1 X394.757 Y195.167
+G1 X395.151 Y195.370
+G1 X395.532 Y195.595
+G1 X395.899 Y195.842
+G1 X396.251 Y196.110
+G1 X396.586 Y196.399
+G1 X396.904 Y196.708
+G1 X397.202 Y197.034
+G1 X397.481 Y197.378
+G1 X397.739 Y197.737
+G1 X397.975 Y198.112
+G1 X398.189 Y198.499
+G1 X398.379 Y198.899
+G1 X398.546 Y199.309
+G1 X398.687 Y199.728
+G1 X398.804 Y200.155
+G1 X398.895 Y200.588
+G1 X398.961 Y201.026
+G1 X399.000 Y201.467
+G1 X399.013 Y201.909
+G1 X399.000 Y202.351
+G1 X398.961 Y202.792
+G1 X398.895 Y203.230
+G1 X398.804 Y203.663
+G1 X398.687 Y204.090
+G1 X398.546 Y204.509
+G1 X398.379 Y204.919
+G1 X398.189 Y205.319
+G1 X397.975 Y205.706
+G1 X397.739 Y206.081
+G1 X397.481 Y206.440
+G1 X397.202 Y206.784
+G1 X396.904 Y207.111
+G1 X396.586 Y207.419
+G1 X396.251 Y207.708
+G1 X395.899 Y207.976
+G1 X395.532 Y208.223
+G1 X395.151 Y208.449
+G1 X394.757 Y208.651
+G1 X394.352 Y208.829
+G1 X393.937 Y208.983
+G1 X393.514 Y209.112
+G1 X393.084 Y209.216
+G1 X392.648 Y209.295
+G1 X392.209 Y209.347
+G1 X391.767 Y209.373
+G1 X391.324 Y209.373
+G1 X390.883 Y209.347
+G1 X390.443 Y209.295
+G1 X390.007 Y209.216
+G1 X389.577 Y209.112
+G1 X389.154 Y208.983
+G1 X388.739 Y208.829
+G1 X388.334 Y208.651
+G1 X387.940 Y208.449
+G1 X387.559 Y208.223
+G1 X387.192 Y207.976
+G1 X386.840 Y207.708
+G1 X386.505 Y207.419
+G1 X386.188 Y207.111
+G1 X385.889 Y206.784
+G1 X385.610 Y206.440
+G1 X385.352 Y206.081
+G1 X385.116 Y205.706
+G1 X384.902 Y205.319
+G1 X384.712 Y204.919
+G1 X384.545 Y204.509
+G1 X384.404 Y204.090
+G1 X384.287 Y203.663
+G1 X384.196 Y203.230
+G1 X384.131 Y202.792
+G1 X384.091 Y202.351
+G1 X384.078 Y201.909
+G1 X384.091 Y201.467
+G1 X384.131 Y201.026
+G1 X384.196 Y200.588
+G1 X384.287 Y200.155
+G1 X384.404 Y199.728
+G1 X384.545 Y199.309
+G1 X384.712 Y198.899
+G1 X384.902 Y198.499
+G1 X385.116 Y198.112
+G1 X385.352 Y197.737
+G1 X385.610 Y197.378
+G1 X385.889 Y197.034
+G1 X386.188 Y196.708
+G1 X386.505 Y196.399
+G1 X386.840 Y196.110
+G1 X387.192 Y195.842
+G1 X387.559 Y195.595
+G1 X387.940 Y195.370
+G1 X388.334 Y195.167
+G1 X388.739 Y194.989
+G1 X389.154 Y194.835
+G1 X389.577 Y194.706
+G1 X390.007 Y194.602
+G1 X390.443 Y194.523
+G1 X390.883 Y194.471
+G1 X391.324 Y194.445
+G1 X391.767 Y194.445
+G1 X392.209 Y194.471
+G1 X392.648 Y194.523
+G1 X393.084 Y194.602
+G1 X393.514 Y194.706
+G1 X393.937 Y194.835
+G1 X394.352 Y194.989
+G1 X394.757 Y195.167
+G1 X395.151 Y195.370
+G1 X395.532 Y195.595
+G1 X395.899 Y195.842
+G1 X396.251 Y196.110
+G1 X396.586 Y196.399
+G1 X396.904 Y196.708
+G1 X397.202 Y197.034
+G1 X397.481 Y197.378
+G1 X397.739 Y197.737
+G1 X397.975 Y198.112
+G1 X398.189 Y198.499
+G1 X398.379 Y198.899
+G1 X398.546 Y199.309
+G1 X398.687 Y199.728
+G1 X398.804 Y200.155
+G1 X398.895 Y200.588
+G1 X398.961 Y201.026
+G1 X399.000 Y201.467
+G1 X399.013 Y201.909
+G1 X399.000 Y202.351
+G1 X398.961 Y202.792
+G1 X398.895 Y203.230
+G1 X398.804 Y203.663
+G1 X398.687 Y204.090
+G1 X398.546 Y204.509
+G1 X398.379 Y204.919
+G1 X398.189 Y205.319
+G1 X397.975 Y205.706
+G1 X397.739 Y206.081
+G1 X397.481 Y206.440
+G1 X397.202 Y206.784
+G1 X396.904 Y207.111
+G1 X396.586 Y207.419
+G1 X396.251 Y207.708
+G1 X395.899 Y207.976
+G1 X395.532 Y208.223
+G1 X395.151 Y208.449
+G1 X394.757 Y208.651
+G1 X394.352 Y208.829
+G1 X393.937 Y208.983
+G1 X393.514 Y209.112
+G1 X393.084 Y209.216
+G1 X392.648 Y209.295
+G1 X392.209 Y209.347
+G1 X391.767 Y209.373
+G1 X391.324 Y209.373
+G1 X390.883 Y209.347
+G1 X390.443 Y209.295
+G1 X390.007 Y209.216
+G1 X389.577 Y209.112
+G1 X389.154 Y208.983
+G1 X388.739 Y208.829
+G1 X388.334 Y208.651
+G1 X387.940 Y208.449
+G1 X387.559 Y208.223
+G1 X387.192 Y207.976
+G1 X386.840 Y207.708
+G1 X386.505 Y207.419
+G1 X386.188 Y207.111
+G1 X385.889 Y206.784
+G1 X385.610 Y206.440
+G1 X385.352 Y206.081
+G1 X385.116 Y205.706
+G1 X384.902 Y205.319
+G1 X384.712 Y204.919
+G1 X384.545 Y204.509
+G1 X384.404 Y204.090
+G1 X384.287 Y203.663
+G1 X384.196 Y203.230
+G1 X384.131 Y202.792
+G1 X384.091 Y202.351
+G1 X384.078 Y201.909
+G1 X384.091 Y201.467
+G1 X384.131 Y201.026
+G1 X384.196 Y200.588
+G1 X384.287 Y200.155
+G1 X384.404 Y199.728
+G1 X384.545 Y199.309
+G1 X384.712 Y198.899
+G1 X384.902 Y198.499
+G1 X385.116 Y198.112
+G1 X385.352 Y197.737
+G1 X385.610 Y197.378
+G1 X385.889 Y197.034
+G1 X386.188 Y196.708
+G1 X386.505 Y196.399
+G1 X386.840 Y196.110
+G1 X387.192 Y195.842
+G1 X387.559 Y195.595
+G1 X387.940 Y195.370
+G1 X388.334 Y195.167
+G1 X388.739 Y194.989
+G1 X389.154 Y194.835
+G1 X389.577 Y194.706
+G1 X390.007 Y194.602
+G1 X390.443 Y194.523
+G1 X390.883 Y194.471
+G1 X391.324 Y194.445
+G1 X391.767 Y194.445
+G1 X392.209 Y194.471
+G1 X392.648 Y194.523
+G1 X393.084 Y194.602
+G1 X393.514 Y194.706
+G1 X393.937 Y194.835
+G1 X394.352 Y194.989
+G1 X394.757 Y195.167
+G1 X395.151 Y195.370
+G1 X395.532 Y195.595
+G1 X395.899 Y195.842
+G1 X396.251 Y196.110
+G1 X396.586 Y196.399
+G1 X396.904 Y196.708
+G1 X397.202 Y197.034
+G1 X397.481 Y197.378
+G1 X397.739 Y197.737
+G1 X397.975 Y198.112
+G1 X398.189 Y198.499
+G1 X398.379 Y198.899
+G1 X398.546 Y199.309
+G1 X398.687 Y199.728
+G1 X398.804 Y200.155
+G1 X398.895 Y200.588
+G1 X398.961 Y201.026
+G1 X399.000 Y201.467
+G1 X399.013 Y201.909
+M5
+G0 X246.596 Y240.376
+M3 S1000
+G1 X246.587 Y240.872 F1200.000
+G1 X246.558 Y241.367
+G1 X246.510 Y241.861
+G1 X246.443 Y242.352
+G1 X246.357 Y242.841
+G1 X246.252 Y243.325
+G1 X246.128 Y243.806
+G1 X245.986 Y244.281
+G1 X245.825 Y244.750
+G1 X245.646 Y245.213
+G1 X245.450 Y245.668
+G1 X245.236 Y246.116
+G1 X245.005 Y246.554
+G1 X244.757 Y246.984
+G1 X244.492 Y247.403
+G1 X244.212 Y247.812
+G1 X243.916 Y248.210
+G1 X243.604 Y248.596
+G1 X243.278 Y248.970
+G1 X242.938 Y249.331
+G1 X242.584 Y249.678
+G1 X242.217 Y250.011
+G1 X241.837 Y250.330
+G1 X241.445 Y250.634
+G1 X241.041 Y250.922
+G1 X240.627 Y251.195
+G1 X240.202 Y251.451
+G1 X239.768 Y251.691
+G1 X239.325 Y251.913
+G1 X238.873 Y252.118
+G1 X238.414 Y252.306
+G1 X237.948 Y252.476
+G1 X237.476 Y252.627
+G1 X236.998 Y252.760
+G1 X236.515 Y252.874
+G1 X236.029 Y252.970
+G1 X235.539 Y253.047
+G1 X235.046 Y253.104
+G1 X234.552 Y253.143
+G1 X234.056 Y253.162
+G1 X233.560 Y253.162
+G1 X233.065 Y253.143
+G1 X232.570 Y253.104
+G1 X232.078 Y253.047
+G1 X231.588 Y252.970
+G1 X231.101 Y252.874
+G1 X230.618 Y252.760
+G1 X230.141 Y252.627
+G1 X229.668 Y252.476
+G1 X229.202 Y252.306
+G1 X228.743 Y252.118
+G1 X228.292 Y251.913
+G1 X227.848 Y251.691
+G1 X227.414 Y251.451
+G1 X226.990 Y251.195
+G1 X226.575 Y250.922
+G1 X226.172 Y250.634
+G1 X225.780 Y250.330
+G1 X225.400 Y250.011
+G1 X225.032 Y249.678
+G1 X224.678 Y249.331
+G1 X224.338 Y248.970
+G1 X224.012 Y248.596
+G1 X223.701 Y248.210
+G1 X223.404 Y247.812
+G1 X223.124 Y247.403
+G1 X222.859 Y246.984
+G1 X222.611 Y246.554
+G1 X222.380 Y246.116
+G1 X222.166 Y245.668
+G1 X221.970 Y245.213
+G1 X221.791 Y244.750
+G1 X221.631 Y244.281
+G1 X221.489 Y243.806
+G1 X221.365 Y243.325
+G1 X221.260 Y242.841
+G1 X221.174 Y242.352
+G1 X221.107 Y241.861
+G1 X221.059 Y241.367
+G1 X221.030 Y240.872
+G1 X221.020 Y240.376
+G1 X221.030 Y239.880
+G1 X221.059 Y239.385
+G1 X221.107 Y238.892
+G1 X221.174 Y238.400
+G1 X221.260 Y237.912
+G1 X221.365 Y237.427
+G1 X221.489 Y236.947
+G1 X221.631 Y236.472
+G1 X221.791 Y236.002
+G1 X221.970 Y235.540
+G1 X222.166 Y235.084
+G1 X222.380 Y234.637
+G1 X222.611 Y234.198
+G1 X222.859 Y233.769
+G1 X223.124 Y233.349
+G1 X223.404 Y232.940
+G1 X223.701 Y232.542
+G1 X224.012 Y232.156
+G1 X224.338 Y231.783
+G1 X224.678 Y231.422
+G1 X225.032 Y231.075
+G1 X225.400 Y230.741
+G1 X225.780 Y230.422
+G1 X226.172 Y230.119
+G1 X226.575 Y229.830
+G1 X226.990 Y229.558
+G1 X227.414 Y229.301
+G1 X227.848 Y229.062
+G1 X228.292 Y228.839
+G1 X228.743 Y228.634
+G1 X229.202 Y228.446
+G1 X229.668 Y228.277
+G1 X230.141 Y228.125
+G1 X230.618 Y227.992
+G1 X231.101 Y227.878
+G1 X231.588 Y227.782
+G1 X232.078 Y227.706
+G1 X232.570 Y227.648
+G1 X233.065 Y227.610
+G1 X233.560 Y227.591
+G1 X234.056 Y227.591
+G1 X234.552 Y227.610
+G1 X235.046 Y227.648
+G1 X235.539 Y227.706
+G1 X236.029 Y227.782
+G1 X236.515 Y227.878
+G1 X236.998 Y227.992
+G1 X237.476 Y228.125
+G1 X237.948 Y228.277
+G1 X238.414 Y228.446
+G1 X238.873 Y228.634
+G1 X239.325 Y228.839
+G1 X239.768 Y229.062
+G1 X240.202 Y229.301
+G1 X240.627 Y229.558
+G1 X241.041 Y229.830
+G1 X241.445 Y230.119
+G1 X241.837 Y230.422
+G1 X242.217 Y230.741
+G1 X242.584 Y231.075
+G1 X242.938 Y231.422
+G1 X243.278 Y231.783
+G1 X243.604 Y232.156
+G1 X243.916 Y232.542
+G1 X244.212 Y232.940
+G1 X244.492 Y233.349
+(finish operation: Depth002)
+(begin operation: Depth003)
+(machine units: mm/min)
+(Depth) 
+G1 X244.757 Y233.769
+G1 X245.005 Y234.198
+G1 X245.236 Y234.637
+G1 X245.450 Y235.084
+G1 X245.646 Y235.540
+G1 X245.825 Y236.002
+G1 X245.986 Y236.472
+G1 X246.128 Y236.947
+G1 X246.252 Y237.427
+G1 X246.357 Y237.912
+G1 X246.443 Y238.400
+G1 X246.510 Y238.892
+G1 X246.558 Y239.385
+G1 X246.587 Y239.880
+G1 X246.596 Y240.376
+G1 X246.587 Y240.872
+G1 X246.558 Y241.367
+G1 X246.510 Y241.861
+G1 X246.443 Y242.352
+G1 X246.357 Y242.841
+G1 X246.252 Y243.325
+G1 X246.128 Y243.806
+G1 X245.986 Y244.281
+G1 X245.825 Y244.750
+G1 X245.646 Y245.213
+G1 X245.450 Y245.668
+G1 X245.236 Y246.116
+G1 X245.005 Y246.554
+G1 X244.757 Y246.984
+G1 X244.492 Y247.403
+G1 X244.212 Y247.812
+G1 X243.916 Y248.210
+G1 X243.604 Y248.596
+G1 X243.278 Y248.970
+G1 X242.938 Y249.331
+G1 X242.584 Y249.678
+G1 X242.217 Y250.011
+G1 X241.837 Y250.330
+G1 X241.445 Y250.634
+G1 X241.041 Y250.922
+G1 X240.627 Y251.195
+G1 X240.202 Y251.451
+G1 X239.768 Y251.691
+G1 X239.325 Y251.913
+G1 X238.873 Y252.118
+G1 X238.414 Y252.306
+G1 X237.948 Y252.476
+G1 X237.476 Y252.627
+G1 X236.998 Y252.760
+G1 X236.515 Y252.874
+G1 X236.029 Y252.970
+G1 X235.539 Y253.047
+G1 X235.046 Y253.104
+G1 X234.552 Y253.143
+G1 X234.056 Y253.162
+G1 X233.560 Y253.162
+G1 X233.065 Y253.143
+G1 X232.570 Y253.104
+G1 X232.078 Y253.047
+G1 X231.588 Y252.970
+G1 X231.101 Y252.874
+G1 X230.618 Y252.760
+G1 X230.141 Y252.627
+G1 X229.668 Y252.476
+G1 X229.202 Y252.306
+G1 X228.743 Y252.118
+G1 X228.292 Y251.913
+G1 X227.848 Y251.691
+G1 X227.414 Y251.451
+G1 X226.990 Y251.195
+G1 X226.575 Y250.922
+G1 X226.172 Y250.634
+G1 X225.780 Y250.330
+G1 X225.400 Y250.011
+G1 X225.032 Y249.678
+G1 X224.678 Y249.331
+G1 X224.338 Y248.970
+G1 X224.012 Y248.596
+G1 X223.701 Y248.210
+G1 X223.404 Y247.812
+G1 X223.124 Y247.403
+G1 X222.859 Y246.984
+G1 X222.611 Y246.554
+G1 X222.380 Y246.116
+G1 X222.166 Y245.668
+G1 X221.970 Y245.213
+G1 X221.791 Y244.750
+G1 X221.631 Y244.281
+G1 X221.489 Y243.806
+G1 X221.365 Y243.325
+G1 X221.260 Y242.841
+G1 X221.174 Y242.352
+G1 X221.107 Y241.861
+G1 X221.059 Y241.367
+G1 X221.030 Y240.872
+G1 X221.020 Y240.376
+G1 X221.030 Y239.880
+G1 X221.059 Y239.385
+G1 X221.107 Y238.892
+G1 X221.174 Y238.400
+G1 X221.260 Y237.912
+G1 X221.365 Y237.427
+G1 X221.489 Y236.947
+G1 X221.631 Y236.472
+G1 X221.791 Y236.002
+G1 X221.970 Y235.540
+G1 X222.166 Y235.084
+G1 X222.380 Y234.637
+G1 X222.611 Y234.198
+G1 X222.859 Y233.769
+G1 X223.124 Y233.349
+G1 X223.404 Y232.940
+G1 X223.701 Y232.542
+G1 X224.012 Y232.156
+G1 X224.338 Y231.783
+G1 X224.678 Y231.422
+G1 X225.032 Y231.075
+G1 X225.400 Y230.741
+G1 X225.780 Y230.422
+G1 X226.172 Y230.119
+G1 X226.575 Y229.830
+G1 X226.990 Y229.558
+G1 X227.414 Y229.301
+G1 X227.848 Y229.062
+G1 X228.292 Y228.839
+G1 X228.743 Y228.634
+G1 X229.202 Y228.446
+G1 X229.668 Y228.277
+G1 X230.141 Y228.125
+G1 X230.618 Y227.992
+G1 X231.101 Y227.878
+G1 X231.588 Y227.782
+G1 X232.078 Y227.706
+G1 X232.570 Y227.648
+G1 X233.065 Y227.610
+G1 X233.560 Y227.591
+G1 X234.056 Y227.591
+G1 X234.552 Y227.610
+G1 X235.046 Y227.648
+G1 X235.539 Y227.706
+G1 X236.029 Y227.782
+G1 X236.515 Y227.878
+G1 X236.998 Y227.992
+G1 X237.476 Y228.125
+G1 X237.948 Y228.277
+G1 X238.414 Y228.446
+G1 X238.873 Y228.634
+G1 X239.325 Y228.839
+G1 X239.768 Y229.062
+G1 X240.202 Y229.301
+G1 X240.627 Y229.558
+G1 X241.041 Y229.830
+G1 X241.445 Y230.119
+G1 X241.837 Y230.422
+G1 X242.217 Y230.741
+G1 X242.584 Y231.075
+G1 X242.938 Y231.422
+G1 X243.278 Y231.783
+G1 X243.604 Y232.156
+G1 X243.916 Y232.542
+G1 X244.212 Y232.940
+G1 X244.492 Y233.349
+G1 X244.757 Y233.769
+G1 X245.005 Y234.198
+G1 X245.236 Y234.637
+G1 X245.450 Y235.084
+G1 X245.646 Y235.540
+G1 X245.825 Y236.002
+G1 X245.986 Y236.472
+G1 X246.128 Y236.947
+G1 X246.252 Y237.427
+G1 X246.357 Y237.912
+G1 X246.443 Y238.400
+G1 X246.510 Y238.892
+G1 X246.558 Y239.385
+G1 X246.587 Y239.880
+G1 X246.596 Y240.376
+G1 X246.587 Y240.872
+G1 X246.558 Y241.367
+G1 X246.510 Y241.861
+G1 X246.443 Y242.352
+G1 X246.357 Y242.841
+G1 X246.252 Y243.325
+G1 X246.128 Y243.806
+G1 X245.986 Y244.281
+G1 X245.825 Y244.750
+G1 X245.646 Y245.213
+G1 X245.450 Y245.668
+G1 X245.236 Y246.116
+G1 X245.005 Y246.554
+G1 X244.757 Y246.984
+G1 X244.492 Y247.403
+G1 X244.212 Y247.812
+G1 X243.916 Y248.210
+G1 X243.604 Y248.596
+G1 X243.278 Y248.970
+G1 X242.938 Y249.331
+G1 X242.584 Y249.678
+G1 X242.217 Y250.011
+G1 X241.837 Y250.330
+G1 X241.445 Y250.634
+G1 X241.041 Y250.922
+G1 X240.627 Y251.195
+G1 X240.202 Y251.451
+G1 X239.768 Y251.691
+G1 X239.325 Y251.913
+G1 X238.873 Y252.118
+G1 X238.414 Y252.306
+G1 X237.948 Y252.476
+G1 X237.476 Y252.627
+G1 X236.998 Y252.760
+G1 X236.515 Y252.874
+G1 X236.029 Y252.970
+G1 X235.539 Y253.047
+G1 X235.046 Y253.104
+G1 X234.552 Y253.143
+G1 X234.056 Y253.162
+G1 X233.560 Y253.162
+G1 X233.065 Y253.143
+G1 X232.570 Y253.104
+G1 X232.078 Y253.047
+G1 X231.588 Y252.970
+G1 X231.101 Y252.874
+G1 X230.618 Y252.760
+G1 X230.141 Y252.627
+G1 X229.668 Y252.476
+G1 X229.202 Y252.306
+G1 X228.743 Y252.118
+G1 X228.292 Y251.913
+G1 X227.848 Y251.691
+G1 X227.414 Y251.451
+G1 X226.990 Y251.195
+G1 X226.575 Y250.922
+G1 X226.172 Y250.634
+G1 X225.780 Y250.330
+G1 X225.400 Y250.011
+G1 X225.032 Y249.678
+G1 X224.678 Y249.331
+G1 X224.338 Y248.970
+G1 X224.012 Y248.596
+G1 X223.701 Y248.210
+G1 X223.404 Y247.812
+G1 X223.124 Y247.403
+G1 X222.859 Y246.984
+G1 X222.611 Y246.554
+G1 X222.380 Y246.116
+G1 X222.166 Y245.668
+G1 X221.970 Y245.213
+G1 X221.791 Y244.750
+G1 X221.631 Y244.281
+G1 X221.489 Y243.806
+G1 X221.365 Y243.325
+G1 X221.260 Y242.841
+G1 X221.174 Y242.352
+G1 X221.107 Y241.861
+G1 X221.059 Y241.367
+G1 X221.030 Y240.872
+G1 X221.020 Y240.376
+G1 X221.030 Y239.880
+G1 X221.059 Y239.385
+G1 X221.107 Y238.892
+G1 X221.174 Y238.400
+G1 X221.260 Y237.912
+G1 X221.365 Y237.427
+G1 X221.489 Y236.947
+G1 X221.631 Y236.472
+G1 X221.791 Y236.002
+G1 X221.970 Y235.540
+G1 X222.166 Y235.084
+G1 X222.380 Y234.637
+G1 X222.611 Y234.198
+G1 X222.859 Y233.769
+G1 X223.124 Y233.349
+G1 X223.404 Y232.940
+G1 X223.701 Y232.542
+G1 X224.012 Y232.156
+G1 X224.338 Y231.783
+G1 X224.678 Y231.422
+G1 X225.032 Y231.075
+G1 X225.400 Y230.741
+G1 X225.780 Y230.422
+G1 X226.172 Y230.119
+G1 X226.575 Y229.830
+G1 X226.990 Y229.558
+G1 X227.414 Y229.301
+G1 X227.848 Y229.062
+G1 X228.292 Y228.839
+G1 X228.743 Y228.634
+G1 X229.202 Y228.446
+G1 X229.668 Y228.277
+G1 X230.141 Y228.125
+G1 X230.618 Y227.992
+G1 X231.101 Y227.878
+G1 X231.588 Y227.782
+G1 X232.078 Y227.706
+G1 X232.570 Y227.648
+G1 X233.065 Y227.610
+G1 X233.560 Y227.591
+G1 X234.056 Y227.591
+G1 X234.552 Y227.610
+G1 X235.046 Y227.648
+G1 X235.539 Y227.706
+G1 X236.029 Y227.782
+G1 X236.515 Y227.878
+G1 X236.998 Y227.992
+G1 X237.476 Y228.125
+G1 X237.948 Y228.277
+G1 X238.414 Y228.446
+G1 X238.873 Y228.634
+G1 X239.325 Y228.839
+G1 X239.768 Y229.062
+G1 X240.202 Y229.301
+G1 X240.627 Y229.558
+G1 X241.041 Y229.830
+G1 X241.445 Y230.119
+G1 X241.837 Y230.422
+G1 X242.217 Y230.741
+G1 X242.584 Y231.075
+G1 X242.938 Y231.422
+G1 X243.278 Y231.783
+G1 X243.604 Y232.156
+G1 X243.916 Y232.542
+G1 X244.212 Y232.940
+G1 X244.492 Y233.349
+G1 X244.757 Y233.769
+G1 X245.005 Y234.198
+G1 X245.236 Y234.637
+G1 X245.450 Y235.084
+G1 X245.646 Y235.540
+G1 X245.825 Y236.002
+G1 X245.986 Y236.472
+G1 X246.128 Y236.947
+G1 X246.252 Y237.427
+G1 X246.357 Y237.912
+G1 X246.443 Y238.400
+G1 X246.510 Y238.892
+G1 X246.558 Y239.385
+G1 X246.587 Y239.880
+G1 X246.596 Y240.376
+G1 X246.587 Y240.872
+G1 X246.558 Y241.367
+G1 X246.510 Y241.861
+G1 X246.443 Y242.352
+G1 X246.357 Y242.841
+G1 X246.252 Y243.325
+G1 X246.128 Y243.806
+G1 X245.986 Y244.281
+G1 X245.825 Y244.750
+G1 X245.646 Y245.213
+G1 X245.450 Y245.668
+G1 X245.236 Y246.116
+G1 X245.005 Y246.554
+G1 X244.757 Y246.984
+G1 X244.492 Y247.403
+G1 X244.212 Y247.812
+G1 X243.916 Y248.210
+G1 X243.604 Y248.596
+G1 X243.278 Y248.970
+G1 X242.938 Y249.331
+G1 X242.584 Y249.678
+G1 X242.217 Y250.011
+G1 X241.837 Y250.330
+G1 X241.445 Y250.634
+G1 X241.041 Y250.922
+G1 X240.627 Y251.195
+G1 X240.202 Y251.451
+G1 X239.768 Y251.691
+G1 X239.325 Y251.913
+G1 X238.873 Y252.118
+G1 X238.414 Y252.306
+G1 X237.948 Y252.476
+G1 X237.476 Y252.627
+G1 X236.998 Y252.760
+G1 X236.515 Y252.874
+G1 X236.029 Y252.970
+G1 X235.539 Y253.047
+G1 X235.046 Y253.104
+G1 X234.552 Y253.143
+G1 X234.056 Y253.162
+G1 X233.560 Y253.162
+G1 X233.065 Y253.143
+G1 X232.570 Y253.104
+G1 X232.078 Y253.047
+G1 X231.588 Y252.970
+G1 X231.101 Y252.874
+G1 X230.618 Y252.760
+G1 X230.141 Y252.627
+G1 X229.668 Y252.476
+G1 X229.202 Y252.306
+G1 X228.743 Y252.118
+G1 X228.292 Y251.913
+G1 X227.848 Y251.691
+G1 X227.414 Y251.451
+G1 X226.990 Y251.195
+G1 X226.575 Y250.922
+(finish operation: Depth003)
+(begin operation: Depth004)
+(machine units: mm/min)
+(Depth) 
+G1 X226.172 Y250.634
+G1 X225.780 Y250.330
+G1 X225.400 Y250.011
+G1 X225.032 Y249.678
+G1 X224.678 Y249.331
+G1 X224.338 Y248.970
+G1 X224.012 Y248.596
+G1 X223.701 Y248.210
+G1 X223.404 Y247.812
+G1 X223.124 Y247.403
+G1 X222.859 Y246.984
+G1 X222.611 Y246.554
+G1 X222.380 Y246.116
+G1 X222.166 Y245.668
+G1 X221.970 Y245.213
+G1 X221.791 Y244.750
+G1 X221.631 Y244.281
+G1 X221.489 Y243.806
+G1 X221.365 Y243.325
+G1 X221.260 Y242.841
+G1 X221.174 Y242.352
+G1 X221.107 Y241.861
+G1 X221.059 Y241.367
+G1 X221.030 Y240.872
+G1 X221.020 Y240.376
+G1 X221.030 Y239.880
+G1 X221.059 Y239.385
+G1 X221.107 Y238.892
+G1 X221.174 Y238.400
+G1 X221.260 Y237.912
+G1 X221.365 Y237.427
+G1 X221.489 Y236.947
+G1 X221.631 Y236.472
+G1 X221.791 Y236.002
+G1 X221.970 Y235.540
+G1 X222.166 Y235.084
+G1 X222.380 Y234.637
+G1 X222.611 Y234.198
+G1 X222.859 Y233.769
+G1 X223.124 Y233.349
+G1 X223.404 Y232.940
+G1 X223.701 Y232.542
+G1 X224.012 Y232.156
+G1 X224.338 Y231.783
+G1 X224.678 Y231.422
+G1 X225.032 Y231.075
+G1 X225.400 Y230.741
+G1 X225.780 Y230.422
+G1 X226.172 Y230.119
+G1 X226.575 Y229.830
+G1 X226.990 Y229.558
+G1 X227.414 Y229.301
+G1 X227.848 Y229.062
+G1 X228.292 Y228.839
+G1 X228.743 Y228.634
+G1 X229.202 Y228.446
+G1 X229.668 Y228.277
+G1 X230.141 Y228.125
+G1 X230.618 Y227.992
+G1 X231.101 Y227.878
+G1 X231.588 Y227.782
+G1 X232.078 Y227.706
+G1 X232.570 Y227.648
+G1 X233.065 Y227.610
+G1 X233.560 Y227.591
+G1 X234.056 Y227.591
+G1 X234.552 Y227.610
+G1 X235.046 Y227.648
+G1 X235.539 Y227.706
+G1 X236.029 Y227.782
+G1 X236.515 Y227.878
+G1 X236.998 Y227.992
+G1 X237.476 Y228.125
+G1 X237.948 Y228.277
+G1 X238.414 Y228.446
+G1 X238.873 Y228.634
+G1 X239.325 Y228.839
+G1 X239.768 Y229.062
+G1 X240.202 Y229.301
+G1 X240.627 Y229.558
+G1 X241.041 Y229.830
+G1 X241.445 Y230.119
+G1 X241.837 Y230.422
+G1 X242.217 Y230.741
+G1 X242.584 Y231.075
+G1 X242.938 Y231.422
+G1 X243.278 Y231.783
+G1 X243.604 Y232.156
+G1 X243.916 Y232.542
+G1 X244.212 Y232.940
+G1 X244.492 Y233.349
+G1 X244.757 Y233.769
+G1 X245.005 Y234.198
+G1 X245.236 Y234.637
+G1 X245.450 Y235.084
+G1 X245.646 Y235.540
+G1 X245.825 Y236.002
+G1 X245.986 Y236.472
+G1 X246.128 Y236.947
+G1 X246.252 Y237.427
+G1 X246.357 Y237.912
+G1 X246.443 Y238.400
+G1 X246.510 Y238.892
+G1 X246.558 Y239.385
+G1 X246.587 Y239.880
+G1 X246.596 Y240.376
+M5
+G0 X285.249 Y237.947
+M3 S1000
+G1 X285.236 Y238.427 F1200.000
+G1 X285.195 Y238.906
+G1 X285.128 Y239.381
+G1 X285.034 Y239.852
+G1 X284.914 Y240.317
+G1 X284.769 Y240.775
+G1 X284.597 Y241.223
+G1 X284.401 Y241.662
+G1 X284.181 Y242.088
+G1 X283.937 Y242.502
+G1 X283.670 Y242.901
+G1 X283.381 Y243.285
+G1 X283.071 Y243.652
+G1 X282.742 Y244.001
+G1 X282.393 Y244.330
+G1 X282.026 Y244.640
+G1 X281.642 Y244.929
+G1 X281.243 Y245.196
+G1 X280.829 Y245.440
+G1 X280.403 Y245.660
+G1 X279.964 Y245.856
+G1 X279.516 Y246.028
+G1 X279.058 Y246.173
+G1 X278.593 Y246.293
+G1 X278.122 Y246.387
+G1 X277.647 Y246.454
+G1 X277.168 Y246.495
+G1 X276.688 Y246.508
+G1 X276.208 Y246.495
+G1 X275.730 Y246.454
+G1 X275.254 Y246.387
+G1 X274.783 Y246.293
+G1 X274.318 Y246.173
+G1 X273.861 Y246.028
+G1 X273.412 Y245.856
+G1 X272.974 Y245.660
+G1 X272.547 Y245.440
+G1 X272.133 Y245.196
+G1 X271.734 Y244.929
+G1 X271.350 Y244.640
+G1 X270.984 Y244.330
+G1 X270.635 Y244.001
+G1 X270.305 Y243.652
+G1 X269.995 Y243.285
+G1 X269.706 Y242.901
+G1 X269.439 Y242.502
+G1 X269.195 Y242.088
+G1 X268.975 Y241.662
+G1 X268.779 Y241.223
+G1 X268.608 Y240.775
+G1 X268.462 Y240.317
+G1 X268.342 Y239.852
+G1 X268.248 Y239.381
+G1 X268.181 Y238.906
+G1 X268.141 Y238.427
+G1 X268.127 Y237.947
+G1 X268.141 Y237.467
+G1 X268.181 Y236.989
+G1 X268.248 Y236.513
+G1 X268.342 Y236.042
+G1 X268.462 Y235.577
+G1 X268.608 Y235.120
+G1 X268.779 Y234.671
+G1 X268.975 Y234.233
+G1 X269.195 Y233.806
+G1 X269.439 Y233.392
+G1 X269.706 Y232.993
+G1 X269.995 Y232.609
+G1 X270.305 Y232.243
+G1 X270.635 Y231.894
+G1 X270.984 Y231.564
+G1 X271.350 Y231.254
+G1 X271.734 Y230.965
+G1 X272.133 Y230.698
+G1 X272.547 Y230.454
+G1 X272.974 Y230.234
+G1 X273.412 Y230.038
+G1 X273.861 Y229.867
+G1 X274.318 Y229.721
+G1 X274.783 Y229.601
+G1 X275.254 Y229.507
+G1 X275.730 Y229.440
+G1 X276.208 Y229.400
+G1 X276.688 Y229.386
+G1 X277.168 Y229.400
+G1 X277.647 Y229.440
+G1 X278.122 Y229.507
+G1 X278.593 Y229.601
+G1 X279.058 Y229.721
+G1 X279.516 Y229.867
+G1 X279.964 Y230.038
+G1 X280.403 Y230.234
+G1 X280.829 Y230.454
+G1 X281.243 Y230.698
+G1 X281.642 Y230.965
+G1 X282.026 Y231.254
+G1 X282.393 Y231.564
+G1 X282.742 Y231.894
+G1 X283.071 Y232.243
+G1 X283.381 Y232.609
+G1 X283.670 Y232.993
+G1 X283.937 Y233.392
+G1 X284.181 Y233.806
+G1 X284.401 Y234.233
+G1 X284.597 Y234.671
+G1 X284.769 Y235.120
+G1 X284.914 Y235.577
+G1 X285.034 Y236.042
+G1 X285.128 Y236.513
+G1 X285.195 Y236.989
+G1 X285.236 Y237.467
+G1 X285.249 Y237.947
+G1 X285.236 Y238.427
+G1 X285.195 Y238.906
+G1 X285.128 Y239.381
+G1 X285.034 Y239.852
+G1 X284.914 Y240.317
+G1 X284.769 Y240.775
+G1 X284.597 Y241.223
+G1 X284.401 Y241.662
+G1 X284.181 Y242.088
+G1 X283.937 Y242.502
+G1 X283.670 Y242.901
+G1 X283.381 Y243.285
+G1 X283.071 Y243.652
+G1 X282.742 Y244.001
+G1 X282.393 Y244.330
+G1 X282.026 Y244.640
+G1 X281.642 Y244.929
+G1 X281.243 Y245.196
+G1 X280.829 Y245.440
+G1 X280.403 Y245.660
+G1 X279.964 Y245.856
+G1 X279.516 Y246.028
+G1 X279.058 Y246.173
+G1 X278.593 Y246.293
+G1 X278.122 Y246.387
+G1 X277.647 Y246.454
+G1 X277.168 Y246.495
+G1 X276.688 Y246.508
+G1 X276.208 Y246.495
+G1 X275.730 Y246.454
+G1 X275.254 Y246.387
+G1 X274.783 Y246.293
+G1 X274.318 Y246.173
+G1 X273.861 Y246.028
+G1 X273.412 Y245.856
+G1 X272.974 Y245.660
+G1 X272.547 Y245.440
+G1 X272.133 Y245.196
+G1 X271.734 Y244.929
+G1 X271.350 Y244.640
+G1 X270.984 Y244.330
+G1 X270.635 Y244.001
+G1 X270.305 Y243.652
+G1 X269.995 Y243.285
+G1 X269.706 Y242.901
+G1 X269.439 Y242.502
+G1 X269.195 Y242.088
+G1 X268.975 Y241.662
+G1 X268.779 Y241.223
+G1 X268.608 Y240.775
+G1 X268.462 Y240.317
+G1 X268.342 Y239.852
+G1 X268.248 Y239.381
+G1 X268.181 Y238.906
+G1 X268.141 Y238.427
+G1 X268.127 Y237.947
+G1 X268.141 Y237.467
+G1 X268.181 Y236.989
+G1 X268.248 Y236.513
+G1 X268.342 Y236.042
+G1 X268.462 Y235.577
+G1 X268.608 Y235.120
+G1 X268.779 Y234.671
+G1 X268.975 Y234.233
+G1 X269.195 Y233.806
+G1 X269.439 Y233.392
+G1 X269.706 Y232.993
+G1 X269.995 Y232.609
+G1 X270.305 Y232.243
+G1 X270.635 Y231.894
+G1 X270.984 Y231.564
+G1 X271.350 Y231.254
+G1 X271.734 Y230.965
+G1 X272.133 Y230.698
+G1 X272.547 Y230.454
+G1 X272.974 Y230.234
+G1 X273.412 Y230.038
+G1 X273.861 Y229.867
+G1 X274.318 Y229.721
+G1 X274.783 Y229.601
+G1 X275.254 Y229.507
+G1 X275.730 Y229.440
+G1 X276.208 Y229.400
+G1 X276.688 Y229.386
+G1 X277.168 Y229.400
+G1 X277.647 Y229.440
+G1 X278.122 Y229.507
+G1 X278.593 Y229.601
+G1 X279.058 Y229.721
+G1 X279.516 Y229.867
+G1 X279.964 Y230.038
+G1 X280.403 Y230.234
+G1 X280.829 Y230.454
+G1 X281.243 Y230.698
+G1 X281.642 Y230.965
+G1 X282.026 Y231.254
+G1 X282.393 Y231.564
+G1 X282.742 Y231.894
+G1 X283.071 Y232.243
+G1 X283.381 Y232.609
+G1 X283.670 Y232.993
+G1 X283.937 Y233.392
+G1 X284.181 Y233.806
+G1 X284.401 Y234.233
+G1 X284.597 Y234.671
+G1 X284.769 Y235.120
+G1 X284.914 Y235.577
+G1 X285.034 Y236.042
+G1 X285.128 Y236.513
+G1 X285.195 Y236.989
+G1 X285.236 Y237.467
+G1 X285.249 Y237.947
+G1 X285.236 Y238.427
+G1 X285.195 Y238.906
+G1 X285.128 Y239.381
+G1 X285.034 Y239.852
+G1 X284.914 Y240.317
+G1 X284.769 Y240.775
+G1 X284.597 Y241.223
+G1 X284.401 Y241.662
+G1 X284.181 Y242.088
+G1 X283.937 Y242.502
+G1 X283.670 Y242.901
+G1 X283.381 Y243.285
+G1 X283.071 Y243.652
+G1 X282.742 Y244.001
+G1 X282.393 Y244.330
+G1 X282.026 Y244.640
+G1 X281.642 Y244.929
+G1 X281.243 Y245.196
+G1 X280.829 Y245.440
+G1 X280.403 Y245.660
+G1 X279.964 Y245.856
+G1 X279.516 Y246.028
+G1 X279.058 Y246.173
+G1 X278.593 Y246.293
+G1 X278.122 Y246.387
+G1 X277.647 Y246.454
+G1 X277.168 Y246.495
+G1 X276.688 Y246.508
+G1 X276.208 Y246.495
+G1 X275.730 Y246.454
+G1 X275.254 Y246.387
+G1 X274.783 Y246.293
+G1 X274.318 Y246.173
+G1 X273.861 Y246.028
+G1 X273.412 Y245.856
+G1 X272.974 Y245.660
+G1 X272.547 Y245.440
+G1 X272.133 Y245.196
+G1 X271.734 Y244.929
+G1 X271.350 Y244.640
+G1 X270.984 Y244.330
+G1 X270.635 Y244.001
+G1 X270.305 Y243.652
+G1 X269.995 Y243.285
+G1 X269.706 Y242.901
+G1 X269.439 Y242.502
+G1 X269.195 Y242.088
+G1 X268.975 Y241.662
+G1 X268.779 Y241.223
+G1 X268.608 Y240.775
+G1 X268.462 Y240.317
+G1 X268.342 Y239.852
+G1 X268.248 Y239.381
+G1 X268.181 Y238.906
+G1 X268.141 Y238.427
+G1 X268.127 Y237.947
+G1 X268.141 Y237.467
+G1 X268.181 Y236.989
+G1 X268.248 Y236.513
+G1 X268.342 Y236.042
+G1 X268.462 Y235.577
+G1 X268.608 Y235.120
+(finish operation: Depth004)
+(begin operation: Depth005)
+(machine units: mm/min)
+(Depth) 
+G1 X268.779 Y234.671
+G1 X268.975 Y234.233
+G1 X269.195 Y233.806
+G1 X269.439 Y233.392
+G1 X269.706 Y232.993
+G1 X269.995 Y232.609
+G1 X270.305 Y232.243
+G1 X270.635 Y231.894
+G1 X270.984 Y231.564
+G1 X271.350 Y231.254
+G1 X271.734 Y230.965
+G1 X272.133 Y230.698
+G1 X272.547 Y230.454
+G1 X272.974 Y230.234
+G1 X273.412 Y230.038
+G1 X273.861 Y229.867
+G1 X274.318 Y229.721
+G1 X274.783 Y229.601
+G1 X275.254 Y229.507
+G1 X275.730 Y229.440
+G1 X276.208 Y229.400
+G1 X276.688 Y229.386
+G1 X277.168 Y229.400
+G1 X277.647 Y229.440
+G1 X278.122 Y229.507
+G1 X278.593 Y229.601
+G1 X279.058 Y229.721
+G1 X279.516 Y229.867
+G1 X279.964 Y230.038
+G1 X280.403 Y230.234
+G1 X280.829 Y230.454
+G1 X281.243 Y230.698
+G1 X281.642 Y230.965
+G1 X282.026 Y231.254
+G1 X282.393 Y231.564
+G1 X282.742 Y231.894
+G1 X283.071 Y232.243
+G1 X283.381 Y232.609
+G1 X283.670 Y232.993
+G1 X283.937 Y233.392
+G1 X284.181 Y233.806
+G1 X284.401 Y234.233
+G1 X284.597 Y234.671
+G1 X284.769 Y235.120
+G1 X284.914 Y235.577
+G1 X285.034 Y236.042
+G1 X285.128 Y236.513
+G1 X285.195 Y236.989
+G1 X285.236 Y237.467
+G1 X285.249 Y237.947
+(finish operation: Depth005)
+(begin postamble)
+M5 G17 G90 M2
\ No newline at end of file
@@ -0,0 +1,1549 @@
+(Exported by FreeCAD)
+(Post Processor: laser_post)
+
+(begin preamble)
+G17 G90
+G21
+(begin operation: TC)
+(machine units: mm/min)
+(TC: Laser) 
+M5
+(finish operation: TC)
+(begin operation: Engrave001)
+(machine units: mm/min)
+(Engrave) 
+M5
+G0 X405.322 Y212.227
+M3 S1000
+G1 X404.865 Y212.302 F1200.000
+G1 X404.454 Y212.400
+G1 X404.003 Y212.382
+G1 X403.854 Y212.384
+G1 X403.762 Y212.376
+G1 X403.362 Y212.288
+G1 X403.056 Y212.085
+G1 X402.783 Y211.916
+G1 X402.716 Y211.866
+G1 X402.399 Y211.572
+G1 X402.222 Y211.461
+G1 X402.102 Y211.311
+G1 X401.887 Y211.103
+G1 X401.683 Y210.960
+G1 X401.278 Y210.735
+G1 X400.870 Y210.517
+G1 X400.661 Y210.212
+G1 X400.549 Y209.825
+G1 X400.319 Y209.470
+G1 X400.167 Y209.341
+G1 X400.104 Y209.294
+M5
+G0 X440.169 Y62.077
+M3 S1000
+G1 X440.116 Y61.669 F1200.000
+G1 X440.069 Y61.481
+G1 X440.012 Y61.208
+G1 X439.990 Y60.911
+G1 X439.941 Y60.546
+G1 X439.761 Y60.315
+G1 X439.407 Y59.985
+G1 X439.180 Y59.881
+G1 X438.867 Y59.821
+G1 X438.687 Y59.840
+G1 X438.554 Y59.819
+G1 X438.225 Y59.712
+G1 X438.022 Y59.542
+G1 X437.830 Y59.141
+M5
+G0 X443.223 Y235.889
+M3 S1000
+G1 X443.496 Y235.783 F1200.000
+G1 X443.626 Y235.666
+G1 X444.002 Y235.490
+G1 X444.317 Y235.470
+G1 X444.716 Y235.208
+G1 X444.940 Y234.943
+G1 X445.197 Y234.517
+G1 X445.271 Y234.470
+G1 X445.491 Y234.229
+G1 X445.625 Y233.821
+G1 X445.681 Y233.671
+G1 X445.730 Y233.530
+G1 X445.807 Y233.130
+G1 X445.798 Y233.035
+G1 X445.843 Y232.928
+G1 X445.953 Y232.640
+G1 X446.079 Y232.198
+G1 X446.069 Y232.137
+G1 X445.982 Y231.813
+G1 X445.861 Y231.623
+G1 X445.703 Y231.474
+G1 X445.663 Y231.429
+G1 X445.337 Y231.074
+G1 X445.246 Y230.961
+G1 X445.036 Y230.609
+G1 X444.924 Y230.395
+G1 X444.878 Y230.311
+G1 X444.709 Y230.014
+G1 X444.647 Y229.816
+G1 X444.636 Y229.750
+G1 X444.652 Y229.655
+G1 X444.727 Y229.458
+G1 X444.858 Y229.102
+G1 X444.940 Y229.006
+G1 X444.986 Y228.656
+G1 X445.069 Y228.312
+G1 X445.160 Y227.891
+G1 X445.189 Y227.574
+G1 X445.257 Y227.334
+G1 X445.356 Y227.122
+G1 X445.561 Y226.895
+G1 X445.658 Y226.707
+G1 X445.848 Y226.325
+G1 X445.873 Y226.275
+G1 X446.160 Y226.021
+G1 X446.286 Y225.898
+G1 X446.408 Y225.796
+G1 X446.571 Y225.722
+G1 X446.756 Y225.619
+G1 X447.084 Y225.584
+G1 X447.445 Y225.494
+G1 X447.748 Y225.335
+G1 X447.797 Y225.321
+G1 X447.952 Y225.292
+G1 X448.288 Y225.315
+G1 X448.573 Y225.203
+G1 X448.809 Y225.214
+G1 X449.034 Y225.136
+M5
+G0 X317.854 Y13.098
+M3 S1000
+G1 X317.489 Y13.126 F1200.000
+G1 X317.128 Y13.408
+G1 X316.839 Y13.550
+G1 X316.656 Y13.621
+G1 X316.258 Y13.777
+G1 X315.776 Y13.700
+G1 X315.552 Y13.623
+G1 X315.101 Y13.816
+G1 X314.758 Y14.069
+G1 X314.364 Y14.339
+G1 X314.163 Y14.466
+G1 X313.823 Y14.657
+G1 X313.395 Y14.897
+G1 X313.291 Y14.984
+G1 X313.134 Y15.267
+G1 X312.935 Y15.567
+G1 X312.837 Y15.656
+G1 X312.786 Y15.985
+G1 X312.770 Y16.042
+G1 X312.703 Y16.119
+G1 X312.632 Y16.268
+M5
+G0 X313.712 Y228.837
+M3 S1000
+G1 X313.685 Y228.785 F1200.000
+G1 X313.642 Y228.731
+G1 X313.292 Y228.410
+G1 X312.856 Y228.228
+G1 X312.510 Y228.053
+G1 X312.177 Y227.903
+G1 X311.726 Y227.832
+G1 X311.398 Y227.911
+G1 X311.271 Y227.979
+G1 X310.965 Y228.050
+G1 X310.765 Y228.061
+G1 X310.361 Y228.080
+M5
+G0 X344.880 Y94.712
+M3 S1000
+G1 X344.648 Y94.502 F1200.000
+G1 X344.517 Y94.335
+G1 X344.468 Y94.246
+G1 X344.280 Y93.917
+G1 X344.159 Y93.498
+G1 X344.016 Y93.148
+G1 X343.916 Y92.993
+M5
+G0 X52.153 Y157.032
+M3 S1000
+G1 X51.762 Y156.857 F1200.000
+G1 X51.557 Y156.688
+G1 X51.267 Y156.466
+G1 X50.920 Y156.310
+G1 X50.532 Y156.078
+G1 X50.397 Y155.905
+G1 X50.024 Y155.590
+G1 X49.953 Y155.538
+G1 X49.622 Y155.336
+G1 X49.432 Y155.212
+G1 X49.197 Y155.052
+G1 X48.895 Y154.970
+G1 X48.564 Y154.839
+G1 X48.073 Y154.779
+G1 X47.911 Y154.737
+G1 X47.710 Y154.672
+G1 X47.631 Y154.672
+G1 X47.196 Y154.537
+G1 X46.943 Y154.550
+G1 X46.715 Y154.577
+G1 X46.577 Y154.613
+G1 X46.444 Y154.549
+G1 X46.351 Y154.480
+G1 X46.132 Y154.281
+G1 X46.069 Y154.181
+G1 X46.103 Y154.070
+M5
+G0 X194.835 Y190.380
+M3 S1000
+G1 X195.076 Y190.118 F1200.000
+G1 X195.536 Y189.925
+G1 X195.778 Y189.692
+G1 X196.190 Y189.467
+G1 X196.229 Y189.430
+G1 X196.349 Y189.278
+G1 X196.385 Y189.087
+G1 X196.256 Y188.793
+G1 X196.197 Y188.688
+G1 X195.963 Y188.405
+G1 X195.833 Y188.177
+G1 X195.650 Y187.753
+G1 X195.595 Y187.695
+G1 X195.381 Y187.367
+G1 X195.285 Y187.134
+G1 X195.265 Y186.694
+G1 X195.152 Y186.463
+G1 X194.976 Y186.234
+G1 X194.947 Y186.176
+G1 X194.948 Y185.893
+G1 X195.040 Y185.586
+G1 X195.251 Y185.258
+G1 X195.370 Y185.123
+G1 X195.772 Y184.847
+G1 X196.078 Y184.544
+G1 X196.222 Y184.487
+G1 X196.618 Y184.297
+G1 X196.996 Y184.362
+G1 X197.176 Y184.408
+G1 X197.448 Y184.410
+G1 X197.615 Y184.392
+G1 X197.836 Y184.420
+G1 X198.046 Y184.347
+G1 X198.204 Y184.351
+G1 X198.509 Y184.574
+G1 X198.766 Y184.645
+M5
+G0 X67.634 Y249.189
+M3 S1000
+G1 X67.526 Y248.853 F1200.000
+G1 X67.573 Y248.623
+G1 X67.831 Y248.425
+G1 X68.028 Y248.252
+G1 X68.121 Y248.179
+G1 X68.443 Y248.095
+G1 X68.539 Y248.079
+G1 X68.741 Y247.985
+G1 X69.088 Y247.787
+G1 X69.224 Y247.492
+M5
+G0 X224.250 Y177.048
+M3 S1000
+G1 X223.980 Y177.452 F1200.000
+G1 X223.761 Y177.824
+G1 X223.624 Y178.285
+G1 X223.587 Y178.669
+G1 X223.463 Y179.134
+G1 X223.288 Y179.535
+G1 X223.096 Y179.994
+G1 X222.959 Y180.162
+G1 X222.865 Y180.261
+G1 X222.637 Y180.684
+G1 X222.302 Y180.993
+G1 X222.248 Y181.024
+M5
+G0 X249.630 Y159.392
+M3 S1000
+G1 X249.699 Y159.331 F1200.000
+G1 X250.059 Y159.154
+G1 X250.248 Y158.842
+G1 X250.279 Y158.746
+G1 X250.383 Y158.528
+G1 X250.299 Y158.065
+G1 X250.195 Y157.851
+G1 X250.183 Y157.471
+G1 X250.200 Y157.410
+G1 X250.189 Y157.347
+G1 X250.184 Y156.883
+G1 X250.221 Y156.806
+G1 X250.249 Y156.730
+G1 X250.309 Y156.532
+G1 X250.327 Y156.481
+G1 X250.392 Y156.430
+G1 X250.719 Y156.119
+G1 X250.988 Y155.889
+G1 X251.399 Y155.658
+M5
+G0 X59.130 Y2.012
+M3 S1000
+G1 X59.038 Y2.078 F1200.000
+G1 X58.845 Y2.244
+G1 X58.782 Y2.398
+G1 X58.754 Y2.454
+G1 X58.509 Y2.870
+G1 X58.379 Y2.998
+M5
+G0 X421.637 Y154.897
+M3 S1000
+G1 X421.455 Y155.150 F1200.000
+G1 X421.386 Y155.248
+G1 X421.002 Y155.399
+G1 X420.869 Y155.538
+G1 X420.741 Y155.666
+G1 X420.512 Y155.733
+G1 X420.453 Y155.740
+G1 X420.369 Y155.748
+G1 X420.077 Y155.690
+G1 X419.714 Y155.563
+G1 X419.424 Y155.393
+G1 X419.362 Y155.331
+G1 X418.944 Y155.099
+G1 X418.882 Y155.056
+G1 X418.526 Y154.929
+G1 X418.357 Y154.834
+G1 X418.138 Y154.690
+G1 X417.813 Y154.340
+G1 X417.624 Y154.106
+G1 X417.340 Y153.885
+G1 X417.173 Y153.728
+G1 X416.815 Y153.560
+G1 X416.568 Y153.500
+G1 X416.121 Y153.348
+G1 X415.832 Y153.176
+G1 X415.645 Y152.984
+G1 X415.392 Y152.722
+G1 X415.168 Y152.482
+G1 X414.980 Y152.134
+G1 X414.824 Y151.839
+G1 X414.601 Y151.547
+G1 X414.432 Y151.347
+G1 X414.308 Y151.253
+G1 X413.923 Y151.179
+G1 X413.818 Y151.175
+G1 X413.532 Y150.831
+G1 X413.402 Y150.576
+G1 X413.277 Y150.290
+G1 X413.195 Y150.148
+G1 X413.120 Y149.988
+G1 X412.991 Y149.697
+G1 X412.934 Y149.665
+M5
+G0 X380.274 Y85.569
+M3 S1000
+G1 X379.950 Y85.793 F1200.000
+G1 X379.913 Y85.864
+G1 X379.848 Y85.953
+G1 X379.724 Y86.211
+G1 X379.502 Y86.636
+G1 X379.331 Y86.876
+G1 X379.234 Y87.022
+G1 X379.250 Y87.271
+G1 X379.272 Y87.374
+G1 X379.301 Y87.474
+G1 X379.460 Y87.730
+G1 X379.525 Y87.903
+G1 X379.620 Y88.017
+G1 X379.855 Y88.150
+G1 X380.329 Y88.229
+G1 X380.576 Y88.269
+G1 X380.993 Y88.435
+G1 X381.110 Y88.525
+G1 X381.553 Y88.750
+G1 X381.881 Y89.029
+G1 X381.915 Y89.109
+G1 X382.132 Y89.534
+G1 X382.175 Y89.742
+G1 X382.210 Y89.838
+G1 X382.245 Y90.175
+G1 X382.262 Y90.355
+G1 X382.251 Y90.663
+G1 X382.259 Y90.799
+G1 X382.365 Y90.995
+G1 X382.425 Y91.184
+G1 X382.489 Y91.282
+G1 X382.870 Y91.558
+G1 X382.971 Y91.659
+G1 X383.045 Y91.771
+G1 X383.259 Y91.886
+G1 X383.360 Y92.138
+G1 X383.467 Y92.361
+G1 X383.585 Y92.439
+M5
+G0 X340.799 Y253.630
+M3 S1000
+G1 X340.869 Y253.658 F1200.000
+G1 X341.169 Y253.812
+G1 X341.425 Y254.012
+G1 X341.615 Y254.327
+G1 X341.930 Y254.641
+G1 X342.080 Y254.786
+G1 X342.345 Y254.885
+G1 X342.774 Y255.100
+G1 X342.975 Y255.526
+G1 X343.159 Y255.776
+G1 X343.291 Y255.843
+G1 X343.440 Y255.924
+G1 X343.480 Y255.956
+G1 X343.740 Y256.182
+G1 X343.916 Y256.492
+G1 X343.970 Y256.976
+G1 X344.123 Y257.178
+G1 X344.171 Y257.375
+G1 X344.068 Y257.769
+G1 X343.952 Y257.927
+G1 X343.930 Y257.986
+G1 X343.899 Y258.049
+G1 X343.813 Y258.322
+G1 X343.753 Y258.442
+G1 X343.540 Y258.758
+G1 X343.378 Y258.858
+G1 X343.189 Y258.938
+G1 X342.879 Y259.141
+G1 X342.797 Y259.134
+G1 X342.550 Y259.061
+G1 X342.151 Y258.951
+(finish operation: Engrave001)
+(begin operation: Engrave002)
+(machine units: mm/min)
+(Engrave) 
+G1 X341.668 Y258.864
+G1 X341.582 Y258.861
+G1 X341.488 Y258.855
+G1 X341.026 Y258.809
+G1 X340.783 Y258.860
+G1 X340.395 Y258.833
+G1 X339.981 Y258.741
+G1 X339.733 Y258.636
+G1 X339.635 Y258.589
+G1 X339.520 Y258.433
+G1 X339.296 Y258.332
+G1 X339.008 Y258.276
+G1 X338.868 Y258.261
+G1 X338.546 Y258.257
+M5
+G0 X257.359 Y73.077
+M3 S1000
+G1 X257.296 Y73.397 F1200.000
+G1 X257.260 Y73.631
+G1 X257.264 Y73.779
+G1 X257.229 Y73.819
+G1 X257.224 Y74.110
+G1 X257.240 Y74.332
+G1 X257.245 Y74.505
+G1 X257.192 Y74.649
+G1 X257.088 Y75.006
+G1 X257.070 Y75.389
+G1 X257.079 Y75.844
+G1 X257.038 Y76.037
+M5
+G0 X179.135 Y134.476
+M3 S1000
+G1 X178.797 Y134.236 F1200.000
+G1 X178.504 Y134.124
+G1 X178.445 Y134.107
+G1 X178.012 Y133.880
+G1 X177.798 Y133.699
+G1 X177.636 Y133.331
+G1 X177.565 Y132.939
+G1 X177.483 Y132.818
+G1 X177.212 Y132.552
+G1 X177.096 Y132.379
+G1 X176.821 Y132.222
+G1 X176.723 Y132.215
+G1 X176.330 Y132.379
+M5
+G0 X252.689 Y100.412
+M3 S1000
+G1 X252.566 Y100.401 F1200.000
+G1 X252.121 Y100.404
+G1 X251.829 Y100.354
+G1 X251.477 Y100.458
+G1 X251.249 Y100.491
+M5
+G0 X91.712 Y88.598
+M3 S1000
+G1 X91.664 Y88.734 F1200.000
+G1 X91.641 Y88.894
+G1 X91.394 Y89.256
+G1 X91.338 Y89.397
+G1 X91.338 Y89.602
+G1 X91.330 Y89.910
+G1 X91.324 Y89.986
+G1 X91.356 Y90.255
+M5
+G0 X29.435 Y67.611
+M3 S1000
+G1 X29.631 Y67.586 F1200.000
+G1 X29.979 Y67.583
+G1 X30.087 Y67.555
+G1 X30.201 Y67.559
+G1 X30.390 Y67.536
+G1 X30.760 Y67.375
+G1 X30.923 Y67.208
+G1 X31.209 Y67.159
+G1 X31.618 Y67.106
+G1 X31.987 Y67.234
+G1 X32.280 Y67.318
+G1 X32.367 Y67.410
+G1 X32.433 Y67.678
+G1 X32.660 Y68.041
+G1 X32.937 Y68.277
+G1 X33.200 Y68.608
+G1 X33.269 Y68.718
+G1 X33.204 Y69.166
+G1 X33.245 Y69.548
+G1 X33.209 Y69.920
+G1 X33.265 Y70.156
+G1 X33.311 Y70.485
+G1 X33.400 Y70.844
+G1 X33.462 Y71.037
+G1 X33.598 Y71.394
+G1 X33.876 Y71.748
+G1 X33.975 Y72.003
+G1 X34.131 Y72.207
+G1 X34.214 Y72.472
+G1 X34.223 Y72.674
+G1 X34.068 Y73.055
+G1 X33.947 Y73.317
+G1 X33.874 Y73.481
+G1 X33.778 Y73.754
+G1 X33.675 Y74.034
+G1 X33.580 Y74.242
+G1 X33.540 Y74.338
+G1 X33.482 Y74.500
+G1 X33.278 Y74.955
+G1 X33.133 Y75.291
+G1 X32.777 Y75.595
+G1 X32.392 Y75.674
+G1 X32.116 Y75.734
+G1 X31.986 Y75.832
+G1 X31.887 Y75.859
+G1 X31.430 Y75.734
+M5
+G0 X116.470 Y188.682
+M3 S1000
+G1 X116.349 Y188.664 F1200.000
+G1 X115.932 Y188.553
+G1 X115.517 Y188.498
+G1 X115.397 Y188.492
+G1 X115.192 Y188.492
+G1 X114.920 Y188.509
+G1 X114.692 Y188.468
+G1 X114.287 Y188.464
+G1 X113.982 Y188.437
+G1 X113.929 Y188.446
+G1 X113.555 Y188.472
+G1 X113.223 Y188.368
+G1 X113.057 Y188.357
+G1 X112.586 Y188.366
+G1 X112.411 Y188.383
+G1 X112.333 Y188.376
+G1 X112.005 Y188.457
+G1 X111.789 Y188.712
+G1 X111.685 Y188.987
+G1 X111.662 Y189.176
+G1 X111.644 Y189.229
+G1 X111.570 Y189.389
+G1 X111.589 Y189.554
+G1 X111.663 Y189.744
+G1 X111.813 Y190.080
+G1 X111.841 Y190.125
+G1 X111.975 Y190.370
+M5
+G0 X376.632 Y196.389
+M3 S1000
+G1 X376.550 Y196.098 F1200.000
+G1 X376.617 Y195.873
+G1 X376.599 Y195.721
+G1 X376.573 Y195.670
+G1 X376.244 Y195.534
+G1 X375.922 Y195.446
+G1 X375.543 Y195.439
+G1 X375.385 Y195.477
+G1 X374.911 Y195.499
+G1 X374.453 Y195.591
+G1 X374.070 Y195.556
+G1 X373.825 Y195.495
+G1 X373.474 Y195.603
+G1 X373.019 Y195.758
+G1 X372.551 Y195.750
+G1 X372.275 Y195.559
+G1 X371.969 Y195.233
+G1 X371.673 Y194.967
+G1 X371.622 Y194.929
+G1 X371.575 Y194.901
+G1 X371.384 Y194.784
+G1 X371.187 Y194.437
+G1 X370.891 Y194.103
+G1 X370.837 Y194.063
+G1 X370.730 Y194.054
+G1 X370.368 Y193.979
+G1 X370.109 Y193.934
+G1 X369.832 Y193.868
+G1 X369.663 Y193.750
+M5
+G0 X2.157 Y53.417
+M3 S1000
+G1 X2.340 Y53.604 F1200.000
+G1 X2.744 Y53.862
+G1 X2.772 Y53.917
+G1 X3.050 Y54.329
+G1 X3.210 Y54.624
+G1 X3.279 Y54.718
+G1 X3.506 Y55.094
+G1 X3.804 Y55.434
+G1 X4.113 Y55.775
+G1 X4.399 Y56.018
+G1 X4.766 Y56.111
+G1 X5.110 Y56.002
+G1 X5.448 Y55.868
+G1 X5.804 Y55.664
+G1 X6.188 Y55.504
+G1 X6.353 Y55.464
+G1 X6.758 Y55.406
+G1 X7.134 Y55.262
+G1 X7.416 Y55.276
+G1 X7.742 Y55.061
+G1 X7.974 Y54.961
+G1 X8.101 Y54.940
+G1 X8.377 Y54.992
+G1 X8.817 Y55.174
+G1 X8.950 Y55.206
+G1 X9.342 Y55.344
+G1 X9.627 Y55.327
+G1 X9.734 Y55.302
+G1 X9.991 Y54.999
+G1 X10.198 Y54.806
+G1 X10.237 Y54.773
+G1 X10.487 Y54.568
+G1 X10.695 Y54.343
+G1 X10.815 Y54.167
+G1 X11.136 Y53.883
+G1 X11.451 Y53.539
+G1 X11.528 Y53.431
+G1 X11.762 Y53.209
+G1 X11.821 Y53.171
+M5
+G0 X309.789 Y195.676
+M3 S1000
+G1 X309.772 Y195.551 F1200.000
+G1 X309.569 Y195.135
+G1 X309.526 Y194.890
+G1 X309.426 Y194.584
+G1 X309.339 Y194.416
+G1 X309.081 Y194.069
+G1 X308.896 Y193.896
+G1 X308.778 Y193.774
+M5
+G0 X455.657 Y17.946
+M3 S1000
+G1 X455.945 Y18.101 F1200.000
+G1 X456.220 Y18.308
+G1 X456.388 Y18.556
+G1 X456.625 Y18.929
+G1 X456.672 Y18.985
+G1 X456.950 Y19.324
+M5
+G0 X379.550 Y240.365
+M3 S1000
+G1 X379.591 Y240.441 F1200.000
+G1 X379.701 Y240.622
+G1 X379.690 Y240.741
+G1 X379.542 Y240.981
+G1 X379.506 Y241.016
+G1 X379.487 Y241.217
+G1 X379.426 Y241.323
+G1 X379.282 Y241.697
+G1 X379.009 Y242.085
+G1 X378.615 Y242.342
+G1 X378.220 Y242.617
+G1 X377.938 Y242.791
+G1 X377.686 Y243.013
+G1 X377.522 Y243.124
+G1 X377.405 Y243.163
+G1 X377.182 Y243.252
+G1 X377.002 Y243.385
+G1 X376.628 Y243.517
+G1 X376.272 Y243.564
+G1 X375.906 Y243.488
+G1 X375.848 Y243.470
+G1 X375.670 Y243.387
+G1 X375.268 Y243.152
+G1 X375.003 Y242.995
+G1 X374.678 Y242.755
+G1 X374.389 Y242.472
+G1 X374.063 Y242.321
+G1 X373.763 Y242.105
+G1 X373.669 Y241.991
+G1 X373.500 Y241.835
+G1 X373.389 Y241.659
+G1 X373.363 Y241.569
+G1 X373.341 Y241.349
+G1 X373.232 Y240.899
+G1 X373.133 Y240.446
+G1 X373.143 Y240.365
+G1 X373.178 Y240.081
+G1 X373.283 Y239.806
+G1 X373.261 Y239.362
+G1 X373.199 Y239.199
+G1 X373.032 Y239.047
+G1 X372.721 Y238.932
+G1 X372.609 Y238.957
+G1 X372.396 Y239.033
+G1 X371.927 Y239.174
+G1 X371.752 Y239.345
+M5
+G0 X50.313 Y128.992
+M3 S1000
+G1 X50.023 Y129.117 F1200.000
+G1 X49.530 Y129.189
+G1 X49.071 Y129.291
+G1 X48.867 Y129.265
+G1 X48.542 Y129.339
+G1 X48.220 Y129.558
+G1 X48.098 Y129.601
+G1 X47.806 Y129.489
+G1 X47.631 Y129.445
+G1 X47.437 Y129.297
+G1 X47.116 Y129.098
+G1 X46.922 Y129.030
+G1 X46.820 Y128.957
+G1 X46.673 Y128.763
+G1 X46.423 Y128.491
+M5
+G0 X326.795 Y217.783
+M3 S1000
+G1 X326.690 Y217.744 F1200.000
+G1 X326.633 Y217.716
+G1 X326.542 Y217.653
+G1 X326.212 Y217.666
+G1 X326.032 Y217.668
+G1 X325.623 Y217.622
+G1 X325.187 Y217.771
+G1 X325.019 Y217.780
+G1 X324.912 Y217.838
+G1 X324.766 Y218.088
+G1 X324.771 Y218.203
+G1 X324.885 Y218.480
+G1 X324.892 Y218.636
+G1 X324.846 Y218.857
+G1 X324.831 Y219.118
+G1 X324.843 Y219.351
+G1 X324.820 Y219.442
+G1 X324.697 Y219.729
+G1 X324.573 Y220.041
+G1 X324.491 Y220.094
+G1 X324.172 Y220.337
+G1 X323.944 Y220.563
+G1 X323.832 Y220.821
+G1 X323.788 Y220.939
+G1 X323.722 Y220.998
+G1 X323.545 Y221.116
+G1 X323.225 Y221.312
+G1 X323.065 Y221.458
+G1 X322.721 Y221.575
+G1 X322.596 Y221.662
+G1 X322.538 Y221.769
+G1 X322.583 Y222.168
+G1 X322.669 Y222.433
+G1 X322.757 Y222.761
+G1 X322.795 Y222.880
+G1 X322.795 Y223.227
+G1 X322.798 Y223.475
+G1 X322.832 Y223.787
+G1 X322.979 Y224.227
+G1 X322.991 Y224.300
+M5
+G0 X180.023 Y224.656
+M3 S1000
+G1 X179.949 Y224.470 F1200.000
+G1 X179.775 Y224.269
+G1 X179.711 Y224.197
+G1 X179.533 Y223.907
+G1 X179.335 Y223.734
+G1 X179.257 Y223.641
+G1 X179.106 Y223.235
+G1 X179.084 Y223.157
+G1 X179.051 Y223.083
+G1 X178.798 Y222.921
+G1 X178.711 Y222.776
+G1 X178.654 Y222.677
+G1 X178.501 Y222.291
+G1 X178.505 Y221.871
+G1 X178.555 Y221.771
+G1 X178.739 Y221.374
+G1 X178.862 Y221.099
+G1 X179.013 Y220.772
+G1 X179.053 Y220.304
+G1 X178.958 Y220.123
+G1 X178.897 Y220.052
+G1 X178.695 Y219.676
+G1 X178.606 Y219.507
+G1 X178.407 Y219.075
+G1 X178.384 Y218.797
+G1 X178.338 Y218.492
+G1 X178.331 Y218.340
+G1 X178.236 Y217.961
+G1 X178.232 Y217.807
+G1 X178.342 Y217.564
+M5
+G0 X422.628 Y100.567
+M3 S1000
+G1 X422.371 Y100.904 F1200.000
+G1 X422.038 Y101.194
+G1 X421.906 Y101.270
+G1 X421.735 Y101.395
+G1 X421.647 Y101.546
+G1 X421.327 Y101.735
+G1 X421.183 Y101.839
+G1 X421.080 Y101.850
+G1 X420.965 Y101.817
+G1 X420.619 Y101.501
+G1 X420.445 Y101.398
+G1 X420.040 Y101.124
+G1 X419.910 Y100.900
+M5
+G0 X221.652 Y262.013
+(finish operation: Engrave002)
+(begin operation: Engrave003)
+(machine units: mm/min)
+(Engrave) 
+M3 S1000
+G1 X221.913 Y261.921 F1200.000
+G1 X222.128 Y261.760
+G1 X222.190 Y261.693
+G1 X222.367 Y261.617
+G1 X222.839 Y261.503
+G1 X223.298 Y261.323
+G1 X223.381 Y261.283
+G1 X223.504 Y261.217
+G1 X223.851 Y261.000
+G1 X224.046 Y260.912
+G1 X224.249 Y260.821
+G1 X224.298 Y260.805
+G1 X224.768 Y260.793
+G1 X224.904 Y260.827
+G1 X224.953 Y260.839
+G1 X225.406 Y260.856
+G1 X225.535 Y260.869
+G1 X225.691 Y260.870
+G1 X226.089 Y260.982
+G1 X226.332 Y261.018
+G1 X226.651 Y260.944
+G1 X226.821 Y260.964
+G1 X227.226 Y260.844
+G1 X227.533 Y260.667
+G1 X227.598 Y260.603
+G1 X227.819 Y260.182
+G1 X227.969 Y259.853
+G1 X228.033 Y259.530
+G1 X228.044 Y259.222
+G1 X227.972 Y258.883
+G1 X227.961 Y258.779
+G1 X227.984 Y258.684
+G1 X228.148 Y258.263
+G1 X228.222 Y258.012
+G1 X228.227 Y257.775
+G1 X228.250 Y257.556
+G1 X228.188 Y257.141
+G1 X228.149 Y256.991
+G1 X228.031 Y256.535
+G1 X228.037 Y256.474
+G1 X228.057 Y256.243
+G1 X228.078 Y255.850
+G1 X228.038 Y255.691
+G1 X228.001 Y255.430
+G1 X227.964 Y255.088
+G1 X228.007 Y254.771
+G1 X228.221 Y254.583
+G1 X228.265 Y254.505
+G1 X228.402 Y254.179
+G1 X228.725 Y253.829
+G1 X229.038 Y253.519
+G1 X229.350 Y253.249
+G1 X229.626 Y253.026
+G1 X229.750 Y252.826
+G1 X229.999 Y252.507
+G1 X230.331 Y252.265
+G1 X230.687 Y252.257
+G1 X230.968 Y252.209
+M5
+G0 X347.485 Y51.297
+M3 S1000
+G1 X347.600 Y51.268 F1200.000
+G1 X347.904 Y51.075
+G1 X348.153 Y50.679
+G1 X348.328 Y50.412
+G1 X348.584 Y50.217
+G1 X348.745 Y50.111
+G1 X348.811 Y50.069
+G1 X348.943 Y49.980
+G1 X349.275 Y49.877
+G1 X349.357 Y49.822
+G1 X349.810 Y49.711
+G1 X350.128 Y49.606
+G1 X350.376 Y49.495
+G1 X350.513 Y49.498
+G1 X350.859 Y49.359
+G1 X351.085 Y49.367
+G1 X351.560 Y49.512
+G1 X351.637 Y49.534
+G1 X351.751 Y49.570
+G1 X352.175 Y49.776
+G1 X352.265 Y49.889
+G1 X352.422 Y50.037
+G1 X352.466 Y50.114
+G1 X352.565 Y50.328
+G1 X352.798 Y50.508
+G1 X353.102 Y50.648
+G1 X353.289 Y50.868
+G1 X353.622 Y51.182
+G1 X353.687 Y51.228
+G1 X353.869 Y51.495
+G1 X353.956 Y51.606
+G1 X354.256 Y51.738
+G1 X354.313 Y51.758
+G1 X354.689 Y51.930
+G1 X355.004 Y51.922
+G1 X355.443 Y51.727
+G1 X355.523 Y51.667
+G1 X355.755 Y51.570
+G1 X355.972 Y51.617
+G1 X356.331 Y51.476
+G1 X356.642 Y51.420
+G1 X357.095 Y51.292
+G1 X357.408 Y51.285
+G1 X357.676 Y51.297
+G1 X357.902 Y51.393
+G1 X358.116 Y51.459
+G1 X358.413 Y51.586
+G1 X358.864 Y51.723
+G1 X358.923 Y51.748
+G1 X359.240 Y51.933
+M5
+G0 X118.982 Y176.210
+M3 S1000
+G1 X119.012 Y176.620 F1200.000
+G1 X118.990 Y176.753
+G1 X118.922 Y176.944
+G1 X118.921 Y177.243
+G1 X118.910 Y177.302
+G1 X118.705 Y177.689
+G1 X118.534 Y178.156
+G1 X118.352 Y178.427
+G1 X118.341 Y178.507
+G1 X118.224 Y178.790
+G1 X118.285 Y179.098
+G1 X118.358 Y179.356
+M5
+G0 X249.708 Y218.931
+M3 S1000
+G1 X249.623 Y219.029 F1200.000
+G1 X249.444 Y219.328
+G1 X249.249 Y219.635
+G1 X249.077 Y219.814
+G1 X248.690 Y220.048
+G1 X248.207 Y220.118
+G1 X247.962 Y220.203
+G1 X247.785 Y220.276
+G1 X247.389 Y220.327
+G1 X247.339 Y220.320
+G1 X246.897 Y220.316
+G1 X246.505 Y220.403
+G1 X246.450 Y220.418
+G1 X246.044 Y220.485
+G1 X245.904 Y220.490
+G1 X245.608 Y220.440
+G1 X245.341 Y220.371
+G1 X244.922 Y220.305
+G1 X244.689 Y220.194
+G1 X244.542 Y220.064
+G1 X244.251 Y219.864
+G1 X244.156 Y219.712
+G1 X243.940 Y219.340
+G1 X243.898 Y219.267
+G1 X243.771 Y218.793
+G1 X243.669 Y218.465
+G1 X243.602 Y218.317
+G1 X243.641 Y217.869
+G1 X243.630 Y217.795
+G1 X243.592 Y217.573
+G1 X243.492 Y217.106
+G1 X243.492 Y216.646
+G1 X243.279 Y216.345
+G1 X243.116 Y216.168
+G1 X242.879 Y215.887
+G1 X242.727 Y215.670
+G1 X242.683 Y215.587
+G1 X242.623 Y215.469
+G1 X242.513 Y215.030
+G1 X242.510 Y214.817
+M5
+G0 X198.674 Y147.654
+M3 S1000
+G1 X198.221 Y147.784 F1200.000
+G1 X198.145 Y147.791
+G1 X197.940 Y147.841
+G1 X197.828 Y147.958
+G1 X197.745 Y148.037
+G1 X197.485 Y148.184
+G1 X197.350 Y148.259
+G1 X196.971 Y148.439
+G1 X196.707 Y148.833
+G1 X196.582 Y148.933
+G1 X196.484 Y149.228
+G1 X196.472 Y149.353
+G1 X196.452 Y149.537
+G1 X196.083 Y149.777
+G1 X195.743 Y149.936
+G1 X195.495 Y150.257
+G1 X195.412 Y150.351
+G1 X195.249 Y150.575
+G1 X195.070 Y150.780
+G1 X194.975 Y150.830
+G1 X194.596 Y151.014
+G1 X194.517 Y151.050
+M5
+G0 X461.551 Y275.473
+M3 S1000
+G1 X461.350 Y275.029 F1200.000
+G1 X461.026 Y274.901
+G1 X460.660 Y274.759
+G1 X460.383 Y274.612
+G1 X460.030 Y274.440
+G1 X459.957 Y274.450
+G1 X459.795 Y274.445
+G1 X459.454 Y274.589
+G1 X459.135 Y274.604
+G1 X458.710 Y274.742
+G1 X458.520 Y274.825
+G1 X458.309 Y274.830
+G1 X457.972 Y274.795
+G1 X457.809 Y274.815
+G1 X457.379 Y274.623
+G1 X456.996 Y274.416
+G1 X456.818 Y274.365
+G1 X456.706 Y274.352
+G1 X456.370 Y274.207
+G1 X456.176 Y274.254
+G1 X455.948 Y274.251
+G1 X455.729 Y274.322
+G1 X455.315 Y274.370
+G1 X455.022 Y274.450
+G1 X454.857 Y274.490
+G1 X454.732 Y274.480
+G1 X454.364 Y274.351
+G1 X454.133 Y274.177
+G1 X453.988 Y273.868
+G1 X453.676 Y273.526
+G1 X453.363 Y273.192
+G1 X453.225 Y272.940
+G1 X453.153 Y272.791
+M5
+G0 X331.860 Y5.118
+M3 S1000
+G1 X331.709 Y5.051 F1200.000
+G1 X331.305 Y4.869
+G1 X330.871 Y4.680
+G1 X330.442 Y4.455
+G1 X330.274 Y4.326
+G1 X329.885 Y4.018
+G1 X329.838 Y3.985
+G1 X329.416 Y3.945
+G1 X329.237 Y4.008
+G1 X328.968 Y4.064
+G1 X328.778 Y4.161
+G1 X328.475 Y4.426
+G1 X328.140 Y4.569
+G1 X327.873 Y4.681
+G1 X327.685 Y4.772
+G1 X327.552 Y4.810
+G1 X327.428 Y4.761
+G1 X327.154 Y4.586
+G1 X326.996 Y4.358
+G1 X326.586 Y4.206
+G1 X326.128 Y4.213
+G1 X326.075 Y4.177
+G1 X325.837 Y3.932
+G1 X325.734 Y3.716
+G1 X325.622 Y3.552
+G1 X325.620 Y3.223
+G1 X325.493 Y2.874
+G1 X325.286 Y2.429
+G1 X325.185 Y2.099
+G1 X325.052 Y1.803
+G1 X325.128 Y1.620
+G1 X325.320 Y1.256
+G1 X325.370 Y1.144
+G1 X325.578 Y0.836
+G1 X325.796 Y0.598
+G1 X326.053 Y0.209
+G1 X326.298 Y-0.101
+G1 X326.473 Y-0.459
+G1 X326.468 Y-0.559
+G1 X326.480 Y-0.945
+G1 X326.344 Y-1.175
+G1 X326.126 Y-1.502
+G1 X326.016 Y-1.629
+G1 X325.853 Y-1.856
+G1 X325.602 Y-2.004
+G1 X325.556 Y-2.037
+G1 X325.238 Y-2.278
+G1 X325.075 Y-2.430
+G1 X324.758 Y-2.804
+G1 X324.554 Y-3.170
+G1 X324.498 Y-3.238
+G1 X324.087 Y-3.511
+G1 X324.038 Y-3.564
+G1 X323.978 Y-3.580
+G1 X323.716 Y-3.763
+G1 X323.366 Y-3.871
+G1 X323.164 Y-3.989
+G1 X322.945 Y-4.431
+G1 X322.885 Y-4.475
+M5
+G0 X401.678 Y245.944
+M3 S1000
+G1 X401.777 Y246.022 F1200.000
+G1 X401.862 Y246.053
+G1 X402.006 Y246.071
+G1 X402.359 Y246.129
+G1 X402.601 Y246.281
+G1 X402.999 Y246.325
+G1 X403.108 Y246.374
+G1 X403.221 Y246.387
+G1 X403.714 Y246.450
+G1 X404.193 Y246.434
+G1 X404.563 Y246.647
+G1 X404.733 Y246.750
+G1 X404.855 Y246.824
+M5
+G0 X216.511 Y191.043
+M3 S1000
+G1 X216.427 Y191.070 F1200.000
+G1 X216.216 Y191.167
+G1 X215.954 Y191.209
+G1 X215.810 Y191.248
+G1 X215.478 Y191.320
+G1 X215.362 Y191.324
+G1 X215.285 Y191.353
+G1 X214.986 Y191.411
+G1 X214.638 Y191.393
+G1 X214.441 Y191.461
+G1 X214.117 Y191.594
+G1 X213.739 Y191.769
+G1 X213.454 Y192.027
+G1 X213.269 Y192.118
+G1 X212.951 Y192.359
+G1 X212.492 Y192.531
+G1 X212.297 Y192.589
+G1 X212.223 Y192.631
+G1 X212.137 Y192.682
+G1 X211.957 Y192.917
+G1 X211.750 Y193.111
+G1 X211.587 Y193.245
+G1 X211.204 Y193.524
+G1 X210.974 Y193.660
+G1 X210.535 Y193.803
+G1 X210.209 Y193.904
+G1 X210.060 Y193.951
+G1 X209.685 Y194.199
+G1 X209.490 Y194.498
+G1 X209.395 Y194.576
+G1 X209.365 Y194.639
+G1 X209.160 Y195.094
+G1 X209.153 Y195.218
+G1 X209.210 Y195.660
+G1 X209.201 Y195.927
+G1 X208.989 Y196.379
+G1 X208.927 Y196.693
+G1 X208.835 Y196.924
+M5
+G0 X277.628 Y273.923
+M3 S1000
+G1 X277.223 Y273.752 F1200.000
+G1 X277.093 Y273.664
+G1 X276.946 Y273.499
+G1 X276.842 Y273.378
+G1 X276.697 Y273.100
+G1 X276.640 Y272.851
+G1 X276.531 Y272.551
+G1 X276.459 Y272.409
+G1 X276.221 Y272.051
+G1 X276.015 Y271.747
+G1 X275.887 Y271.455
+G1 X275.866 Y271.315
+G1 X275.820 Y271.191
+G1 X275.623 Y270.830
+G1 X275.530 Y270.552
+G1 X275.510 Y270.380
+G1 X275.474 Y270.244
+G1 X275.467 Y270.185
+G1 X275.423 Y270.056
+G1 X275.362 Y269.629
+G1 X275.460 Y269.392
+G1 X275.562 Y269.144
+G1 X275.810 Y268.809
+G1 X276.101 Y268.589
+G1 X276.283 Y268.274
+G1 X276.695 Y268.089
+G1 X276.891 Y268.050
+G1 X277.264 Y268.023
+G1 X277.510 Y268.054
+G1 X277.965 Y267.976
+G1 X278.176 Y267.919
+G1 X278.262 Y267.907
+G1 X278.742 Y267.819
+G1 X278.794 Y267.795
+G1 X279.063 Y267.575
+G1 X279.120 Y267.161
+G1 X279.159 Y266.665
+G1 X279.176 Y266.599
+G1 X279.188 Y266.507
+G1 X279.336 Y266.117
+G1 X279.449 Y265.690
+G1 X279.489 Y265.384
+G1 X279.320 Y264.948
+G1 X278.957 Y264.688
+G1 X278.784 Y264.665
+(finish operation: Engrave003)
+(begin operation: Engrave004)
+(machine units: mm/min)
+(Engrave) 
+G1 X278.319 Y264.552
+G1 X278.216 Y264.508
+G1 X277.874 Y264.292
+G1 X277.768 Y264.247
+G1 X277.660 Y264.219
+G1 X277.233 Y264.170
+G1 X277.111 Y264.238
+G1 X276.798 Y264.267
+G1 X276.465 Y264.391
+G1 X276.075 Y264.392
+G1 X275.701 Y264.395
+G1 X275.375 Y264.439
+G1 X275.063 Y264.509
+G1 X274.929 Y264.573
+G1 X274.546 Y264.576
+M5
+G0 X324.215 Y117.095
+M3 S1000
+G1 X324.273 Y117.132 F1200.000
+G1 X324.387 Y117.192
+G1 X324.538 Y117.312
+G1 X324.768 Y117.565
+G1 X325.062 Y117.805
+G1 X325.234 Y117.922
+G1 X325.391 Y117.993
+G1 X325.530 Y117.943
+G1 X325.788 Y117.791
+G1 X326.250 Y117.664
+G1 X326.704 Y117.596
+G1 X327.055 Y117.718
+G1 X327.419 Y118.004
+G1 X327.844 Y118.163
+G1 X328.107 Y118.286
+G1 X328.180 Y118.322
+G1 X328.420 Y118.386
+G1 X328.624 Y118.406
+G1 X329.025 Y118.582
+G1 X329.124 Y118.622
+G1 X329.492 Y118.656
+G1 X329.557 Y118.651
+G1 X329.882 Y118.613
+G1 X330.090 Y118.498
+G1 X330.312 Y118.362
+G1 X330.544 Y118.186
+G1 X330.632 Y118.130
+G1 X330.720 Y118.040
+G1 X330.766 Y117.907
+G1 X330.847 Y117.689
+G1 X331.156 Y117.362
+G1 X331.215 Y117.226
+G1 X331.242 Y117.139
+G1 X331.286 Y117.040
+G1 X331.335 Y116.911
+G1 X331.330 Y116.667
+G1 X331.281 Y116.445
+G1 X331.134 Y116.062
+G1 X330.958 Y115.773
+M5
+G0 X289.374 Y8.085
+M3 S1000
+G1 X289.331 Y8.135 F1200.000
+G1 X289.296 Y8.270
+G1 X289.149 Y8.665
+G1 X289.067 Y8.745
+G1 X288.958 Y8.881
+G1 X288.735 Y9.140
+G1 X288.583 Y9.586
+G1 X288.313 Y9.951
+G1 X288.155 Y10.237
+G1 X287.817 Y10.488
+G1 X287.762 Y10.560
+G1 X287.407 Y10.815
+G1 X287.226 Y11.211
+G1 X287.041 Y11.405
+G1 X286.846 Y11.500
+G1 X286.491 Y11.498
+G1 X286.141 Y11.427
+G1 X286.062 Y11.396
+G1 X285.970 Y11.291
+G1 X285.812 Y11.199
+G1 X285.457 Y11.057
+G1 X285.229 Y11.064
+G1 X284.897 Y11.049
+G1 X284.778 Y11.033
+G1 X284.579 Y10.973
+G1 X284.334 Y10.778
+G1 X284.094 Y10.479
+G1 X284.014 Y10.415
+G1 X283.729 Y10.090
+G1 X283.625 Y9.873
+G1 X283.469 Y9.518
+G1 X283.367 Y9.228
+G1 X283.320 Y9.146
+G1 X283.105 Y8.979
+G1 X282.797 Y8.774
+G1 X282.452 Y8.549
+G1 X282.264 Y8.217
+G1 X282.226 Y8.056
+G1 X282.151 Y7.918
+G1 X282.091 Y7.832
+G1 X281.977 Y7.448
+G1 X281.878 Y7.377
+G1 X281.719 Y7.388
+G1 X281.567 Y7.397
+G1 X281.132 Y7.475
+G1 X280.772 Y7.727
+G1 X280.358 Y7.743
+G1 X280.045 Y7.787
+G1 X279.952 Y7.795
+G1 X279.622 Y7.779
+G1 X279.386 Y7.816
+G1 X279.320 Y7.834
+G1 X279.074 Y7.775
+G1 X278.892 Y7.678
+M5
+G0 X121.891 Y114.182
+M3 S1000
+G1 X121.959 Y114.123 F1200.000
+G1 X122.197 Y113.834
+G1 X122.359 Y113.639
+G1 X122.785 Y113.400
+G1 X123.083 Y113.313
+G1 X123.368 Y113.234
+G1 X123.674 Y113.208
+G1 X123.962 Y113.240
+G1 X124.054 Y113.237
+G1 X124.395 Y113.266
+G1 X124.563 Y113.270
+G1 X124.901 Y113.481
+G1 X124.949 Y113.520
+G1 X125.291 Y113.863
+G1 X125.659 Y114.013
+G1 X125.902 Y114.152
+G1 X126.263 Y114.384
+G1 X126.637 Y114.473
+G1 X126.792 Y114.544
+G1 X127.034 Y114.897
+G1 X127.306 Y115.251
+G1 X127.433 Y115.363
+G1 X127.591 Y115.427
+M5
+G0 X419.284 Y194.315
+M3 S1000
+G1 X419.296 Y194.684 F1200.000
+G1 X419.292 Y194.748
+G1 X419.302 Y194.937
+G1 X419.404 Y195.108
+G1 X419.742 Y195.323
+G1 X419.847 Y195.446
+G1 X420.000 Y195.808
+G1 X420.043 Y196.165
+G1 X420.104 Y196.365
+G1 X420.139 Y196.676
+G1 X420.314 Y197.138
+G1 X420.372 Y197.211
+G1 X420.711 Y197.547
+G1 X421.037 Y197.657
+G1 X421.189 Y197.696
+G1 X421.264 Y197.708
+G1 X421.692 Y197.733
+G1 X421.976 Y197.691
+G1 X422.264 Y197.604
+G1 X422.374 Y197.570
+G1 X422.461 Y197.543
+M5
+G0 X361.481 Y126.654
+M3 S1000
+G1 X361.488 Y126.821 F1200.000
+G1 X361.525 Y126.943
+G1 X361.543 Y126.992
+G1 X361.608 Y127.179
+G1 X361.673 Y127.447
+G1 X361.649 Y127.631
+G1 X361.572 Y127.793
+G1 X361.526 Y127.855
+G1 X361.439 Y127.944
+G1 X361.358 Y128.038
+G1 X361.331 Y128.400
+G1 X361.279 Y128.642
+G1 X361.225 Y128.856
+G1 X361.135 Y129.329
+G1 X361.023 Y129.709
+G1 X360.972 Y129.844
+G1 X360.863 Y130.166
+G1 X360.832 Y130.442
+G1 X360.762 Y130.772
+G1 X360.759 Y130.826
+G1 X360.846 Y130.954
+G1 X360.896 Y131.154
+G1 X361.053 Y131.515
+G1 X361.058 Y131.775
+G1 X361.067 Y131.980
+G1 X361.322 Y132.287
+G1 X361.470 Y132.499
+G1 X361.607 Y132.809
+M5
+G0 X178.711 Y174.132
+M3 S1000
+G1 X178.799 Y174.095 F1200.000
+G1 X179.140 Y173.930
+G1 X179.529 Y173.779
+G1 X179.938 Y173.531
+G1 X179.981 Y173.483
+G1 X180.093 Y173.275
+G1 X180.036 Y173.033
+G1 X180.031 Y172.978
+G1 X179.941 Y172.490
+G1 X179.863 Y172.152
+G1 X179.715 Y171.702
+G1 X179.554 Y171.535
+G1 X179.511 Y171.493
+G1 X179.346 Y171.286
+G1 X179.314 Y171.246
+G1 X179.010 Y171.122
+G1 X178.703 Y170.872
+G1 X178.468 Y170.834
+G1 X178.389 Y170.832
+G1 X178.327 Y170.860
+G1 X178.153 Y170.996
+G1 X177.829 Y171.101
+G1 X177.658 Y171.149
+M5
+G0 X466.434 Y155.062
+M3 S1000
+G1 X466.262 Y155.011 F1200.000
+G1 X465.841 Y155.016
+G1 X465.377 Y155.008
+G1 X464.984 Y155.231
+G1 X464.591 Y155.272
+G1 X464.417 Y155.205
+G1 X464.132 Y155.123
+G1 X463.820 Y155.094
+G1 X463.496 Y154.864
+G1 X463.059 Y154.660
+G1 X462.914 Y154.539
+G1 X462.767 Y154.491
+G1 X462.714 Y154.521
+G1 X462.346 Y154.781
+G1 X461.946 Y154.976
+G1 X461.653 Y155.108
+G1 X461.528 Y155.196
+G1 X461.288 Y155.348
+G1 X460.900 Y155.596
+G1 X460.805 Y155.687
+G1 X460.716 Y155.897
+G1 X460.684 Y156.014
+G1 X460.615 Y156.114
+G1 X460.401 Y156.266
+G1 X460.159 Y156.560
+G1 X460.021 Y156.738
+G1 X459.897 Y157.026
+G1 X459.869 Y157.101
+G1 X459.571 Y157.360
+G1 X459.236 Y157.688
+G1 X459.103 Y157.905
+G1 X459.037 Y158.115
+G1 X458.972 Y158.162
+G1 X458.881 Y158.172
+G1 X458.828 Y158.171
+G1 X458.497 Y158.165
+G1 X458.377 Y158.162
+G1 X458.037 Y158.203
+G1 X457.732 Y158.272
+G1 X457.625 Y158.243
+G1 X457.534 Y158.212
+G1 X457.195 Y158.134
+G1 X457.057 Y158.158
+G1 X456.971 Y158.149
+G1 X456.721 Y158.068
+M5
+G0 X412.607 Y276.415
+M3 S1000
+G1 X412.543 Y276.207 F1200.000
+G1 X412.397 Y275.800
+G1 X412.272 Y275.552
+G1 X412.243 Y275.493
+G1 X412.127 Y275.133
+G1 X411.904 Y274.689
+G1 X411.870 Y274.496
+G1 X411.729 Y274.160
+G1 X411.594 Y274.077
+G1 X411.254 Y273.951
+G1 X410.910 Y273.748
+G1 X410.758 Y273.597
+G1 X410.595 Y273.452
+G1 X410.565 Y273.407
+G1 X410.470 Y273.058
+M5
+G0 X313.192 Y38.319
+M3 S1000
+G1 X313.360 Y38.660 F1200.000
+G1 X313.451 Y38.801
+G1 X313.531 Y38.880
+G1 X313.559 Y39.086
+G1 X313.547 Y39.472
+G1 X313.502 Y39.744
+G1 X313.356 Y39.974
+G1 X313.228 Y40.285
+G1 X313.165 Y40.607
+G1 X313.144 Y40.836
+G1 X313.160 Y40.931
+G1 X313.221 Y41.147
+G1 X313.138 Y41.340
+G1 X313.121 Y41.403
+G1 X313.083 Y41.792
+G1 X313.131 Y41.904
+G1 X313.216 Y42.048
+G1 X313.260 Y42.122
+G1 X313.400 Y42.266
+G1 X313.560 Y42.324
+G1 X313.843 Y42.521
+G1 X314.004 Y42.888
+G1 X314.066 Y43.003
+G1 X314.307 Y43.158
+G1 X314.351 Y43.248
+G1 X314.636 Y43.405
+G1 X314.708 Y43.446
+G1 X314.772 Y43.473
+G1 X314.806 Y43.513
+G1 X314.884 Y43.614
+G1 X315.054 Y43.772
+G1 X315.499 Y43.893
+G1 X315.563 Y43.893
+G1 X315.676 Y43.818
+G1 X316.005 Y43.519
+G1 X316.282 Y43.124
+(finish operation: Engrave004)
+(begin postamble)
+M5 G17 G90 M2
\ No newline at end of file
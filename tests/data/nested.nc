@@ -0,0 +1,1573 @@
+(Exported by FreeCAD)
+(Post Processor: laser_post)
+
+(begin preamble)
+G17 G90
+G21
+(begin operation: TC)
+(machine units: mm/min)
+(TC: Laser) 
+M5
+(finish operation: TC)
+(begin operation: Nested001)
+(machine units: mm/min)
+(Nested) 
+M5
+G0 X13.211 Y9.365
+M3 S1000
+G3 X10.916 Y9.365 I-1.147 J0.000 F1200.000
+G3 X13.211 Y9.365 I1.147 J0.000
+M5
+G0 X10.498 Y12.270
+M3 S1000
+G1 X10.468 Y12.541 F1200.000
+G1 X10.381 Y12.799
+G1 X10.241 Y13.032
+G1 X10.054 Y13.229
+G1 X9.829 Y13.382
+G1 X9.576 Y13.483
+G1 X9.308 Y13.527
+G1 X9.036 Y13.512
+G1 X8.774 Y13.439
+G1 X8.533 Y13.312
+G1 X8.326 Y13.136
+G1 X8.161 Y12.919
+G1 X8.047 Y12.672
+G1 X7.989 Y12.406
+G1 X7.989 Y12.134
+G1 X8.047 Y11.869
+G1 X8.161 Y11.622
+G1 X8.326 Y11.405
+G1 X8.533 Y11.229
+G1 X8.774 Y11.101
+G1 X9.036 Y11.029
+G1 X9.308 Y11.014
+G1 X9.576 Y11.058
+G1 X9.829 Y11.159
+G1 X10.054 Y11.311
+G1 X10.241 Y11.509
+G1 X10.381 Y11.742
+G1 X10.468 Y12.000
+G1 X10.498 Y12.270
+M5
+G0 X12.427 Y8.255
+M3 S1000
+G3 X7.648 Y8.255 I-2.390 J0.000 F1200.000
+G3 X12.427 Y8.255 I2.390 J0.000
+M5
+G0 X10.961 Y13.278
+M3 S1000
+G3 X5.047 Y13.278 I-2.957 J0.000 F1200.000
+G3 X10.961 Y13.278 I2.957 J0.000
+M5
+G0 X2.000 Y0.000
+M3 S1000
+G1 X17.609 Y0.000 F1200.000
+G3 X19.609 Y2.000 I0.000 J2.000
+G1 X19.609 Y15.241
+G3 X17.609 Y17.241 I-2.000 J0.000
+G1 X2.000 Y17.241
+G3 X0.000 Y15.241 I0.000 J-2.000
+G1 X0.000 Y2.000
+G3 X2.000 Y0.000 I2.000 J0.000
+M5
+G0 X39.871 Y11.472
+M3 S1000
+G1 X39.853 Y11.717 F1200.000
+G1 X39.800 Y11.956
+G1 X39.712 Y12.185
+G1 X39.592 Y12.399
+G1 X39.442 Y12.593
+G1 X39.266 Y12.763
+G1 X39.066 Y12.906
+G1 X38.848 Y13.018
+G1 X38.616 Y13.098
+G1 X38.374 Y13.142
+G1 X38.129 Y13.151
+G1 X37.885 Y13.124
+G1 X37.648 Y13.062
+G1 X37.422 Y12.966
+G1 X37.213 Y12.838
+G1 X37.024 Y12.682
+G1 X36.861 Y12.499
+G1 X36.725 Y12.294
+G1 X36.621 Y12.072
+G1 X36.551 Y11.837
+G1 X36.515 Y11.595
+G1 X36.515 Y11.349
+G1 X36.551 Y11.107
+G1 X36.621 Y10.872
+G1 X36.725 Y10.649
+G1 X36.861 Y10.445
+G1 X37.024 Y10.262
+G1 X37.213 Y10.105
+G1 X37.422 Y9.977
+G1 X37.648 Y9.882
+G1 X37.885 Y9.819
+G1 X38.129 Y9.793
+G1 X38.374 Y9.802
+G1 X38.616 Y9.846
+G1 X38.848 Y9.925
+G1 X39.066 Y10.038
+G1 X39.266 Y10.180
+G1 X39.442 Y10.351
+G1 X39.592 Y10.545
+G1 X39.712 Y10.759
+G1 X39.800 Y10.988
+G1 X39.853 Y11.227
+G1 X39.871 Y11.472
+M5
+G0 X27.000 Y0.000
+M3 S1000
+G1 X40.265 Y0.000 F1200.000
+G3 X42.265 Y2.000 I0.000 J2.000
+G1 X42.265 Y16.562
+G3 X40.265 Y18.562 I-2.000 J0.000
+G1 X27.000 Y18.562
+G3 X25.000 Y16.562 I0.000 J-2.000
+G1 X25.000 Y2.000
+G3 X27.000 Y0.000 I2.000 J0.000
+M5
+G0 X66.396 Y9.816
+M3 S1000
+G1 X66.193 Y10.835 F1200.000
+G1 X65.616 Y11.699
+G1 X64.752 Y12.277
+G1 X63.733 Y12.479
+G1 X62.714 Y12.277
+G1 X61.850 Y11.699
+G1 X61.272 Y10.835
+G1 X61.070 Y9.816
+G1 X61.272 Y8.797
+G1 X61.850 Y7.933
+G1 X62.714 Y7.356
+G1 X63.733 Y7.153
+G1 X64.752 Y7.356
+G1 X65.616 Y7.933
+G1 X66.193 Y8.797
+G1 X66.396 Y9.816
+M5
+G0 X59.022 Y12.721
+M3 S1000
+G3 X54.471 Y12.721 I-2.276 J0.000 F1200.000
+G3 X59.022 Y12.721 I2.276 J0.000
+M5
+G0 X52.000 Y0.000
+M3 S1000
+G1 X66.501 Y0.000 F1200.000
+G3 X68.501 Y2.000 I0.000 J2.000
+G1 X68.501 Y16.448
+G3 X66.501 Y18.448 I-2.000 J0.000
+G1 X52.000 Y18.448
+G3 X50.000 Y16.448 I0.000 J-2.000
+G1 X50.000 Y2.000
+G3 X52.000 Y0.000 I2.000 J0.000
+M5
+G0 X85.627 Y8.602
+M3 S1000
+G1 X85.569 Y9.158 F1200.000
+G1 X85.396 Y9.690
+G1 X85.116 Y10.175
+G1 X84.742 Y10.590
+G1 X84.289 Y10.919
+G1 X83.778 Y11.147
+G1 X83.231 Y11.263
+G1 X82.672 Y11.263
+G1 X82.124 Y11.147
+G1 X81.613 Y10.919
+G1 X81.161 Y10.590
+G1 X80.786 Y10.175
+G1 X80.506 Y9.690
+G1 X80.334 Y9.158
+G1 X80.275 Y8.602
+G1 X80.334 Y8.045
+G1 X80.506 Y7.513
+G1 X80.786 Y7.029
+G1 X81.161 Y6.613
+G1 X81.613 Y6.284
+G1 X82.124 Y6.056
+G1 X82.672 Y5.940
+G1 X83.231 Y5.940
+G1 X83.778 Y6.056
+G1 X84.289 Y6.284
+G1 X84.742 Y6.613
+G1 X85.116 Y7.029
+G1 X85.396 Y7.513
+G1 X85.569 Y8.045
+G1 X85.627 Y8.602
+M5
+G0 X85.417 Y13.740
+M3 S1000
+G1 X85.305 Y14.480 F1200.000
+G1 X84.981 Y15.153
+G1 X84.473 Y15.701
+G1 X83.825 Y16.075
+G1 X83.096 Y16.241
+G1 X82.351 Y16.185
+G1 X81.655 Y15.912
+G1 X81.070 Y15.446
+G1 X80.649 Y14.828
+G1 X80.429 Y14.114
+G1 X80.429 Y13.367
+G1 X80.649 Y12.652
+G1 X81.070 Y12.034
+G1 X81.655 Y11.568
+G1 X82.351 Y11.295
+G1 X83.096 Y11.239
+G1 X83.825 Y11.406
+G1 X84.473 Y11.780
+G1 X84.981 Y12.328
+G1 X85.305 Y13.001
+G1 X85.417 Y13.740
+M5
+G0 X91.941 Y13.001
+M3 S1000
+G1 X91.893 Y13.535 F1200.000
+G1 X91.750 Y14.053
+G1 X91.517 Y14.537
+G1 X91.201 Y14.971
+G1 X90.813 Y15.342
+G1 X90.365 Y15.638
+G1 X89.871 Y15.849
+G1 X89.348 Y15.969
+G1 X88.811 Y15.993
+G1 X88.279 Y15.921
+G1 X87.769 Y15.755
+G1 X87.296 Y15.500
+G1 X86.876 Y15.165
+G1 X86.523 Y14.761
+G1 X86.247 Y14.300
+G1 X86.059 Y13.797
+G1 X85.963 Y13.269
+G1 X85.963 Y12.732
+G1 X86.059 Y12.204
+G1 X86.247 Y11.701
+G1 X86.523 Y11.240
+G1 X86.876 Y10.836
+G1 X87.296 Y10.501
+G1 X87.769 Y10.247
+G1 X88.279 Y10.081
+G1 X88.811 Y10.009
+G1 X89.348 Y10.033
+G1 X89.871 Y10.152
+G1 X90.365 Y10.363
+G1 X90.813 Y10.659
+G1 X91.201 Y11.030
+G1 X91.517 Y11.465
+G1 X91.750 Y11.948
+G1 X91.893 Y12.466
+G1 X91.941 Y13.001
+M5
+G0 X77.000 Y0.000
+M3 S1000
+G1 X91.205 Y0.000 F1200.000
+G3 X93.205 Y2.000 I0.000 J2.000
+G1 X93.205 Y16.826
+G3 X91.205 Y18.826 I-2.000 J0.000
+G1 X77.000 Y18.826
+G3 X75.000 Y16.826 I0.000 J-2.000
+G1 X75.000 Y2.000
+G3 X77.000 Y0.000 I2.000 J0.000
+M5
+G0 X115.425 Y10.322
+M3 S1000
+G3 X109.606 Y10.322 I-2.910 J0.000 F1200.000
+G3 X115.425 Y10.322 I2.910 J0.000
+M5
+G0 X112.692 Y9.560
+M3 S1000
+G1 X112.651 Y9.961 F1200.000
+G1 X112.530 Y10.345
+G1 X112.335 Y10.697
+G1 X112.072 Y11.003
+G1 X111.754 Y11.249
+G1 X111.392 Y11.427
+G1 X111.002 Y11.528
+G1 X110.600 Y11.548
+G1 X110.202 Y11.487
+G1 X109.824 Y11.347
+G1 X109.482 Y11.134
+G1 X109.190 Y10.857
+G1 X108.960 Y10.526
+G1 X108.802 Y10.156
+G1 X108.720 Y9.761
+G1 X108.720 Y9.359
+G1 X108.802 Y8.964
+G1 X108.960 Y8.594
+G1 X109.190 Y8.263
+G1 X109.482 Y7.986
+G1 X109.824 Y7.773
+G1 X110.202 Y7.633
+G1 X110.600 Y7.572
+G1 X111.002 Y7.592
+G1 X111.392 Y7.693
+G1 X111.754 Y7.871
+G1 X112.072 Y8.117
+G1 X112.335 Y8.423
+G1 X112.530 Y8.775
+G1 X112.651 Y9.159
+G1 X112.692 Y9.560
+M5
+G0 X109.289 Y7.515
+M3 S1000
+G3 X107.356 Y7.515 I-0.967 J0.000 F1200.000
+G3 X109.289 Y7.515 I0.967 J0.000
+M5
+G0 X102.000 Y0.000
+M3 S1000
+G1 X116.627 Y0.000 F1200.000
+G3 X118.627 Y2.000 I0.000 J2.000
+G1 X118.627 Y15.906
+G3 X116.627 Y17.906 I-2.000 J0.000
+G1 X102.000 Y17.906
+G3 X100.000 Y15.906 I0.000 J-2.000
+G1 X100.000 Y2.000
+G3 X102.000 Y0.000 I2.000 J0.000
+M5
+G0 X137.304 Y7.042
+M3 S1000
+G1 X137.265 Y7.299 F1200.000
+G1 X137.152 Y7.534
+G1 X136.975 Y7.725
+G1 X136.749 Y7.855
+G1 X136.495 Y7.913
+G1 X136.235 Y7.894
+G1 X135.993 Y7.799
+G1 X135.789 Y7.636
+G1 X135.642 Y7.421
+G1 X135.566 Y7.172
+G1 X135.566 Y6.912
+G1 X135.642 Y6.663
+G1 X135.789 Y6.447
+G1 X135.993 Y6.285
+G1 X136.235 Y6.190
+G1 X136.495 Y6.170
+G1 X136.749 Y6.228
+G1 X136.975 Y6.359
+G1 X137.152 Y6.550
+G1 X137.265 Y6.784
+G1 X137.304 Y7.042
+M5
+G0 X127.000 Y0.000
+M3 S1000
+G1 X142.593 Y0.000 F1200.000
+G3 X144.593 Y2.000 I0.000 J2.000
+G1 X144.593 Y17.692
+G3 X142.593 Y19.692 I-2.000 J0.000
+G1 X127.000 Y19.692
+G3 X125.000 Y17.692 I0.000 J-2.000
+G1 X125.000 Y2.000
+G3 X127.000 Y0.000 I2.000 J0.000
+M5
+G0 X164.507 Y10.197
+M3 S1000
+G1 X164.465 Y10.585 F1200.000
+G1 X164.341 Y10.954
+G1 X164.139 Y11.289
+G1 X163.871 Y11.572
+G1 X163.548 Y11.791
+G1 X163.186 Y11.935
+G1 X162.801 Y11.998
+G1 X162.411 Y11.977
+G1 X162.035 Y11.873
+G1 X161.690 Y11.690
+G1 X161.393 Y11.438
+G1 X161.157 Y11.127
+G1 X160.993 Y10.773
+G1 X160.909 Y10.392
+G1 X160.909 Y10.001
+G1 X160.993 Y9.620
+G1 X161.157 Y9.266
+G1 X161.393 Y8.956
+G1 X161.690 Y8.703
+G1 X162.035 Y8.520
+G1 X162.411 Y8.416
+G1 X162.801 Y8.395
+G1 X163.186 Y8.458
+G1 X163.548 Y8.602
+G1 X163.871 Y8.821
+G1 X164.139 Y9.105
+G1 X164.341 Y9.439
+G1 X164.465 Y9.809
+G1 X164.507 Y10.197
+M5
+G0 X166.035 Y10.718
+M3 S1000
+G3 X160.286 Y10.718 I-2.874 J0.000 F1200.000
+G3 X166.035 Y10.718 I2.874 J0.000
+M5
+G0 X162.595 Y11.282
+M3 S1000
+G3 X156.614 Y11.282 I-2.991 J0.000 F1200.000
+G3 X162.595 Y11.282 I2.991 J0.000
+M5
+G0 X164.379 Y6.659
+M3 S1000
+G1 X164.349 Y7.002 F1200.000
+G1 X164.262 Y7.336
+G1 X164.121 Y7.650
+G1 X163.928 Y7.936
+G1 X163.689 Y8.184
+G1 X163.412 Y8.389
+G1 X163.104 Y8.544
+(finish operation: Nested001)
+(begin operation: Nested002)
+(machine units: mm/min)
+(Nested) 
+G1 X162.775 Y8.645
+G1 X162.433 Y8.689
+G1 X162.089 Y8.674
+G1 X161.752 Y8.602
+G1 X161.432 Y8.473
+G1 X161.138 Y8.293
+G1 X160.880 Y8.065
+G1 X160.663 Y7.797
+G1 X160.495 Y7.496
+G1 X160.380 Y7.171
+G1 X160.322 Y6.831
+G1 X160.322 Y6.487
+G1 X160.380 Y6.147
+G1 X160.495 Y5.822
+G1 X160.663 Y5.521
+G1 X160.880 Y5.253
+G1 X161.138 Y5.025
+G1 X161.432 Y4.845
+G1 X161.752 Y4.716
+G1 X162.089 Y4.643
+G1 X162.433 Y4.629
+G1 X162.775 Y4.673
+G1 X163.104 Y4.774
+G1 X163.412 Y4.929
+G1 X163.689 Y5.134
+G1 X163.928 Y5.382
+G1 X164.121 Y5.668
+G1 X164.262 Y5.982
+G1 X164.349 Y6.316
+G1 X164.379 Y6.659
+M5
+G0 X152.000 Y0.000
+M3 S1000
+G1 X167.380 Y0.000 F1200.000
+G3 X169.380 Y2.000 I0.000 J2.000
+G1 X169.380 Y14.972
+G3 X167.380 Y16.972 I-2.000 J0.000
+G1 X152.000 Y16.972
+G3 X150.000 Y14.972 I0.000 J-2.000
+G1 X150.000 Y2.000
+G3 X152.000 Y0.000 I2.000 J0.000
+M5
+G0 X184.424 Y7.764
+M3 S1000
+G1 X184.289 Y8.571 F1200.000
+G1 X183.899 Y9.291
+G1 X183.297 Y9.845
+G1 X182.547 Y10.174
+G1 X181.732 Y10.242
+G1 X180.938 Y10.041
+G1 X180.253 Y9.593
+G1 X179.750 Y8.947
+G1 X179.485 Y8.173
+G1 X179.485 Y7.354
+G1 X179.750 Y6.580
+G1 X180.253 Y5.934
+G1 X180.938 Y5.487
+G1 X181.732 Y5.286
+G1 X182.547 Y5.353
+G1 X183.297 Y5.682
+G1 X183.899 Y6.236
+G1 X184.289 Y6.956
+G1 X184.424 Y7.764
+M5
+G0 X184.049 Y7.171
+M3 S1000
+G1 X183.939 Y7.864 F1200.000
+G1 X183.620 Y8.490
+G1 X183.124 Y8.986
+G1 X182.498 Y9.305
+G1 X181.805 Y9.415
+G1 X181.111 Y9.305
+G1 X180.486 Y8.986
+G1 X179.989 Y8.490
+G1 X179.671 Y7.864
+G1 X179.561 Y7.171
+G1 X179.671 Y6.477
+G1 X179.989 Y5.852
+G1 X180.486 Y5.355
+G1 X181.111 Y5.037
+G1 X181.805 Y4.927
+G1 X182.498 Y5.037
+G1 X183.124 Y5.355
+G1 X183.620 Y5.852
+G1 X183.939 Y6.477
+G1 X184.049 Y7.171
+M5
+G0 X183.229 Y11.080
+M3 S1000
+G3 X179.198 Y11.080 I-2.016 J0.000 F1200.000
+G3 X183.229 Y11.080 I2.016 J0.000
+M5
+G0 X177.000 Y0.000
+M3 S1000
+G1 X190.565 Y0.000 F1200.000
+G3 X192.565 Y2.000 I0.000 J2.000
+G1 X192.565 Y15.481
+G3 X190.565 Y17.481 I-2.000 J0.000
+G1 X177.000 Y17.481
+G3 X175.000 Y15.481 I0.000 J-2.000
+G1 X175.000 Y2.000
+G3 X177.000 Y0.000 I2.000 J0.000
+M5
+G0 X209.194 Y6.173
+M3 S1000
+G1 X209.086 Y6.956 F1200.000
+G1 X208.771 Y7.681
+G1 X208.272 Y8.294
+G1 X207.627 Y8.750
+G1 X206.882 Y9.015
+G1 X206.093 Y9.069
+G1 X205.319 Y8.908
+G1 X204.617 Y8.544
+G1 X204.040 Y8.005
+G1 X203.629 Y7.329
+G1 X203.416 Y6.568
+G1 X203.416 Y5.778
+G1 X203.629 Y5.017
+G1 X204.040 Y4.341
+G1 X204.617 Y3.802
+G1 X205.319 Y3.438
+G1 X206.093 Y3.277
+G1 X206.882 Y3.331
+G1 X207.627 Y3.596
+G1 X208.272 Y4.052
+G1 X208.771 Y4.665
+G1 X209.086 Y5.390
+G1 X209.194 Y6.173
+M5
+G0 X202.000 Y0.000
+M3 S1000
+G1 X215.917 Y0.000 F1200.000
+G3 X217.917 Y2.000 I0.000 J2.000
+G1 X217.917 Y16.909
+G3 X215.917 Y18.909 I-2.000 J0.000
+G1 X202.000 Y18.909
+G3 X200.000 Y16.909 I0.000 J-2.000
+G1 X200.000 Y2.000
+G3 X202.000 Y0.000 I2.000 J0.000
+M5
+G0 X240.060 Y6.182
+M3 S1000
+G1 X240.030 Y6.487 F1200.000
+G1 X239.941 Y6.781
+G1 X239.796 Y7.051
+G1 X239.602 Y7.288
+G1 X239.365 Y7.483
+G1 X239.094 Y7.627
+G1 X238.801 Y7.716
+G1 X238.496 Y7.746
+G1 X238.191 Y7.716
+G1 X237.897 Y7.627
+G1 X237.627 Y7.483
+G1 X237.390 Y7.288
+G1 X237.195 Y7.051
+G1 X237.051 Y6.781
+G1 X236.962 Y6.487
+G1 X236.932 Y6.182
+G1 X236.962 Y5.877
+G1 X237.051 Y5.584
+G1 X237.195 Y5.313
+G1 X237.390 Y5.076
+G1 X237.627 Y4.882
+G1 X237.897 Y4.737
+G1 X238.191 Y4.648
+G1 X238.496 Y4.618
+G1 X238.801 Y4.648
+G1 X239.094 Y4.737
+G1 X239.365 Y4.882
+G1 X239.602 Y5.076
+G1 X239.796 Y5.313
+G1 X239.941 Y5.584
+G1 X240.030 Y5.877
+G1 X240.060 Y6.182
+M5
+G0 X227.000 Y0.000
+M3 S1000
+G1 X239.280 Y0.000 F1200.000
+G3 X241.280 Y2.000 I0.000 J2.000
+G1 X241.280 Y14.288
+G3 X239.280 Y16.288 I-2.000 J0.000
+G1 X227.000 Y16.288
+G3 X225.000 Y14.288 I0.000 J-2.000
+G1 X225.000 Y2.000
+G3 X227.000 Y0.000 I2.000 J0.000
+M5
+G0 X260.561 Y7.443
+M3 S1000
+G1 X260.490 Y7.938 F1200.000
+G1 X260.282 Y8.394
+G1 X259.954 Y8.772
+G1 X259.533 Y9.043
+G1 X259.053 Y9.184
+G1 X258.552 Y9.184
+G1 X258.072 Y9.043
+G1 X257.650 Y8.772
+G1 X257.323 Y8.394
+G1 X257.115 Y7.938
+G1 X257.043 Y7.443
+G1 X257.115 Y6.947
+G1 X257.323 Y6.492
+G1 X257.650 Y6.113
+G1 X258.072 Y5.842
+G1 X258.552 Y5.701
+G1 X259.053 Y5.701
+G1 X259.533 Y5.842
+G1 X259.954 Y6.113
+G1 X260.282 Y6.492
+G1 X260.490 Y6.947
+G1 X260.561 Y7.443
+M5
+G0 X262.745 Y9.130
+M3 S1000
+G3 X260.444 Y9.130 I-1.150 J0.000 F1200.000
+G3 X262.745 Y9.130 I1.150 J0.000
+M5
+G0 X261.686 Y13.218
+M3 S1000
+G3 X257.837 Y13.218 I-1.924 J0.000 F1200.000
+G3 X261.686 Y13.218 I1.924 J0.000
+M5
+G0 X252.000 Y0.000
+M3 S1000
+G1 X264.814 Y0.000 F1200.000
+G3 X266.814 Y2.000 I0.000 J2.000
+G1 X266.814 Y17.069
+G3 X264.814 Y19.069 I-2.000 J0.000
+G1 X252.000 Y19.069
+G3 X250.000 Y17.069 I0.000 J-2.000
+G1 X250.000 Y2.000
+G3 X252.000 Y0.000 I2.000 J0.000
+M5
+G0 X288.890 Y8.739
+M3 S1000
+G3 X286.637 Y8.739 I-1.127 J0.000 F1200.000
+G3 X288.890 Y8.739 I1.127 J0.000
+M5
+G0 X286.218 Y7.399
+M3 S1000
+G1 X286.203 Y7.618 F1200.000
+G1 X286.160 Y7.833
+G1 X286.090 Y8.041
+G1 X285.993 Y8.238
+G1 X285.871 Y8.421
+G1 X285.726 Y8.586
+G1 X285.561 Y8.731
+G1 X285.378 Y8.853
+G1 X285.181 Y8.950
+G1 X284.973 Y9.020
+G1 X284.758 Y9.063
+G1 X284.539 Y9.078
+G1 X284.319 Y9.063
+G1 X284.104 Y9.020
+G1 X283.896 Y8.950
+G1 X283.699 Y8.853
+G1 X283.516 Y8.731
+G1 X283.351 Y8.586
+G1 X283.206 Y8.421
+G1 X283.084 Y8.238
+G1 X282.987 Y8.041
+G1 X282.917 Y7.833
+G1 X282.874 Y7.618
+G1 X282.859 Y7.399
+G1 X282.874 Y7.179
+G1 X282.917 Y6.964
+G1 X282.987 Y6.756
+G1 X283.084 Y6.559
+G1 X283.206 Y6.376
+G1 X283.351 Y6.211
+G1 X283.516 Y6.066
+G1 X283.699 Y5.944
+G1 X283.896 Y5.847
+G1 X284.104 Y5.777
+G1 X284.319 Y5.734
+G1 X284.539 Y5.719
+G1 X284.758 Y5.734
+G1 X284.973 Y5.777
+G1 X285.181 Y5.847
+G1 X285.378 Y5.944
+G1 X285.561 Y6.066
+G1 X285.726 Y6.211
+G1 X285.871 Y6.376
+G1 X285.993 Y6.559
+G1 X286.090 Y6.756
+G1 X286.160 Y6.964
+G1 X286.203 Y7.179
+G1 X286.218 Y7.399
+M5
+G0 X277.000 Y0.000
+M3 S1000
+G1 X292.670 Y0.000 F1200.000
+G3 X294.670 Y2.000 I0.000 J2.000
+G1 X294.670 Y16.596
+G3 X292.670 Y18.596 I-2.000 J0.000
+G1 X277.000 Y18.596
+G3 X275.000 Y16.596 I0.000 J-2.000
+G1 X275.000 Y2.000
+G3 X277.000 Y0.000 I2.000 J0.000
+M5
+G0 X314.603 Y8.007
+M3 S1000
+G1 X314.518 Y8.568 F1200.000
+G1 X314.272 Y9.079
+G1 X313.887 Y9.494
+G1 X313.396 Y9.778
+G1 X312.843 Y9.904
+G1 X312.278 Y9.861
+G1 X311.751 Y9.654
+G1 X311.307 Y9.301
+G1 X310.988 Y8.832
+G1 X310.821 Y8.291
+G1 X310.821 Y7.724
+G1 X310.988 Y7.182
+G1 X311.307 Y6.714
+G1 X311.751 Y6.361
+G1 X312.278 Y6.154
+G1 X312.843 Y6.111
+G1 X313.396 Y6.237
+G1 X313.887 Y6.521
+G1 X314.272 Y6.936
+G1 X314.518 Y7.447
+G1 X314.603 Y8.007
+M5
+G0 X309.890 Y6.366
+M3 S1000
+G1 X309.878 Y6.529 F1200.000
+G1 X309.845 Y6.690
+G1 X309.790 Y6.845
+G1 X309.715 Y6.990
+G1 X309.620 Y7.124
+G1 X309.508 Y7.244
+G1 X309.381 Y7.348
+G1 X309.240 Y7.433
+G1 X309.090 Y7.498
+G1 X308.932 Y7.543
+G1 X308.769 Y7.565
+G1 X308.605 Y7.565
+G1 X308.443 Y7.543
+G1 X308.285 Y7.498
+G1 X308.134 Y7.433
+G1 X307.994 Y7.348
+G1 X307.867 Y7.244
+G1 X307.755 Y7.124
+G1 X307.660 Y6.990
+G1 X307.585 Y6.845
+G1 X307.530 Y6.690
+G1 X307.496 Y6.529
+G1 X307.485 Y6.366
+G1 X307.496 Y6.202
+G1 X307.530 Y6.041
+G1 X307.585 Y5.887
+G1 X307.660 Y5.741
+G1 X307.755 Y5.607
+G1 X307.867 Y5.487
+G1 X307.994 Y5.383
+G1 X308.134 Y5.298
+G1 X308.285 Y5.233
+G1 X308.443 Y5.189
+G1 X308.605 Y5.166
+G1 X308.769 Y5.166
+G1 X308.932 Y5.189
+G1 X309.090 Y5.233
+G1 X309.240 Y5.298
+G1 X309.381 Y5.383
+G1 X309.508 Y5.487
+G1 X309.620 Y5.607
+G1 X309.715 Y5.741
+G1 X309.790 Y5.887
+G1 X309.845 Y6.041
+G1 X309.878 Y6.202
+G1 X309.890 Y6.366
+M5
+G0 X310.216 Y8.303
+M3 S1000
+G3 X307.420 Y8.303 I-1.398 J0.000 F1200.000
+G3 X310.216 Y8.303 I1.398 J0.000
+M5
+G0 X313.359 Y10.969
+M3 S1000
+G1 X313.333 Y11.310 F1200.000
+G1 X313.257 Y11.643
+G1 X313.132 Y11.962
+G1 X312.961 Y12.258
+G1 X312.748 Y12.526
+G1 X312.497 Y12.758
+G1 X312.215 Y12.951
+G1 X311.906 Y13.099
+G1 X311.579 Y13.200
+G1 X311.241 Y13.251
+G1 X310.899 Y13.251
+G1 X310.561 Y13.200
+G1 X310.234 Y13.099
+G1 X309.925 Y12.951
+G1 X309.643 Y12.758
+G1 X309.392 Y12.526
+G1 X309.179 Y12.258
+G1 X309.008 Y11.962
+G1 X308.883 Y11.643
+(finish operation: Nested002)
+(begin operation: Nested003)
+(machine units: mm/min)
+(Nested) 
+G1 X308.807 Y11.310
+G1 X308.781 Y10.969
+G1 X308.807 Y10.627
+G1 X308.883 Y10.294
+G1 X309.008 Y9.975
+G1 X309.179 Y9.679
+G1 X309.392 Y9.412
+G1 X309.643 Y9.179
+G1 X309.925 Y8.986
+G1 X310.234 Y8.838
+G1 X310.561 Y8.737
+G1 X310.899 Y8.686
+G1 X311.241 Y8.686
+G1 X311.579 Y8.737
+G1 X311.906 Y8.838
+G1 X312.215 Y8.986
+G1 X312.497 Y9.179
+G1 X312.748 Y9.412
+G1 X312.961 Y9.679
+G1 X313.132 Y9.975
+G1 X313.257 Y10.294
+G1 X313.333 Y10.627
+G1 X313.359 Y10.969
+M5
+G0 X302.000 Y0.000
+M3 S1000
+G1 X317.316 Y0.000 F1200.000
+G3 X319.316 Y2.000 I0.000 J2.000
+G1 X319.316 Y14.323
+G3 X317.316 Y16.323 I-2.000 J0.000
+G1 X302.000 Y16.323
+G3 X300.000 Y14.323 I0.000 J-2.000
+G1 X300.000 Y2.000
+G3 X302.000 Y0.000 I2.000 J0.000
+M5
+G0 X337.646 Y7.281
+M3 S1000
+G1 X337.635 Y7.438 F1200.000
+G1 X337.599 Y7.592
+G1 X337.542 Y7.740
+G1 X337.463 Y7.876
+G1 X337.364 Y8.000
+G1 X337.248 Y8.108
+G1 X337.118 Y8.197
+G1 X336.975 Y8.265
+G1 X336.824 Y8.312
+G1 X336.668 Y8.335
+G1 X336.510 Y8.335
+G1 X336.353 Y8.312
+G1 X336.202 Y8.265
+G1 X336.060 Y8.197
+G1 X335.929 Y8.108
+G1 X335.813 Y8.000
+G1 X335.715 Y7.876
+G1 X335.636 Y7.740
+G1 X335.578 Y7.592
+G1 X335.543 Y7.438
+G1 X335.531 Y7.281
+G1 X335.543 Y7.123
+G1 X335.578 Y6.969
+G1 X335.636 Y6.822
+G1 X335.715 Y6.685
+G1 X335.813 Y6.561
+G1 X335.929 Y6.454
+G1 X336.060 Y6.365
+G1 X336.202 Y6.296
+G1 X336.353 Y6.249
+G1 X336.510 Y6.226
+G1 X336.668 Y6.226
+G1 X336.824 Y6.249
+G1 X336.975 Y6.296
+G1 X337.118 Y6.365
+G1 X337.248 Y6.454
+G1 X337.364 Y6.561
+G1 X337.463 Y6.685
+G1 X337.542 Y6.822
+G1 X337.599 Y6.969
+G1 X337.635 Y7.123
+G1 X337.646 Y7.281
+M5
+G0 X333.171 Y12.974
+M3 S1000
+G3 X329.334 Y12.974 I-1.919 J0.000 F1200.000
+G3 X333.171 Y12.974 I1.919 J0.000
+M5
+G0 X327.000 Y0.000
+M3 S1000
+G1 X341.836 Y0.000 F1200.000
+G3 X343.836 Y2.000 I0.000 J2.000
+G1 X343.836 Y14.663
+G3 X341.836 Y16.663 I-2.000 J0.000
+G1 X327.000 Y16.663
+G3 X325.000 Y14.663 I0.000 J-2.000
+G1 X325.000 Y2.000
+G3 X327.000 Y0.000 I2.000 J0.000
+M5
+G0 X359.893 Y7.261
+M3 S1000
+G1 X359.754 Y7.958 F1200.000
+G1 X359.360 Y8.548
+G1 X358.770 Y8.942
+G1 X358.074 Y9.080
+G1 X357.378 Y8.942
+G1 X356.788 Y8.548
+G1 X356.393 Y7.958
+G1 X356.255 Y7.261
+G1 X356.393 Y6.565
+G1 X356.788 Y5.975
+G1 X357.378 Y5.581
+G1 X358.074 Y5.443
+G1 X358.770 Y5.581
+G1 X359.360 Y5.975
+G1 X359.754 Y6.565
+G1 X359.893 Y7.261
+M5
+G0 X352.000 Y0.000
+M3 S1000
+G1 X367.536 Y0.000 F1200.000
+G3 X369.536 Y2.000 I0.000 J2.000
+G1 X369.536 Y15.978
+G3 X367.536 Y17.978 I-2.000 J0.000
+G1 X352.000 Y17.978
+G3 X350.000 Y15.978 I0.000 J-2.000
+G1 X350.000 Y2.000
+G3 X352.000 Y0.000 I2.000 J0.000
+M5
+G0 X390.259 Y6.399
+M3 S1000
+G3 X385.145 Y6.399 I-2.557 J0.000 F1200.000
+G3 X390.259 Y6.399 I2.557 J0.000
+M5
+G0 X387.229 Y10.388
+M3 S1000
+G3 X381.414 Y10.388 I-2.908 J0.000 F1200.000
+G3 X387.229 Y10.388 I2.908 J0.000
+M5
+G0 X388.236 Y7.044
+M3 S1000
+G3 X387.163 Y7.044 I-0.537 J0.000 F1200.000
+G3 X388.236 Y7.044 I0.537 J0.000
+M5
+G0 X377.000 Y0.000
+M3 S1000
+G1 X390.670 Y0.000 F1200.000
+G3 X392.670 Y2.000 I0.000 J2.000
+G1 X392.670 Y14.014
+G3 X390.670 Y16.014 I-2.000 J0.000
+G1 X377.000 Y16.014
+G3 X375.000 Y14.014 I0.000 J-2.000
+G1 X375.000 Y2.000
+G3 X377.000 Y0.000 I2.000 J0.000
+M5
+G0 X414.295 Y6.019
+M3 S1000
+G3 X409.182 Y6.019 I-2.557 J0.000 F1200.000
+G3 X414.295 Y6.019 I2.557 J0.000
+M5
+G0 X402.000 Y0.000
+M3 S1000
+G1 X414.391 Y0.000 F1200.000
+G3 X416.391 Y2.000 I0.000 J2.000
+G1 X416.391 Y14.476
+G3 X414.391 Y16.476 I-2.000 J0.000
+G1 X402.000 Y16.476
+G3 X400.000 Y14.476 I0.000 J-2.000
+G1 X400.000 Y2.000
+G3 X402.000 Y0.000 I2.000 J0.000
+M5
+G0 X440.936 Y8.240
+M3 S1000
+G1 X440.901 Y8.690 F1200.000
+G1 X440.798 Y9.129
+G1 X440.630 Y9.547
+G1 X440.399 Y9.935
+G1 X440.112 Y10.283
+G1 X439.775 Y10.583
+G1 X439.397 Y10.828
+G1 X438.985 Y11.013
+G1 X438.550 Y11.132
+G1 X438.102 Y11.184
+G1 X437.651 Y11.167
+G1 X437.209 Y11.081
+G1 X436.784 Y10.928
+G1 X436.388 Y10.713
+G1 X436.029 Y10.439
+G1 X435.716 Y10.114
+G1 X435.457 Y9.745
+G1 X435.257 Y9.341
+G1 X435.120 Y8.911
+G1 X435.052 Y8.465
+G1 X435.052 Y8.014
+G1 X435.120 Y7.569
+G1 X435.257 Y7.138
+G1 X435.457 Y6.734
+G1 X435.716 Y6.365
+G1 X436.029 Y6.040
+G1 X436.388 Y5.767
+G1 X436.784 Y5.551
+G1 X437.209 Y5.399
+G1 X437.651 Y5.313
+G1 X438.102 Y5.296
+G1 X438.550 Y5.347
+G1 X438.985 Y5.467
+G1 X439.397 Y5.652
+G1 X439.775 Y5.897
+G1 X440.112 Y6.197
+G1 X440.399 Y6.545
+G1 X440.630 Y6.933
+G1 X440.798 Y7.351
+G1 X440.901 Y7.790
+G1 X440.936 Y8.240
+M5
+G0 X438.806 Y6.175
+M3 S1000
+G3 X433.236 Y6.175 I-2.785 J0.000 F1200.000
+G3 X438.806 Y6.175 I2.785 J0.000
+M5
+G0 X427.000 Y0.000
+M3 S1000
+G1 X439.463 Y0.000 F1200.000
+G3 X441.463 Y2.000 I0.000 J2.000
+G1 X441.463 Y15.026
+G3 X439.463 Y17.026 I-2.000 J0.000
+G1 X427.000 Y17.026
+G3 X425.000 Y15.026 I0.000 J-2.000
+G1 X425.000 Y2.000
+G3 X427.000 Y0.000 I2.000 J0.000
+M5
+G0 X459.549 Y7.236
+M3 S1000
+G1 X459.488 Y7.800 F1200.000
+G1 X459.306 Y8.339
+G1 X459.013 Y8.826
+G1 X458.622 Y9.239
+G1 X458.152 Y9.557
+G1 X457.624 Y9.768
+G1 X457.063 Y9.860
+G1 X456.496 Y9.829
+G1 X455.948 Y9.677
+G1 X455.446 Y9.411
+G1 X455.013 Y9.043
+G1 X454.669 Y8.590
+G1 X454.430 Y8.075
+G1 X454.308 Y7.520
+G1 X454.308 Y6.951
+G1 X454.430 Y6.396
+G1 X454.669 Y5.881
+G1 X455.013 Y5.428
+G1 X455.446 Y5.060
+G1 X455.948 Y4.794
+G1 X456.496 Y4.642
+G1 X457.063 Y4.611
+G1 X457.624 Y4.703
+G1 X458.152 Y4.914
+G1 X458.622 Y5.232
+G1 X459.013 Y5.645
+G1 X459.306 Y6.132
+G1 X459.488 Y6.671
+G1 X459.549 Y7.236
+M5
+G0 X464.314 Y10.467
+M3 S1000
+G3 X458.582 Y10.467 I-2.866 J0.000 F1200.000
+G3 X464.314 Y10.467 I2.866 J0.000
+M5
+G0 X465.652 Y6.336
+M3 S1000
+G3 X460.906 Y6.336 I-2.373 J0.000 F1200.000
+G3 X465.652 Y6.336 I2.373 J0.000
+M5
+G0 X452.000 Y0.000
+M3 S1000
+G1 X466.621 Y0.000 F1200.000
+G3 X468.621 Y2.000 I0.000 J2.000
+G1 X468.621 Y16.849
+G3 X466.621 Y18.849 I-2.000 J0.000
+G1 X452.000 Y18.849
+G3 X450.000 Y16.849 I0.000 J-2.000
+G1 X450.000 Y2.000
+G3 X452.000 Y0.000 I2.000 J0.000
+M5
+G0 X487.966 Y8.980
+M3 S1000
+G1 X487.935 Y9.319 F1200.000
+G1 X487.841 Y9.646
+G1 X487.690 Y9.951
+G1 X487.484 Y10.222
+G1 X487.233 Y10.452
+G1 X486.943 Y10.631
+G1 X486.626 Y10.754
+G1 X486.291 Y10.817
+G1 X485.951 Y10.817
+G1 X485.616 Y10.754
+G1 X485.299 Y10.631
+G1 X485.009 Y10.452
+G1 X484.758 Y10.222
+G1 X484.553 Y9.951
+G1 X484.401 Y9.646
+G1 X484.308 Y9.319
+G1 X484.276 Y8.980
+G1 X484.308 Y8.641
+G1 X484.401 Y8.313
+G1 X484.553 Y8.008
+G1 X484.758 Y7.737
+G1 X485.009 Y7.507
+G1 X485.299 Y7.328
+G1 X485.616 Y7.205
+G1 X485.951 Y7.143
+G1 X486.291 Y7.143
+G1 X486.626 Y7.205
+G1 X486.943 Y7.328
+G1 X487.233 Y7.507
+G1 X487.484 Y7.737
+G1 X487.690 Y8.008
+G1 X487.841 Y8.313
+G1 X487.935 Y8.641
+G1 X487.966 Y8.980
+M5
+G0 X482.405 Y7.208
+M3 S1000
+G3 X479.738 Y7.208 I-1.334 J0.000 F1200.000
+G3 X482.405 Y7.208 I1.334 J0.000
+M5
+G0 X488.799 Y8.706
+M3 S1000
+G1 X488.740 Y9.197 F1200.000
+G1 X488.564 Y9.659
+G1 X488.283 Y10.066
+G1 X487.913 Y10.394
+G1 X487.475 Y10.624
+G1 X486.995 Y10.742
+G1 X486.501 Y10.742
+G1 X486.021 Y10.624
+G1 X485.583 Y10.394
+G1 X485.213 Y10.066
+G1 X484.932 Y9.659
+G1 X484.756 Y9.197
+G1 X484.697 Y8.706
+G1 X484.756 Y8.215
+G1 X484.932 Y7.753
+G1 X485.213 Y7.346
+G1 X485.583 Y7.018
+G1 X486.021 Y6.788
+G1 X486.501 Y6.670
+G1 X486.995 Y6.670
+G1 X487.475 Y6.788
+G1 X487.913 Y7.018
+G1 X488.283 Y7.346
+G1 X488.564 Y7.753
+G1 X488.740 Y8.215
+G1 X488.799 Y8.706
+M5
+G0 X483.598 Y10.668
+M3 S1000
+G3 X480.793 Y10.668 I-1.402 J0.000 F1200.000
+G3 X483.598 Y10.668 I1.402 J0.000
+M5
+G0 X477.000 Y0.000
+M3 S1000
+G1 X489.519 Y0.000 F1200.000
+G3 X491.519 Y2.000 I0.000 J2.000
+G1 X491.519 Y14.460
+G3 X489.519 Y16.460 I-2.000 J0.000
+G1 X477.000 Y16.460
+G3 X475.000 Y14.460 I0.000 J-2.000
+G1 X475.000 Y2.000
+G3 X477.000 Y0.000 I2.000 J0.000
+M5
+G0 X16.113 Y33.463
+M3 S1000
+G3 X10.827 Y33.463 I-2.643 J0.000 F1200.000
+G3 X16.113 Y33.463 I2.643 J0.000
+M5
+G0 X9.669 Y37.684
+M3 S1000
+G1 X9.658 Y37.854 F1200.000
+G1 X9.623 Y38.021
+G1 X9.566 Y38.182
+G1 X9.488 Y38.333
+G1 X9.390 Y38.472
+G1 X9.273 Y38.597
+G1 X9.141 Y38.704
+G1 X8.996 Y38.793
+G1 X8.839 Y38.860
+G1 X8.675 Y38.906
+G1 X8.507 Y38.930
+G1 X8.336 Y38.930
+G1 X8.167 Y38.906
+G1 X8.003 Y38.860
+G1 X7.847 Y38.793
+G1 X7.702 Y38.704
+G1 X7.569 Y38.597
+G1 X7.453 Y38.472
+G1 X7.355 Y38.333
+G1 X7.277 Y38.182
+G1 X7.220 Y38.021
+G1 X7.185 Y37.854
+G1 X7.173 Y37.684
+(finish operation: Nested003)
+(begin operation: Nested004)
+(machine units: mm/min)
+(Nested) 
+G1 X7.185 Y37.515
+G1 X7.220 Y37.348
+G1 X7.277 Y37.187
+G1 X7.355 Y37.036
+G1 X7.453 Y36.897
+G1 X7.569 Y36.772
+G1 X7.702 Y36.665
+G1 X7.847 Y36.576
+G1 X8.003 Y36.508
+G1 X8.167 Y36.463
+G1 X8.336 Y36.439
+G1 X8.507 Y36.439
+G1 X8.675 Y36.463
+G1 X8.839 Y36.508
+G1 X8.996 Y36.576
+G1 X9.141 Y36.665
+G1 X9.273 Y36.772
+G1 X9.390 Y36.897
+G1 X9.488 Y37.036
+G1 X9.566 Y37.187
+G1 X9.623 Y37.348
+G1 X9.658 Y37.515
+G1 X9.669 Y37.684
+M5
+G0 X2.000 Y25.000
+M3 S1000
+G1 X15.896 Y25.000 F1200.000
+G3 X17.896 Y27.000 I0.000 J2.000
+G1 X17.896 Y42.363
+G3 X15.896 Y44.363 I-2.000 J0.000
+G1 X2.000 Y44.363
+G3 X0.000 Y42.363 I0.000 J-2.000
+G1 X0.000 Y27.000
+G3 X2.000 Y25.000 I2.000 J0.000
+M5
+G0 X33.739 Y31.928
+M3 S1000
+G1 X33.714 Y32.223 F1200.000
+G1 X33.639 Y32.509
+G1 X33.517 Y32.779
+G1 X33.352 Y33.024
+G1 X33.147 Y33.237
+G1 X32.909 Y33.413
+G1 X32.645 Y33.547
+G1 X32.362 Y33.633
+G1 X32.069 Y33.671
+G1 X31.773 Y33.658
+G1 X31.484 Y33.596
+G1 X31.209 Y33.486
+G1 X30.957 Y33.331
+G1 X30.735 Y33.135
+G1 X30.549 Y32.905
+G1 X30.405 Y32.647
+G1 X30.307 Y32.368
+G1 X30.257 Y32.076
+G1 X30.257 Y31.780
+G1 X30.307 Y31.489
+G1 X30.405 Y31.210
+G1 X30.549 Y30.951
+G1 X30.735 Y30.721
+G1 X30.957 Y30.526
+G1 X31.209 Y30.371
+G1 X31.484 Y30.260
+G1 X31.773 Y30.198
+G1 X32.069 Y30.185
+G1 X32.362 Y30.223
+G1 X32.645 Y30.310
+G1 X32.909 Y30.443
+G1 X33.147 Y30.619
+G1 X33.352 Y30.832
+G1 X33.517 Y31.077
+G1 X33.639 Y31.347
+G1 X33.714 Y31.633
+G1 X33.739 Y31.928
+M5
+G0 X39.677 Y38.155
+M3 S1000
+G3 X34.079 Y38.155 I-2.799 J0.000 F1200.000
+G3 X39.677 Y38.155 I2.799 J0.000
+M5
+G0 X36.102 Y38.796
+M3 S1000
+G1 X36.009 Y39.415 F1200.000
+G1 X35.737 Y39.978
+G1 X35.312 Y40.436
+G1 X34.771 Y40.749
+G1 X34.161 Y40.888
+G1 X33.538 Y40.841
+G1 X32.956 Y40.613
+G1 X32.467 Y40.223
+G1 X32.115 Y39.706
+G1 X31.931 Y39.109
+G1 X31.931 Y38.484
+G1 X32.115 Y37.887
+G1 X32.467 Y37.370
+G1 X32.956 Y36.980
+G1 X33.538 Y36.752
+G1 X34.161 Y36.705
+G1 X34.771 Y36.844
+G1 X35.312 Y37.157
+G1 X35.737 Y37.615
+G1 X36.009 Y38.178
+G1 X36.102 Y38.796
+M5
+G0 X27.000 Y25.000
+M3 S1000
+G1 X39.792 Y25.000 F1200.000
+G3 X41.792 Y27.000 I0.000 J2.000
+G1 X41.792 Y39.884
+G3 X39.792 Y41.884 I-2.000 J0.000
+G1 X27.000 Y41.884
+G3 X25.000 Y39.884 I0.000 J-2.000
+G1 X25.000 Y27.000
+G3 X27.000 Y25.000 I2.000 J0.000
+M5
+G0 X57.860 Y34.150
+M3 S1000
+G1 X57.844 Y34.390 F1200.000
+G1 X57.796 Y34.625
+G1 X57.718 Y34.852
+G1 X57.609 Y35.067
+G1 X57.473 Y35.264
+G1 X57.312 Y35.443
+G1 X57.129 Y35.598
+G1 X56.927 Y35.727
+G1 X56.709 Y35.828
+G1 X56.480 Y35.899
+G1 X56.243 Y35.939
+G1 X56.003 Y35.947
+G1 X55.764 Y35.923
+G1 X55.530 Y35.867
+G1 X55.306 Y35.781
+G1 X55.096 Y35.666
+G1 X54.902 Y35.523
+G1 X54.730 Y35.356
+G1 X54.581 Y35.168
+G1 X54.458 Y34.961
+G1 X54.365 Y34.740
+G1 X54.301 Y34.509
+G1 X54.269 Y34.271
+G1 X54.269 Y34.030
+G1 X54.301 Y33.792
+G1 X54.365 Y33.561
+G1 X54.458 Y33.340
+G1 X54.581 Y33.133
+G1 X54.730 Y32.945
+G1 X54.902 Y32.778
+G1 X55.096 Y32.635
+G1 X55.306 Y32.520
+G1 X55.530 Y32.434
+G1 X55.764 Y32.378
+G1 X56.003 Y32.354
+G1 X56.243 Y32.362
+G1 X56.480 Y32.402
+G1 X56.709 Y32.473
+G1 X56.927 Y32.574
+G1 X57.129 Y32.703
+G1 X57.312 Y32.858
+G1 X57.473 Y33.036
+G1 X57.609 Y33.234
+G1 X57.718 Y33.449
+G1 X57.796 Y33.676
+G1 X57.844 Y33.911
+G1 X57.860 Y34.150
+M5
+G0 X63.349 Y36.715
+M3 S1000
+G1 X63.327 Y36.932 F1200.000
+G1 X63.259 Y37.140
+G1 X63.150 Y37.328
+G1 X63.004 Y37.490
+G1 X62.828 Y37.619
+G1 X62.629 Y37.707
+G1 X62.415 Y37.753
+G1 X62.197 Y37.753
+G1 X61.984 Y37.707
+G1 X61.785 Y37.619
+G1 X61.608 Y37.490
+G1 X61.462 Y37.328
+G1 X61.353 Y37.140
+G1 X61.286 Y36.932
+G1 X61.263 Y36.715
+G1 X61.286 Y36.498
+G1 X61.353 Y36.291
+G1 X61.462 Y36.102
+G1 X61.608 Y35.940
+G1 X61.785 Y35.812
+G1 X61.984 Y35.723
+G1 X62.197 Y35.678
+G1 X62.415 Y35.678
+G1 X62.629 Y35.723
+G1 X62.828 Y35.812
+G1 X63.004 Y35.940
+G1 X63.150 Y36.102
+G1 X63.259 Y36.291
+G1 X63.327 Y36.498
+G1 X63.349 Y36.715
+M5
+G0 X66.350 Y33.087
+M3 S1000
+G1 X66.317 Y33.489 F1200.000
+G1 X66.218 Y33.880
+G1 X66.056 Y34.250
+G1 X65.835 Y34.588
+G1 X65.562 Y34.885
+G1 X65.244 Y35.132
+G1 X64.889 Y35.324
+G1 X64.507 Y35.455
+G1 X64.109 Y35.522
+G1 X63.706 Y35.522
+G1 X63.308 Y35.455
+G1 X62.926 Y35.324
+G1 X62.572 Y35.132
+G1 X62.253 Y34.885
+G1 X61.980 Y34.588
+G1 X61.759 Y34.250
+G1 X61.597 Y33.880
+G1 X61.498 Y33.489
+G1 X61.465 Y33.087
+G1 X61.498 Y32.685
+G1 X61.597 Y32.294
+G1 X61.759 Y31.925
+G1 X61.980 Y31.587
+G1 X62.253 Y31.290
+G1 X62.572 Y31.042
+G1 X62.926 Y30.850
+G1 X63.308 Y30.719
+G1 X63.706 Y30.653
+G1 X64.109 Y30.653
+G1 X64.507 Y30.719
+G1 X64.889 Y30.850
+G1 X65.244 Y31.042
+G1 X65.562 Y31.290
+G1 X65.835 Y31.587
+G1 X66.056 Y31.925
+G1 X66.218 Y32.294
+G1 X66.317 Y32.685
+G1 X66.350 Y33.087
+M5
+G0 X59.552 Y37.576
+M3 S1000
+G1 X59.525 Y37.950 F1200.000
+G1 X59.446 Y38.317
+G1 X59.314 Y38.669
+G1 X59.134 Y38.999
+G1 X58.909 Y39.300
+G1 X58.644 Y39.565
+G1 X58.343 Y39.790
+G1 X58.014 Y39.970
+G1 X57.662 Y40.101
+G1 X57.295 Y40.181
+G1 X56.920 Y40.208
+G1 X56.546 Y40.181
+G1 X56.179 Y40.101
+G1 X55.827 Y39.970
+G1 X55.497 Y39.790
+G1 X55.196 Y39.565
+G1 X54.931 Y39.300
+G1 X54.706 Y38.999
+G1 X54.526 Y38.669
+G1 X54.395 Y38.317
+G1 X54.315 Y37.950
+G1 X54.288 Y37.576
+G1 X54.315 Y37.201
+G1 X54.395 Y36.834
+G1 X54.526 Y36.482
+G1 X54.706 Y36.153
+G1 X54.931 Y35.852
+G1 X55.196 Y35.587
+G1 X55.497 Y35.362
+G1 X55.827 Y35.182
+G1 X56.179 Y35.050
+G1 X56.546 Y34.970
+G1 X56.920 Y34.944
+G1 X57.295 Y34.970
+G1 X57.662 Y35.050
+G1 X58.014 Y35.182
+G1 X58.343 Y35.362
+G1 X58.644 Y35.587
+G1 X58.909 Y35.852
+G1 X59.134 Y36.153
+G1 X59.314 Y36.482
+G1 X59.446 Y36.834
+G1 X59.525 Y37.201
+G1 X59.552 Y37.576
+M5
+G0 X52.000 Y25.000
+M3 S1000
+G1 X67.010 Y25.000 F1200.000
+G3 X69.010 Y27.000 I0.000 J2.000
+G1 X69.010 Y39.807
+G3 X67.010 Y41.807 I-2.000 J0.000
+G1 X52.000 Y41.807
+G3 X50.000 Y39.807 I0.000 J-2.000
+G1 X50.000 Y27.000
+G3 X52.000 Y25.000 I2.000 J0.000
+M5
+G0 X84.789 Y32.658
+M3 S1000
+G3 X83.578 Y32.658 I-0.605 J0.000 F1200.000
+G3 X84.789 Y32.658 I0.605 J0.000
+M5
+G0 X83.722 Y32.171
+M3 S1000
+G1 X83.691 Y32.418 F1200.000
+G1 X83.599 Y32.650
+G1 X83.452 Y32.852
+G1 X83.260 Y33.011
+G1 X83.035 Y33.117
+G1 X82.790 Y33.164
+G1 X82.541 Y33.148
+G1 X82.304 Y33.071
+G1 X82.093 Y32.937
+G1 X81.922 Y32.756
+G1 X81.802 Y32.537
+G1 X81.740 Y32.296
+G1 X81.740 Y32.046
+G1 X81.802 Y31.805
+G1 X81.922 Y31.586
+G1 X82.093 Y31.404
+G1 X82.304 Y31.271
+G1 X82.541 Y31.194
+G1 X82.790 Y31.178
+G1 X83.035 Y31.225
+G1 X83.260 Y31.331
+G1 X83.452 Y31.490
+G1 X83.599 Y31.692
+G1 X83.691 Y31.923
+G1 X83.722 Y32.171
+M5
+G0 X83.558 Y35.770
+M3 S1000
+G3 X80.118 Y35.770 I-1.720 J0.000 F1200.000
+G3 X83.558 Y35.770 I1.720 J0.000
+M5
+G0 X87.910 Y34.386
+M3 S1000
+G3 X84.304 Y34.386 I-1.803 J0.000 F1200.000
+G3 X87.910 Y34.386 I1.803 J0.000
+M5
+G0 X77.000 Y25.000
+M3 S1000
+G1 X92.551 Y25.000 F1200.000
+G3 X94.551 Y27.000 I0.000 J2.000
+G1 X94.551 Y42.334
+G3 X92.551 Y44.334 I-2.000 J0.000
+G1 X77.000 Y44.334
+G3 X75.000 Y42.334 I0.000 J-2.000
+G1 X75.000 Y27.000
+G3 X77.000 Y25.000 I2.000 J0.000
+(finish operation: Nested004)
+(begin postamble)
+M5 G17 G90 M2
\ No newline at end of file
@@ -0,0 +1,42 @@
+import contextlib
+import io
+import os
+
+import pytest
+
+from conftest import _OUTPUT_TIME, laser_post
+
+
+def _run(objects, filename, args="", progress=None):
+    with contextlib.redirect_stdout(io.StringIO()):
+        task = laser_post.BackgroundExport(objects, filename, args, progress=progress)
+        task._thread.join()
+    return task
+
+
+def test_background_export_writes_the_program(job, post_text, tmp_path):
+    _, objects = job
+    seen = []
+    task = _run(objects, str(tmp_path / "background.nc"), "--compact", lambda task: seen.append(task.operations))
+    assert task.result() == ""
+    with open(tmp_path / "background.nc") as f:
+        assert _OUTPUT_TIME.sub("", f.read()) == post_text(objects, "--compact")[0]
+    # reported as it went and once more at the end
+    assert seen == sorted(seen)
+    assert seen[-1] == task.total
+    assert _OUTPUT_TIME.sub("", _run(objects, "-").result()) == post_text(objects)[0]
+
+
+def test_cancel_leaves_the_old_file(job, tmp_path):
+
+    # cancelled from the first report, the post stops there
+    _, objects = job
+    target = tmp_path / "part.nc"
+    target.write_text("old program\n")
+    task = _run(objects, str(target), progress=lambda task: task.cancel())
+    assert task.done()
+    assert task.cancelled()
+    with pytest.raises(laser_post.ExportCancelled):
+        task.result()
+    assert target.read_text() == "old program\n"
+    assert os.listdir(tmp_path) == ["part.nc"]
@@ -0,0 +1,55 @@
+import json
+import os
+
+import pytest
+
+import laser_batch
+from conftest import _OUTPUT_TIME, operation
+
+
+@pytest.fixture(autouse=True)
+def post():
+    laser_batch.load_post()
+
+
+def dump(tmp_path, name, objects, args=""):
+    filename = str(tmp_path / (name + ".json"))
+    laser_batch.dump(objects, filename, name, args)
+    return filename
+
+
+def _square():
+    return [
+        operation("TC", ("M3", {"S": 700})),
+        operation("Square", ("G0", {"X": 1.0, "Y": 1.0}), ("G1", {"X": 2.0, "Y": 1.0, "F": 100.0})),
+    ]
+
+
+@pytest.mark.parametrize("post_args", [None, ""])
+def test_a_dump_posts_as_the_job_it_was_written_from(job, post_text, tmp_path, post_args):
+
+    # the arguments saved with the dump are used unless others are given
+    name, objects = job
+    filename = dump(tmp_path, name, objects, "--compact")
+    os.mkdir(tmp_path / "out")
+    options = {"output_dir": str(tmp_path / "out"), "suffix": ".nc", "post_args": post_args, "dump": False}
+    [row] = laser_batch._post_file(filename, options)
+    assert row["status"] == "ok"
+    assert row["output"] == str(tmp_path / "out" / (name + ".nc"))
+    with open(row["output"]) as f:
+        written = f.read()
+    assert _OUTPUT_TIME.sub("", written) == post_text(objects, "--compact" if post_args is None else "")[0]
+    assert row["lines"] == written.count("\n")
+    assert row["bytes"] == len(written)
+
+
+def test_main_reports_every_job(tmp_path, capsys):
+    good = dump(tmp_path, "good", _square())
+    bad = dump(tmp_path, "bad", _square(), "--no-such-argument")
+    summary = str(tmp_path / "summary.json")
+    assert laser_batch.main([good, bad, str(tmp_path / "missing.json"), "--workers", "2", "--summary", summary]) == 1
+    with open(summary) as f:
+        rows = json.load(f)["jobs"]
+    assert [row["status"] for row in rows] == ["ok", "failed", "failed"]
+    assert os.path.exists(rows[0]["output"])
+    assert "3 jobs from 3 files, 2 failed" in capsys.readouterr().out
@@ -0,0 +1,14 @@
+import pytest
+
+from conftest import moves
+
+
+@pytest.mark.parametrize("args", ["", "--numpy"])
+def test_compact_runs_the_same_moves_in_fewer_bytes(job, post_text, args):
+    if args:
+        pytest.importorskip("numpy")
+    _, objects = job
+    plain, post = post_text(objects, args)
+    text, _ = post_text(objects, args + " --compact")
+    assert len(text) < len(plain)
+    assert moves(text, post) == moves(plain, post)
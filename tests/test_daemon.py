@@ -0,0 +1,61 @@
+import json
+import socketserver
+import threading
+
+import pytest
+
+import laser_batch
+import laser_daemon
+from conftest import _OUTPUT_TIME
+
+
+@pytest.fixture(autouse=True)
+def post():
+    laser_batch.load_post()
+
+
+def _dump(objects, args=""):
+    # a command dump as it is sent inline
+    data = {"version": laser_batch.DUMP_VERSION, "label": "Job", "args": args}
+    data["objects"] = [laser_batch._dump_object(obj) for obj in objects]
+    return json.loads(json.dumps(data))
+
+
+def test_handle_replies_with_the_program(job, post_text, tmp_path):
+    _, objects = job
+    reply = laser_daemon.handle({"dump": _dump(objects, "--compact")})
+    assert reply["status"] == "ok"
+    [answer] = reply["jobs"]
+    assert _OUTPUT_TIME.sub("", answer["gcode"]) == post_text(objects, "--compact")[0]
+
+    # "args" replaces the saved arguments, "output" writes a file
+    output = str(tmp_path / "part.nc")
+    reply = laser_daemon.handle({"dump": _dump(objects, "--compact"), "args": "", "output": output})
+    [answer] = reply["jobs"]
+    with open(output) as f:
+        assert _OUTPUT_TIME.sub("", f.read()) == post_text(objects)[0]
+    assert answer["bytes"] > 0
+
+
+def test_handle_reports_what_failed():
+    assert laser_daemon.handle({})["status"] == "failed"
+    reply = laser_daemon.handle({"dump": _dump([]), "args": "--no-such-argument"})
+    assert reply["status"] == "failed"
+    assert reply["message"].endswith("unrecognized arguments: --no-such-argument")
+
+
+def test_requests_over_the_socket(job, post_text, tmp_path):
+    _, objects = job
+    path = str(tmp_path / "post.sock")
+    server = socketserver.UnixStreamServer(path, laser_daemon._Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        assert laser_daemon.request(path, command="ping") == {"status": "ok"}
+        reply = laser_daemon.request(path, dump=_dump(objects))
+        assert _OUTPUT_TIME.sub("", reply["jobs"][0]["gcode"]) == post_text(objects)[0]
+        assert laser_daemon.request(path, dump={"version": 0})["status"] == "failed"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
@@ -0,0 +1,35 @@
+import math
+
+import pytest
+
+from conftest import moves, operation, square
+
+pytest.importorskip("numpy")
+
+
+def _cut_length(text, post):
+    length = 0.0
+    here = None
+    for motion, x, y, i, j, feed, laser in moves(text, post):
+        if here is not None and laser and motion != 0.0:
+            length += math.dist(here, (x, y))
+        here = (x, y)
+    return length
+
+
+def test_a_shared_edge_is_cut_once(post_text):
+    objects = [operation("TC", ("M3", {"S": 700})), operation("A", *square(0, 0, 10)), operation("B", *square(10, 0, 10))]
+    plain, post = post_text(objects)
+    text, _ = post_text(objects, "--dedupe 0.01")
+    assert _cut_length(plain, post) == pytest.approx(80.0)
+    assert _cut_length(text, post) == pytest.approx(70.0)
+
+
+def test_passes_through_thick_material_are_kept(job, post_text):
+    name, objects = job
+    plain, post = post_text(objects)
+    text, _ = post_text(objects, "--dedupe 0.01")
+    if name == "depth":
+        assert moves(text, post) == moves(plain, post)
+    else:
+        assert _cut_length(text, post) <= _cut_length(plain, post) + 1e-6
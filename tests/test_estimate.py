@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from check import estimate_difference, reference_estimate, unrolled
+from conftest import laser_post
+
+pytest.importorskip("numpy")
+
+
+def _settings(post):
+    settings = {
+        "scale": 25.4 if post.UNITS == "G20" else 1.0,
+        "start": [float(post.CORNER_MIN[axis]) for axis in "xyz"],
+        "acceleration": post._estimate["acceleration"],
+        "rapid_rate": post._estimate["rapid_rate"],
+        "junction_deviation": post._estimate["junction_deviation"],
+    }
+    settings["on"], settings["off"] = laser_post._laser_codes(post)
+    return settings
+
+
+@pytest.mark.parametrize("args", ["", "--acceleration 0", "--acceleration 300 --rapid-rate 3000", "--repeat-passes linuxcnc --fit-tolerance 0.05"])
+def test_estimate_agrees_with_the_reference_planner(job, post_text, tmp_path, args):
+
+    # every figure of the program and of each operation, against the move by
+    # move planner of bench/check.py
+    _, objects = job
+    text, post = post_text(objects, "--estimate " + args)
+    program = unrolled(text, post.REPEAT_BEGIN, post.REPEAT_END)
+    assert estimate_difference(post._estimate, reference_estimate(program, _settings(post))) is None
+    with open(tmp_path / "part.estimate.json") as f:
+        assert json.load(f) == post._estimate
+
+
+def test_estimate_goes_into_the_header(job, post_text):
+    _, objects = job
+    text, post = post_text(objects, "--estimate")
+    assert "(Estimated time: %s)\n" % laser_post._clock(post._estimate["seconds"]) in text
+    # an operation that makes no move gets no line
+    assert text.count("(Estimated ") == 2 + sum(1 for op in post._estimate["operations"] if op["moves"])
+    # the rest of the program is the one written without it
+    plain, _ = post_text(objects)
+    assert [line for line in text.splitlines() if not line.startswith(("(Estimated", "(Rapid distance"))] == plain.splitlines()
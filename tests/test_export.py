@@ -0,0 +1,72 @@
+import contextlib
+import io
+import os
+import types
+
+import pytest
+
+from conftest import HERE, laser_post, operation
+from headless import Operation, Toolpath
+
+
+def _numpy(args):
+    if "--numpy" in args:
+        pytest.importorskip("numpy")
+    return args
+
+
+def _export(objects, filename, args=""):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return laser_post.PostProcessor().export(objects, filename, args + " --no-show-editor")
+
+
+def test_default_output_matches_baseline(job, post_text):
+
+    # the programs in data/ were written by the post before any of its fast
+    # paths, 7c33e2d, with the same jobs
+    name, objects = job
+    text, _ = post_text(objects)
+    with open(os.path.join(HERE, "data", name + ".nc")) as f:
+        assert text == f.read()
+
+
+@pytest.mark.parametrize("args", ["--stream", "--numpy", "--numpy --stream"])
+def test_fast_paths_write_the_plain_program(job, post_text, args):
+    _, objects = job
+    assert post_text(objects, _numpy(args))[0] == post_text(objects)[0]
+
+
+def test_export_returns_the_program(job, tmp_path):
+
+    # the text that went to the file, "" when it went there while it was
+    # generated, None for a job the post refuses
+    _, objects = job
+    target = str(tmp_path / "part.nc")
+    text = _export(objects, target)
+    with open(target) as f:
+        assert text == f.read()
+    assert _export(objects, target, "--stream") == ""
+    # not a Path object
+    assert _export(objects + [types.SimpleNamespace(Name="Sketch")], target) is None
+
+
+def test_failed_post_leaves_the_old_file(tmp_path):
+
+    # the program is written next to the target and only moved into place once
+    # it is complete
+    class Broken(Toolpath):
+        @property
+        def Commands(self):
+            raise RuntimeError("the document went away")
+
+    target = tmp_path / "part.nc"
+    target.write_text("old program\n")
+    objects = [
+        operation("Square", ("G0", {"X": 1.0, "Y": 1.0}), ("G1", {"X": 2.0, "Y": 1.0, "F": 100.0})),
+        Operation("Broken", Broken()),
+    ]
+    for args in ("", "--stream"):
+        with pytest.raises(RuntimeError):
+            _export(objects, str(target), args)
+        assert target.read_text() == "old program\n"
+        assert os.listdir(tmp_path) == ["part.nc"]
@@ -0,0 +1,44 @@
+import math
+
+from conftest import moves
+
+TOLERANCE = 0.05
+SLACK = 0.002  # the rounding of three digits
+
+
+def _distance(point, start, move):
+
+    # distance of a point from a fitted line or from the circle of an arc
+    motion, x, y, i, j = move[:5]
+    if motion in (2.0, 3.0):
+        centre = (start[0] + i, start[1] + j)
+        return abs(math.dist(point, centre) - math.dist((x, y), centre))
+    dx, dy = x - start[0], y - start[1]
+    px, py = point[0] - start[0], point[1] - start[1]
+    length2 = dx * dx + dy * dy
+    t = min(max((px * dx + py * dy) / length2, 0.0), 1.0) if length2 else 0.0
+    return math.hypot(px - t * dx, py - t * dy)
+
+
+def test_fit_tolerance_keeps_every_point_within_the_tolerance(job, post_text):
+
+    # the fitted moves end on points of the plain program, the points they skip
+    # lie within the tolerance of them
+    name, objects = job
+    plain, post = post_text(objects)
+    fitted, _ = post_text(objects, "--fit-tolerance %s" % TOLERANCE)
+    plain_moves = moves(plain, post)
+    fitted_moves = moves(fitted, post)
+    if name != "arcs":
+        assert len(fitted_moves) < len(plain_moves)
+
+    k = 0
+    start = None
+    for move in plain_moves:
+        point = move[1:3]
+        if point == fitted_moves[k][1:3]:
+            start = point
+            k += 1
+        else:
+            assert _distance(point, start, fitted_moves[k]) <= TOLERANCE + SLACK
+    assert k == len(fitted_moves)
@@ -0,0 +1,66 @@
+import pytest
+
+from conftest import laser_post, operation
+
+
+def _numpy(args):
+    if "--numpy" in args:
+        pytest.importorskip("numpy")
+    return args
+
+
+def _passes(powers):
+
+    # an operation for each power, None for one without an S word, each with an
+    # arc that takes I and J from the operation before
+    objects = []
+    for k, power in enumerate(powers):
+        commands = [("G0", {"X": 1.0 + k, "Y": 1.0})]
+        if power is not None:
+            commands.append(("M3", {"S": power}))
+        commands.append(("G1", {"X": 2.0 + k, "Y": 2.0, "F": 100.0}))
+        commands += [("G1", {"X": 5.0 + n * 0.1, "Y": 5.0}) for n in range(40)]
+        commands.append(("G2", {"X": 8.0, "Y": 8.0, "I": 1.5, "J": 1.5}) if k % 2 else ("G3", {"X": 9.0, "Y": 8.0}))
+        objects.append(operation("Op%d" % k, *commands))
+    return objects
+
+
+@pytest.mark.parametrize("args", ["", "--numpy"])
+def test_jobs_and_cache_write_the_plain_program(job, post_text, args):
+    _, objects = job
+    plain, _ = post_text(objects, _numpy(args))
+    assert post_text(objects, args + " --jobs 2")[0] == plain
+    # filling the cache and then reading it
+    assert post_text(objects, args + " --cache")[0] == plain
+    assert post_text(objects, args + " --cache")[0] == plain
+    assert post_text(objects, args + " --cache --jobs 2")[0] == plain
+
+
+@pytest.mark.parametrize("powers", [[None, 700, 300, None], [700, None, 300], [None, None, 500], [None, 0, 400]])
+@pytest.mark.parametrize("args", ["--jobs 2", "--cache", "--laser-power S9 --jobs 2"])
+def test_seams_take_the_power_and_arcs_of_the_operations_before(post_text, powers, args):
+
+    # the power is captured by the first operation with an S word, jobs that
+    # come before it or capture another one still write the plain program
+    objects = _passes(powers)
+    plain, _ = post_text(objects, args.replace("--jobs 2", ""))
+    assert post_text(objects, args)[0] == plain
+    assert post_text(objects, args)[0] == plain
+
+
+def test_cache_posts_only_what_changed(post_text, monkeypatch):
+    objects = _passes([700, None, None, None])
+    post_text(objects, "--cache")
+    posted = []
+    post_operation = laser_post._post_operation
+
+    def spy(post, obj, key=None):
+        posted.append(obj.Label)
+        return post_operation(post, obj, key)
+
+    monkeypatch.setattr(laser_post, "_post_operation", spy)
+    objects[2] = operation("Op2", ("G0", {"X": 3.0, "Y": 3.0}), ("G1", {"X": 4.0, "Y": 3.0, "F": 200.0}))
+    plain, _ = post_text(objects)
+    posted.clear()
+    assert post_text(objects, "--cache")[0] == plain
+    assert posted == ["Op2"]
@@ -0,0 +1,22 @@
+from conftest import cuts, moves, operation, rapid_length, square
+
+
+def test_order_cuts_keeps_every_cut_and_shortens_the_rapids(job, post_text):
+    _, objects = job
+    plain, post = post_text(objects)
+    ordered, _ = post_text(objects, "--order-cuts")
+    assert cuts(ordered, post) == cuts(plain, post)
+    assert rapid_length(ordered, post) <= rapid_length(plain, post)
+
+
+def test_inner_first_cuts_the_holes_before_the_outline(post_text):
+
+    # the outline starts right where the head is, the hole is the far one
+    objects = [
+        operation("TC", ("M3", {"S": 700})),
+        operation("Part", *square(0.0, 0.0, 50.0) + square(30.0, 30.0, 10.0) + square(80.0, 0.0, 5.0)),
+    ]
+    for args, first in (("--order-cuts", (0.0, 0.0)), ("--order-cuts --inner-first", (30.0, 30.0))):
+        text, post = post_text(objects, args)
+        rapids = [(x, y) for motion, x, y, i, j, feed, laser in moves(text, post) if motion == 0.0]
+        assert rapids[0] == first
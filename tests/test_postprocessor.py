@@ -0,0 +1,44 @@
+import contextlib
+import io
+import threading
+
+from conftest import _OUTPUT_TIME, laser_post, operation, square
+
+RUNS = ("", "--compact", "--inches --line-numbers", "--order-cuts --laser-power S500")
+
+
+def _export(post, objects, args):
+    return _OUTPUT_TIME.sub("", post.export(objects, "-", args + " --no-show-editor"))
+
+
+def test_posts_in_threads_write_what_they_write_alone(job):
+    _, objects = job
+    found = [None] * len(RUNS)
+
+    def run(n):
+        found[n] = _export(laser_post.PostProcessor(), objects, RUNS[n])
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        alone = [_export(laser_post.PostProcessor(), objects, args) for args in RUNS]
+        threads = [threading.Thread(target=run, args=(n,)) for n in range(len(RUNS))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert found == alone
+
+
+def test_module_posts_start_from_the_module_settings(monkeypatch):
+
+    # arguments and line numbers never carry over, what is set on the module
+    # is used by the next post
+    objects = [operation("Part", ("M3", {"S": 700}), *square(0.0, 0.0, 10.0))]
+    with contextlib.redirect_stdout(io.StringIO()):
+        plain = _export(laser_post, objects, "")
+        numbered = _export(laser_post, objects, "--line-numbers")
+        assert _export(laser_post, objects, "") == plain
+        assert _export(laser_post, objects, "--line-numbers") == numbered
+        monkeypatch.setattr(laser_post, "PREAMBLE", "G17 G90 G54\n")
+        own = _export(laser_post, objects, "")
+    assert numbered != plain
+    assert "G17 G90 G54\n" in own and "G17 G90 G54\n" not in plain
@@ -0,0 +1,57 @@
+import struct
+import zlib
+
+import pytest
+
+from conftest import laser_post, operation
+
+np = pytest.importorskip("numpy")
+
+
+def _pixels(png):
+
+    # the palette indexes of a PNG as _png() writes it
+    width, height = struct.unpack(">II", png[16:24])
+    pos = 8
+    data = b""
+    while pos < len(png):
+        size, kind = struct.unpack(">I4s", png[pos : pos + 8])
+        if kind == b"IDAT":
+            data += png[pos + 8 : pos + 8 + size]
+        pos += 12 + size
+    return np.frombuffer(zlib.decompress(data), np.uint8).reshape(height, width + 1)[:, 1:]
+
+
+def test_cuts_and_rapids_are_drawn_without_gaps(post_text, tmp_path):
+    objects = [
+        operation("TC", ("M3", {"S": 700})),
+        operation(
+            "Cut",
+            ("G0", {"X": 100.0, "Y": 50.0}),
+            ("G1", {"X": 400.0, "Y": 50.0, "F": 100.0}),
+            ("G0", {"X": 400.0, "Y": 250.0}),
+            ("G1", {"X": 100.0, "Y": 150.0}),
+            ("G2", {"X": 100.0, "Y": 250.0, "I": 0.0, "J": 50.0}),
+        ),
+    ]
+    post_text(objects, "--preview --preview-size 521")
+    image = _pixels((tmp_path / "part.preview.png").read_bytes())
+
+    # the bed and the moves framed with 2% of the longer side around them, a
+    # pixel per mm
+    assert image.shape == (321, 521)
+
+    def pixel(x, y):
+        return image[10 + 300 - y, 10 + x]
+
+    assert pixel(0, 300) == pixel(500, 0) == 1
+    assert image[0, 0] == 0
+    assert [pixel(x, 50) for x in range(100, 401)] == [3] * 301
+    assert [pixel(400, y) for y in range(51, 250)] == [2] * 199
+    assert pixel(50, 200) == 3  # the far side of the arc
+
+
+def test_the_editor_picture_is_the_preview(job, post_text, tmp_path):
+    _, objects = job
+    text, post = post_text(objects, "--preview")
+    assert laser_post._preview_text(post, text) == (tmp_path / "part.preview.png").read_bytes()
@@ -0,0 +1,34 @@
+import json
+
+import pytest
+
+
+def _profile(tmp_path):
+    with open(tmp_path / "part.profile.json") as f:
+        return json.load(f)
+
+
+def test_profile_times_the_post_of_the_plain_program(job, post_text, tmp_path):
+    _, objects = job
+    text, _ = post_text(objects, "--profile")
+    assert text == post_text(objects)[0]
+    profile = _profile(tmp_path)
+    assert profile["commands"] == sum(len(obj.Path.Commands) for obj in objects)
+    assert [stage["stage"] for stage in profile["stages"]] == ["parse", "laser_gcode", "join", "write"]
+    assert all(stage["seconds"] >= 0 for stage in profile["stages"])
+    assert [op["label"] for op in profile["operations"]] == [obj.Label for obj in objects]
+
+
+@pytest.mark.parametrize("args", ["--jobs 2", "--cache", "--compact --repeat-passes linuxcnc --jobs 2"])
+def test_rules_are_counted_once_whichever_way_the_job_posts(job, post_text, tmp_path, args):
+
+    # a cached operation brings the counts of the rules it ran along
+    _, objects = job
+    plain_args = args.replace("--jobs 2", "").replace("--cache", "")
+    post_text(objects, "--profile " + plain_args)
+    rules = _profile(tmp_path)["rules"]
+    assert any(rules.values())
+    post_text(objects, "--profile " + args)
+    assert _profile(tmp_path)["rules"] == rules
+    post_text(objects, "--profile " + args)
+    assert _profile(tmp_path)["rules"] == rules
@@ -0,0 +1,58 @@
+import pytest
+
+from conftest import moves, operation
+
+pytest.importorskip("numpy")
+
+
+def _image(tmp_path, rows):
+    # a binary PGM, rows from the top down
+    filename = tmp_path / "image.pgm"
+    filename.write_bytes(b"P5 %d %d 255\n" % (len(rows[0]), len(rows)) + bytes(value for row in rows for value in row))
+    return str(filename)
+
+
+def _engraving(text):
+    lines = text.splitlines()
+    begin = next(n for n, line in enumerate(lines) if line.startswith("(begin operation: raster"))
+    return lines[begin + 2 : lines.index("(finish operation: raster image.pgm)")]
+
+
+def test_scanlines_run_back_and_forth_at_the_power_of_each_pixel(post_text, tmp_path):
+
+    # the bottom row first, left to right, the blank end of it skipped
+    image = _image(tmp_path, [[255, 0, 0, 255], [0, 128, 255, 255]])
+    text, _ = post_text([operation("TC", ("M3", {"S": 700}))], "--raster %s --raster-origin 10,10" % image)
+    assert _engraving(text) == [
+        "M5",
+        "G0 X8.000 Y10.050",
+        "M3 S0",
+        "G1 X10.000 F3000.000",
+        "G1 X10.100 S700",
+        "G1 X10.200 S327",
+        "G1 X12.200 S0",
+        "M5",
+        "G0 X12.300 Y10.150",
+        "M3 S0",
+        "G1 X10.300 F3000.000",
+        "G1 X10.100 S700",
+        "G1 X8.100 S0",
+        "M5",
+    ]
+
+
+def test_without_a_power_word_the_laser_switches(post_text, tmp_path):
+    image = _image(tmp_path, [[255, 0, 0, 255], [0, 128, 255, 255]])
+    text, post = post_text([operation("TC", ("M3", {"S": 700}))], "--raster %s --laser-power '' --raster-origin 10,10" % image)
+    burnt = [(x, y) for motion, x, y, i, j, feed, laser in moves("\n".join(_engraving(text)), post) if laser]
+    assert burnt == [(10.1, 10.05), (10.1, 10.15)]
+
+
+def test_overscan_stops_at_the_bed(post_text, tmp_path):
+
+    # an engraving from the corner of the bed to its far edge
+    image = _image(tmp_path, [[0] * 50, [0] * 50])
+    text, post = post_text([operation("TC", ("M3", {"S": 700}))], "--raster %s --raster-size 500" % image)
+    xs = [x for motion, x, y, i, j, feed, laser in moves(text, post)]
+    assert min(xs) == float(post.CORNER_MIN["x"])
+    assert max(xs) == float(post.CORNER_MAX["x"])
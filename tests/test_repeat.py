@@ -0,0 +1,20 @@
+import pytest
+
+from check import unrolled
+from conftest import moves
+
+
+@pytest.mark.parametrize("args", ["", "--numpy"])
+@pytest.mark.parametrize("variant", ["--repeat-passes linuxcnc", "--repeat-passes marlin", "--compact --repeat-passes linuxcnc"])
+def test_repeat_passes_run_the_same_moves(job, post_text, args, variant):
+    if args:
+        pytest.importorskip("numpy")
+    name, objects = job
+    plain, post = post_text(objects, args)
+    text, repeated = post_text(objects, args + " " + variant)
+    loops = unrolled(text, repeated.REPEAT_BEGIN, repeated.REPEAT_END)
+    if name == "depth":
+        # the passes of every contour are written once, in a loop
+        assert loops != text
+        assert len(text) < len(plain)
+    assert moves(loops, repeated) == moves(plain, post)
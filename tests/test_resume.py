@@ -0,0 +1,92 @@
+import pytest
+
+import laser_resume
+import workloads
+from check import unrolled
+from conftest import SIZE, moves
+from headless import Command, Operation, Toolpath
+
+
+def _square():
+    return [
+        Operation("TC", Toolpath([Command("M3", {"S": 700})])),
+        Operation("Square", Toolpath([
+            Command("G0", {"X": 1.0, "Y": 1.0, "Z": 5.0}),
+            Command("G1", {"Z": -1.0, "F": 100.0}),
+            Command("G1", {"X": 4.0, "Y": 1.0, "F": 300.0}),
+            Command("G1", {"X": 4.0, "Y": 4.0}),
+            Command("G1", {"X": 1.0, "Y": 4.0}),
+            Command("G0", {"Z": 5.0}),
+            Command("G0", {"X": 0.0, "Y": 0.0}),
+        ])),
+    ]
+
+
+def test_restart_preamble(post_text, tmp_path):
+
+    # stopped in the middle of the square: units and modes, laser off, over
+    # the last point reached, the feed, the laser on at its power, then the
+    # program from that line on
+    text, _ = post_text(_square(), "--index")
+    lines = text.splitlines(True)
+    line = lines.index("G1 X4.000 Y4.000\n") + 1
+    output = str(tmp_path / "part.resume.nc")
+    laser_resume.resume(str(tmp_path / "part.nc"), line, output)
+    with open(output) as f:
+        resumed = f.read()
+    head = [
+        "(resumed at line %d of part.nc)\n" % line,
+        "G21 G17 G90\n",
+        "M5\n",
+        "G0 X4.000 Y1.000\n",
+        "F18000.000\n",
+        "M3 S700\n",
+    ]
+    assert resumed == "".join(head + lines[line - 1:])
+
+
+def test_restart_from_an_index_entry(job, post_text, tmp_path):
+
+    # the state kept in the index brings the head to where reading the whole
+    # program before the line does
+    name, objects = job
+    text, post = post_text(objects, "--index")
+    lines = text.splitlines()
+    program = str(tmp_path / "part.nc")
+    index = laser_resume.load_index(str(tmp_path / "part.index.json"), program)
+    for line in (2, post.INDEX_STEP + 1, len(lines) - 3):
+        state = {}
+        for before in lines[:line - 1]:
+            laser_resume.advance(state, before, index)
+        output = str(tmp_path / "part.resume.nc")
+        laser_resume.resume(program, line, output)
+        with open(output, "rb") as f:
+            resumed = f.read()
+        assert resumed.startswith(laser_resume.restart_head(state, index, line, "part.nc"))
+
+
+def test_restart_inside_a_repeated_block(post_text, tmp_path):
+
+    # the machine runs the rest of the pass, the passes left and what follows,
+    # as it would have run them from there
+    objects = workloads.depth(SIZE)
+    text, post = post_text(objects, "--index --repeat-passes linuxcnc")
+    lines = text.splitlines(True)
+    begin = next(n for n, line in enumerate(lines) if line.startswith("o"))
+    count = int(lines[begin].split("[")[1].split("]")[0])
+    line = begin + 5
+    program = str(tmp_path / "part.nc")
+    output = str(tmp_path / "part.resume.nc")
+    with pytest.raises(ValueError, match="give the pass it stopped in with --pass"):
+        laser_resume.resume(program, line, output)
+    for repeat_pass in (1, 2, count):
+        laser_resume.resume(program, line, output, repeat_pass=repeat_pass)
+        with open(output) as f:
+            resumed = f.read()
+        marked = "".join(lines[: line - 1] + ["(mark)\n"] + lines[line - 1 :])
+        full = unrolled(marked, post.REPEAT_BEGIN, post.REPEAT_END)
+        cut = -1
+        for _ in range(repeat_pass):
+            cut = full.index("(mark)", cut + 1)
+        skipped = len(moves(full[:cut], post))
+        assert moves(unrolled(resumed, post.REPEAT_BEGIN, post.REPEAT_END), post)[1:] == moves(full, post)[skipped:]
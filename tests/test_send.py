@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+import laser_batch
+import laser_send
+from conftest import operation
+
+SIM_ARGS = "--sim-args=--baud 1000000 --latency 0.0005 --time-scale 0.0001"
+
+
+def _square():
+    return [
+        operation("TC", ("M3", {"S": 700})),
+        operation("Square", *[("G1", {"X": x, "Y": y, "F": 600.0}) for x, y in [(0, 0), (20, 0), (20, 20), (0, 20), (0, 0)] * 20]),
+    ]
+
+
+def _main(tmp_path, program, *args):
+    summary = str(tmp_path / "summary.json")
+    status = laser_send.main([program, "--simulate", SIM_ARGS, "--status", "0.02", "--summary", summary] + list(args))
+    with open(summary) as f:
+        return status, json.load(f)
+
+
+def test_program_lines_leave_out_comments_and_blank_lines():
+    chunks = ["(Exported by FreeCAD)\nG21\n\n  G1 X1.000 (cut) Y2.000\n", "M5 ; off\n"]
+    assert list(laser_send.program_lines(chunks)) == [b"G21\n", b"G1 X1.000  Y2.000\n", b"M5\n"]
+
+
+@pytest.mark.parametrize("args", [[], ["--ping-pong"]])
+def test_every_line_reaches_the_controller(post_text, tmp_path, args):
+    text, _ = post_text(_square())
+    lines = list(laser_send.program_lines([text]))
+    status, stats = _main(tmp_path, str(tmp_path / "part.nc"), *args)
+    assert status == 0
+    assert stats["lines"] == len(lines)
+    assert stats["bytes"] == sum(len(line) for line in lines)
+    assert stats["controller"]["lines"] == len(lines)
+    assert stats["controller"]["errors"] == stats["controller"]["overflows"] == 0
+
+
+def test_a_dump_is_posted_while_it_is_sent(post_text, tmp_path):
+    text, _ = post_text(_square(), "--compact")
+    filename = str(tmp_path / "job.json")
+    laser_batch.dump(_square(), filename, "Job", "--compact")
+    status, stats = _main(tmp_path, filename)
+    assert status == 0
+    assert stats["lines"] == len(list(laser_send.program_lines([text])))
+
+
+def test_the_sender_stops_at_an_error(tmp_path, capsys):
+    program = tmp_path / "bad.nc"
+    program.write_text("G21\nG1 X1 F600\nG99\nG1 X2\n")
+    assert laser_send.main([str(program), "--simulate", SIM_ARGS]) == 1
+    assert "line 3: error" in capsys.readouterr().err
@@ -0,0 +1,55 @@
+import collections
+import contextlib
+import io
+
+import laser_batch
+import laser_daemon
+from conftest import cuts, laser_post, moves, operation, square
+
+
+def _sheet():
+    # twelve parts, each an outline with a hole, the holes all in one operation
+    outlines = []
+    holes = []
+    for k in range(12):
+        x, y = 30.0 * (k % 4), 30.0 * (k // 4)
+        outlines += square(x, y, 20.0 + k % 3)
+        holes += square(x + 5.0, y + 5.0, 4.0)
+    return [operation("TC", ("M3", {"S": 700})), operation("Holes", *holes), operation("Outlines", *outlines)]
+
+
+def _split(tmp_path, objects, args=""):
+    post = laser_post.PostProcessor()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = post.export(objects, str(tmp_path / "part.nc"), "--split 3 --no-show-editor " + args)
+    texts = []
+    for name in post.outputs:
+        with open(name) as f:
+            texts.append(f.read())
+    return result, post, texts
+
+
+def test_split_shares_every_cut_out_once(post_text, tmp_path):
+    objects = _sheet()
+    plain, post = post_text(objects)
+    result, split, texts = _split(tmp_path, objects)
+    assert result == ""
+    assert split.outputs == [str(tmp_path / ("part_%d.nc" % k)) for k in (1, 2, 3)]
+    assert sum((cuts(text, post) for text in texts), collections.Counter()) == cuts(plain, post)
+    # a part keeps its hole, and the parts take about the same time
+    for text in texts:
+        starts = {(x, y) for motion, x, y, i, j, feed, laser in moves(text, post) if motion == 0.0}
+        outlines = {(x, y) for x, y in starts if x % 30 == 0}
+        assert {(x - 5.0, y - 5.0) for x, y in starts - outlines} == outlines
+        assert len(outlines) == 4
+
+
+def test_split_jobs_in_batch_and_daemon_list_every_program(tmp_path):
+    laser_batch.load_post()
+    filename = str(tmp_path / "sheet.json")
+    laser_batch.dump(_sheet(), filename, "Sheet", "--split 2")
+    options = {"output_dir": None, "suffix": ".nc", "post_args": None, "dump": False}
+    [row] = laser_batch._post_file(filename, options)
+    assert row["outputs"] == [str(tmp_path / ("sheet_%d.nc" % k)) for k in (1, 2)]
+    reply = laser_daemon.handle({"input": filename, "output": str(tmp_path / "daemon.nc")})
+    assert reply["jobs"][0]["outputs"] == [str(tmp_path / ("daemon_%d.nc" % k)) for k in (1, 2)]
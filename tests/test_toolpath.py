@@ -0,0 +1,28 @@
+import pytest
+
+import laser_batch
+from conftest import _OUTPUT_TIME, laser_post
+
+pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("args", ["", "--compact --laser-on M4", "--inches --order-cuts"])
+def test_a_toolpath_posts_as_the_job_it_was_saved_from(job, post_text, tmp_path, args):
+    _, objects = job
+    post_text(objects, "--toolpath", name="saved.nc")
+    loaded = laser_post.load_toolpath(str(tmp_path / "saved.toolpath"))
+    assert [obj.Label for obj in loaded] == [obj.Label for obj in objects]
+    assert post_text(loaded, args)[0] == post_text(objects, args)[0]
+
+
+def test_save_toolpath_and_batch(job, post_text, tmp_path):
+
+    # written from code and read as a batch input
+    _, objects = job
+    filename = str(tmp_path / "job.toolpath")
+    laser_post.save_toolpath(objects, filename)
+    laser_batch.load_post()
+    options = {"output_dir": None, "suffix": ".nc", "post_args": "--compact", "dump": False}
+    [row] = laser_batch._post_file(filename, options)
+    with open(row["output"]) as f:
+        assert _OUTPUT_TIME.sub("", f.read()) == post_text(objects, "--compact")[0]
@@ -0,0 +1,88 @@
+import json
+import math
+
+import pytest
+
+from conftest import _COMMENT, _WORD, laser_post, operation
+
+pytest.importorskip("numpy")
+
+
+def _violations(text):
+    post = laser_post.PostProcessor()
+    state = laser_post._validate_state(post)
+    laser_post._validate_block(text, state)
+    return {rule: [int(n) for found in state["found"][rule] for n in found] for rule, _ in laser_post._VALIDATE_RULES}
+
+
+def _outside(text, low=(0.0, 0.0), high=(500.0, 300.0)):
+
+    # the lines of moves that end off the bed or, for the half circles of the
+    # jobs, bulge off it
+    found = []
+    here = {"X": 0.0, "Y": 0.0}
+    for number, line in enumerate(text.splitlines(), 1):
+        words = dict((letter, float(value)) for letter, value in _WORD.findall(_COMMENT.sub("", line)))
+        if "X" not in words and "Y" not in words:
+            continue
+        points = [(words.get("X", here["X"]), words.get("Y", here["Y"]))]
+        if "I" in words:
+            centre = (here["X"] + words["I"], here["Y"] + words.get("J", 0.0))
+            radius = math.hypot(words["I"], words.get("J", 0.0))
+            points += [(centre[0], centre[1] - radius), (centre[0], centre[1] + radius)]
+        if any(not (low[0] <= x <= high[0] and low[1] <= y <= high[1]) for x, y in points):
+            found.append(number)
+        here = {"X": points[0][0], "Y": points[0][1]}
+    return found
+
+
+def test_the_jobs_are_checked(job, post_text, tmp_path):
+
+    # the jobs keep to the rules, some of them run off the bed
+    _, objects = job
+    text, _ = post_text(objects, "--validate")
+    assert text == post_text(objects)[0]
+    with open(tmp_path / "part.validate.json") as f:
+        report = json.load(f)
+    assert report["lines"] == text.count("\n") + 1
+    assert report["violations"].pop("outside") == _outside(text)
+    assert not any(report["violations"].values())
+
+
+def test_a_default_raster_passes(post_text, tmp_path):
+
+    # its overscan runs to the edge of the bed and no further
+    image = tmp_path / "image.pgm"
+    image.write_bytes(b"P5 4 2 255\n" + bytes([0, 0, 0, 0, 0, 128, 0, 0]))
+    post_text([operation("TC", ("M3", {"S": 700}))], "--validate --raster %s" % image)
+    with open(tmp_path / "part.validate.json") as f:
+        assert not any(json.load(f)["violations"].values())
+
+
+def test_lines_that_break_the_rules_are_found(post_text, tmp_path):
+    objects = [
+        operation("TC", ("M3", {"S": 700})),
+        operation(
+            "Bad",
+            ("G0", {"X": 1.0, "Y": 1.0}),
+            ("G1", {"X": 600.0, "Y": 1.0, "F": 100.0}),
+            ("G2", {"X": 5.0, "Y": 5.0, "I": 0.0, "J": 0.0}),
+            ("G3", {"X": 10.0, "Y": 5.0, "I": 1.0, "J": 0.0}),
+        ),
+    ]
+    text, _ = post_text(objects, "--validate --bed 700x300")
+    lines = text.splitlines()
+    with open(tmp_path / "part.validate.json") as f:
+        violations = json.load(f)["violations"]
+    assert violations["outside"] == []
+    assert [lines[n - 1] for n in violations["arc"]] == ["G2 X5.000 Y5.000 I0.000 J0.000", "G3 X10.000 Y5.000 I1.000 J0.000"]
+    text, _ = post_text(objects, "--validate")
+    with open(tmp_path / "part.validate.json") as f:
+        assert [text.splitlines()[n - 1] for n in json.load(f)["violations"]["outside"]] == ["G1 X600.000 Y1.000 F6000.000"]
+
+
+def test_the_laser_rules():
+    found = _violations(
+        "G21\nM3 S700\nG0 X1 Y1\nM5\nG1 X2 F0\nM3\nG1 X3\nG1 X4 F100\nG1 X\nG3 X5 Y1 I0.5 J0\nG2 X6 Y1 I1 J0\n"
+    )
+    assert found == {"outside": [], "laser_on_rapid": [3], "no_feed": [7], "arc": [11], "malformed": [9]}